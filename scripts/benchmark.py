@@ -0,0 +1,340 @@
+"""
+Benchmarks des chemins de calcul des stats et de préparation des pages.
+
+Génère une édition synthétique dans un dossier temporaire, chronomètre chaque
+opération (meilleur temps et médiane sur --repeat exécutions) et écrit les
+résultats en JSON. Avec --compare, signale les opérations dont la médiane
+dépasse celle de la référence de plus de --threshold (code de sortie 1).
+
+Démarrage à froid (si streamlit est installé): chaque mesure dans un nouvel
+interpréteur, imports de l'accueil puis rendu complet de l'accueil
+(streamlit.testing), objectif < COLD_START_TARGET.
+
+Usage:
+    python scripts/benchmark.py --teams 32 --matches 1000 --output baseline.json
+    python scripts/benchmark.py --teams 32 --matches 1000 --compare baseline.json
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import subprocess
+import logging
+import argparse
+import platform
+import statistics
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+# Ajouter le répertoire racine au path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src" / "streamlit_app"))
+
+from src.core.data_manager import EditionDataManager, MultiEditionManager
+from src.core.stats_calculator import StatsCalculator, build_team_stats
+from src.utils.synthetic import write_synthetic_edition, iter_matches
+from components.view_models import (
+    build_match_sort_index,
+    build_player_to_team,
+    build_team_match_history
+)
+
+EDITION = 9001
+APPENDS = 50
+
+# Rendu de l'accueil dans un process neuf (secondes)
+COLD_START_TARGET = 1.0
+
+APP_DIR = project_root / "src" / "streamlit_app"
+
+# Scripts exécutés dans un nouvel interpréteur: affichent la durée mesurée
+COLD_IMPORTS = {
+    # Modules importés par l'accueil
+    "home_imports": "import components.app_shell, components.assets",
+    # Imports différés par les pages (components/app_shell.py: lazy_module)
+    "deferred_imports": "import pandas, plotly.express, plotly.graph_objects"
+}
+COLD_HOME = """
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({app!r}, default_timeout=30)
+app.run()
+if app.exception:
+    sys.exit("home page failed: " + app.exception[0].message)
+"""
+COLD_TEMPLATE = """
+import sys, time
+sys.path[:0] = [{root!r}, {app_dir!r}]
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+def bench(name: str, func: Callable, repeat: int, setup: Optional[Callable] = None) -> Dict:
+    """
+    Chronomètre func() `repeat` fois (setup() exécuté avant chaque mesure, hors chrono).
+
+    Returns:
+        {"min": s, "median": s, "repeat": n}
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    result = {"min": min(timings), "median": statistics.median(timings), "repeat": repeat}
+    print(f"  {name:<32} min {result['min'] * 1000:9.2f} ms   median {result['median'] * 1000:9.2f} ms")
+    return result
+
+
+def bench_cold(name: str, code: str, repeat: int, cwd: Path) -> Optional[Dict]:
+    """
+    Chronomètre `code` dans `repeat` interpréteurs neufs (caches d'import vides).
+
+    Returns:
+        {"min": s, "median": s, "repeat": n}, ou None si le code échoue
+        (dépendance absente)
+    """
+    script = COLD_TEMPLATE.format(root=str(project_root), app_dir=str(APP_DIR), code=code)
+    timings = []
+    for _ in range(repeat):
+        process = subprocess.run([sys.executable, "-c", script], cwd=cwd, capture_output=True, text=True)
+        if process.returncode != 0:
+            error = (process.stderr.strip().splitlines() or ["?"])[-1]
+            print(f"  {name:<32} ignoré ({error})")
+            return None
+        timings.append(float(process.stdout.strip().splitlines()[-1]))
+
+    result = {"min": min(timings), "median": statistics.median(timings), "repeat": repeat}
+    print(f"  {name:<32} min {result['min'] * 1000:9.2f} ms   median {result['median'] * 1000:9.2f} ms")
+    return result
+
+
+def run_cold_start(base_path: Path, repeat: int) -> Dict[str, Dict]:
+    """Imports et rendu de l'accueil sur un process froid, avec l'édition synthétique"""
+    # L'app lit data/editions depuis le répertoire courant
+    cwd = base_path.parent / "app_cwd"
+    (cwd / "data").mkdir(parents=True, exist_ok=True)
+    editions_link = cwd / "data" / "editions"
+    if not editions_link.exists():
+        os.symlink(base_path, editions_link, target_is_directory=True)
+
+    results = {}
+    for name, code in COLD_IMPORTS.items():
+        result = bench_cold(name, code, repeat, cwd)
+        if result:
+            results[name] = result
+
+    result = bench_cold("home_cold_start", COLD_HOME.format(app=str(APP_DIR / "app.py")), repeat, cwd)
+    if result:
+        results["home_cold_start"] = result
+        if result["median"] > COLD_START_TARGET:
+            print(f"  ⚠️ Accueil à froid: {result['median']:.2f}s (objectif < {COLD_START_TARGET:.0f}s)")
+    return results
+
+
+def run_benchmarks(base_path: Path, teams: int, matches: int, seed: int,
+                   repeat: int, timelines: bool) -> Dict[str, Dict]:
+    manager = write_synthetic_edition(
+        EDITION, teams=teams, matches=matches, seed=seed,
+        base_path=str(base_path), timelines=timelines
+    )
+    match_details = manager.load_match_details()
+    teams_with_puuid = manager.load_teams_with_puuid()
+    timeline_frames = manager.timelines.load_all() if timelines else None
+    stats = StatsCalculator().calculate_all_stats(match_details, teams_with_puuid)
+    player_to_team = build_player_to_team(teams_with_puuid)
+    first_team = next(iter(teams_with_puuid))
+    extra_matches = list(iter_matches(teams_with_puuid, APPENDS, seed + 1))
+
+    results = {}
+
+    # Stockage
+    results["load_match_details"] = bench(
+        "load_match_details", manager.load_match_details, repeat
+    )
+    results["iter_match_details"] = bench(
+        "iter_match_details", lambda: sum(1 for _ in manager.iter_match_details()), repeat
+    )
+    results["save_match_details"] = bench(
+        "save_match_details", lambda: manager.save_match_details(match_details), repeat
+    )
+
+    def append_matches():
+        for match_id, match in extra_matches:
+            manager.add_match_detail(match_id, match)
+
+    results[f"add_match_detail_x{APPENDS}"] = bench(
+        f"add_match_detail x{APPENDS}", append_matches, repeat,
+        setup=manager.match_log.clear
+    )
+    manager.match_log.clear()
+
+    def clear_catalog():
+        if manager.catalog.path.exists():
+            manager.catalog.path.unlink()
+
+    results["get_summary_cold"] = bench(
+        "get_summary (cold)", lambda: EditionDataManager(EDITION, str(base_path)).get_summary(),
+        repeat, setup=clear_catalog
+    )
+    results["get_summary_warm"] = bench(
+        "get_summary (warm)", lambda: EditionDataManager(EDITION, str(base_path)).get_summary(),
+        repeat
+    )
+
+    # Stats
+    results["calculate_all_stats"] = bench(
+        "calculate_all_stats",
+        lambda: StatsCalculator().calculate_all_stats(match_details, teams_with_puuid),
+        repeat
+    )
+    results["calculate_all_stats_stream"] = bench(
+        "calculate_all_stats (stream)",
+        lambda: StatsCalculator().calculate_all_stats(manager.iter_match_details(), teams_with_puuid),
+        repeat
+    )
+    if timeline_frames:
+        results["calculate_all_stats_timelines"] = bench(
+            "calculate_all_stats (timelines)",
+            lambda: StatsCalculator().calculate_all_stats(match_details, teams_with_puuid, timeline_frames),
+            repeat
+        )
+    results["build_team_stats"] = bench(
+        "build_team_stats", lambda: build_team_stats(stats), repeat
+    )
+
+    results["build_participant_matrix"] = bench(
+        "build_participant_matrix", manager.build_participant_matrix, repeat
+    )
+    matrix = manager.participants.load()
+    champions = matrix.values("champion")[:3]
+    results["participant_matrix_filter"] = bench(
+        "participant_matrix filter + aggregate",
+        lambda: matrix.aggregate(matrix.mask(champion=champions), by="player"),
+        repeat
+    )
+
+    # Carrières multi-éditions (depuis general_stats.json)
+    manager.save_general_stats(stats)
+    multi_manager = MultiEditionManager(str(base_path))
+
+    def clear_careers():
+        if multi_manager.careers.path.exists():
+            multi_manager.careers.path.unlink()
+
+    results["all_time_leaderboard_cold"] = bench(
+        "all_time_leaderboard (cold)",
+        lambda: MultiEditionManager(str(base_path)).all_time_leaderboard(include_private=True),
+        repeat, setup=clear_careers
+    )
+    results["all_time_leaderboard_warm"] = bench(
+        "all_time_leaderboard (warm)",
+        lambda: MultiEditionManager(str(base_path)).all_time_leaderboard(include_private=True),
+        repeat
+    )
+
+    def clear_champion_meta():
+        if multi_manager.champion_meta.path.exists():
+            multi_manager.champion_meta.path.unlink()
+
+    results["champion_trends_cold"] = bench(
+        "champion_trends (cold)",
+        lambda: MultiEditionManager(str(base_path)).get_champion_trends(include_private=True),
+        repeat, setup=clear_champion_meta
+    )
+    results["champion_trends_warm"] = bench(
+        "champion_trends (warm)",
+        lambda: MultiEditionManager(str(base_path)).get_champion_trends(include_private=True),
+        repeat
+    )
+
+    # Préparation des pages
+    results["build_match_sort_index"] = bench(
+        "build_match_sort_index", lambda: build_match_sort_index(match_details), repeat
+    )
+    results["build_team_match_history"] = bench(
+        "build_team_match_history",
+        lambda: build_team_match_history(match_details, player_to_team, first_team),
+        repeat
+    )
+
+    return results
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> int:
+    """Affiche les écarts avec la référence et retourne le nombre de régressions"""
+    regressions = 0
+    print(f"\nComparaison (seuil +{threshold:.0%}):")
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"  {name:<32} (absent de la référence)")
+            continue
+        ratio = result["median"] / reference["median"] if reference["median"] else 1.0
+        regressed = ratio > 1 + threshold
+        regressions += regressed
+        flag = "❌ REGRESSION" if regressed else "✅"
+        print(f"  {name:<32} {ratio:6.2f}x  {flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark stats and page-prep code paths")
+    parser.add_argument("--teams", type=int, default=16, help="Number of synthetic teams")
+    parser.add_argument("--matches", type=int, default=200, help="Number of synthetic matches")
+    parser.add_argument("--seed", type=int, default=42, help="Generator seed")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per benchmark")
+    parser.add_argument("--timelines", action="store_true", help="Also benchmark early game metrics")
+    parser.add_argument("--no-cold-start", action="store_true",
+                        help="Skip the cold process import / home page render timings")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed median slowdown before flagging a regression (0.2 = +20%%)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    print(f"📏 Benchmark: {args.teams} équipes, {args.matches} matchs, {args.repeat} exécutions")
+    tmp_dir = Path(tempfile.mkdtemp(prefix="occilan_bench_"))
+    try:
+        base_path = tmp_dir / "editions"
+        results = run_benchmarks(base_path, args.teams, args.matches, args.seed,
+                                 args.repeat, args.timelines)
+        if not args.no_cold_start:
+            print("\n🧊 Démarrage à froid")
+            results.update(run_cold_start(base_path, args.repeat))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    report = {
+        "params": {
+            "teams": args.teams,
+            "matches": args.matches,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "timelines": args.timelines
+        },
+        "python": platform.python_version(),
+        "results": results
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Résultats → {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get("params") != report["params"]:
+            print("⚠️ Paramètres différents de la référence, comparaison indicative")
+        if compare(results, baseline.get("results", {}), args.threshold):
+            sys.exit(1)
@@ -1,28 +1,47 @@
 """
 Script de nettoyage du projet Occilan-data
-Supprime tous les fichiers inutiles, backups, tests obsolètes, etc.
+Compacte les backups des éditions, supprime les fichiers inutiles, tests obsolètes, etc.
 """
 
-import os
+import sys
 import shutil
 from pathlib import Path
 
+# Ajouter le répertoire racine au path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.data_manager import MultiEditionManager
+
+
+def compact_edition_backups(base_path: Path) -> int:
+    """
+    Migre les anciens backups <file>.backup_<timestamp> de chaque édition vers
+    backups/ (gzip, dédupliqués, rétention appliquée).
+    
+    Returns:
+        Nombre d'anciens fichiers de backup supprimés
+    """
+    multi = MultiEditionManager(str(base_path / "data" / "editions"))
+    removed = 0
+    
+    for edition_num in multi.list_editions():
+        stats = multi.get_edition_manager(edition_num).compact_backups()
+        if stats["removed"]:
+            print(
+                f"🗜️  Édition {edition_num}: {stats['removed']} backups → {stats['kept']} conservés "
+                f"({stats['deduplicated']} doublons, {stats['bytes_before'] / 1024:.0f} KB → {stats['bytes_after'] / 1024:.0f} KB)"
+            )
+        removed += stats["removed"]
+    
+    return removed
+
+
 def cleanup():
-    base_path = Path("d:/Occilan-data")
+    base_path = project_root
     
     # Liste des fichiers et dossiers à supprimer
     files_to_delete = [
-        # Backups JSON
-        "data/editions/edition_6/general_stats.json.backup_20251018_210444",
-        "data/editions/edition_6/teams_with_puuid.json.backup_20251018_210254",
-        "data/editions/edition_6/teams_with_puuid.json.backup_20251018_210442",
-        "data/editions/edition_6/tournament_matches.json.backup_20251018_210444",
-        "data/editions/edition_6/tournament_matches.json.backup_20251018_211500",
-        
-        # Backups Edition 7
-        "data/editions/edition_7/teams_with_puuid.json.backup_20251017_143714",
-        "data/editions/edition_7/teams_with_puuid.json.backup_20251017_143905",
-        
         # Backup pages Streamlit
         "src/streamlit_app/pages/1_📊_Stats_Generales.py.backup",
         
@@ -70,6 +89,9 @@ def cleanup():
     
     print("🧹 Nettoyage du projet Occilan-data...\n")
     
+    # Backups des éditions (remplace la suppression fichier par fichier)
+    deleted_count += compact_edition_backups(base_path)
+    
     # Suppression des fichiers
     for file_path in files_to_delete:
         full_path = base_path / file_path
@@ -0,0 +1,39 @@
+"""
+Génère une édition synthétique (privée) de taille configurable pour les benchmarks.
+Même seed → mêmes fichiers.
+"""
+import sys
+import argparse
+import logging
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.synthetic import write_synthetic_edition
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic edition")
+    parser.add_argument("--edition", type=int, default=9001, help="Edition number to create")
+    parser.add_argument("--teams", type=int, default=16, help="Number of teams")
+    parser.add_argument("--matches", type=int, default=100, help="Number of matches")
+    parser.add_argument("--seed", type=int, default=42, help="Generator seed")
+    parser.add_argument("--timelines", action="store_true", help="Also write timeline frames")
+    parser.add_argument("--raw", action="store_true", help="Store full Match-V5 payloads instead of the lean projection")
+    parser.add_argument("--base-path", default="data/editions", help="Editions directory")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    manager = write_synthetic_edition(
+        args.edition,
+        teams=args.teams,
+        matches=args.matches,
+        seed=args.seed,
+        base_path=args.base_path,
+        timelines=args.timelines,
+        raw=args.raw
+    )
+    print(f"✅ Édition synthétique {args.edition} → {manager.edition_path}")
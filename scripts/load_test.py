@@ -0,0 +1,111 @@
+"""
+Test de charge du pipeline de récupération contre le mock de l'API Riot.
+
+Crée une édition synthétique (teams.json seulement) dans un dossier
+temporaire, lance EditionProcessor.run_full_pipeline sans cache contre le
+mock local, puis affiche le temps total, le débit de requêtes, les 429 et
+5xx reçus (= retries du client) et le détail par route.
+
+Exemple:
+    python scripts/load_test.py --teams 16 --matches 200 --error-rate 0.02
+    python scripts/load_test.py --app-limits 20:1,100:120   # clé de développement
+"""
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from mock_riot_server import add_server_arguments, build_server
+from src.core.data_manager import EditionDataManager
+from src.core.riot_client import RiotAPIClient
+from src.pipeline.edition_processor import EditionProcessor
+from src.utils.synthetic import generate_teams, to_teams, GAME_CREATION_BASE
+
+EDITION = 9001
+
+
+def run_load_test(args) -> dict:
+    tmp_dir = Path(tempfile.mkdtemp(prefix="occilan_load_"))
+    server = build_server(args).start()
+    try:
+        base_path = str(tmp_dir / "editions")
+        manager = EditionDataManager(EDITION, base_path)
+        manager.initialize_edition("Load test", 2025, "2025-10-09", "2025-10-12", is_private=True)
+        manager.save_teams(to_teams(generate_teams(args.teams, args.seed)))
+
+        client = RiotAPIClient("mock-key", cache_dir=str(tmp_dir / "cache"), base_url=server.url)
+        processor = EditionProcessor(EDITION, "mock-key", riot_client=client, base_path=base_path)
+
+        # Fenêtre couvrant tous les matchs synthétiques (espacés de 15 min)
+        start_timestamp = GAME_CREATION_BASE // 1000 - 3600
+        end_timestamp = start_timestamp + args.matches * 15 * 60 + 2 * 3600
+
+        server.reset_stats()
+        started = time.perf_counter()
+        results = processor.run_full_pipeline(
+            start_timestamp, end_timestamp,
+            use_cache=False,
+            fetch_timelines=args.timelines
+        )
+        wall_time = time.perf_counter() - started
+        stats = server.stats()
+    finally:
+        server.stop()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return {
+        "params": {k: v for k, v in vars(args).items() if k != "output"},
+        "wall_time": round(wall_time, 3),
+        "requests": stats["requests"],
+        "requests_per_second": round(stats["requests"] / wall_time, 2) if wall_time else 0,
+        "retries": stats["throttled"] + stats["server_errors"],
+        "throttled": stats["throttled"],
+        "server_errors": stats["server_errors"],
+        "routes": stats["routes"],
+        "statuses": stats["statuses"],
+        "matches_fetched": results["steps"].get("step5_match_details", {}).get("matches_fetched", 0),
+        "pipeline_success": results.get("success", False),
+        "pipeline_errors": len(results.get("errors", [])),
+        "client_metrics": client.metrics()
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the fetch pipeline against the mock Riot API")
+    add_server_arguments(parser)
+    parser.add_argument("--timelines", action="store_true", help="Also fetch match timelines")
+    parser.add_argument("--output", help="Write the report to this JSON file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    print(f"🧪 Load test: {args.teams} équipes, {args.matches} matchs, "
+          f"latence {args.latency_ms:.0f} ms, erreurs {args.error_rate:.1%}")
+    report = run_load_test(args)
+
+    print(f"\n⏱️  Temps total        {report['wall_time']:.2f} s")
+    print(f"📨 Requêtes           {report['requests']} ({report['requests_per_second']:.1f} req/s)")
+    print(f"🔁 Retries            {report['retries']} (429: {report['throttled']}, 5xx: {report['server_errors']})")
+    print(f"🎮 Matchs récupérés   {report['matches_fetched']}")
+    totals = report["client_metrics"]["totals"]
+    print(f"💤 Attente client     {totals['sleep_seconds']:.2f} s (requêtes: {totals['latency_seconds']:.2f} s)")
+    print("\nPar route:")
+    endpoints = report["client_metrics"]["endpoints"]
+    for route, count in sorted(report["routes"].items()):
+        latency = endpoints.get(route, {}).get("latency", {}).get("avg", 0)
+        print(f"  {route:<12} {count:>6}   latence moy. {latency * 1000:7.1f} ms")
+    if not report["pipeline_success"]:
+        print(f"\n⚠️ Pipeline en échec ({report['pipeline_errors']} erreurs)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Rapport → {args.output}")
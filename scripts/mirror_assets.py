@@ -0,0 +1,27 @@
+"""
+Copie locale des icônes champions/rôles (Data Dragon, CommunityDragon)
+À lancer une fois par version Data Dragon; les pages utilisent ensuite le cache local.
+"""
+import sys
+import argparse
+import logging
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.streamlit_app.components.assets import DDRAGON_VERSION, ASSETS_DIR, mirror_assets
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mirror champion and role icons locally")
+    parser.add_argument("--version", default=DDRAGON_VERSION, help="Data Dragon version")
+    parser.add_argument("--force", action="store_true", help="Re-download icons already mirrored")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    print(f"🖼️  Mirroring assets (Data Dragon {args.version}) → {ASSETS_DIR}")
+    counts = mirror_assets(version=args.version, force=args.force)
+    print(f"✅ {counts['downloaded']} téléchargés, {counts['skipped']} déjà présents, {counts['failed']} échecs")
@@ -0,0 +1,67 @@
+"""
+Lance le mock local de l'API Riot (données synthétiques).
+
+Exemple:
+    python scripts/mock_riot_server.py --teams 16 --matches 200 --port 8765 --error-rate 0.01
+    RIOT_API_BASE_URL=http://127.0.0.1:8765 streamlit run src/streamlit_app/app.py
+
+Avec RIOT_API_BASE_URL, RiotAPIClient met son cache dans data/cache/mock
+(et non data/cache): les matchs et PUUIDs synthétiques ne sont jamais relus
+par un run sur l'API réelle. Supprimer data/cache/mock pour repartir de zéro.
+"""
+import sys
+import argparse
+import logging
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.mock_riot_api import MockRiotData, MockRiotServer, PRODUCTION_APP_LIMITS, DEV_KEY_APP_LIMITS
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    """Options communes au serveur et au test de charge"""
+    parser.add_argument("--teams", type=int, default=16, help="Number of synthetic teams")
+    parser.add_argument("--matches", type=int, default=100, help="Number of synthetic matches")
+    parser.add_argument("--seed", type=int, default=42, help="Synthetic data seed")
+    parser.add_argument("--app-limits", default=PRODUCTION_APP_LIMITS,
+                        help=f"Application rate limits (dev key: {DEV_KEY_APP_LIMITS})")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="Median response latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Log-normal latency spread")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of starting a 5xx burst")
+    parser.add_argument("--error-burst", type=int, default=3, help="Consecutive 5xx per burst")
+
+
+def build_server(args, host: str = "127.0.0.1", port: int = 0) -> MockRiotServer:
+    return MockRiotServer(
+        MockRiotData.synthetic(args.teams, args.matches, args.seed),
+        host=host,
+        port=port,
+        app_limits=args.app_limits,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        error_burst=args.error_burst,
+        seed=args.seed
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local mock of the Riot API")
+    add_server_arguments(parser)
+    parser.add_argument("--host", default="127.0.0.1", help="Listen address")
+    parser.add_argument("--port", type=int, default=8765, help="Listen port")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    server = build_server(args, args.host, args.port)
+    print(f"🧪 Mock Riot API → {server.url} (stats: {server.url}/mock/stats)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,225 @@
+"""
+OcciLan CLI - point d'entrée unique des opérations sur les éditions
+
+Commandes:
+    list       Éditions disponibles (résumé depuis le catalogue)
+    refresh    Étapes 2-6 du pipeline sur une ou plusieurs éditions, en parallèle
+               (une édition par worker, un seul client API donc un seul rate limit)
+    watch      Suivi en direct d'une édition pendant l'événement: nouveaux matchs
+               ingérés et stats recalculées au fil des parties (Ctrl+C pour arrêter)
+
+Exemples:
+    python scripts/occilan.py list
+    python scripts/occilan.py refresh --all --incremental              # refresh nocturne
+    python scripts/occilan.py refresh --edition 7 --steps 3            # LP/rangs seulement
+    python scripts/occilan.py refresh --edition 6 7 --steps stats      # recalcul hors ligne
+    python scripts/occilan.py refresh --all --steps 4-6 --incremental --dry-run
+    python scripts/occilan.py watch --edition 8 --fast 60 --idle 900 --budget 0.3
+
+Étapes: 2=puuids, 3=ranks, 4=match-ids, 5=matches, 6=stats
+(voir src/pipeline/batch_runner.py pour le mode --incremental)
+"""
+import os
+import sys
+import json
+import signal
+import logging
+import argparse
+import threading
+from pathlib import Path
+from datetime import datetime
+
+# Ajouter le répertoire racine au path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+from src.core.data_manager import MultiEditionManager
+from src.core.rate_limiter import PRODUCTION_APP_LIMITS, DEV_KEY_APP_LIMITS
+from src.pipeline.batch_runner import STEPS, API_STEPS, parse_steps, run_batch
+
+load_dotenv()
+
+STATUS_ICONS = {"ok": "✅", "skipped": "⏭️", "failed": "❌", "planned": "📝"}
+
+
+def cmd_list(args) -> int:
+    multi_manager = MultiEditionManager(args.base_path)
+    summaries = multi_manager.get_all_summaries()
+    if not summaries:
+        print("Aucune édition")
+        return 0
+
+    print(f"{'Édition':<9} {'Statut':<12} {'Équipes':>8} {'Matchs':>8} {'Stats':>6}  Nom")
+    for summary in summaries:
+        private = " 🔒" if summary.get("is_private") else ""
+        print(f"{summary['edition_number']:<9} {summary['status']:<12} "
+              f"{summary['total_teams']:>8} {summary['total_matches']:>8} "
+              f"{'oui' if summary['has_stats'] else 'non':>6}  {summary['edition_name']}{private}")
+    return 0
+
+
+def print_summary(batch: dict):
+    """Récapitulatif par édition et par étape, avec les durées"""
+    title = "📝 Dry run" if batch["dry_run"] else "⏱️ Récapitulatif"
+    print(f"\n{title} ({len(batch['editions'])} édition(s), {batch['seconds']:.1f}s au total)")
+
+    for report in batch["editions"]:
+        icon = "✅" if report["success"] else "❌"
+        duration = "" if batch["dry_run"] else f" — {report['seconds']:.1f}s"
+        print(f"\n{icon} Édition {report['edition']}{duration}")
+        for step in report["steps"]:
+            seconds = "" if batch["dry_run"] else f"{step.get('seconds', 0):7.1f}s  "
+            print(f"   {STATUS_ICONS.get(step['status'], '?')} {step['step']} {step['name']:<10} {seconds}{step['detail']}")
+        for error in report["errors"][:5]:
+            print(f"   ⚠️ {error}")
+        if report["warnings"]:
+            print(f"   {len(report['warnings'])} avertissement(s)")
+
+    totals = (batch.get("api_metrics") or {}).get("totals")
+    if totals:
+        print(f"\n🌐 API: {totals['requests']} requêtes, {totals['retries']} retries, {totals['errors']} erreurs, "
+              f"{totals['sleep_seconds']:.1f}s d'attente, cache {totals['cache_hits']}/"
+              f"{totals['cache_hits'] + totals['cache_misses']}")
+
+
+def cmd_refresh(args) -> int:
+    try:
+        steps = parse_steps(args.steps)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+
+    multi_manager = MultiEditionManager(args.base_path)
+    available = multi_manager.list_editions()
+    editions = available if args.all else args.edition
+    missing = [edition for edition in editions if edition not in available]
+    if missing:
+        print(f"❌ Édition(s) introuvable(s): {missing} (disponibles: {available})")
+        return 2
+
+    client = None
+    api_key = os.getenv("RIOT_API_KEY", "")
+    if set(steps) & API_STEPS and not args.dry_run:
+        if not api_key:
+            print("❌ RIOT_API_KEY non trouvée dans .env (requise pour les étapes 2-5)")
+            return 2
+        from src.core.riot_client import RiotAPIClient
+        client = RiotAPIClient(api_key, cache_dir=args.cache_dir)
+
+    print(f"🔄 Éditions {editions} — étapes {', '.join(f'{s} ({STEPS[s][0]})' for s in steps)}"
+          f"{' — incrémental' if args.incremental else ''} — {args.workers} worker(s)")
+
+    batch = run_batch(
+        editions, steps, riot_client=client, api_key=api_key, base_path=args.base_path,
+        workers=args.workers, incremental=args.incremental, dry_run=args.dry_run,
+        use_cache=not args.no_cache, fetch_timelines=args.timelines
+    )
+    print_summary(batch)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(batch, f, indent=2, ensure_ascii=False)
+        print(f"\n📄 Rapport: {args.report}")
+
+    return 0 if all(report["success"] for report in batch["editions"]) else 1
+
+
+def cmd_watch(args) -> int:
+    if args.edition not in MultiEditionManager(args.base_path).list_editions():
+        print(f"❌ Édition {args.edition} introuvable")
+        return 2
+
+    api_key = os.getenv("RIOT_API_KEY", "")
+    if not api_key:
+        print("❌ RIOT_API_KEY non trouvée dans .env")
+        return 2
+
+    from src.core.riot_client import RiotAPIClient
+    from src.pipeline.edition_processor import EditionProcessor
+    from src.pipeline.live_watcher import LiveWatcher
+
+    client = RiotAPIClient(api_key, cache_dir=args.cache_dir)
+    processor = EditionProcessor(args.edition, api_key, riot_client=client, base_path=args.base_path)
+    watcher = LiveWatcher(
+        processor, fast_interval=args.fast, idle_interval=args.idle, backoff=args.backoff,
+        hot_window=args.hot_window, budget=args.budget, app_limits=args.app_limits
+    )
+
+    # Ctrl+C / SIGTERM: termine le cycle en cours puis s'arrête proprement
+    stop_event = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop_event.set())
+
+    def on_cycle(result: dict):
+        time_label = datetime.now().strftime("%H:%M:%S")
+        if result["state"] == "before":
+            print(f"[{time_label}] ⏳ Édition pas encore commencée, prochain essai dans {result['next_interval']:.0f}s")
+        elif result["state"] == "error":
+            print(f"[{time_label}] ⚠️ {result['error']} — nouvel essai dans {result['next_interval']:.0f}s")
+        elif result["state"] == "live":
+            stats = " — stats à jour" if result["stats_updated"] else ""
+            print(f"[{time_label}] 🔴 {result['ingested']} nouveau(x) match(s){stats} "
+                  f"({result['requests']} requêtes, {result['seconds']:.1f}s) — prochain poll dans {result['next_interval']:.0f}s")
+
+    print(f"👀 Suivi de l'édition {args.edition} (Ctrl+C pour arrêter)")
+    summary = watcher.run(stop_event, max_cycles=args.max_cycles, on_cycle=on_cycle)
+    print(f"\n✅ {summary['cycles']} cycle(s), {summary['ingested']} match(s) ingéré(s)")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="occilan", description="OcciLan editions command line")
+    parser.add_argument("--base-path", default="data/editions", help="Editions directory")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log pipeline progress")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="List editions")
+
+    refresh = subparsers.add_parser("refresh", help="Run pipeline steps over editions")
+    target = refresh.add_mutually_exclusive_group(required=True)
+    target.add_argument("--edition", type=int, nargs="+", help="Edition number(s)")
+    target.add_argument("--all", action="store_true", help="Every edition (private ones included)")
+    refresh.add_argument("--steps", nargs="+", default=["2-6"],
+                         help="Steps to run: numbers, ranges or names (default: 2-6)")
+    refresh.add_argument("--incremental", action="store_true", help="Skip work that is already up to date")
+    refresh.add_argument("--workers", type=int, default=4, help="Editions processed concurrently")
+    refresh.add_argument("--dry-run", action="store_true", help="Show what would run, call nothing")
+    refresh.add_argument("--timelines", action="store_true", help="Also fetch match timelines (step 5)")
+    refresh.add_argument("--no-cache", action="store_true", help="Ignore the API match cache (step 5)")
+    refresh.add_argument("--cache-dir", help="Riot API cache directory (default: data/cache, data/cache/mock "
+                                             "with RIOT_API_BASE_URL)")
+    refresh.add_argument("--report", help="Write the JSON run report to this file")
+
+    watch = subparsers.add_parser("watch", help="Poll an edition during the event")
+    watch.add_argument("--edition", type=int, required=True, help="Edition number")
+    watch.add_argument("--fast", type=float, default=60, help="Seconds between polls while games are played")
+    watch.add_argument("--idle", type=float, default=900, help="Maximum seconds between polls when idle")
+    watch.add_argument("--backoff", type=float, default=1.5, help="Interval growth after an empty poll")
+    watch.add_argument("--hot-window", type=float, default=1800,
+                       help="Seconds after a game's end during which polling stays fast")
+    watch.add_argument("--budget", type=float, default=0.5, help="Fraction of the rate limits the watcher may use")
+    watch.add_argument("--app-limits", default=DEV_KEY_APP_LIMITS,
+                       help=f"Application rate limits of the key (production key: {PRODUCTION_APP_LIMITS})")
+    watch.add_argument("--max-cycles", type=int, help="Stop after this many polls")
+    watch.add_argument("--cache-dir", help="Riot API cache directory (default: data/cache, data/cache/mock "
+                                           "with RIOT_API_BASE_URL)")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(threadName)s - %(levelname)s - %(message)s'
+    )
+    if args.command == "list":
+        return cmd_list(args)
+    if args.command == "watch":
+        return cmd_watch(args)
+    return cmd_refresh(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
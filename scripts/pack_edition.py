@@ -0,0 +1,37 @@
+"""
+Regroupe les fichiers JSON d'une édition dans un bundle unique (edition.bundle)
+ou restaure les fichiers JSON depuis le bundle (--unpack).
+"""
+import sys
+import argparse
+import logging
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.data_manager import EditionDataManager
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack/unpack an edition bundle")
+    parser.add_argument("edition", type=int, help="Edition number")
+    parser.add_argument("--unpack", action="store_true", help="Restore JSON files from the bundle")
+    parser.add_argument("--keep-files", action="store_true", help="Keep JSON files after packing")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    manager = EditionDataManager(args.edition)
+    if not manager.exists():
+        print(f"❌ Édition {args.edition} introuvable")
+        sys.exit(1)
+
+    if args.unpack:
+        manager.unpack_bundle()
+        print(f"✅ Édition {args.edition}: fichiers JSON restaurés")
+    else:
+        path = manager.pack_bundle(remove_files=not args.keep_files)
+        sections = ", ".join(manager.bundle.sections())
+        print(f"✅ Édition {args.edition} → {path} ({path.stat().st_size / 1024:.0f} KB: {sections})")
@@ -1,6 +1,9 @@
 """
 Data refresh script
-Refreshes all data from APIs
+Refreshes all editions from the Riot API (incremental)
+
+Shortcut for: python scripts/occilan.py refresh --all --incremental
+Extra arguments are passed through (ex: --workers 2 --dry-run).
 """
 
 import sys
@@ -9,26 +12,12 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.utils.logger import log
+from occilan import main
 
 
 def refresh_data():
     """Refresh all tournament data"""
-    try:
-        log.info("Starting data refresh...")
-        
-        # TODO: Implement data refresh logic
-        # 1. Load edition config
-        # 2. Fetch match IDs for all players
-        # 3. Fetch match details
-        # 4. Calculate statistics
-        # 5. Update database
-        
-        log.warning("Data refresh not yet implemented")
-        
-    except Exception as e:
-        log.error(f"Failed to refresh data: {e}")
-        sys.exit(1)
+    sys.exit(main(["refresh", "--all", "--incremental", *sys.argv[1:]]))
 
 
 if __name__ == "__main__":
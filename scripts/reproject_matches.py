@@ -0,0 +1,55 @@
+"""
+Re-projette match_details.json d'une ou plusieurs éditions au schéma
+courant (src/core/match_projection.py) à partir du cache API brut.
+
+À lancer après avoir ajouté un champ à la projection (SCHEMA_VERSION
+incrémentée), ou une fois sur les éditions stockées avant la projection
+(payloads bruts convertis sur place, sans appel API).
+
+Exemple:
+    python scripts/reproject_matches.py --edition 7
+    python scripts/reproject_matches.py --edition 6 7 --fetch-missing
+"""
+import os
+import sys
+import logging
+import argparse
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+from src.core.match_projection import SCHEMA_VERSION
+from src.core.riot_client import RiotAPIClient
+from src.pipeline.edition_processor import EditionProcessor
+
+load_dotenv()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild match_details.json at the current projection schema")
+    parser.add_argument("--edition", type=int, nargs="+", required=True, help="Edition number(s)")
+    parser.add_argument("--fetch-missing", action="store_true",
+                        help="Fetch raw payloads missing from the cache (needs RIOT_API_KEY)")
+    parser.add_argument("--cache-dir", help="Riot API cache directory (default: data/cache, data/cache/mock "
+                                            "with RIOT_API_BASE_URL)")
+    parser.add_argument("--base-path", default="data/editions", help="Editions directory")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    api_key = os.getenv("RIOT_API_KEY", "")
+    if args.fetch_missing and not api_key:
+        print("❌ RIOT_API_KEY non trouvée dans .env (requise avec --fetch-missing)")
+        sys.exit(1)
+
+    client = RiotAPIClient(api_key, cache_dir=args.cache_dir)
+
+    for edition in args.edition:
+        processor = EditionProcessor(edition, api_key, riot_client=client, base_path=args.base_path)
+        counts = processor.reproject_match_details(fetch_missing=args.fetch_missing)
+        print(f"✅ Édition {edition} (schéma v{SCHEMA_VERSION}): {counts['reprojected']} re-projetés, "
+              f"{counts['up_to_date']} à jour, {counts['missing']} sans payload brut")
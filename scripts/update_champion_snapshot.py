@@ -0,0 +1,56 @@
+"""
+Met à jour le snapshot local champion.json (Data Dragon) utilisé par le ChampionRegistry
+Ne garde que id / key / name pour chaque champion.
+"""
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import requests
+from src.core.champion_registry import DDRAGON_VERSION, SNAPSHOT_DIR
+
+CHAMPION_LIST_URL = "https://ddragon.leagueoflegends.com/cdn/{version}/data/en_US/champion.json"
+
+
+def update_snapshot(version: str):
+    """Télécharge champion.json et écrit le snapshot réduit"""
+    response = requests.get(CHAMPION_LIST_URL.format(version=version), timeout=10)
+    response.raise_for_status()
+    payload = response.json()
+
+    data = {
+        champion_id: {
+            "version": version,
+            "id": entry["id"],
+            "key": entry["key"],
+            "name": entry["name"]
+        }
+        for champion_id, entry in sorted(payload.get("data", {}).items(), key=lambda x: x[0].lower())
+    }
+    snapshot = {
+        "type": payload.get("type", "champion"),
+        "format": payload.get("format", "standAloneComplex"),
+        "version": version,
+        "data": data
+    }
+
+    target = SNAPSHOT_DIR / version / "champion.json"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, indent=2, ensure_ascii=False)
+
+    print(f"✅ {len(data)} champions → {target}")
+    if version != DDRAGON_VERSION:
+        print(f"ℹ️  Pensez à mettre à jour DDRAGON_VERSION ({DDRAGON_VERSION}) dans src/core/champion_registry.py")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Update the local Data Dragon champion snapshot")
+    parser.add_argument("--version", default=DDRAGON_VERSION, help="Data Dragon version")
+    args = parser.parse_args()
+    update_snapshot(args.version)
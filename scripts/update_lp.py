@@ -1,8 +1,11 @@
 """
 Script rapide pour re-fetch les ranks avec les bons LP
+Les changements de rang sont ajoutés à rank_history.json (seuls les joueurs
+dont l'entrée a changé y sont écrits).
 """
 import sys
 import os
+import time
 from pathlib import Path
 
 # Ajouter le répertoire racine au path
@@ -31,6 +34,7 @@ def update_lp_for_edition(edition_number: int):
     
     # Re-run step 3 (fetch ranks)
     print("🔄 Re-fetch des ranks avec les LP corrects...")
+    started = int(time.time())
     result = processor.step3_fetch_ranks()
     
     if result:
@@ -44,6 +48,10 @@ def update_lp_for_edition(edition_number: int):
         print("\n✅ Rangs mis à jour avec succès!")
         print(f"📊 {ranked_count} joueurs ranked trouvés")
         
+        history = processor.data_manager.rank_history
+        changed = [puuid for puuid in history.players() if history.latest(puuid)["timestamp"] >= started]
+        print(f"📈 {len(changed)} changement(s) de rang enregistré(s) dans rank_history.json")
+        
         # Afficher quelques exemples de Master+ avec LP
         print("\n🎯 Exemples de Master+ avec LP:")
         for team_name, team_data in result.items():
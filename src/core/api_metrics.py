@@ -0,0 +1,200 @@
+"""
+API Metrics
+Compteurs par famille d'endpoints de l'API Riot (account, summoner, league,
+match-ids, match, timeline): requêtes, histogramme de latence, codes HTTP,
+retries, temps d'attente (rate limit / Retry-After / backoff) et cache.
+
+Snapshot:
+{
+    "endpoints": {
+        "match": {
+            "requests": 120,
+            "statuses": {"200": 118, "429": 2},
+            "errors": 0,                      # exceptions réseau
+            "retries": 2,
+            "latency": {"count": 120, "sum": 4.2, "avg": 0.035, "max": 0.41,
+                        "buckets": {"0.05": 97, "0.1": 115, ..., "+Inf": 120}},  # cumulés
+            "sleep": {"throttle": 1.2, "retry_after": 2.0, "backoff": 0.0},
+            "cache": {"hits": 30, "misses": 120, "hit_ratio": 0.2}
+        }
+    },
+    "totals": {"requests", "retries", "errors", "latency_seconds", "sleep_seconds", "cache_hits", "cache_misses"}
+}
+"""
+
+import json
+import threading
+from typing import Dict, Optional
+
+# Bornes supérieures (s) de l'histogramme de latence
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SLEEP_REASONS = ("throttle", "retry_after", "backoff")
+
+
+def _new_endpoint() -> Dict:
+    return {
+        "requests": 0,
+        "statuses": {},
+        "errors": 0,
+        "retries": 0,
+        "latency_count": 0,
+        "latency_sum": 0.0,
+        "latency_max": 0.0,
+        "buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+        "sleep": {reason: 0.0 for reason in SLEEP_REASONS},
+        "cache_hits": 0,
+        "cache_misses": 0
+    }
+
+
+class ApiMetrics:
+    """
+    Compteurs thread-safe, agrégés par famille d'endpoints.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict] = {}
+
+    def _endpoint(self, endpoint: str) -> Dict:
+        data = self._endpoints.get(endpoint)
+        if data is None:
+            data = self._endpoints[endpoint] = _new_endpoint()
+        return data
+
+    def reset(self):
+        with self._lock:
+            self._endpoints = {}
+
+    # =========================================================================
+    # ENREGISTREMENT
+    # =========================================================================
+
+    def observe_request(self, endpoint: str, latency: float, status: Optional[int] = None):
+        """
+        Une requête HTTP terminée.
+
+        Args:
+            endpoint: Famille d'endpoints
+            latency: Durée de la requête (s)
+            status: Code HTTP (None = exception réseau)
+        """
+        with self._lock:
+            data = self._endpoint(endpoint)
+            data["requests"] += 1
+            if status is None:
+                data["errors"] += 1
+            else:
+                data["statuses"][str(status)] = data["statuses"].get(str(status), 0) + 1
+            data["latency_count"] += 1
+            data["latency_sum"] += latency
+            data["latency_max"] = max(data["latency_max"], latency)
+            bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS) if latency <= bound), len(LATENCY_BUCKETS))
+            data["buckets"][bucket] += 1
+
+    def record_retry(self, endpoint: str):
+        with self._lock:
+            self._endpoint(endpoint)["retries"] += 1
+
+    def record_sleep(self, endpoint: str, reason: str, seconds: float):
+        """Temps d'attente (reason: throttle, retry_after ou backoff)"""
+        with self._lock:
+            self._endpoint(endpoint)["sleep"][reason] += seconds
+
+    def record_cache(self, endpoint: str, hit: bool):
+        with self._lock:
+            self._endpoint(endpoint)["cache_hits" if hit else "cache_misses"] += 1
+
+    # =========================================================================
+    # EXPORT
+    # =========================================================================
+
+    def snapshot(self) -> Dict:
+        """Copie des compteurs (voir le format en tête de module)"""
+        with self._lock:
+            endpoints = {}
+            totals = {"requests": 0, "retries": 0, "errors": 0, "latency_seconds": 0.0,
+                      "sleep_seconds": 0.0, "cache_hits": 0, "cache_misses": 0}
+
+            for name, data in sorted(self._endpoints.items()):
+                cumulative = 0
+                buckets = {}
+                for bound, count in zip([str(b) for b in LATENCY_BUCKETS] + ["+Inf"], data["buckets"]):
+                    cumulative += count
+                    buckets[bound] = cumulative
+
+                lookups = data["cache_hits"] + data["cache_misses"]
+                endpoints[name] = {
+                    "requests": data["requests"],
+                    "statuses": dict(data["statuses"]),
+                    "errors": data["errors"],
+                    "retries": data["retries"],
+                    "latency": {
+                        "count": data["latency_count"],
+                        "sum": round(data["latency_sum"], 4),
+                        "avg": round(data["latency_sum"] / data["latency_count"], 4) if data["latency_count"] else 0.0,
+                        "max": round(data["latency_max"], 4),
+                        "buckets": buckets
+                    },
+                    "sleep": {reason: round(seconds, 4) for reason, seconds in data["sleep"].items()},
+                    "cache": {
+                        "hits": data["cache_hits"],
+                        "misses": data["cache_misses"],
+                        "hit_ratio": round(data["cache_hits"] / lookups, 4) if lookups else None
+                    }
+                }
+
+                totals["requests"] += data["requests"]
+                totals["retries"] += data["retries"]
+                totals["errors"] += data["errors"]
+                totals["latency_seconds"] += data["latency_sum"]
+                totals["sleep_seconds"] += sum(data["sleep"].values())
+                totals["cache_hits"] += data["cache_hits"]
+                totals["cache_misses"] += data["cache_misses"]
+
+            totals["latency_seconds"] = round(totals["latency_seconds"], 4)
+            totals["sleep_seconds"] = round(totals["sleep_seconds"], 4)
+            return {"endpoints": endpoints, "totals": totals}
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix: str = "riot_api") -> str:
+        """Format texte d'exposition Prometheus"""
+        snapshot = self.snapshot()["endpoints"]
+        lines = []
+
+        def metric(name: str, kind: str, help_text: str):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        metric("requests_total", "counter", "HTTP requests by endpoint and status")
+        for endpoint, data in snapshot.items():
+            for status, count in sorted(data["statuses"].items()):
+                lines.append(f'{prefix}_requests_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+            if data["errors"]:
+                lines.append(f'{prefix}_requests_total{{endpoint="{endpoint}",status="error"}} {data["errors"]}')
+
+        metric("retries_total", "counter", "Retried requests")
+        for endpoint, data in snapshot.items():
+            lines.append(f'{prefix}_retries_total{{endpoint="{endpoint}"}} {data["retries"]}')
+
+        metric("request_duration_seconds", "histogram", "Request latency")
+        for endpoint, data in snapshot.items():
+            for bound, count in data["latency"]["buckets"].items():
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound}"}} {count}')
+            lines.append(f'{prefix}_request_duration_seconds_sum{{endpoint="{endpoint}"}} {data["latency"]["sum"]}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{endpoint="{endpoint}"}} {data["latency"]["count"]}')
+
+        metric("sleep_seconds_total", "counter", "Time spent waiting (throttle, retry_after, backoff)")
+        for endpoint, data in snapshot.items():
+            for reason, seconds in data["sleep"].items():
+                lines.append(f'{prefix}_sleep_seconds_total{{endpoint="{endpoint}",reason="{reason}"}} {seconds}')
+
+        metric("cache_lookups_total", "counter", "Local cache lookups")
+        for endpoint, data in snapshot.items():
+            if data["cache"]["hits"] or data["cache"]["misses"]:
+                lines.append(f'{prefix}_cache_lookups_total{{endpoint="{endpoint}",result="hit"}} {data["cache"]["hits"]}')
+                lines.append(f'{prefix}_cache_lookups_total{{endpoint="{endpoint}",result="miss"}} {data["cache"]["misses"]}')
+
+        return "\n".join(lines) + "\n"
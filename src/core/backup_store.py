@@ -0,0 +1,318 @@
+"""
+Backup Store
+Backups compressés, dédupliqués par hash de contenu et à rétention limitée.
+
+Structure par édition:
+data/editions/edition_X/backups/
+├── index.json                  # {filename: [{"id", "timestamp", "sha1", "bytes"}, ...]}
+└── objects/<sha1>.gz           # Contenu gzip (un objet par contenu distinct)
+
+Politique:
+- contenu identique au dernier backup du fichier → pas de nouveau backup
+- backups d'un même fichier plus rapprochés que min_interval → regroupés
+  (un run de pipeline ne crée qu'un backup par fichier: l'état d'avant le run)
+- rétention: les keep_last derniers + le plus récent de chacun des keep_daily
+  derniers jours; les objets qui ne sont plus référencés sont supprimés
+
+index.json est lu, modifié et réécrit sous un verrou inter-process
+(file_lock.py): le pipeline, la page Admin et les scripts peuvent
+sauvegarder la même édition en même temps sans perdre d'entrée, et le
+ménage des objets ne supprime pas un objet qu'un autre process vient
+d'ajouter.
+"""
+
+import os
+import re
+import gzip
+import json
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+from datetime import datetime
+
+from src.core.file_lock import file_lock
+
+logger = logging.getLogger(__name__)
+
+# Anciens backups: <filename>.backup_YYYYmmdd_HHMMSS
+LEGACY_BACKUP_PATTERN = re.compile(r"^(?P<filename>.+)\.backup_(?P<stamp>\d{8}_\d{6})$")
+
+
+def _atomic_write(path: Path, content: bytes):
+    """Écrit via un fichier temporaire + os.replace"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class BackupStore:
+    """
+    Backups content-addressed d'un dossier d'édition.
+    """
+
+    def __init__(
+        self,
+        backup_dir: Path,
+        keep_last: int = 5,
+        keep_daily: int = 7,
+        min_interval: int = 300
+    ):
+        """
+        Args:
+            backup_dir: Dossier des backups (ex: data/editions/edition_7/backups)
+            keep_last: Nombre de backups récents conservés par fichier
+            keep_daily: Nombre de jours pour lesquels un backup quotidien est conservé
+            min_interval: Délai minimal (secondes) entre deux backups d'un même fichier
+        """
+        self.backup_dir = Path(backup_dir)
+        self.objects_dir = self.backup_dir / "objects"
+        self.index_path = self.backup_dir / "index.json"
+        self.keep_last = keep_last
+        self.keep_daily = keep_daily
+        self.min_interval = min_interval
+
+    # =========================================================================
+    # INDEX
+    # =========================================================================
+
+    def _load_index(self) -> Dict[str, List[Dict]]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Invalid backup index {self.index_path}: {e}")
+            return {}
+
+    def _save_index(self, index: Dict[str, List[Dict]]):
+        content = json.dumps(index, indent=2, ensure_ascii=False).encode('utf-8')
+        _atomic_write(self.index_path, content)
+
+    def _object_path(self, sha1: str) -> Path:
+        return self.objects_dir / f"{sha1}.gz"
+
+    def _store_object(self, content: bytes) -> str:
+        sha1 = hashlib.sha1(content).hexdigest()
+        path = self._object_path(sha1)
+        if not path.exists():
+            _atomic_write(path, gzip.compress(content, compresslevel=6))
+        return sha1
+
+    # =========================================================================
+    # BACKUP
+    # =========================================================================
+
+    def backup(self, source_path: Path, timestamp: Optional[datetime] = None, force: bool = False) -> Optional[Dict]:
+        """
+        Sauvegarde le contenu actuel d'un fichier.
+
+        Args:
+            source_path: Fichier à sauvegarder
+            timestamp: Date du backup (défaut: maintenant)
+            force: Si True, ignore min_interval (le contenu identique reste ignoré)
+
+        Returns:
+            Entrée d'index créée, None si le backup a été ignoré
+        """
+        source_path = Path(source_path)
+        if not source_path.exists():
+            return None
+
+        timestamp = timestamp or datetime.now()
+        filename = source_path.name
+        with file_lock(self.index_path):
+            index = self._load_index()
+            entries = index.setdefault(filename, [])
+
+            content = source_path.read_bytes()
+            sha1 = hashlib.sha1(content).hexdigest()
+
+            if entries:
+                last = entries[-1]
+                if last["sha1"] == sha1:
+                    logger.debug(f"Backup skipped for {filename}: content unchanged")
+                    return None
+                elapsed = (timestamp - datetime.fromisoformat(last["timestamp"])).total_seconds()
+                if not force and 0 <= elapsed < self.min_interval:
+                    logger.debug(f"Backup skipped for {filename}: last backup {elapsed:.0f}s ago")
+                    return None
+
+            self._store_object(content)
+            entry = {
+                "id": timestamp.strftime("%Y%m%d_%H%M%S_%f"),
+                "timestamp": timestamp.isoformat(),
+                "sha1": sha1,
+                "bytes": len(content)
+            }
+            entries.append(entry)
+            entries.sort(key=lambda e: e["timestamp"])
+
+            self._apply_retention(index)
+            self._save_index(index)
+            logger.debug(f"Backup created: {filename} ({entry['id']})")
+            return entry
+
+    def _retained(self, entries: List[Dict]) -> List[Dict]:
+        """Entrées conservées: keep_last derniers + le dernier de chaque jour récent"""
+        keep = {id(e) for e in entries[-self.keep_last:]} if self.keep_last > 0 else set()
+
+        days = {}
+        for entry in entries:
+            days[entry["timestamp"][:10]] = entry  # entrées triées: le dernier du jour gagne
+        for day in sorted(days)[-self.keep_daily:] if self.keep_daily > 0 else []:
+            keep.add(id(days[day]))
+
+        return [e for e in entries if id(e) in keep]
+
+    def _apply_retention(self, index: Dict[str, List[Dict]]):
+        for filename in list(index):
+            index[filename] = self._retained(index[filename])
+            if not index[filename]:
+                del index[filename]
+        self._collect_garbage(index)
+
+    def _collect_garbage(self, index: Dict[str, List[Dict]]):
+        """Supprime les objets qui ne sont plus référencés par l'index"""
+        if not self.objects_dir.exists():
+            return
+        referenced = {e["sha1"] for entries in index.values() for e in entries}
+        for path in self.objects_dir.glob("*.gz"):
+            if path.stem not in referenced:
+                path.unlink()
+
+    # =========================================================================
+    # LIST & RESTORE
+    # =========================================================================
+
+    def list_backups(self, filename: Optional[str] = None) -> List[Dict]:
+        """
+        Liste les backups (plus récent en premier).
+
+        Args:
+            filename: Filtrer sur un fichier (ex: "teams.json")
+
+        Returns:
+            [{"filename", "id", "timestamp", "sha1", "bytes"}, ...]
+        """
+        index = self._load_index()
+        backups = [
+            {"filename": name, **entry}
+            for name, entries in index.items()
+            if filename is None or name == filename
+            for entry in entries
+        ]
+        return sorted(backups, key=lambda b: b["timestamp"], reverse=True)
+
+    def read_backup(self, filename: str, backup_id: Optional[str] = None) -> Optional[bytes]:
+        """
+        Contenu d'un backup.
+
+        Args:
+            filename: Nom du fichier sauvegardé
+            backup_id: Identifiant du backup (défaut: le plus récent)
+
+        Returns:
+            Contenu décompressé ou None si introuvable
+        """
+        entries = self._load_index().get(filename, [])
+        if backup_id is not None:
+            entries = [e for e in entries if e["id"] == backup_id]
+        if not entries:
+            return None
+
+        path = self._object_path(entries[-1]["sha1"])
+        if not path.exists():
+            logger.error(f"Backup object missing: {path.name}")
+            return None
+        return gzip.decompress(path.read_bytes())
+
+    def restore(self, target_path: Path, backup_id: Optional[str] = None) -> bool:
+        """
+        Restaure un fichier depuis un backup (l'état actuel est sauvegardé avant).
+
+        Args:
+            target_path: Fichier à restaurer
+            backup_id: Identifiant du backup (défaut: le plus récent)
+
+        Returns:
+            True si le fichier a été restauré
+        """
+        target_path = Path(target_path)
+        content = self.read_backup(target_path.name, backup_id)
+        if content is None:
+            logger.warning(f"No backup found for {target_path.name} ({backup_id or 'latest'})")
+            return False
+
+        self.backup(target_path, force=True)
+        _atomic_write(target_path, content)
+        logger.info(f"Restored {target_path.name} from backup {backup_id or 'latest'}")
+        return True
+
+    # =========================================================================
+    # COMPACTION
+    # =========================================================================
+
+    def compact(self, legacy_dir: Path) -> Dict[str, int]:
+        """
+        Importe les anciens backups <file>.backup_<timestamp> puis les supprime.
+
+        Args:
+            legacy_dir: Dossier contenant les anciens backups
+
+        Returns:
+            {"imported": n, "deduplicated": n, "kept": n, "removed": n,
+             "bytes_before": n, "bytes_after": n}
+        """
+        legacy = []
+        for path in Path(legacy_dir).iterdir():
+            match = LEGACY_BACKUP_PATTERN.match(path.name)
+            if path.is_file() and match:
+                stamp = datetime.strptime(match.group("stamp"), "%Y%m%d_%H%M%S")
+                legacy.append((match.group("filename"), stamp, path))
+
+        stats = {"imported": 0, "deduplicated": 0, "kept": 0, "removed": 0, "bytes_before": 0, "bytes_after": 0}
+        if not legacy:
+            return stats
+
+        with file_lock(self.index_path):
+            index = self._load_index()
+            for filename, stamp, path in sorted(legacy, key=lambda item: item[1]):
+                content = path.read_bytes()
+                stats["bytes_before"] += len(content)
+                sha1 = hashlib.sha1(content).hexdigest()
+
+                entries = index.setdefault(filename, [])
+                if any(e["sha1"] == sha1 for e in entries):
+                    stats["deduplicated"] += 1
+                else:
+                    self._store_object(content)
+                    entries.append({
+                        "id": stamp.strftime("%Y%m%d_%H%M%S_%f"),
+                        "timestamp": stamp.isoformat(),
+                        "sha1": sha1,
+                        "bytes": len(content)
+                    })
+                    entries.sort(key=lambda e: e["timestamp"])
+                    stats["imported"] += 1
+
+            self._apply_retention(index)
+            self._save_index(index)
+            stats["kept"] = sum(len(entries) for entries in index.values())
+
+        for _, _, path in legacy:
+            path.unlink()
+            stats["removed"] += 1
+
+        stats["bytes_after"] = sum(p.stat().st_size for p in self.objects_dir.glob("*.gz"))
+        logger.info(f"Backups compacted in {self.backup_dir}: {stats}")
+        return stats
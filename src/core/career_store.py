@@ -0,0 +1,255 @@
+"""
+Career Store
+Carrières des joueurs sur toutes les éditions, agrégées depuis les stats
+par édition (general_stats.json player_stats + teams_with_puuid.json), sans
+relire les matchs.
+
+data/editions/careers.json
+{
+    "version": 1,
+    "editions": {
+        "7": {
+            "files": {"general_stats.json": 1730000000000000000, ...},  # mtime_ns
+            "accounts": {"<puuid ou name:Foo#EUW>": "<puuid principal>"},  # oldAccounts
+            "players": {
+                "<puuid>": {
+                    "name": "Foo#EUW", "team": "KCDQ", "role": "MID",
+                    "games": 12, "wins": 7,
+                    "totals": {"kills": ..., "deaths": ..., "assists": ..., "cs": ..., ...},
+                    "champions": {"Ahri": {"games", "wins", "kills", "deaths", "assists"}}
+                }
+            }
+        }
+    }
+}
+
+Une édition n'est relue que si les mtimes de ses fichiers ont changé (voir
+edition_cache.py); les carrières sont ensuite sommées en
+mémoire depuis ces splits par édition.
+
+Un joueur est identifié par le PUUID de son compte au roster. Les comptes
+listés dans oldAccounts (PUUID si présent, sinon Riot ID) sont rattachés au
+compte principal, y compris d'une édition à l'autre.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.core.edition_cache import EditionCache
+
+logger = logging.getLogger(__name__)
+
+CAREERS_VERSION = 1
+
+# Fichiers dont dépendent les splits d'une édition
+TRACKED_FILES = [
+    "general_stats.json",
+    "teams_with_puuid.json",
+    "edition.bundle"
+]
+
+# Totaux repris de player_stats (clé career → clé general_stats)
+TOTAL_FIELDS = {
+    "kills": "total_kills",
+    "deaths": "total_deaths",
+    "assists": "total_assists",
+    "cs": "total_cs",
+    "vision": "total_vision_score",
+    "gold": "total_gold_earned",
+    "damage": "total_damage_dealt",
+    "damage_taken": "total_damage_taken",
+    "duration": "total_game_duration"
+}
+
+CHAMPION_FIELDS = ("games", "wins", "kills", "deaths", "assists")
+
+
+def _account_key(account: Dict) -> Optional[str]:
+    """Clé d'un compte: PUUID, sinon Riot ID préfixé par "name:" """
+    if account.get("puuid"):
+        return account["puuid"]
+    if account.get("gameName"):
+        return f"name:{account['gameName']}#{account.get('tagLine', '')}"
+    return None
+
+
+def build_edition_splits(general_stats: Dict, teams_with_puuid: Dict) -> Dict:
+    """
+    Splits d'une édition: une entrée par joueur du roster ayant joué.
+
+    Returns:
+        {"accounts": {clé compte: puuid principal}, "players": {puuid: split}}
+    """
+    roster = {}
+    accounts = {}
+    for team_name, team_data in teams_with_puuid.items():
+        for player in team_data.get("players", []):
+            puuid = player.get("puuid")
+            if not puuid:
+                continue
+            name = f"{player.get('gameName', 'Unknown')}#{player.get('tagLine', '0000')}"
+            roster[name] = (puuid, team_name, (player.get("role") or "").upper())
+            for old in player.get("oldAccounts", []) or []:
+                key = _account_key(old)
+                if key and key != puuid:
+                    accounts[key] = puuid
+                if old.get("gameName"):
+                    # Stats calculées sous l'ancien Riot ID (clé de player_stats)
+                    roster.setdefault(f"{old['gameName']}#{old.get('tagLine', '')}", (puuid, team_name, ""))
+
+    players: Dict[str, Dict] = {}
+    for name, stats in (general_stats.get("player_stats") or {}).items():
+        if name not in roster or not stats.get("games_played"):
+            continue
+        puuid, team_name, role = roster[name]
+        split = players.get(puuid)
+        if split is None:
+            split = players[puuid] = {
+                "name": name, "team": team_name, "role": role,
+                "games": 0, "wins": 0,
+                "totals": {field: 0 for field in TOTAL_FIELDS},
+                "champions": {}
+            }
+        elif role:
+            # Compte principal prioritaire sur les anciens comptes
+            split.update(name=name, role=role)
+
+        split["games"] += stats.get("games_played", 0)
+        split["wins"] += stats.get("wins", 0)
+        for field, source in TOTAL_FIELDS.items():
+            split["totals"][field] += stats.get(source, 0) or 0
+        for champion, champ_stats in (stats.get("champion_stats") or {}).items():
+            target = split["champions"].setdefault(champion, {field: 0 for field in CHAMPION_FIELDS})
+            for field in CHAMPION_FIELDS:
+                target[field] += champ_stats.get(field, 0)
+
+    return {"accounts": accounts, "players": players}
+
+
+def _summarize(career: Dict) -> Dict:
+    """Ajoute les moyennes d'une carrière (mêmes formules que StatsCalculator)"""
+    games = career["games"]
+    totals = career["totals"]
+    minutes = totals["duration"] / 60
+    career.update({
+        "losses": games - career["wins"],
+        "winrate": round(career["wins"] / games * 100, 2) if games else 0,
+        "average_kills": round(totals["kills"] / games, 2) if games else 0,
+        "average_deaths": round(totals["deaths"] / games, 2) if games else 0,
+        "average_assists": round(totals["assists"] / games, 2) if games else 0,
+        "average_kda": round((totals["kills"] + totals["assists"]) / max(1, totals["deaths"]), 2),
+        "average_cs_per_min": round(totals["cs"] / minutes, 2) if minutes else 0,
+        "average_vision_score": round(totals["vision"] / games, 2) if games else 0,
+        "average_damage_per_min": round(totals["damage"] / minutes, 0) if minutes else 0,
+        "champion_pool": sorted(career["champions"], key=lambda c: -career["champions"][c]["games"]),
+        "unique_champions_played": len(career["champions"])
+    })
+    return career
+
+
+class CareerStore:
+    """
+    Splits par édition (EditionCache, validé par mtimes) et agrégation des
+    carrières (mémoïsée en mémoire).
+    """
+
+    def __init__(self, base_path: Path):
+        """
+        Args:
+            base_path: Dossier des éditions (ex: data/editions)
+        """
+        self.cache = EditionCache(
+            Path(base_path) / "careers.json", CAREERS_VERSION, TRACKED_FILES,
+            lambda manager: build_edition_splits(manager.load_general_stats(), manager.load_teams_with_puuid())
+        )
+        self._careers: Dict[Tuple, Dict[str, Dict]] = {}
+
+    @property
+    def path(self) -> Path:
+        return self.cache.path
+
+    def refresh(self, managers: Iterable) -> Dict[str, Dict]:
+        """Splits à jour {numéro (str): entrée} des éditions données"""
+        return self.cache.refresh(managers)
+
+    # =========================================================================
+    # CARRIÈRES
+    # =========================================================================
+
+    def careers(self, managers: Iterable) -> Dict[str, Dict]:
+        """
+        Carrières {puuid principal: carrière} sur les éditions données.
+
+        Une carrière: name (Riot ID le plus récent), names, teams, editions,
+        accounts (PUUID vus au roster), games, wins, totals, champions ({champion: stats}), splits ({édition:
+        split}) et les moyennes (average_kda, winrate, champion_pool, ...).
+        Résultat mémoïsé tant qu'aucune édition n'a changé.
+        """
+        editions = self.refresh(managers)
+        memo_key = (self.cache.cache_key, tuple(sorted(editions, key=int)))
+        cached = self._careers.get(memo_key)
+        if cached is not None:
+            return cached
+
+        # Anciens comptes déclarés dans n'importe quelle édition
+        accounts = {}
+        for entry in editions.values():
+            accounts.update(entry.get("accounts", {}))
+
+        def resolve(puuid: str, name: str) -> str:
+            key = accounts.get(puuid) or accounts.get(f"name:{name}") or puuid
+            for _ in range(10):  # Chaînes de comptes successifs
+                if key not in accounts or accounts[key] == key:
+                    break
+                key = accounts[key]
+            return key
+
+        careers: Dict[str, Dict] = {}
+        for edition in sorted(editions, key=int):
+            for puuid, split in editions[edition]["players"].items():
+                key = resolve(puuid, split["name"])
+                career = careers.get(key)
+                if career is None:
+                    career = careers[key] = {
+                        "puuid": key, "name": split["name"], "names": [], "teams": [], "editions": [], "accounts": [],
+                        "games": 0, "wins": 0,
+                        "totals": {field: 0 for field in TOTAL_FIELDS},
+                        "champions": {}, "splits": {}
+                    }
+                career["name"] = split["name"]  # Éditions triées: la plus récente l'emporte
+                for field, value in (("names", split["name"]), ("teams", split["team"]),
+                                     ("editions", int(edition)), ("accounts", puuid)):
+                    if value not in career[field]:
+                        career[field].append(value)
+                career["games"] += split["games"]
+                career["wins"] += split["wins"]
+                for field, value in split["totals"].items():
+                    career["totals"][field] += value
+                for champion, champ_stats in split["champions"].items():
+                    target = career["champions"].setdefault(champion, {field: 0 for field in CHAMPION_FIELDS})
+                    for field in CHAMPION_FIELDS:
+                        target[field] += champ_stats[field]
+                career["splits"][edition] = split
+
+        careers = {key: _summarize(career) for key, career in careers.items()}
+        self._careers = {memo_key: careers}
+        return careers
+
+    def leaderboard(self, managers: Iterable, sort_by: str = "average_kda",
+                    min_games: int = 0, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Classement all-time (carrières sans splits ni détail des champions).
+
+        Args:
+            sort_by: Clé de tri décroissant (ex: "games", "winrate", "average_kda")
+            min_games: Nombre minimum de parties
+            limit: Nombre de joueurs retournés
+        """
+        rows = [
+            {key: value for key, value in career.items() if key not in ("splits", "champions")}
+            for career in self.careers(managers).values()
+            if career["games"] >= min_games
+        ]
+        rows.sort(key=lambda row: row.get(sort_by, 0), reverse=True)
+        return rows[:limit] if limit is not None else rows
@@ -0,0 +1,172 @@
+"""
+Champion Meta
+Matrice champion × édition (picks, bans, wins, KDA, KP) pour suivre
+l'évolution de la méta d'une édition à l'autre.
+
+Par édition, calculée une fois puis mise en cache dans
+data/editions/champion_meta.json (voir edition_cache.py):
+- picks / bans / wins: general_stats.json champion_stats
+- kda / kp (moyennes par partie): matrice des participants
+  (participant_matrix.py), générée par l'étape 6 du pipeline; construite
+  une seule fois (sous verrou) si elle manque, voir
+  EditionDataManager.ensure_participant_matrix()
+
+{
+    "version": 2,
+    "editions": {
+        "7": {
+            "files": {...},
+            "matches": 97,
+            "champions": {"Ahri": {"picks": 10, "bans": 3, "wins": 6, "kda": 3.1, "kp": 61.2}}
+        }
+    }
+}
+
+Aucune page n'a donc besoin de charger match_details.json de plusieurs
+éditions: seule une édition modifiée est relue.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.core.edition_cache import EditionCache
+
+logger = logging.getLogger(__name__)
+
+META_VERSION = 2  # 2: kda/kp des éditions sans matrice (matrice construite à la demande)
+
+TRACKED_FILES = [
+    "general_stats.json",
+    "edition.bundle",
+    "participants/dictionaries.json"  # Écrit en dernier par ParticipantMatrixBuilder.save
+]
+
+COUNT_FIELDS = ("picks", "bans", "wins")
+
+# Champs d'une ligne de tendance (voir ChampionMetaStore.trends)
+TREND_FIELDS = ("picks", "bans", "wins", "winrate", "pickrate", "banrate", "presence", "kda", "kp")
+
+
+def build_edition_meta(manager) -> Dict:
+    """
+    Stats champions d'une édition.
+
+    Args:
+        manager: EditionDataManager
+
+    Returns:
+        {"matches": nombre de matchs, "champions": {champion: {"picks", "bans", "wins", "kda", "kp"}}}
+        (kda/kp à None si l'édition n'a pas de match_details)
+    """
+    general_stats = manager.load_general_stats()
+    champion_stats = general_stats.get("champion_stats") or {}
+
+    champions: Dict[str, Dict] = {}
+    for field in COUNT_FIELDS:
+        for champion, value in (champion_stats.get(field) or {}).items():
+            entry = champions.setdefault(champion, {"picks": 0, "bans": 0, "wins": 0, "kda": None, "kp": None})
+            entry[field] = value
+
+    matrix = manager.ensure_participant_matrix()
+    if matrix is not None:
+        try:
+            matrix = matrix.load()
+        except ValueError as e:
+            logger.warning(f"Edition {manager.edition_number}: {e}")
+            matrix = None
+        if matrix is not None and len(matrix):
+            for row in matrix.aggregate(matrix.mask(), by="champion"):
+                entry = champions.setdefault(row["champion"], {"picks": row["games"], "bans": 0,
+                                                               "wins": row["wins"], "kda": None, "kp": None})
+                entry["kda"] = row["game_kda"]
+                entry["kp"] = row["kp"]
+
+    matches = (general_stats.get("metadata") or {}).get("total_matches_processed")
+    if not matches:
+        # Anciennes stats sans metadata: 10 picks par partie
+        matches = round(sum(entry["picks"] for entry in champions.values()) / 10)
+
+    return {"matches": matches, "champions": champions}
+
+
+class ChampionMetaStore:
+    """
+    Stats champions par édition (EditionCache, validé par mtimes) et
+    tableaux de tendance multi-éditions.
+    """
+
+    def __init__(self, base_path: Path):
+        """
+        Args:
+            base_path: Dossier des éditions (ex: data/editions)
+        """
+        self.cache = EditionCache(Path(base_path) / "champion_meta.json", META_VERSION, TRACKED_FILES,
+                                  build_edition_meta)
+        self._trends: Dict[Tuple, List[Dict]] = {}
+
+    @property
+    def path(self) -> Path:
+        return self.cache.path
+
+    def refresh(self, managers: Iterable) -> Dict[str, Dict]:
+        """Entrées à jour {numéro (str): {"matches", "champions"}} des éditions données"""
+        return self.cache.refresh(managers)
+
+    def trends(self, managers: Iterable) -> List[Dict]:
+        """
+        Lignes (champion, édition), triées par champion puis édition:
+        {"champion", "edition", "matches", "picks", "bans", "wins", "winrate",
+         "pickrate", "banrate", "presence" (% des matchs), "kda", "kp"}
+
+        Résultat mémoïsé tant qu'aucune édition n'a changé.
+        """
+        editions = self.refresh(managers)
+        memo_key = (self.cache.cache_key, tuple(sorted(editions, key=int)))
+        cached = self._trends.get(memo_key)
+        if cached is not None:
+            return cached
+
+        rows = []
+        for edition in sorted(editions, key=int):
+            matches = editions[edition]["matches"]
+            for champion, stats in editions[edition]["champions"].items():
+                picks, bans = stats["picks"], stats["bans"]
+                rows.append({
+                    "champion": champion,
+                    "edition": int(edition),
+                    "matches": matches,
+                    "picks": picks,
+                    "bans": bans,
+                    "wins": stats["wins"],
+                    "winrate": round(stats["wins"] / picks * 100, 2) if picks else None,
+                    "pickrate": round(picks / matches * 100, 2) if matches else None,
+                    "banrate": round(bans / matches * 100, 2) if matches else None,
+                    "presence": round((picks + bans) / matches * 100, 2) if matches else None,
+                    "kda": stats["kda"],
+                    "kp": stats["kp"]
+                })
+        rows.sort(key=lambda row: (row["champion"], row["edition"]))
+
+        self._trends = {memo_key: rows}
+        return rows
+
+    def matrix(self, managers: Iterable, field: str = "presence",
+               champions: Optional[List[str]] = None) -> Dict[str, Dict[int, Optional[float]]]:
+        """
+        Matrice {champion: {édition: valeur}} d'un champ de TREND_FIELDS.
+
+        Args:
+            field: Champ à pivoter (ex: "picks", "winrate", "presence")
+            champions: Restreindre à ces champions (tous par défaut)
+        """
+        if field not in TREND_FIELDS:
+            raise ValueError(f"Unknown trend field: {field}")
+
+        wanted = set(champions) if champions is not None else None
+        result: Dict[str, Dict[int, Optional[float]]] = {}
+        for row in self.trends(managers):
+            if wanted is not None and row["champion"] not in wanted:
+                continue
+            result.setdefault(row["champion"], {})[row["edition"]] = row[field]
+        return result
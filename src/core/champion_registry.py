@@ -0,0 +1,161 @@
+"""
+Champion Registry
+Référentiel des champions (id ↔ clé Data Dragon ↔ nom d'affichage) chargé
+depuis un snapshot local versionné de champion.json.
+
+Snapshot:
+data/ddragon/<version>/champion.json   # Format Data Dragon (id, key, name)
+
+Mise à jour: scripts/update_champion_snapshot.py
+"""
+
+import json
+import logging
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DDRAGON_VERSION = "15.20.1"
+SNAPSHOT_DIR = Path(__file__).parent.parent.parent / "data" / "ddragon"
+
+# Libellés historiques de general_stats.json (clé Data Dragon sinon)
+LEGACY_STATS_NAMES = {
+    "MonkeyKing": "Wukong"
+}
+
+
+class Champion(NamedTuple):
+    """Un champion du référentiel"""
+    id: int       # championId Riot (ex: 62)
+    key: str      # Clé Data Dragon / championName Match-V5 (ex: "MonkeyKing")
+    name: str     # Nom d'affichage (ex: "Wukong")
+
+
+def _fold(value: str) -> str:
+    """Forme canonique pour la recherche: minuscules, alphanumérique uniquement"""
+    return "".join(c for c in value.lower() if c.isalnum())
+
+
+class ChampionRegistry:
+    """
+    Lookups O(1) entre championId, clé Data Dragon et nom d'affichage.
+
+    Toutes les variantes connues d'un nom ("MonkeyKing", "Wukong", "Kai'Sa",
+    "Kaisa", "Nunu & Willump", ...) sont indexées une seule fois au chargement.
+    Les champions plus récents que le snapshot peuvent être appris à la volée
+    depuis les payloads Match-V5 (register).
+    """
+
+    def __init__(self, version: str = DDRAGON_VERSION, snapshot_dir: Path = SNAPSHOT_DIR):
+        """
+        Args:
+            version: Version Data Dragon du snapshot
+            snapshot_dir: Dossier contenant <version>/champion.json
+        """
+        self.version = version
+        self.snapshot_path = Path(snapshot_dir) / version / "champion.json"
+
+        self.by_id: Dict[int, Champion] = {}
+        self.by_key: Dict[str, Champion] = {}
+        self._aliases: Dict[str, Champion] = {}
+        self._lock = threading.Lock()
+
+        self._load_snapshot()
+
+    def _load_snapshot(self):
+        if not self.snapshot_path.exists():
+            logger.warning(f"Champion snapshot not found: {self.snapshot_path}")
+            return
+
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading champion snapshot {self.snapshot_path}: {e}")
+            return
+
+        for entry in snapshot.get("data", {}).values():
+            self._add(Champion(int(entry["key"]), entry["id"], entry.get("name", entry["id"])))
+
+        logger.debug(f"Champion registry loaded: {len(self.by_id)} champions ({self.version})")
+
+    def _add(self, champion: Champion):
+        self.by_id[champion.id] = champion
+        self.by_key[champion.key] = champion
+        for alias in (champion.key, champion.name, LEGACY_STATS_NAMES.get(champion.key, champion.key)):
+            self._aliases[_fold(alias)] = champion
+
+    # =========================================================================
+    # LOOKUPS
+    # =========================================================================
+
+    def get(self, value: Union[int, str, None]) -> Optional[Champion]:
+        """
+        Résout un champion depuis n'importe quelle représentation.
+
+        Args:
+            value: championId (62 ou "62"), clé ("MonkeyKing") ou nom ("Wukong")
+
+        Returns:
+            Champion ou None si inconnu
+        """
+        if value is None:
+            return None
+        if isinstance(value, int):
+            return self.by_id.get(value)
+        if value in self.by_key:
+            return self.by_key[value]
+        if value.isdigit():
+            return self.by_id.get(int(value))
+        return self._aliases.get(_fold(value))
+
+    def key(self, value: Union[int, str, None], default: Optional[str] = None) -> Optional[str]:
+        """Clé Data Dragon (icônes, championName) d'un champion"""
+        champion = self.get(value)
+        if champion:
+            return champion.key
+        return default if default is not None else value
+
+    def display_name(self, value: Union[int, str, None]) -> Optional[str]:
+        """Nom d'affichage d'un champion ("Kai'Sa", "Wukong", ...)"""
+        champion = self.get(value)
+        return champion.name if champion else value
+
+    def stats_name(self, value: Union[int, str, None]) -> Optional[str]:
+        """
+        Libellé utilisé comme clé dans general_stats.json.
+
+        Clé Data Dragon, sauf les libellés historiques (MonkeyKing → Wukong)
+        pour rester compatible avec les stats déjà calculées.
+        """
+        champion = self.get(value)
+        if not champion:
+            return None
+        return LEGACY_STATS_NAMES.get(champion.key, champion.key)
+
+    # =========================================================================
+    # LEARNING
+    # =========================================================================
+
+    def register(self, champion_id: Optional[int], champion_key: Optional[str]):
+        """
+        Ajoute un champion absent du snapshot (ex: sorti après la version locale).
+
+        Appelé avec le couple (championId, championName) des participants
+        Match-V5 pour que les bans de ce champion soient résolus ensuite.
+        """
+        if not champion_id or champion_id < 0 or not champion_key or champion_id in self.by_id:
+            return
+        with self._lock:
+            if champion_id not in self.by_id:
+                self._add(Champion(champion_id, champion_key, champion_key))
+                logger.info(f"Champion {champion_key} ({champion_id}) not in snapshot {self.version}, registered")
+
+
+@lru_cache(maxsize=4)
+def get_champion_registry(version: str = DDRAGON_VERSION) -> ChampionRegistry:
+    """Registry partagé par process (un seul chargement du snapshot par version)"""
+    return ChampionRegistry(version)
@@ -8,17 +8,44 @@ data/editions/edition_X/
 ├── teams.json               # Équipes avec OP.GG links
 ├── teams_with_puuid.json    # + PUUID, elo
 ├── tournament_matches.json  # {team: [match_ids]}
-├── match_details.json       # {match_id: full_data}
-└── general_stats.json       # Stats agrégées
+├── match_details.json       # {match_id: data} (projection, lisible en streaming)
+├── match_details.log(.idx)  # Matchs ajoutés depuis la dernière compaction (match_store.py)
+├── timelines/               # Frames or/xp/cs par match en .npz (timeline_store.py)
+├── participants/            # Matrice (match, participant) en .npy memmap (participant_matrix.py)
+├── rank_history.json        # Changements de rang SoloQ par joueur, en deltas (rank_history.py)
+├── general_stats.json       # Stats agrégées
+├── team_stats.json          # Vue par équipe (dérivable de general_stats)
+└── backups/                 # Backups gzip dédupliqués (voir backup_store.py)
+
+Index des éditions: data/editions/catalog.json (config + compteurs de chaque
+édition, validé par mtimes), voir src/core/edition_catalog.py.
+
+Carrières multi-éditions: data/editions/careers.json (splits par joueur et
+par édition, validés par mtimes), voir src/core/career_store.py.
+Méta des champions: data/editions/champion_meta.json, voir src/core/champion_meta.py.
+
+Format bundle optionnel (pack_bundle): un seul fichier edition.bundle avec
+un en-tête (config + résumé + index des sections) et une section par
+fichier JSON, chargée à la demande. Voir src/core/edition_bundle.py.
 """
 
+import io
 import os
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
 
+from src.core.backup_store import BackupStore
+from src.core.career_store import CareerStore
+from src.core.champion_meta import ChampionMetaStore
+from src.core.edition_bundle import EditionBundle
+from src.core.edition_catalog import EditionCatalog
+from src.core.file_lock import file_lock
+from src.core.match_store import MatchLog, iter_json_object
+from src.core.stats_calculator import build_team_stats
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,7 +57,7 @@ class EditionDataManager:
     - Création/lecture/écriture des fichiers JSON
     - Validation des schémas
     - Auto-création de la structure de dossiers
-    - Backups automatiques
+    - Backups automatiques (dédupliqués, compressés, rétention limitée)
     """
     
     # Structure des fichiers par édition
@@ -40,9 +67,15 @@ class EditionDataManager:
         "teams_with_puuid.json",
         "tournament_matches.json",
         "match_details.json",
-        "general_stats.json"
+        "general_stats.json",
+        "team_stats.json"
     ]
     
+    BUNDLE_FILE = "edition.bundle"
+    
+    # Nombre de matchs dans le log au-delà duquel add_match_detail compacte
+    MATCH_LOG_COMPACT_THRESHOLD = 200
+    
     def __init__(self, edition_number: int, base_path: str = "data/editions"):
         """
         Initialise le gestionnaire pour une édition.
@@ -54,6 +87,10 @@ class EditionDataManager:
         self.edition_number = edition_number
         self.base_path = Path(base_path)
         self.edition_path = self.base_path / f"edition_{edition_number}"
+        self.bundle = EditionBundle(self.edition_path / self.BUNDLE_FILE)
+        self.backups = BackupStore(self.edition_path / "backups")
+        self.match_log = MatchLog(self.edition_path)
+        self.catalog = EditionCatalog(self.base_path)
         
         # Créer la structure si nécessaire
         self._ensure_edition_structure()
@@ -114,16 +151,43 @@ class EditionDataManager:
         logger.info(f"Edition {self.edition_number} initialized: {edition_name}")
     
     def exists(self) -> bool:
-        """Vérifie si l'édition existe (config.json présent)."""
-        return (self.edition_path / "config.json").exists()
+        """Vérifie si l'édition existe (config.json ou bundle présent)."""
+        return (self.edition_path / "config.json").exists() or self.is_bundled
+    
+    @property
+    def is_bundled(self) -> bool:
+        """True si l'édition est stockée au format bundle (edition.bundle)."""
+        return self.bundle.exists()
+    
+    def data_version(self, filename: str) -> Optional[float]:
+        """
+        Version (mtime) du stockage d'un fichier, pour les clés de cache.
+        
+        Args:
+            filename: Nom du fichier (ex: "match_details.json")
+        
+        Returns:
+            mtime du fichier ou du bundle, None si absent
+        """
+        path = self.bundle.path if self.is_bundled else self.edition_path / filename
+        paths = [path]
+        if filename == "match_details.json":
+            paths.append(self.match_log.log_path)
+        mtimes = [p.stat().st_mtime for p in paths if p.exists()]
+        return max(mtimes) if mtimes else None
     
     # =========================================================================
     # GENERIC FILE OPERATIONS
     # =========================================================================
     
+    @staticmethod
+    def _section_name(filename: str) -> str:
+        """Nom de section bundle d'un fichier ("teams.json" → "teams")"""
+        return Path(filename).stem
+    
     def _read_json(self, filename: str) -> Optional[Dict]:
         """
-        Lit un fichier JSON de l'édition.
+        Lit un fichier JSON de l'édition (ou sa section en mode bundle).
         
         Args:
             filename: Nom du fichier (ex: "teams.json")
@@ -131,6 +195,14 @@ class EditionDataManager:
         Returns:
             Contenu du fichier ou None si inexistant
         """
+        if self.is_bundled:
+            if filename == "config.json":
+                return self.bundle.read_header().get("config")
+            return self.bundle.read_section(self._section_name(filename))
+        return self._read_json_file(filename)
+    
+    def _read_json_file(self, filename: str) -> Optional[Dict]:
+        """Lit un fichier JSON du dossier de l'édition (hors bundle)."""
         file_path = self.edition_path / filename
         
         if not file_path.exists():
@@ -151,13 +223,38 @@ class EditionDataManager:
     
     def _write_json(self, filename: str, data: Dict, backup: bool = True):
         """
-        Écrit un fichier JSON de l'édition.
+        Écrit un fichier JSON de l'édition (ou sa section en mode bundle).
         
         Args:
             filename: Nom du fichier (ex: "teams.json")
             data: Données à écrire
             backup: Si True, crée un backup avant d'écraser
         """
+        name = self._section_name(filename)
+        counts = self._summary_fields({name: data})
+        
+        if self.is_bundled:
+            if backup:
+                self._backup_file(self.BUNDLE_FILE)
+            if filename == "config.json":
+                self.bundle.write(config=data)
+            else:
+                self.bundle.write({name: data}, summary=counts)
+            logger.debug(f"Saved {filename} in {self.BUNDLE_FILE}")
+            written_path = self.bundle.path
+        else:
+            self._write_json_file(filename, data, backup)
+            written_path = self.edition_path / filename
+        
+        self.catalog.record_write(
+            self.edition_number,
+            written_path,
+            config=data if filename == "config.json" else None,
+            counts=counts
+        )
+    
+    def _write_json_file(self, filename: str, data: Dict, backup: bool = True):
+        """Écrit un fichier JSON dans le dossier de l'édition (hors bundle)."""
         file_path = self.edition_path / filename
         
         # Backup si le fichier existe déjà
@@ -172,23 +269,52 @@ class EditionDataManager:
             logger.error(f"Error writing {filename}: {e}")
             raise
     
-    def _backup_file(self, filename: str):
-        """Crée un backup d'un fichier avec timestamp."""
+    def _backup_file(self, filename: str, force: bool = False):
+        """
+        Crée un backup d'un fichier dans backups/.
+        
+        Ignoré si le contenu est identique au dernier backup ou (sauf force)
+        si le fichier a déjà été sauvegardé il y a moins de min_interval secondes.
+        """
         file_path = self.edition_path / filename
         
         if not file_path.exists():
             return
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = self.edition_path / f"{filename}.backup_{timestamp}"
-        
         try:
-            import shutil
-            shutil.copy2(file_path, backup_path)
-            logger.debug(f"Backup created: {backup_path.name}")
+            self.backups.backup(file_path, force=force)
         except Exception as e:
             logger.warning(f"Failed to create backup: {e}")
     
+    def list_backups(self, filename: Optional[str] = None) -> List[Dict]:
+        """
+        Liste les backups de l'édition (plus récent en premier).
+        
+        Args:
+            filename: Filtrer sur un fichier (ex: "teams.json")
+        """
+        return self.backups.list_backups(filename)
+    
+    def restore_backup(self, filename: str, backup_id: Optional[str] = None) -> bool:
+        """
+        Restaure un fichier depuis un backup (l'état actuel est sauvegardé avant).
+        
+        Args:
+            filename: Nom du fichier (ex: "teams.json", "edition.bundle")
+            backup_id: Identifiant du backup (défaut: le plus récent)
+        
+        Returns:
+            True si restauré
+        """
+        return self.backups.restore(self.edition_path / filename, backup_id)
+    
+    def compact_backups(self) -> Dict[str, int]:
+        """
+        Migre les anciens backups <file>.backup_<timestamp> vers backups/
+        (dédupliqués, compressés) et applique la rétention.
+        """
+        return self.backups.compact(self.edition_path)
+    
     # =========================================================================
     # CONFIG.JSON
     # =========================================================================
@@ -205,7 +331,8 @@ class EditionDataManager:
                 "start_date": "2024-01-15",
                 "end_date": "2024-03-20",
                 "created_at": "2024-01-10T12:00:00",
-                "status": "pending"
+                "status": "pending",
+                "platform": "euw1"       # optionnel: platform par défaut des joueurs
             }
         """
         return self._read_json("config.json")
@@ -355,7 +482,7 @@ class EditionDataManager:
     
     def load_match_details(self) -> Dict[str, Dict]:
         """
-        Charge les détails de tous les matchs.
+        Charge les détails de tous les matchs (base compactée + log).
         
         Returns:
             {
@@ -366,29 +493,160 @@ class EditionDataManager:
                 ...
             }
         """
-        return self._read_json("match_details.json") or {}
+        details = self._read_json("match_details.json") or {}
+        details.update(self.match_log.items())
+        return details
+    
+    def iter_match_details(self) -> Iterator[Tuple[str, Dict]]:
+        """
+        Itère les matchs (base compactée puis log) sans charger la base en
+        entier: un seul match décodé à la fois.
+        
+        Même contenu et même ordre que load_match_details(): un match présent
+        dans le log est émis à sa place dans la base, avec sa version du log.
+        
+        Yields:
+            (match_id, match_data)
+        """
+        logged = set(self.match_log.ids())
+        replaced = set()
+        for match_id, match_data in self._iter_base_match_details():
+            if match_id in logged:
+                replaced.add(match_id)
+                match_data = self.match_log.get(match_id)
+            yield match_id, match_data
+        for match_id, match_data in self.match_log.items():
+            if match_id not in replaced:
+                yield match_id, match_data
+    
+    def _iter_base_match_details(self) -> Iterator[Tuple[str, Dict]]:
+        """Entrées de match_details.json (ou de la section du bundle) en streaming."""
+        if self.is_bundled:
+            content = self.bundle.read_section_bytes("match_details")
+            if content is None:
+                return
+            f = io.TextIOWrapper(io.BytesIO(content), encoding='utf-8')
+        else:
+            file_path = self.edition_path / "match_details.json"
+            if not file_path.exists():
+                return
+            f = open(file_path, 'r', encoding='utf-8')
+        
+        with f:
+            try:
+                yield from iter_json_object(f)
+            except ValueError as e:
+                # Ne pas tronquer silencieusement: des stats partielles passeraient pour complètes
+                logger.error(f"Invalid JSON in match_details.json (edition {self.edition_number}): {e}")
+                raise
     
     def save_match_details(self, match_details: Dict):
-        """Sauvegarde les détails de matchs."""
-        self._write_json("match_details.json", match_details)
+        """
+        Sauvegarde les détails de matchs (remplace la base et vide le log).
+        
+        match_details doit être complet (ex: issu de load_match_details lu
+        sous self.match_log.locked(), comme compact_match_log).
+        """
+        with self.match_log.locked():
+            self._write_json("match_details.json", match_details)
+            self.match_log.clear()
     
     def add_match_detail(self, match_id: str, match_data: Dict):
         """
         Ajoute les détails d'un match.
         
+        Ajout en fin de log (I/O constant par match); le log est fusionné
+        dans match_details.json au-delà de MATCH_LOG_COMPACT_THRESHOLD
+        matchs ou via compact_match_log().
+        
         Args:
             match_id: ID du match
-            match_data: Données complètes du match (Match-V5)
+            match_data: Données du match (projection Match-V5, voir match_projection)
         """
-        details = self.load_match_details()
-        details[match_id] = match_data
-        self.save_match_details(details)
+        self.match_log.append(match_id, match_data)
         logger.debug(f"Match detail added: {match_id}")
+        
+        if len(self.match_log) >= self.MATCH_LOG_COMPACT_THRESHOLD:
+            self.compact_match_log()
+    
+    def compact_match_log(self) -> int:
+        """
+        Fusionne le log des matchs dans match_details.json.
+        
+        Le verrou du log est tenu de la lecture à l'effacement du log: un
+        ajout concurrent (autre manager, autre process) attend la fin de la
+        compaction puis repart dans un log neuf.
+        
+        Returns:
+            Nombre de matchs fusionnés
+        """
+        with self.match_log.locked():
+            count = len(self.match_log)
+            if count == 0:
+                return 0
+            self.save_match_details(self.load_match_details())
+        logger.info(f"Match log compacted: {count} matches merged into match_details.json")
+        return count
+    
+    @property
+    def timelines(self):
+        """TimelineStore de l'édition (import numpy seulement si utilisé)."""
+        from src.core.timeline_store import TimelineStore
+        return TimelineStore(self.edition_path / "timelines")
+    
+    @property
+    def rank_history(self):
+        """RankHistory de l'édition (snapshots de l'étape 3), chargé au premier accès."""
+        from src.core.rank_history import RankHistory
+        return RankHistory(self.edition_path / "rank_history.json")
+    
+    @property
+    def participants(self):
+        """ParticipantMatrix de l'édition, non chargée (import numpy seulement si utilisé)."""
+        from src.core.participant_matrix import ParticipantMatrix
+        return ParticipantMatrix(self.edition_path / "participants")
+    
+    def build_participant_matrix(self):
+        """
+        (Re)construit la matrice des participants depuis match_details (streaming).
+        
+        Normalement générée à l'étape 6; utile pour les éditions calculées
+        avant son introduction.
+        """
+        from src.core.participant_matrix import ParticipantMatrixBuilder
+        builder = ParticipantMatrixBuilder(self.load_teams_with_puuid())
+        for match_id, match_data in self.iter_match_details():
+            builder.add(match_id, match_data)
+        return builder.save(self.participants.directory)
+    
+    def ensure_participant_matrix(self):
+        """
+        Matrice des participants, construite une fois si elle manque.
+        
+        Les matrices ne sont pas versionnées (.gitignore): après un checkout
+        ou un déploiement, la première page qui en a besoin la construit
+        depuis match_details. Le verrou évite que plusieurs sessions ou
+        process la construisent en même temps.
+        
+        Returns:
+            ParticipantMatrix (non chargée), None sans match_details
+        """
+        matrix = self.participants
+        if matrix.exists():
+            return matrix
+        if self.data_version("match_details.json") is None:
+            return None
+        with file_lock(matrix.directory / matrix.DICTIONARIES_FILE):
+            if not matrix.exists():  # Construite par un autre process pendant l'attente
+                logger.info(f"Edition {self.edition_number}: building missing participant matrix")
+                self.build_participant_matrix()
+        return matrix
     
     def get_match_detail(self, match_id: str) -> Optional[Dict]:
         """Récupère les détails d'un match spécifique."""
-        details = self.load_match_details()
-        return details.get(match_id)
+        if match_id in self.match_log:
+            return self.match_log.get(match_id)
+        return next((data for mid, data in self._iter_base_match_details() if mid == match_id), None)
     
     # =========================================================================
     # GENERAL_STATS.JSON
@@ -423,6 +681,44 @@ class EditionDataManager:
         """Sauvegarde les statistiques générales."""
         self._write_json("general_stats.json", stats)
     
+    # =========================================================================
+    # TEAM_STATS.JSON
+    # =========================================================================
+    
+    def load_team_stats(self) -> Dict[str, Dict]:
+        """
+        Charge les stats par équipe (format des pages Stats Équipes/Joueurs).
+        
+        Si aucune vue n'est stockée (cas normal en mode bundle), elle est
+        reconstruite depuis general_stats (team_stats + player_stats).
+        
+        Returns:
+            {
+                "KCDQ": {
+                    "team_stats": {...},
+                    "players": {"Player1": {...}, ...}
+                },
+                ...
+            }
+        """
+        team_stats = self._read_json("team_stats.json")
+        if team_stats is not None:
+            return team_stats
+        return build_team_stats(self.load_general_stats())
+    
+    def save_team_stats(self, team_stats: Dict):
+        """
+        Sauvegarde les stats par équipe.
+        
+        En mode bundle, la section n'est stockée que si elle diffère de la vue
+        dérivée de general_stats (anciennes éditions calculées autrement).
+        """
+        if self.is_bundled and team_stats == build_team_stats(self.load_general_stats()):
+            if self.bundle.has_section("team_stats"):
+                self.bundle.write({"team_stats": None})
+            return
+        self._write_json("team_stats.json", team_stats)
+    
     # =========================================================================
     # BULK OPERATIONS
     # =========================================================================
@@ -458,6 +754,9 @@ class EditionDataManager:
         """
         Génère un résumé de l'édition.
         
+        Lu depuis le catalogue des éditions s'il est à jour, sinon calculé
+        (en-tête seul en mode bundle) puis enregistré dans le catalogue.
+        
         Returns:
             {
                 "edition_number": 7,
@@ -465,38 +764,90 @@ class EditionDataManager:
                 "teams_count": 12,
                 "matches_count": 45,
                 "players_count": 60,
-                "has_stats": True
+                "has_stats": True,
+                "is_private": False
             }
         """
-        config = self.load_config() or {}
-        teams = self.load_teams()
-        stats = self.load_general_stats()
-        
-        # Handle both list and dict formats
-        if isinstance(teams, list):
-            players_count = sum(len(team.get("players", [])) for team in teams)
-            teams_count = len(teams)
-        elif isinstance(teams, dict):
-            players_count = sum(len(team.get("players", [])) for team in teams.values())
-            teams_count = len(teams)
+        fingerprint = self.catalog.fingerprint(self.edition_path)
+        entry = self.catalog.get(self.edition_number, fingerprint)
+        
+        if entry is not None:
+            config, counts = entry["config"], entry["counts"]
         else:
-            players_count = 0
-            teams_count = 0
+            config, counts = self._compute_summary_parts()
+            self.catalog.put(self.edition_number, fingerprint, config, counts)
+        
+        return self.build_summary(self.edition_number, config, counts)
+    
+    def _compute_summary_parts(self) -> tuple:
+        """(config, compteurs) de l'édition, lus depuis le disque."""
+        if self.is_bundled:
+            # En-tête seul: aucune section n'est parsée
+            header = self.bundle.read_header()
+            return header.get("config") or {}, header.get("summary", {})
+        
+        config = self.load_config() or {}
+        counts = self._summary_fields({
+            "teams": self.load_teams(),
+            "tournament_matches": self.load_tournament_matches(),
+            "general_stats": self.load_general_stats()
+        })
+        return config, counts
+    
+    @staticmethod
+    def build_summary(edition_number: int, config: Dict, counts: Dict) -> Dict:
+        """Résumé d'une édition depuis sa config et ses compteurs."""
+        teams_count = counts.get("teams_count", 0)
+        players_count = counts.get("players_count", 0)
+        matches_count = counts.get("matches_count", 0)
         
         return {
-            "edition_number": self.edition_number,
-            "edition_name": config.get("edition_name", f"Edition {self.edition_number}"),
+            "edition_number": edition_number,
+            "edition_name": config.get("edition_name", f"Edition {edition_number}"),
             "year": config.get("year"),
             "status": config.get("status", "unknown"),
+            "is_private": config.get("is_private", False),
             "total_teams": teams_count,
             "teams_count": teams_count,  # Legacy compatibility
             "total_players": players_count,
             "players_count": players_count,  # Legacy compatibility
-            "total_matches": self.get_matches_count(),
-            "matches_count": self.get_matches_count(),  # Legacy compatibility
-            "has_stats": bool(stats)
+            "total_matches": matches_count,
+            "matches_count": matches_count,  # Legacy compatibility
+            "has_stats": counts.get("has_stats", False)
         }
     
+    @staticmethod
+    def _summary_fields(sections: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compteurs du résumé calculables depuis les sections fournies.
+        
+        Args:
+            sections: {"teams": ..., "tournament_matches": ..., "general_stats": ...}
+                      (seules les sections présentes sont prises en compte)
+        """
+        fields = {}
+        
+        if "teams" in sections:
+            teams = sections["teams"]
+            # Handle both list and dict formats
+            if isinstance(teams, dict):
+                teams = list(teams.values())
+            if isinstance(teams, list):
+                fields["teams_count"] = len(teams)
+                fields["players_count"] = sum(len(team.get("players", [])) for team in teams)
+            else:
+                fields["teams_count"] = 0
+                fields["players_count"] = 0
+        
+        if "tournament_matches" in sections:
+            matches = sections["tournament_matches"] or {}
+            fields["matches_count"] = len({m for team_matches in matches.values() for m in team_matches})
+        
+        if "general_stats" in sections:
+            fields["has_stats"] = bool(sections["general_stats"])
+        
+        return fields
+    
     # =========================================================================
     # CLEANUP & MAINTENANCE
     # =========================================================================
@@ -506,14 +857,78 @@ class EditionDataManager:
         Supprime toutes les données de l'édition (garde la structure).
         Utile pour reset une édition.
         """
-        for filename in self.EDITION_FILES:
+        self.compact_match_log()
+        
+        for filename in self.EDITION_FILES + [self.BUNDLE_FILE]:
             file_path = self.edition_path / filename
             if file_path.exists():
-                self._backup_file(filename)
+                self._backup_file(filename, force=True)
                 file_path.unlink()
         
         logger.warning(f"All data cleared for edition {self.edition_number}")
     
+    def pack_bundle(self, remove_files: bool = False) -> Path:
+        """
+        Regroupe les fichiers JSON de l'édition dans edition.bundle.
+        
+        team_stats.json n'est conservé que s'il ne correspond pas à la vue
+        reconstruite depuis general_stats.
+        
+        Args:
+            remove_files: Si True, supprime les fichiers JSON après packing
+        
+        Returns:
+            Chemin du bundle
+        """
+        if self.is_bundled:
+            logger.info(f"Edition {self.edition_number} already bundled")
+            return self.bundle.path
+        
+        self.compact_match_log()
+        
+        sections = {}
+        for filename in self.EDITION_FILES:
+            if filename == "config.json":
+                continue
+            data = self._read_json_file(filename)
+            if data is not None:
+                sections[self._section_name(filename)] = data
+        
+        team_stats = sections.get("team_stats")
+        if team_stats is not None and team_stats == build_team_stats(sections.get("general_stats") or {}):
+            del sections["team_stats"]
+        
+        self.bundle.write(
+            sections,
+            config=self._read_json_file("config.json") or {},
+            summary=self._summary_fields({
+                "teams": sections.get("teams", {}),
+                "tournament_matches": sections.get("tournament_matches", {}),
+                "general_stats": sections.get("general_stats", {})
+            })
+        )
+        
+        if remove_files:
+            for filename in self.EDITION_FILES:
+                file_path = self.edition_path / filename
+                if file_path.exists():
+                    file_path.unlink()
+        
+        logger.info(f"Edition {self.edition_number} packed into {self.BUNDLE_FILE} ({', '.join(self.bundle.sections())})")
+        return self.bundle.path
+    
+    def unpack_bundle(self):
+        """Réécrit les fichiers JSON depuis edition.bundle puis supprime le bundle."""
+        if not self.is_bundled:
+            return
+        
+        self._write_json_file("config.json", self.bundle.read_header().get("config") or {}, backup=False)
+        for name in self.bundle.sections():
+            self._write_json_file(f"{name}.json", self.bundle.read_section(name))
+        
+        self.bundle.path.unlink()
+        logger.info(f"Edition {self.edition_number} unpacked from {self.BUNDLE_FILE}")
+    
     def export_to_dict(self) -> Dict[str, Any]:
         """
         Exporte toutes les données de l'édition en un seul dict.
@@ -549,38 +964,66 @@ class MultiEditionManager:
     def __init__(self, base_path: str = "data/editions"):
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.catalog = EditionCatalog(self.base_path)
+        self.careers = CareerStore(self.base_path)
+        self.champion_meta = ChampionMetaStore(self.base_path)
     
     def get_edition_manager(self, edition_number: int) -> EditionDataManager:
         """Récupère le manager pour une édition."""
         return EditionDataManager(edition_number, str(self.base_path))
     
+    def _edition_dirs(self) -> Dict[int, Path]:
+        """{numéro: dossier} des éditions présentes sur le disque"""
+        dirs = {}
+        for path in self.base_path.iterdir():
+            if path.is_dir() and path.name.startswith("edition_"):
+                try:
+                    dirs[int(path.name.split("_")[1])] = path
+                except ValueError:
+                    continue
+        return dirs
+    
+    def get_summary(self, edition_number: int) -> Dict:
+        """
+        Résumé d'une édition, depuis le catalogue s'il est à jour
+        (aucun EditionDataManager construit ni fichier parsé dans ce cas).
+        """
+        edition_path = self.base_path / f"edition_{edition_number}"
+        entry = self.catalog.get(edition_number, self.catalog.fingerprint(edition_path))
+        if entry is not None:
+            return EditionDataManager.build_summary(edition_number, entry["config"], entry["counts"])
+        return self.get_edition_manager(edition_number).get_summary()
+    
+    def get_config(self, edition_number: int) -> Dict:
+        """
+        Config d'une édition, depuis le catalogue s'il est à jour
+        (sélecteur d'édition des pages: aucun fichier de l'édition n'est lu).
+        """
+        edition_path = self.base_path / f"edition_{edition_number}"
+        entry = self.catalog.get(edition_number, self.catalog.fingerprint(edition_path))
+        if entry is not None:
+            return entry["config"] or {}
+        manager = self.get_edition_manager(edition_number)
+        manager.get_summary()  # enregistre l'entrée pour les prochains appels
+        return manager.load_config() or {}
+    
     def list_editions(self, include_private: bool = True) -> List[int]:
         """
         Liste toutes les éditions disponibles.
         
         Args:
             include_private: Si False, exclut les éditions privées
+                             (flag lu depuis le catalogue des éditions)
         
         Returns:
             Liste des numéros d'éditions [4, 5, 6, 7]
         """
         editions = []
         
-        for path in self.base_path.iterdir():
-            if path.is_dir() and path.name.startswith("edition_"):
-                try:
-                    edition_num = int(path.name.split("_")[1])
-                    
-                    # Si on n'inclut pas les privées, vérifier la config
-                    if not include_private:
-                        manager = self.get_edition_manager(edition_num)
-                        config = manager.load_config()
-                        if config and config.get("is_private", False):
-                            continue  # Skip cette édition
-                    
-                    editions.append(edition_num)
-                except ValueError:
-                    continue
+        for edition_num in self._edition_dirs():
+            if not include_private and self.get_summary(edition_num)["is_private"]:
+                continue  # Skip cette édition
+            editions.append(edition_num)
         
         return sorted(editions)
     
@@ -595,13 +1038,68 @@ class MultiEditionManager:
                 ...
             ]
         """
-        summaries = []
+        return [self.get_summary(edition_num) for edition_num in self.list_editions()]
+    
+    # =========================================================================
+    # CARRIÈRES
+    # =========================================================================
+    
+    def _edition_managers(self, include_private: bool) -> List[EditionDataManager]:
+        return [self.get_edition_manager(edition_num) for edition_num in self.list_editions(include_private)]
+    
+    def get_player_careers(self, include_private: bool = False) -> Dict[str, Dict]:
+        """
+        Carrières de tous les joueurs, par PUUID (anciens comptes fusionnés).
+        
+        Calculées depuis general_stats.json de chaque édition; seules les
+        éditions modifiées depuis le dernier appel sont relues.
         
-        for edition_num in self.list_editions():
-            manager = self.get_edition_manager(edition_num)
-            summaries.append(manager.get_summary())
+        Returns:
+            {puuid: {"name", "names", "teams", "editions", "games", "winrate",
+                     "average_kda", "champion_pool", "splits": {édition: ...}, ...}}
+        """
+        return self.careers.careers(self._edition_managers(include_private))
+    
+    def get_player_career(self, puuid: str, include_private: bool = False) -> Optional[Dict]:
+        """Carrière d'un joueur (PUUID du compte principal ou d'un ancien compte)"""
+        careers = self.get_player_careers(include_private)
+        if puuid in careers:
+            return careers[puuid]
+        for career in careers.values():
+            if any(split_puuid == puuid for split_puuid in career["accounts"]):
+                return career
+        return None
+    
+    def all_time_leaderboard(self, sort_by: str = "average_kda", min_games: int = 0,
+                             limit: Optional[int] = None, include_private: bool = False) -> List[Dict]:
+        """
+        Classement all-time des joueurs, toutes éditions confondues.
         
-        return summaries
+        Args:
+            sort_by: Clé de tri décroissant ("games", "winrate", "average_kda", ...)
+            min_games: Nombre minimum de parties jouées
+            limit: Nombre de joueurs retournés
+            include_private: Inclure les éditions privées
+        """
+        return self.careers.leaderboard(self._edition_managers(include_private), sort_by, min_games, limit)
+    
+    # =========================================================================
+    # MÉTA DES CHAMPIONS
+    # =========================================================================
+    
+    def get_champion_trends(self, include_private: bool = False) -> List[Dict]:
+        """
+        Stats champions par édition (picks, bans, wins, winrate, pickrate,
+        banrate, presence, kda, kp), une ligne par (champion, édition).
+        
+        Seules les éditions modifiées depuis le dernier appel sont relues.
+        """
+        return self.champion_meta.trends(self._edition_managers(include_private))
+    
+    def get_champion_meta_matrix(self, field: str = "presence", champions: Optional[List[str]] = None,
+                                 include_private: bool = False) -> Dict[str, Dict[int, Any]]:
+        """Matrice {champion: {édition: valeur}} d'un champ des tendances"""
+        return self.champion_meta.matrix(self._edition_managers(include_private), field, champions)
 
 
 # =============================================================================
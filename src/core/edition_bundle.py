@@ -0,0 +1,213 @@
+"""
+Edition Bundle
+Format optionnel "un fichier par édition" avec en-tête indexé et sections
+chargeables indépendamment.
+
+Structure du fichier (edition.bundle):
+ligne 1   {"format": "occilan-edition-bundle", "version": 1, "config": {...},
+           "summary": {...}, "sections": {"teams": {"offset": 0, "length": 1234}, ...}}
+ligne 2+  sections JSON compactes concaténées (une par ligne)
+
+Les offsets sont relatifs à la fin de la ligne d'en-tête. Lire le résumé ou
+la config d'une édition ne lit que la première ligne; charger une section
+fait un seek + read de sa plage d'octets sans parser les autres.
+"""
+
+import os
+import json
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT = "occilan-edition-bundle"
+BUNDLE_VERSION = 1
+
+
+def _encode(data: Any) -> bytes:
+    """Section JSON compacte terminée par un saut de ligne"""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b"\n"
+
+
+class EditionBundle:
+    """
+    Lecture/écriture d'un bundle d'édition.
+
+    L'en-tête est mis en cache par (mtime, taille) du fichier: les lectures
+    répétées de get_summary / list_editions ne relisent pas le disque.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Chemin du fichier bundle (ex: data/editions/edition_7/edition.bundle)
+        """
+        self.path = Path(path)
+        self._header: Optional[Dict] = None
+        self._header_key = None
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    # =========================================================================
+    # LECTURE
+    # =========================================================================
+
+    def read_header(self) -> Dict:
+        """
+        Lit uniquement la ligne d'en-tête.
+
+        Returns:
+            En-tête ({} si le bundle n'existe pas ou est invalide)
+        """
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return {}
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._header is not None and self._header_key == key:
+            return self._header
+
+        try:
+            with open(self.path, 'rb') as f:
+                header = json.loads(f.readline())
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.error(f"Invalid bundle header in {self.path}: {e}")
+            return {}
+
+        if header.get("format") != BUNDLE_FORMAT:
+            logger.error(f"Unknown bundle format in {self.path}: {header.get('format')}")
+            return {}
+
+        self._header = header
+        self._header_key = key
+        return header
+
+    def sections(self) -> List[str]:
+        """Noms des sections présentes dans le bundle"""
+        return list(self.read_header().get("sections", {}))
+
+    def has_section(self, name: str) -> bool:
+        return name in self.read_header().get("sections", {})
+
+    def read_section_bytes(self, name: str) -> Optional[bytes]:
+        """Octets bruts d'une section (sans parsing), None si absente"""
+        header = self.read_header()
+        entry = header.get("sections", {}).get(name)
+        if entry is None:
+            return None
+
+        with open(self.path, 'rb') as f:
+            f.readline()
+            f.seek(entry["offset"], os.SEEK_CUR)
+            content = f.read(entry["length"])
+
+        if len(content) != entry["length"]:
+            logger.error(f"Truncated section '{name}' in {self.path}")
+            return None
+        return content
+
+    def read_section(self, name: str) -> Optional[Any]:
+        """
+        Charge et parse une seule section.
+
+        Args:
+            name: Nom de la section (ex: "teams", "match_details")
+
+        Returns:
+            Contenu de la section ou None si absente
+        """
+        content = self.read_section_bytes(name)
+        if content is None:
+            return None
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in section '{name}' of {self.path}: {e}")
+            return None
+
+    # =========================================================================
+    # ÉCRITURE
+    # =========================================================================
+
+    def write(
+        self,
+        sections: Optional[Dict[str, Any]] = None,
+        config: Optional[Dict] = None,
+        summary: Optional[Dict] = None
+    ):
+        """
+        Met à jour des sections (et/ou l'en-tête) du bundle.
+
+        Les sections non modifiées sont recopiées octet par octet sans être
+        parsées. L'écriture passe par un fichier temporaire puis os.replace,
+        un lecteur concurrent voit donc l'ancien ou le nouveau bundle.
+
+        Args:
+            sections: {nom: données}; None comme valeur supprime la section
+            config: Nouvelle config (None = inchangée)
+            summary: Champs du résumé à mettre à jour (fusionnés)
+        """
+        sections = sections or {}
+        old_header = self.read_header()
+        old_sections = old_header.get("sections", {})
+
+        names = list(old_sections)
+        names += [name for name in sections if name not in old_sections]
+
+        # Encoder les nouvelles sections, calculer les offsets avant d'écrire
+        encoded = {
+            name: _encode(data)
+            for name, data in sections.items()
+            if data is not None
+        }
+        layout = []
+        index = {}
+        offset = 0
+        for name in names:
+            if name in sections and sections[name] is None:
+                continue
+            length = len(encoded[name]) if name in encoded else old_sections[name]["length"]
+            layout.append(name)
+            index[name] = {"offset": offset, "length": length}
+            offset += length
+
+        header = {
+            "format": BUNDLE_FORMAT,
+            "version": BUNDLE_VERSION,
+            "updated_at": datetime.now().isoformat(),
+            "config": old_header.get("config") if config is None else config,
+            "summary": {**old_header.get("summary", {}), **(summary or {})},
+            "sections": index
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                out.write(_encode(header))
+                old = open(self.path, 'rb') if old_sections else None
+                try:
+                    if old:
+                        body_start = len(old.readline())
+                    for name in layout:
+                        if name in encoded:
+                            out.write(encoded[name])
+                        else:
+                            old.seek(body_start + old_sections[name]["offset"])
+                            out.write(old.read(old_sections[name]["length"]))
+                finally:
+                    if old:
+                        old.close()
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        self._header = None
+        logger.debug(f"Bundle written: {self.path.name} ({', '.join(layout)})")
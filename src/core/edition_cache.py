@@ -0,0 +1,141 @@
+"""
+Edition Cache
+Cache JSON d'agrégats calculés par édition, validé par les mtimes des
+fichiers sources (même principe que edition_catalog.py).
+
+data/editions/<nom>.json
+{
+    "version": 1,
+    "editions": {
+        "7": {"files": {"general_stats.json": 1730000000000000000, ...}, ...},
+        ...
+    }
+}
+
+Utilisé par career_store.py (carrières des joueurs) et champion_meta.py
+(méta des champions): seules les éditions dont un fichier suivi a changé
+sont recalculées, les autres sont relues depuis le cache.
+"""
+
+import os
+import json
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class EditionCache:
+    """
+    Entrées par édition {"files": mtimes, **build(manager)} persistées dans
+    un fichier JSON unique, écrit de façon atomique.
+    """
+
+    def __init__(self, path: Path, version: int, tracked_files: List[str], build: Callable[..., Dict]):
+        """
+        Args:
+            path: Fichier du cache (ex: data/editions/careers.json)
+            version: Version du format; un cache d'une autre version est ignoré
+            tracked_files: Fichiers (relatifs au dossier de l'édition) dont dépend l'entrée
+            build: build(manager) -> entrée calculée pour un EditionDataManager
+        """
+        self.path = Path(path)
+        self.version = version
+        self.tracked_files = tracked_files
+        self.build = build
+        self._cache: Optional[Dict] = None
+        self._cache_key: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def cache_key(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, taille) du fichier chargé: change à chaque mise à jour du cache"""
+        return self._cache_key
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return {}
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache_key == key:
+            return self._cache
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                content = json.load(f)
+        except Exception as e:
+            logger.warning(f"Invalid edition cache {self.path}: {e}")
+            return {}
+
+        if content.get("version") != self.version:
+            return {}
+
+        self._cache = content.get("editions", {})
+        self._cache_key = key
+        return self._cache
+
+    def _save(self, editions: Dict[str, Dict]):
+        content = json.dumps({"version": self.version, "editions": editions}, ensure_ascii=False)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.stem}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        stat = self.path.stat()
+        self._cache = editions
+        self._cache_key = (stat.st_mtime_ns, stat.st_size)
+
+    def fingerprint(self, edition_path: Path) -> Dict[str, int]:
+        """mtimes (ns) des fichiers suivis présents dans le dossier de l'édition"""
+        files = {}
+        for filename in self.tracked_files:
+            try:
+                files[filename] = (Path(edition_path) / filename).stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+        return files
+
+    def refresh(self, managers: Iterable) -> Dict[str, Dict]:
+        """
+        Recalcule les entrées des éditions modifiées (les autres ne sont pas relues).
+
+        Args:
+            managers: EditionDataManager des éditions à inclure
+
+        Returns:
+            {numéro (str): entrée} pour toutes les éditions demandées
+        """
+        with self._lock:
+            editions = dict(self._load())
+            wanted = []
+            changed = False
+            for manager in managers:
+                key = str(manager.edition_number)
+                wanted.append(key)
+                entry = editions.get(key)
+                if entry is not None and entry.get("files") == self.fingerprint(manager.edition_path):
+                    continue
+                built = self.build(manager)
+                # Empreinte prise après le calcul: build() peut générer un fichier suivi
+                editions[key] = {"files": self.fingerprint(manager.edition_path), **built}
+                changed = True
+                logger.info(f"{self.path.name}: edition {key} rebuilt")
+
+            base_path = self.path.parent
+            for key in [key for key in editions if not (base_path / f"edition_{key}").exists()]:
+                del editions[key]
+                changed = True
+
+            if changed:
+                self._save(editions)
+            return {key: editions[key] for key in wanted if key in editions}
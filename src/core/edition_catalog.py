@@ -0,0 +1,197 @@
+"""
+Edition Catalog
+Index des éditions (config + compteurs du résumé) dans un seul petit fichier.
+
+data/editions/catalog.json
+{
+    "version": 1,
+    "editions": {
+        "7": {
+            "files": {"config.json": 1730000000000000000, "teams.json": ...},  # mtime_ns
+            "config": {...},
+            "counts": {"teams_count": 16, "players_count": 80, "matches_count": 45, "has_stats": true}
+        }
+    }
+}
+
+Une entrée est valide tant que les mtimes des fichiers suivis n'ont pas
+changé; sinon le résumé est recalculé puis réenregistré. Les écritures
+passant par EditionDataManager mettent l'entrée à jour directement.
+
+Chaque mise à jour relit le catalogue et le réécrit sous un verrou
+inter-process (file_lock.py): Streamlit, le pipeline et les scripts
+peuvent mettre à jour des éditions différentes sans effacer l'entrée que
+l'autre vient d'écrire.
+"""
+
+import os
+import json
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.core.file_lock import file_lock
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = 1
+
+# Fichiers dont dépendent la config et les compteurs du résumé
+TRACKED_FILES = [
+    "config.json",
+    "teams.json",
+    "tournament_matches.json",
+    "general_stats.json",
+    "edition.bundle"
+]
+
+
+class EditionCatalog:
+    """
+    Cache persistant des résumés d'éditions, validé par mtimes.
+    """
+
+    def __init__(self, base_path: Path):
+        """
+        Args:
+            base_path: Dossier des éditions (ex: data/editions)
+        """
+        self.base_path = Path(base_path)
+        self.path = self.base_path / "catalog.json"
+        self._cache: Optional[Dict] = None
+        self._cache_key = None
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # LECTURE
+    # =========================================================================
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return {}
+
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache_key == key:
+            return self._cache
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                catalog = json.load(f)
+        except Exception as e:
+            logger.warning(f"Invalid edition catalog {self.path}: {e}")
+            return {}
+
+        if catalog.get("version") != CATALOG_VERSION:
+            return {}
+
+        self._cache = catalog.get("editions", {})
+        self._cache_key = key
+        return self._cache
+
+    @staticmethod
+    def fingerprint(edition_path: Path) -> Dict[str, int]:
+        """mtimes (ns) des fichiers suivis présents dans le dossier de l'édition"""
+        files = {}
+        for filename in TRACKED_FILES:
+            try:
+                files[filename] = (Path(edition_path) / filename).stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+        return files
+
+    def get(self, edition_number: int, fingerprint: Dict[str, int]) -> Optional[Dict]:
+        """
+        Entrée du catalogue si elle est à jour.
+
+        Args:
+            edition_number: Numéro de l'édition
+            fingerprint: Résultat de fingerprint() pour le dossier de l'édition
+
+        Returns:
+            {"files", "config", "counts"} ou None si absente / périmée
+        """
+        entry = self._load().get(str(edition_number))
+        if entry and entry.get("files") == fingerprint:
+            return entry
+        return None
+
+    # =========================================================================
+    # ÉCRITURE
+    # =========================================================================
+
+    def _save(self, editions: Dict[str, Dict]):
+        content = json.dumps(
+            {"version": CATALOG_VERSION, "editions": editions},
+            indent=2, ensure_ascii=False
+        )
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.base_path, prefix=".catalog.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._cache = None
+
+    def put(self, edition_number: int, fingerprint: Dict[str, int], config: Dict, counts: Dict):
+        """
+        Enregistre le résumé d'une édition.
+
+        Args:
+            fingerprint: mtimes relevés AVANT le calcul du résumé (une écriture
+                         concurrente rend ainsi l'entrée périmée)
+        """
+        with self._lock, file_lock(self.path):
+            editions = dict(self._load())
+            editions[str(edition_number)] = {"files": fingerprint, "config": config, "counts": counts}
+            self._save(editions)
+
+    def record_write(
+        self,
+        edition_number: int,
+        written_path: Path,
+        config: Optional[Dict] = None,
+        counts: Optional[Dict] = None
+    ):
+        """
+        Met à jour une entrée après une écriture.
+
+        Seul le mtime du fichier écrit est rafraîchi: une modification externe
+        d'un autre fichier suivi reste détectée.
+
+        Args:
+            edition_number: Numéro de l'édition
+            written_path: Fichier écrit
+            config: Nouvelle config (si config écrite)
+            counts: Compteurs recalculés depuis les données écrites
+        """
+        written_path = Path(written_path)
+        if written_path.name not in TRACKED_FILES:
+            return
+
+        with self._lock, file_lock(self.path):
+            editions = self._load()
+            entry = editions.get(str(edition_number))
+            if entry is None:
+                return  # calculé à la prochaine lecture
+
+            entry = {
+                "files": {**entry["files"], written_path.name: written_path.stat().st_mtime_ns},
+                "config": config if config is not None else entry["config"],
+                "counts": {**entry["counts"], **(counts or {})}
+            }
+            self._save({**editions, str(edition_number): entry})
+
+    def remove(self, edition_number: int):
+        """Supprime l'entrée d'une édition"""
+        with self._lock, file_lock(self.path):
+            editions = dict(self._load())
+            if editions.pop(str(edition_number), None) is not None:
+                self._save(editions)
@@ -0,0 +1,197 @@
+"""
+ELO Ranking
+Scores ELO des joueurs et seeding des équipes (page Stats Générales).
+
+Barème (inchangé):
+    Iron 1, Bronze 2, Silver 3, Gold 4, Platinum 5, Emerald 6, Diamond 7
+        + 0 (IV), 0.25 (III), 0.5 (II), 0.75 (I)
+    Master 8, Grandmaster 15, Challenger 20
+        + 1 par 100 LP
+
+Les conversions tier / division / LP → score et score → ELO passent par des
+tableaux de correspondance NumPy: une seule opération pour tous les joueurs
+de l'édition au lieu d'un appel de fonction (et d'une cascade de if) par
+joueur. La moyenne par équipe est un groupby.
+
+Usage:
+    df_players = build_player_frame(teams_with_puuid)
+    df_teams = rank_teams(df_players)
+    df_ranking = rank_players(df_players)
+"""
+
+from typing import Any, Dict, Sequence, Union
+
+import numpy as np
+
+from src.core.rank_history import TIERS, DIVISIONS, APEX_TIERS, UNRANKED
+
+# Code 0 = unranked / tier inconnu, puis TIERS dans l'ordre (1 = IRON ... 10 = CHALLENGER)
+TIER_CODES = {tier: code for code, tier in enumerate(TIERS, start=1)}
+
+# Score de base par code de tier
+TIER_BASE_SCORES = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 15, 20], dtype=float)
+
+# Master+ : +1 par 100 LP au lieu du bonus de division
+APEX_MASK = np.array([False] + [tier in APEX_TIERS for tier in TIERS])
+
+# Bonus par division, indexé comme DIVISIONS (IV, III, II, I); division inconnue = 0
+DIVISION_CODES = {division: code for code, division in enumerate(DIVISIONS)}
+DIVISION_BONUS = np.array([0.0, 0.25, 0.5, 0.75])
+
+# Seuils score → tier: searchsorted(TIER_BASE_SCORES[1:], score, "right") = code du tier
+TIER_THRESHOLDS = TIER_BASE_SCORES[1:]
+
+# Libellés ELO par (code de tier, division) pour les tiers à divisions
+DIVISION_LABELS = np.array([
+    f"{tier} {division}" if tier not in APEX_TIERS else tier
+    for tier in TIERS
+    for division in DIVISIONS
+], dtype=object)
+
+# Tier estimé d'une équipe par code de tier de son score moyen
+# (Grandmaster au-delà de 15, Iron en dessous de 2)
+ESTIMATED_TIERS = np.array(
+    ["Iron"] + [tier.capitalize() for tier in TIERS[:-1]] + ["Grandmaster"], dtype=object
+)
+
+ArrayLike = Union[Sequence, np.ndarray]
+
+
+# ============================================================================
+# CONVERSIONS VECTORISÉES
+# ============================================================================
+
+def tier_codes(tiers: ArrayLike) -> np.ndarray:
+    """Code de chaque tier (0 si unranked ou inconnu)"""
+    return np.fromiter((TIER_CODES.get(tier, 0) for tier in tiers), dtype=np.int8, count=len(tiers))
+
+
+def player_scores(tiers: ArrayLike, ranks: ArrayLike, lps: ArrayLike) -> np.ndarray:
+    """
+    Score de chaque joueur
+
+    Args:
+        tiers: Tiers ("GOLD", "MASTER", "UNRANKED"...)
+        ranks: Divisions ("I" à "IV")
+        lps: League points
+
+    Returns:
+        Scores (float), 0 pour les joueurs unranked
+    """
+    codes = tier_codes(tiers)
+    divisions = np.fromiter((DIVISION_CODES.get(rank, 0) for rank in ranks), dtype=np.int8, count=len(ranks))
+    lps = np.asarray(lps, dtype=float)
+    bonus = np.where(APEX_MASK[codes], lps / 100.0, DIVISION_BONUS[divisions])
+    return TIER_BASE_SCORES[codes] + bonus
+
+
+def score_tier_codes(scores: ArrayLike) -> np.ndarray:
+    """Code du tier atteint par chaque score (0 en dessous d'Iron)"""
+    return np.searchsorted(TIER_THRESHOLDS, np.asarray(scores, dtype=float), side="right")
+
+
+def scores_to_elo(scores: ArrayLike) -> np.ndarray:
+    """
+    ELO équivalent à chaque score: "GOLD II", "MASTER (42 LP)", "GRANDMASTER",
+    "UNRANKED" en dessous d'Iron
+    """
+    scores = np.asarray(scores, dtype=float)
+    codes = score_tier_codes(scores)
+    base = TIER_BASE_SCORES[codes]
+    divisions = np.clip(np.floor((scores - base) * 4), 0, 3).astype(int)
+
+    labels = np.full(scores.shape, UNRANKED, dtype=object)
+    ranked = codes > 0
+    labels[ranked] = DIVISION_LABELS[(codes[ranked] - 1) * len(DIVISIONS) + divisions[ranked]]
+
+    master = codes == TIER_CODES["MASTER"]
+    labels[master] = [f"MASTER ({lp} LP)" for lp in ((scores[master] - 8) * 100).astype(int)]
+    return labels
+
+
+def score_to_elo(score: float) -> str:
+    """ELO équivalent à un score (voir scores_to_elo)"""
+    return scores_to_elo([score])[0]
+
+
+def estimated_tiers(scores: ArrayLike) -> np.ndarray:
+    """Tier estimé ("Gold", "Master"...) d'un score moyen d'équipe"""
+    return ESTIMATED_TIERS[score_tier_codes(scores)]
+
+
+# ============================================================================
+# TABLEAUX
+# ============================================================================
+
+def build_player_frame(teams_with_puuid: Dict[str, Any]):
+    """
+    Un joueur par ligne avec son score
+
+    Returns:
+        DataFrame: team, gameName, tagLine, role, tier, rank, lp, score, summonerLevel
+    """
+    import pandas as pd
+
+    df = pd.DataFrame(
+        [
+            {
+                "team": team_name,
+                "gameName": player.get("gameName", "Unknown"),
+                "tagLine": player.get("tagLine", "0000"),
+                "role": player.get("role", "UNKNOWN"),
+                "tier": player.get("tier", UNRANKED),
+                "rank": player.get("rank", "IV"),
+                "lp": player.get("leaguePoints", 0),
+                "summonerLevel": player.get("summonerLevel", 0)
+            }
+            for team_name, team_data in teams_with_puuid.items()
+            for player in team_data.get("players", [])
+        ],
+        columns=["team", "gameName", "tagLine", "role", "tier", "rank", "lp", "summonerLevel"]
+    )
+    df.insert(7, "score", player_scores(df["tier"].to_numpy(), df["rank"].to_numpy(), df["lp"].to_numpy()))
+    return df
+
+
+def rank_teams(df_players):
+    """
+    Seeding: score moyen des joueurs classés de chaque équipe
+
+    Returns:
+        DataFrame indexé par "Rank" (1 = meilleur seed): Team, Avg Score, Estimated Tier
+    """
+    import pandas as pd
+
+    ranked = df_players[df_players["tier"] != UNRANKED]
+    df = (
+        ranked.groupby("team", sort=False)["score"].mean()
+        .rename("Avg Score").rename_axis("Team").reset_index()
+    )
+    df["Estimated Tier"] = estimated_tiers(df["Avg Score"].to_numpy())
+    df = df.sort_values("Avg Score", ascending=False, kind="stable").reset_index(drop=True)
+    df.index = pd.RangeIndex(1, len(df) + 1, name="Rank")
+    return df
+
+
+def rank_players(df_players):
+    """
+    Classement des joueurs classés par score décroissant
+
+    Returns:
+        DataFrame: Rang, Joueur, Rôle, Équipe, ELO ("GOLD II", "MASTER (120 LP)"), Score
+    """
+    import pandas as pd
+
+    ranked = df_players[df_players["tier"] != UNRANKED].sort_values("score", ascending=False, kind="stable")
+    apex = ranked["tier"].isin(APEX_TIERS)
+    elo = ranked["tier"] + np.where(
+        apex, " (" + ranked["lp"].astype(str) + " LP)", " " + ranked["rank"].astype(str)
+    )
+    return pd.DataFrame({
+        "Rang": np.arange(1, len(ranked) + 1),
+        "Joueur": (ranked["gameName"] + "#" + ranked["tagLine"]).to_numpy(),
+        "Rôle": ranked["role"].to_numpy(),
+        "Équipe": ranked["team"].to_numpy(),
+        "ELO": elo.to_numpy(),
+        "Score": ranked["score"].round(2).to_numpy()
+    })
@@ -0,0 +1,78 @@
+"""
+File Lock
+Verrou exclusif inter-process sur un fichier partagé.
+
+Les petits index JSON (backups/index.json, catalog.json) sont lus, modifiés
+puis réécrits par Streamlit, le pipeline et les scripts en même temps. Le
+verrou est tenu de la lecture jusqu'au os.replace de l'écriture: sans lui,
+deux process lisent la même version et le dernier à écrire efface l'ajout
+de l'autre.
+
+Le verrou porte sur un fichier "<nom>.lock" à côté du fichier protégé (le
+fichier lui-même est remplacé par os.replace, son inode change):
+fcntl.flock sous POSIX, msvcrt.locking sous Windows. Le fichier .lock n'est
+jamais supprimé (le supprimer pendant qu'un autre process l'attend casserait
+l'exclusion).
+
+Non réentrant: ne pas reprendre le verrou d'un fichier déjà verrouillé
+par le même thread.
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue  # LK_LOCK abandonne après ~10 s d'attente: on réessaie
+
+    def _unlock(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def lock_path_for(path: Path) -> Path:
+    """Fichier de verrou d'un fichier ("index.json" → "index.json.lock")"""
+    path = Path(path)
+    return path.with_name(f"{path.name}.lock")
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Verrou exclusif (bloquant) sur path, entre threads et entre process.
+
+    Exemple:
+        with file_lock(index_path):
+            index = load(index_path)
+            index[key] = value
+            atomic_write(index_path, index)
+    """
+    lock_path = lock_path_for(path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        _lock(fd)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,113 @@
+"""
+Match Projection
+Projection des payloads Match-V5 vers le schéma réduit stocké dans
+match_details.json.
+
+Un payload brut contient ~140 champs par participant (perks, challenges,
+pings, items...) dont une vingtaine seulement sert aux stats et aux pages.
+Le payload complet reste dans le cache API (data/cache/matches/*.json.gz);
+l'édition ne garde que les champs listés ci-dessous:
+
+{
+    "metadata": {"matchId": "EUW1_...", "participants": [puuid, ...], "projection": 1},
+    "info": {
+        "gameCreation": ..., "gameDuration": ..., "gameVersion": ..., ...,
+        "participants": [{"puuid": ..., "championName": ..., "kills": ..., "challenges": {"kda": ..., "killParticipation": ...}}, ...],
+        "teams": [{"teamId": 100, "win": true, "bans": [...], "objectives": {...}}, ...]
+    }
+}
+
+Ajouter un champ: l'ajouter à la liste correspondante, incrémenter
+SCHEMA_VERSION puis relancer la re-projection depuis le cache
+(scripts/reproject_matches.py). Les champs absents du payload brut sont
+simplement omis: les lecteurs utilisent .get() comme pour les données brutes.
+"""
+
+from typing import Dict, Optional
+
+SCHEMA_VERSION = 1
+
+INFO_FIELDS = (
+    "gameId", "gameCreation", "gameStartTimestamp", "gameEndTimestamp", "gameDuration",
+    "gameMode", "gameType", "gameVersion", "mapId", "platformId", "queueId", "tournamentCode"
+)
+
+PARTICIPANT_FIELDS = (
+    # Identité
+    "participantId", "puuid", "riotIdGameName", "riotIdTagline", "summonerName",
+    "teamId", "teamPosition", "individualPosition", "championId", "championName", "champLevel",
+    # Combat
+    "kills", "deaths", "assists", "doubleKills", "tripleKills", "quadraKills", "pentaKills",
+    "firstBloodKill", "firstBloodAssist",
+    "totalDamageDealtToChampions", "totalDamageTaken", "damageDealtToObjectives", "timeCCingOthers",
+    # Économie / vision
+    "goldEarned", "goldSpent", "totalMinionsKilled", "neutralMinionsKilled",
+    "visionScore", "wardsPlaced", "wardsKilled",
+    "timePlayed", "win"
+)
+
+CHALLENGE_FIELDS = ("kda", "killParticipation")
+
+TEAM_FIELDS = ("teamId", "win", "bans", "objectives")
+
+
+def _pick(source: Dict, fields) -> Dict:
+    return {field: source[field] for field in fields if field in source}
+
+
+def projection_version(match_data: Dict) -> Optional[int]:
+    """Version du schéma d'un match stocké (None = payload brut)"""
+    return (match_data.get("metadata") or {}).get("projection")
+
+
+def is_projected(match_data: Dict) -> bool:
+    return projection_version(match_data) is not None
+
+
+def project_match(match_data: Dict) -> Dict:
+    """
+    Projette un payload Match-V5 brut vers le schéma réduit.
+
+    Un match déjà projeté est retourné tel quel (une projection ne peut pas
+    être reconstruite à partir d'une autre: repartir du cache brut).
+
+    Args:
+        match_data: Payload brut de /lol/match/v5/matches/{matchId}
+
+    Returns:
+        Match au schéma SCHEMA_VERSION
+    """
+    if is_projected(match_data):
+        return match_data
+
+    metadata = match_data.get("metadata", {})
+    info = match_data.get("info", {})
+
+    participants = []
+    for participant in info.get("participants", []):
+        projected = _pick(participant, PARTICIPANT_FIELDS)
+        challenges = _pick(participant.get("challenges") or {}, CHALLENGE_FIELDS)
+        if challenges:
+            projected["challenges"] = challenges
+        participants.append(projected)
+
+    teams = []
+    for team in info.get("teams", []):
+        projected = _pick(team, TEAM_FIELDS)
+        if "bans" in projected:
+            projected["bans"] = [{"championId": ban.get("championId"), "pickTurn": ban.get("pickTurn")}
+                                 for ban in projected["bans"]]
+        teams.append(projected)
+
+    return {
+        "metadata": {
+            "matchId": metadata.get("matchId"),
+            "participants": metadata.get("participants", []),
+            "projection": SCHEMA_VERSION
+        },
+        "info": {
+            **_pick(info, INFO_FIELDS),
+            "participants": participants,
+            "teams": teams
+        }
+    }
@@ -0,0 +1,357 @@
+"""
+Match Store
+Journal append-only des détails de matchs d'une édition.
+
+Structure:
+data/editions/edition_X/
+├── match_details.json       # Base compactée {match_id: data} (ou section du bundle)
+├── match_details.log        # Une ligne par ajout: "<match_id>\t<json compact>\n"
+└── match_details.log.idx    # Une ligne par ajout: "<match_id>\t<offset>\t<length>\n"
+
+Ajouter un match écrit une ligne dans le log et une dans l'index (I/O
+constant, indépendant du nombre de matchs déjà stockés). La compaction
+fusionne le log dans la base puis vide le log.
+
+Les écritures (ajout, réécriture de l'index, compaction) passent par
+MatchLog.locked(): verrou inter-process (file_lock.py) sur le log, car le
+pipeline, le watcher et les jobs de l'Admin peuvent écrire la même édition
+en même temps. La compaction le tient de la lecture du log jusqu'à son
+effacement: un match ajouté entre-temps par un autre process attend la fin
+de la compaction au lieu d'être effacé. Les lectures ne verrouillent pas.
+
+iter_json_object() lit la base {match_id: data} entrée par entrée (parseur
+incrémental), sans construire le dict complet en mémoire.
+"""
+
+import os
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from src.core.file_lock import file_lock
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:}]"
+
+
+def iter_json_object(f: TextIO, chunk_size: int = 1 << 20) -> Iterator[Tuple[str, Any]]:
+    """
+    Itère les paires (clé, valeur) d'un objet JSON de premier niveau.
+
+    Le fichier est lu par blocs de chunk_size caractères et chaque valeur est
+    décodée dès qu'elle est complète (json.JSONDecoder.raw_decode): la mémoire
+    est bornée par un bloc + la plus grande valeur, quel que soit le format
+    (indenté ou compact).
+
+    Args:
+        f: Fichier texte contenant un objet JSON
+        chunk_size: Taille des blocs de lecture
+
+    Raises:
+        ValueError: JSON invalide ou tronqué, avec la clé (match_id) concernée
+                    et la position de l'erreur en octets (UTF-8)
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+    consumed = 0  # Octets déjà retirés du buffer
+    context = "at start of object"
+
+    def read_more() -> bool:
+        nonlocal buffer, pos, eof, consumed
+        if eof:
+            return False
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        consumed += len(buffer[:pos].encode('utf-8'))
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    def error(message: str, at: Optional[int] = None) -> ValueError:
+        offset = consumed + len(buffer[:pos if at is None else at].encode('utf-8'))
+        return ValueError(f"{message} ({context}, byte {offset})")
+
+    def peek() -> str:
+        """Prochain caractère non blanc ("" en fin de fichier)"""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not read_more():
+                return ""
+
+    def decode() -> Any:
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                # Un nombre coupé par la fin du bloc se décode sans erreur:
+                # la valeur n'est sûre que suivie d'un séparateur
+                if eof or (end < len(buffer) and buffer[end] in _DELIMITERS):
+                    pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if eof:
+                    raise error(f"Invalid JSON: {e.msg}", e.pos) from e
+            read_more()
+
+    if peek() != "{":
+        raise error("Expected a JSON object")
+    pos += 1
+
+    first = True
+    while True:
+        char = peek()
+        if char == "}":
+            return
+        if not first:
+            if char != ",":
+                raise error(f"Expected ',' or '}}', got {char!r}")
+            pos += 1
+        key = decode()
+        context = f"key {key!r}"
+        if peek() != ":":
+            raise error(f"Expected ':' after key {key!r}")
+        pos += 1
+        value = decode()
+        first = False
+        context = f"after key {key!r}"
+        yield key, value
+
+
+class MatchLog:
+    """
+    Journal append-only {match_id: data} avec index des offsets.
+
+    En cas de ré-ajout d'un match, la dernière entrée du log fait foi.
+    """
+
+    LOG_FILE = "match_details.log"
+    INDEX_FILE = "match_details.log.idx"
+
+    def __init__(self, directory: Path):
+        """
+        Args:
+            directory: Dossier de l'édition
+        """
+        self.log_path = Path(directory) / self.LOG_FILE
+        self.index_path = Path(directory) / self.INDEX_FILE
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+        self._indexed_size = -1
+        self._end = 0  # Fin de la dernière entrée complète du log
+        self._lock = threading.RLock()
+        self._owner: Optional[int] = None  # Thread qui tient le verrou du log
+        self._depth = 0
+
+    @property
+    def files(self) -> List[Path]:
+        return [self.log_path, self.index_path]
+
+    def exists(self) -> bool:
+        return self.log_path.exists()
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """
+        Verrou exclusif sur le log, entre threads et entre process.
+
+        Réentrant pour le thread qui le tient: append() et clear() peuvent
+        être appelés dans un bloc locked() (ex: compaction).
+        """
+        with self._lock:
+            if self._depth == 0:
+                with file_lock(self.log_path):
+                    self._owner, self._depth = threading.get_ident(), 1
+                    try:
+                        yield
+                    finally:
+                        self._owner, self._depth = None, 0
+            else:
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+
+    # =========================================================================
+    # INDEX
+    # =========================================================================
+
+    def _log_size(self) -> int:
+        try:
+            return self.log_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _refresh_index(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Charge l'index (ou le reconstruit s'il ne couvre pas tout le log,
+        ex: écriture interrompue ou log ajouté par un autre process).
+
+        Une dernière ligne d'index sans fin de ligne est un ajout en cours
+        d'écriture par un autre process: elle est ignorée, l'index n'est pas
+        réécrit et sera relu à l'appel suivant. L'index reconstruit n'est
+        réécrit que sous locked(); sinon il reste en mémoire.
+        """
+        size = self._log_size()
+        if size == self._indexed_size:
+            return self._offsets
+
+        offsets = {}
+        end = 0
+        complete = True
+        if self.index_path.exists():
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        complete = False
+                        break
+                    parts = line.rstrip("\n").split("\t")
+                    if len(parts) != 3:
+                        continue
+                    try:
+                        offset, length = int(parts[1]), int(parts[2])
+                    except ValueError:
+                        logger.warning(f"Ignoring malformed line in {self.index_path.name}: {line!r}")
+                        continue
+                    offsets[parts[0]] = (offset, length)
+                    end = max(end, offset + length)
+
+        if end != size:
+            offsets, end = self._scan_log()
+            if complete and self._owner == threading.get_ident():
+                self._write_index(offsets)
+
+        self._offsets = offsets
+        self._end = end
+        if complete:
+            self._indexed_size = size
+        return offsets
+
+    def _scan_log(self) -> Tuple[Dict[str, Tuple[int, int]], int]:
+        """
+        Reconstruit l'index depuis le log (lit seulement le préfixe match_id).
+
+        Returns:
+            (offsets, fin de la dernière entrée complète)
+        """
+        offsets = {}
+        end = 0
+        if not self.log_path.exists():
+            return offsets, end
+
+        offset = 0
+        with open(self.log_path, 'rb') as f:
+            for line in f:
+                match_id, sep, _ = line.partition(b"\t")
+                if sep and line.endswith(b"\n"):
+                    offsets[match_id.decode('utf-8')] = (offset, len(line))
+                    end = offset + len(line)
+                else:
+                    logger.warning(f"Ignoring truncated entry at offset {offset} in {self.log_path.name}")
+                offset += len(line)
+
+        logger.info(f"Match log index rebuilt: {len(offsets)} matches")
+        return offsets, end
+
+    def _write_index(self, offsets: Dict[str, Tuple[int, int]]):
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            for match_id, (offset, length) in sorted(offsets.items(), key=lambda item: item[1][0]):
+                f.write(f"{match_id}\t{offset}\t{length}\n")
+
+    # =========================================================================
+    # LECTURE
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return len(self._refresh_index())
+
+    def __contains__(self, match_id: str) -> bool:
+        return match_id in self._refresh_index()
+
+    def ids(self) -> List[str]:
+        return list(self._refresh_index())
+
+    def _decode(self, line: bytes) -> Any:
+        return json.loads(line.partition(b"\t")[2])
+
+    def get(self, match_id: str) -> Optional[Dict]:
+        """Détails d'un match du log (seek + read d'une seule entrée)"""
+        entry = self._refresh_index().get(match_id)
+        if entry is None:
+            return None
+        with open(self.log_path, 'rb') as f:
+            f.seek(entry[0])
+            return self._decode(f.read(entry[1]))
+
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        """Itère les entrées à jour du log, dans l'ordre d'ajout"""
+        offsets = self._refresh_index()
+        if not offsets:
+            return
+        with open(self.log_path, 'rb') as f:
+            for match_id, (offset, length) in sorted(offsets.items(), key=lambda item: item[1][0]):
+                f.seek(offset)
+                yield match_id, self._decode(f.read(length))
+
+    # =========================================================================
+    # ÉCRITURE
+    # =========================================================================
+
+    def append(self, match_id: str, match_data: Dict):
+        """
+        Ajoute (ou remplace) un match: une ligne dans le log et une dans l'index.
+
+        Args:
+            match_id: ID du match
+            match_data: Données du match
+        """
+        line = (
+            match_id.encode('utf-8') + b"\t"
+            + json.dumps(match_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            + b"\n"
+        )
+        with self.locked():
+            self._refresh_index()
+            with open(self.log_path, 'ab') as f:
+                offset = f.tell()
+                if offset != self._end:
+                    # Entrée interrompue en fin de log (process arrêté en pleine
+                    # écriture, aucun autre ne peut écrire sous le verrou): on l'écrase
+                    f.truncate(self._end)
+                    offset = self._end
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(f"{match_id}\t{offset}\t{len(line)}\n")
+
+            self._offsets[match_id] = (offset, len(line))
+            self._indexed_size = self._end = offset + len(line)
+
+    def clear(self):
+        """
+        Vide le log (après compaction dans la base).
+
+        À appeler dans le même bloc locked() que la lecture du log fusionné,
+        sinon les matchs ajoutés entre-temps sont perdus.
+        """
+        with self.locked():
+            for path in self.files:
+                if path.exists():
+                    path.unlink()
+            self._offsets = {}
+            self._indexed_size = -1
+            self._end = 0
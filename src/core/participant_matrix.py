@@ -0,0 +1,389 @@
+"""
+Participant Matrix
+Une ligne par (match, participant) en tableaux NumPy ouverts en memmap,
+pour filtrer les stats (joueur, équipe, rôle, champion, dates) par masques
+booléens sans reconstruire de DataFrame depuis match_details.json.
+
+data/editions/edition_X/participants/
+├── stats.<build>.npy   int32 (N, len(NUMERIC_COLUMNS))
+├── codes.<build>.npy   int32 (N, len(CATEGORY_COLUMNS))   # index dans les dictionnaires
+└── dictionaries.json   {"version": 1, "rows": N, "numeric": [...], "categories": {colonne: [valeurs]},
+                         "files": {"stats": "stats.<build>.npy", "codes": "codes.<build>.npy"}}
+
+Générée à l'étape 6 (même passe que StatsCalculator), ou à la demande par
+EditionDataManager.ensure_participant_matrix() si elle manque (matrices non
+versionnées: checkout, déploiement). Les fichiers .npy sont
+ouverts en lecture seule (mmap_mode="r"): plusieurs sessions Streamlit
+partagent les mêmes pages mémoire du système.
+
+Chaque reconstruction écrit de nouveaux .npy (suffixe de build) puis
+remplace dictionaries.json, qui les désigne: un fichier ouvert en memmap
+n'est jamais écrasé (impossible sous Windows, et tronquer un fichier mappé
+fait planter le process qui le lit). Les anciens builds sont supprimés au
+mieux; ceux encore mappés (Windows) le seront à la reconstruction suivante.
+
+Les noms (player, team) suivent StatsCalculator: "gameName#tagLine" de
+teams_with_puuid.json et nom d'équipe; champion = libellé du registre.
+"""
+
+import os
+import json
+import time
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.core.champion_registry import get_champion_registry
+
+logger = logging.getLogger(__name__)
+
+MATRIX_VERSION = 1
+
+NUMERIC_COLUMNS = (
+    "game_creation",   # secondes (epoch)
+    "duration",        # secondes
+    "win",
+    "kills", "deaths", "assists",
+    "cs", "gold", "damage", "damage_taken", "vision",
+    "team_kills"       # kills de l'équipe du joueur (kill participation)
+)
+
+CATEGORY_COLUMNS = (
+    "match",
+    "player",          # nom StatsCalculator ("Unknown Player" hors roster)
+    "riot_id",         # riotIdGameName#riotIdTagline tel que dans le match
+    "team",
+    "opponent",
+    "role",            # rôle du roster (TOP/JGL/MID/ADC/SUP), sinon teamPosition
+    "champion"
+)
+
+TEAM_POSITION_ROLES = {"TOP": "TOP", "JUNGLE": "JGL", "MIDDLE": "MID", "BOTTOM": "ADC", "UTILITY": "SUP"}
+
+
+class ParticipantMatrixBuilder:
+    """
+    Construit la matrice au fil des matchs (une seule passe, mémoire ~ N lignes d'entiers).
+    """
+
+    def __init__(self, teams_with_puuid: Dict[str, Any]):
+        self.roster = {
+            player["puuid"]: (
+                f"{player.get('gameName', 'Unknown')}#{player.get('tagLine', '0000')}",
+                team_name,
+                (player.get("role") or "").upper()
+            )
+            for team_name, team_data in teams_with_puuid.items()
+            for player in team_data.get("players", [])
+            if player.get("puuid")
+        }
+        self.champions = get_champion_registry()
+        self.rows: List[Tuple[int, ...]] = []
+        self.codes: List[Tuple[int, ...]] = []
+        self.dictionaries: Dict[str, Dict[str, int]] = {name: {} for name in CATEGORY_COLUMNS}
+
+    def _code(self, column: str, value: str) -> int:
+        dictionary = self.dictionaries[column]
+        code = dictionary.get(value)
+        if code is None:
+            code = dictionary[value] = len(dictionary)
+        return code
+
+    def add(self, match_id: str, match_data: Dict):
+        """Ajoute les 10 participants d'un match (ignoré si durée nulle, comme StatsCalculator)"""
+        info = match_data.get("info", {})
+        try:
+            duration = int(info.get("gameDuration") or 0)
+        except (ValueError, TypeError):
+            return
+        participants = info.get("participants", [])
+        if duration == 0 or not participants:
+            return
+
+        resolved = [self.roster.get(p.get("puuid"), ("Unknown Player", "Unknown Team", "")) for p in participants]
+        team_names = {}
+        team_kills = {}
+        for participant, (_, team_name, _) in zip(participants, resolved):
+            team_names.setdefault(participant.get("teamId"), team_name)
+            team_kills[participant.get("teamId")] = team_kills.get(participant.get("teamId"), 0) + participant.get("kills", 0)
+
+        game_creation = int(info.get("gameCreation", 0)) // 1000
+        for participant, (player_name, team_name, role) in zip(participants, resolved):
+            team_id = participant.get("teamId")
+            opponent = next((name for tid, name in team_names.items() if tid != team_id), "Unknown Team")
+            riot_name = participant.get("riotIdGameName")
+            riot_id = f"{riot_name}#{participant.get('riotIdTagline', '')}" if riot_name else participant.get("summonerName", "")
+            champion = participant.get("championName", "Unknown")
+
+            self.rows.append((
+                game_creation,
+                duration,
+                1 if participant.get("win") else 0,
+                participant.get("kills", 0),
+                participant.get("deaths", 0),
+                participant.get("assists", 0),
+                participant.get("totalMinionsKilled", 0) + participant.get("neutralMinionsKilled", 0),
+                participant.get("goldEarned", 0),
+                participant.get("totalDamageDealtToChampions", 0),
+                participant.get("totalDamageTaken", 0),
+                participant.get("visionScore", 0),
+                team_kills.get(team_id, 0)
+            ))
+            self.codes.append((
+                self._code("match", match_id),
+                self._code("player", player_name),
+                self._code("riot_id", riot_id),
+                self._code("team", team_name),
+                self._code("opponent", opponent),
+                self._code("role", role or TEAM_POSITION_ROLES.get(participant.get("teamPosition", ""), "")),
+                self._code("champion", self.champions.stats_name(champion) or champion)
+            ))
+
+    def collect(self, match_details: Iterable[Tuple[str, Dict]]) -> Iterator[Tuple[str, Dict]]:
+        """Ajoute chaque match au passage (pour partager la passe de StatsCalculator)"""
+        for match_id, match_data in match_details:
+            self.add(match_id, match_data)
+            yield match_id, match_data
+
+    def save(self, directory: Path) -> "ParticipantMatrix":
+        """Écrit les fichiers de la matrice (remplace la version précédente)"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        stats = np.array(self.rows, dtype=np.int32).reshape(len(self.rows), len(NUMERIC_COLUMNS))
+        codes = np.array(self.codes, dtype=np.int32).reshape(len(self.codes), len(CATEGORY_COLUMNS))
+        # Nouveaux noms à chaque build: les .npy mappés par d'autres sessions restent intacts
+        build = f"{time.time_ns():x}"
+        files = {"stats": f"stats.{build}.npy", "codes": f"codes.{build}.npy"}
+        np.save(directory / files["stats"], stats)
+        np.save(directory / files["codes"], codes)
+
+        header = json.dumps({
+            "version": MATRIX_VERSION,
+            "rows": len(self.rows),
+            "numeric": list(NUMERIC_COLUMNS),
+            "categories": {name: list(values) for name, values in self.dictionaries.items()},
+            "files": files
+        }, ensure_ascii=False)
+
+        # Les dictionnaires (lus puis fermés, jamais mappés) désignent le build courant
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".dictionaries.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(header)
+            os.replace(tmp_path, directory / ParticipantMatrix.DICTIONARIES_FILE)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self._remove_old_builds(directory, set(files.values()))
+        logger.info(f"Participant matrix saved: {len(self.rows)} rows → {directory}")
+        return ParticipantMatrix(directory)
+
+    @staticmethod
+    def _remove_old_builds(directory: Path, keep: set):
+        """Supprime les .npy des builds précédents (ignorés s'ils sont encore mappés)"""
+        for path in directory.glob("*.npy"):
+            if path.name in keep:
+                continue
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.debug(f"Old participant matrix file kept for now: {path.name} ({e})")
+
+
+class ParticipantMatrix:
+    """
+    Lecture de la matrice d'une édition (memmap en lecture seule).
+
+    Exemple:
+        matrix = ParticipantMatrix(path).load()
+        mask = matrix.mask(champion=["Ahri", "Syndra"], start=1760000000)
+        rows = matrix.aggregate(mask, by="player")
+    """
+
+    # Noms fixes des matrices écrites avant les builds versionnés
+    STATS_FILE = "stats.npy"
+    CODES_FILE = "codes.npy"
+    DICTIONARIES_FILE = "dictionaries.json"
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.stats: Optional[np.ndarray] = None
+        self.codes: Optional[np.ndarray] = None
+        self.dictionaries: Dict[str, List[str]] = {}
+        self._lookup: Dict[str, Dict[str, int]] = {}
+
+    def exists(self) -> bool:
+        return (self.directory / self.DICTIONARIES_FILE).exists()
+
+    def version(self) -> Optional[float]:
+        """mtime des dictionnaires (écrits en dernier), pour les clés de cache"""
+        path = self.directory / self.DICTIONARIES_FILE
+        return path.stat().st_mtime if path.exists() else None
+
+    def load(self) -> "ParticipantMatrix":
+        # Une reconstruction peut supprimer le build lu entre les dictionnaires et les
+        # .npy: on relit alors les dictionnaires, qui désignent le nouveau build
+        for attempt in range(2):
+            try:
+                return self._load()
+            except FileNotFoundError:
+                if attempt:
+                    raise
+
+    def _load(self) -> "ParticipantMatrix":
+        with open(self.directory / self.DICTIONARIES_FILE, 'r', encoding='utf-8') as f:
+            header = json.load(f)
+        if header.get("version") != MATRIX_VERSION or header.get("numeric") != list(NUMERIC_COLUMNS):
+            raise ValueError(f"Participant matrix version mismatch in {self.directory}, rebuild it")
+
+        files = header.get("files", {"stats": self.STATS_FILE, "codes": self.CODES_FILE})
+        if header["rows"]:
+            self.stats = np.load(self.directory / files["stats"], mmap_mode="r")
+            self.codes = np.load(self.directory / files["codes"], mmap_mode="r")
+        else:
+            # np.load refuse de mapper un tableau vide
+            self.stats = np.zeros((0, len(NUMERIC_COLUMNS)), dtype=np.int32)
+            self.codes = np.zeros((0, len(CATEGORY_COLUMNS)), dtype=np.int32)
+        self.dictionaries = header["categories"]
+        self._lookup = {name: {value: code for code, value in enumerate(values)}
+                        for name, values in self.dictionaries.items()}
+        return self
+
+    def __len__(self) -> int:
+        return 0 if self.stats is None else len(self.stats)
+
+    # =========================================================================
+    # COLONNES
+    # =========================================================================
+
+    def column(self, name: str) -> np.ndarray:
+        """Colonne numérique (vue sur le memmap)"""
+        return self.stats[:, NUMERIC_COLUMNS.index(name)]
+
+    def category(self, name: str) -> np.ndarray:
+        """Codes d'une colonne catégorielle (vue sur le memmap)"""
+        return self.codes[:, CATEGORY_COLUMNS.index(name)]
+
+    def values(self, name: str) -> List[str]:
+        """Dictionnaire d'une colonne catégorielle (valeur = values[code])"""
+        return self.dictionaries.get(name, [])
+
+    # =========================================================================
+    # FILTRES
+    # =========================================================================
+
+    def mask(self, start: Optional[int] = None, end: Optional[int] = None,
+             **categories: Union[None, str, Sequence[str]]) -> np.ndarray:
+        """
+        Masque booléen des lignes correspondant à tous les filtres.
+
+        Args:
+            start, end: Bornes de game_creation (secondes epoch, incluses)
+            **categories: colonne=valeur ou liste de valeurs (None = pas de filtre),
+                          ex: player="Foo#EUW", champion=["Ahri", "Syndra"]
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= self.column("game_creation") >= start
+        if end is not None:
+            mask &= self.column("game_creation") <= end
+        for name, wanted in categories.items():
+            if wanted is None:
+                continue
+            if isinstance(wanted, str):
+                wanted = [wanted]
+            codes = [self._lookup[name][value] for value in wanted if value in self._lookup[name]]
+            mask &= np.isin(self.category(name), codes)
+        return mask
+
+    # =========================================================================
+    # AGRÉGATS
+    # =========================================================================
+
+    def aggregate(self, mask: np.ndarray, by: str) -> List[Dict[str, Any]]:
+        """
+        Agrège les lignes du masque par colonne catégorielle.
+
+        Returns:
+            Une entrée par groupe présent: {by, games, wins, losses, winrate,
+            kills, deaths, assists (moyennes), kda (totaux, comme StatsCalculator),
+            game_kda (moyenne par partie), kp (%, moyenne par partie),
+            cs_per_min, gold_per_min, damage_per_min, vision, champions}
+        """
+        if not mask.any():
+            return []
+
+        group = self.category(by)[mask]
+        size = len(self.values(by))
+
+        def total(name: str) -> np.ndarray:
+            return np.bincount(group, weights=self.column(name)[mask], minlength=size)
+
+        kills, deaths, assists = total("kills"), total("deaths"), total("assists")
+        cs, gold, damage, vision, wins = total("cs"), total("gold"), total("damage"), total("vision"), total("win")
+        minutes = total("duration") / 60
+        games = np.bincount(group, minlength=size)
+
+        row_k = self.column("kills")[mask].astype(np.float64)
+        row_a = self.column("assists")[mask].astype(np.float64)
+        row_d = self.column("deaths")[mask]
+        row_team_kills = self.column("team_kills")[mask]
+        game_kda = np.where(row_d > 0, (row_k + row_a) / np.maximum(row_d, 1), row_k + row_a)
+        game_kp = np.where(row_team_kills > 0, (row_k + row_a) / np.maximum(row_team_kills, 1) * 100, 0.0)
+        game_kda = np.bincount(group, weights=game_kda, minlength=size)
+        game_kp = np.bincount(group, weights=game_kp, minlength=size)
+
+        # Champions joués par groupe (paires uniques groupe × champion)
+        champions = self.values("champion")
+        pairs = np.unique(group.astype(np.int64) * len(champions) + self.category("champion")[mask])
+        played: Dict[int, List[str]] = {}
+        for pair in pairs.tolist():
+            played.setdefault(pair // len(champions), []).append(champions[pair % len(champions)])
+
+        names = self.values(by)
+        results = []
+        for code in np.flatnonzero(games).tolist():
+            n = int(games[code])
+            results.append({
+                by: names[code],
+                "games": n,
+                "wins": int(wins[code]),
+                "losses": n - int(wins[code]),
+                "winrate": round(wins[code] / n * 100, 2),
+                "kills": round(kills[code] / n, 2),
+                "deaths": round(deaths[code] / n, 2),
+                "assists": round(assists[code] / n, 2),
+                "kda": round((kills[code] + assists[code]) / max(1, deaths[code]), 2),
+                "game_kda": round(game_kda[code] / n, 2),
+                "kp": round(game_kp[code] / n, 1),
+                "cs_per_min": round(cs[code] / minutes[code], 2) if minutes[code] else 0,
+                "gold_per_min": round(gold[code] / minutes[code], 0) if minutes[code] else 0,
+                "damage_per_min": round(damage[code] / minutes[code], 0) if minutes[code] else 0,
+                "vision": round(vision[code] / n, 2),
+                "champions": played.get(code, [])
+            })
+        return results
+
+    def rows(self, mask: np.ndarray, limit: Optional[int] = None, latest_first: bool = True) -> List[Dict[str, Any]]:
+        """Lignes décodées du masque, triées par date (les plus récentes d'abord par défaut)"""
+        indices = np.flatnonzero(mask)
+        order = np.argsort(self.column("game_creation")[indices], kind="stable")
+        if latest_first:
+            order = order[::-1]
+        indices = indices[order[:limit] if limit is not None else order]
+
+        stats = np.asarray(self.stats[indices])
+        codes = np.asarray(self.codes[indices])
+        results = []
+        for stat_row, code_row in zip(stats.tolist(), codes.tolist()):
+            row = dict(zip(NUMERIC_COLUMNS, stat_row))
+            row["win"] = bool(row["win"])
+            for name, code in zip(CATEGORY_COLUMNS, code_row):
+                row[name] = self.dictionaries[name][code]
+            results.append(row)
+        return results
@@ -0,0 +1,275 @@
+"""
+Rank History
+Historique des rangs (League-V4 SoloQ) des joueurs d'une édition.
+
+L'étape 3 écrase tier / rank / LP dans teams_with_puuid.json: l'historique
+garde chaque changement d'entrée de ligue, pour les courbes de LP et le
+« rang au début du tournoi » sans refaire d'appel API.
+
+data/editions/edition_X/rank_history.json
+{
+    "version": 1,
+    "players": {
+        "<puuid>": [
+            [1730000000, 45, 120, 98, "GOLD", "II"],   # 1er snapshot: valeurs absolues
+            [86400, 12, 3, 1],                         # suivants: deltas
+            [3600, -57, 2, 3, "GOLD", "I"],            # tier/division seulement s'ils changent
+            ...
+        ]
+    }
+}
+
+Un snapshot = [Δt (s), ΔLP, Δvictoires, Δdéfaites(, tier, division)].
+Un snapshot n'est ajouté que si l'entrée du joueur a changé depuis le
+précédent: un refresh quotidien sans partie jouée n'écrit rien.
+
+L'étape 3 (jobs de l'Admin, CLI), le rafraîchissement d'une équipe et
+scripts/update_lp.py peuvent écrire en même temps: record_many() relit le
+fichier sous un verrou inter-process (file_lock.py) avant d'ajouter ses
+snapshots, au lieu de réécrire la copie chargée au premier accès.
+"""
+
+import os
+import json
+import time
+import bisect
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.core.file_lock import file_lock
+
+logger = logging.getLogger(__name__)
+
+HISTORY_VERSION = 1
+
+UNRANKED = "UNRANKED"
+TIERS = ["IRON", "BRONZE", "SILVER", "GOLD", "PLATINUM", "EMERALD", "DIAMOND",
+         "MASTER", "GRANDMASTER", "CHALLENGER"]
+DIVISIONS = ["IV", "III", "II", "I"]
+APEX_TIERS = {"MASTER", "GRANDMASTER", "CHALLENGER"}
+
+
+def league_entry(ranked_info: Optional[Dict]) -> Dict:
+    """Entrée normalisée depuis get_ranked_info() (None = unranked)"""
+    ranked_info = ranked_info or {}
+    return {
+        "tier": ranked_info.get("tier") or UNRANKED,
+        "rank": ranked_info.get("rank") or "",
+        "leaguePoints": ranked_info.get("leaguePoints", 0) or 0,
+        "wins": ranked_info.get("wins", 0) or 0,
+        "losses": ranked_info.get("losses", 0) or 0
+    }
+
+
+def lp_score(snapshot: Dict) -> Optional[int]:
+    """
+    Position sur une échelle continue (axe des courbes de LP):
+    400 par tier, 100 par division, LP; Master+ partagent une même échelle.
+
+    Returns:
+        Score, ou None si unranked
+    """
+    tier = snapshot.get("tier")
+    if tier not in TIERS:
+        return None
+    if tier in APEX_TIERS:
+        return TIERS.index("MASTER") * 400 + snapshot.get("leaguePoints", 0)
+    division = DIVISIONS.index(snapshot["rank"]) if snapshot.get("rank") in DIVISIONS else 0
+    return TIERS.index(tier) * 400 + division * 100 + snapshot.get("leaguePoints", 0)
+
+
+def _decode(records: List[List]) -> List[Dict]:
+    snapshots = []
+    state = {"timestamp": 0, "tier": UNRANKED, "rank": "", "leaguePoints": 0, "wins": 0, "losses": 0}
+    for record in records:
+        state = dict(state)
+        state["timestamp"] += record[0]
+        state["leaguePoints"] += record[1]
+        state["wins"] += record[2]
+        state["losses"] += record[3]
+        if len(record) > 4:
+            state["tier"], state["rank"] = record[4], record[5]
+        snapshots.append(state)
+    return snapshots
+
+
+def _encode(previous: Optional[Dict], snapshot: Dict) -> List:
+    if previous is None:
+        return [snapshot["timestamp"], snapshot["leaguePoints"], snapshot["wins"], snapshot["losses"],
+                snapshot["tier"], snapshot["rank"]]
+    record = [
+        snapshot["timestamp"] - previous["timestamp"],
+        snapshot["leaguePoints"] - previous["leaguePoints"],
+        snapshot["wins"] - previous["wins"],
+        snapshot["losses"] - previous["losses"]
+    ]
+    if (snapshot["tier"], snapshot["rank"]) != (previous["tier"], previous["rank"]):
+        record += [snapshot["tier"], snapshot["rank"]]
+    return record
+
+
+class RankHistory:
+    """
+    Historique des rangs d'une édition, chargé au premier accès.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Fichier rank_history.json de l'édition
+        """
+        self.path = Path(path)
+        self._records: Optional[Dict[str, List[List]]] = None
+        self._snapshots: Dict[str, List[Dict]] = {}
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # STOCKAGE
+    # =========================================================================
+
+    def _load(self) -> Dict[str, List[List]]:
+        if self._records is None:
+            records = {}
+            if self.path.exists():
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if data.get("version") == HISTORY_VERSION:
+                        records = data.get("players", {})
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Invalid rank history {self.path}: {e}")
+            self._records = records
+        return self._records
+
+    def _save(self):
+        content = json.dumps(
+            {"version": HISTORY_VERSION, "players": self._records},
+            ensure_ascii=False, separators=(',', ':')
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".rank_history.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    # =========================================================================
+    # ÉCRITURE
+    # =========================================================================
+
+    def record_many(self, entries: Dict[str, Optional[Dict]], timestamp: Optional[int] = None) -> int:
+        """
+        Ajoute un snapshot pour chaque joueur dont l'entrée a changé, puis
+        enregistre le fichier (une seule écriture, aucune si rien n'a changé).
+        Le fichier est relu sous verrou avant la fusion: les snapshots écrits
+        entre-temps par un autre process sont conservés.
+
+        Args:
+            entries: {puuid: entrée de get_ranked_info() ou None si unranked}
+            timestamp: Date des entrées (secondes, défaut: maintenant)
+
+        Returns:
+            Nombre de snapshots ajoutés
+        """
+        timestamp = int(timestamp if timestamp is not None else time.time())
+        added = 0
+        with self._lock, file_lock(self.path):
+            # Copie chargée au premier accès: peut-être périmée
+            self._records = None
+            self._snapshots = {}
+            records = self._load()
+            for puuid, ranked_info in entries.items():
+                snapshot = {"timestamp": timestamp, **league_entry(ranked_info)}
+                previous = self.latest(puuid)
+                if previous is not None:
+                    unchanged = all(previous[key] == snapshot[key] for key in snapshot if key != "timestamp")
+                    if unchanged or timestamp < previous["timestamp"]:
+                        continue
+                records.setdefault(puuid, []).append(_encode(previous, snapshot))
+                self._snapshots.setdefault(puuid, []).append(snapshot)
+                added += 1
+            if added:
+                self._save()
+        return added
+
+    def record(self, puuid: str, ranked_info: Optional[Dict], timestamp: Optional[int] = None) -> bool:
+        """Ajoute un snapshot si l'entrée du joueur a changé (voir record_many)"""
+        return self.record_many({puuid: ranked_info}, timestamp) > 0
+
+    # =========================================================================
+    # REQUÊTES
+    # =========================================================================
+
+    def players(self) -> List[str]:
+        """PUUIDs ayant au moins un snapshot"""
+        return list(self._load())
+
+    def history(self, puuid: str, start: Optional[int] = None, end: Optional[int] = None) -> List[Dict]:
+        """
+        Snapshots d'un joueur, du plus ancien au plus récent.
+
+        Args:
+            start, end: Bornes incluses (secondes), optionnelles
+
+        Returns:
+            [{"timestamp", "tier", "rank", "leaguePoints", "wins", "losses"}]
+        """
+        if puuid not in self._snapshots:
+            self._snapshots[puuid] = _decode(self._load().get(puuid, []))
+        snapshots = self._snapshots[puuid]
+        return [
+            snapshot for snapshot in snapshots
+            if (start is None or snapshot["timestamp"] >= start)
+            and (end is None or snapshot["timestamp"] <= end)
+        ]
+
+    def latest(self, puuid: str) -> Optional[Dict]:
+        """Dernier snapshot connu d'un joueur"""
+        snapshots = self.history(puuid)
+        return snapshots[-1] if snapshots else None
+
+    def rank_at(self, puuid: str, timestamp: int) -> Optional[Dict]:
+        """
+        Rang d'un joueur à une date: dernier snapshot à cette date ou avant.
+
+        Returns:
+            Snapshot, ou None si aucun snapshot n'est aussi ancien
+        """
+        snapshots = self.history(puuid)
+        index = bisect.bisect_right([snapshot["timestamp"] for snapshot in snapshots], timestamp)
+        return snapshots[index - 1] if index else None
+
+    def ranks_at(self, timestamp: int) -> Dict[str, Dict]:
+        """Rang de chaque joueur à une date (ex: début du tournoi)"""
+        ranks = {}
+        for puuid in self.players():
+            snapshot = self.rank_at(puuid, timestamp)
+            if snapshot is not None:
+                ranks[puuid] = snapshot
+        return ranks
+
+    def lp_progression(self, puuid: str, start: Optional[int] = None,
+                       end: Optional[int] = None) -> List[Dict]:
+        """
+        Points d'une courbe de LP: [{"timestamp", "score", "label"}]
+        (snapshots unranked ignorés, voir lp_score)
+        """
+        points = []
+        for snapshot in self.history(puuid, start, end):
+            score = lp_score(snapshot)
+            if score is None:
+                continue
+            division = "" if snapshot["tier"] in APEX_TIERS else f" {snapshot['rank']}"
+            points.append({
+                "timestamp": snapshot["timestamp"],
+                "score": score,
+                "label": f"{snapshot['tier']}{division} {snapshot['leaguePoints']} LP"
+            })
+        return points
@@ -0,0 +1,198 @@
+"""
+Rate Limiter
+Espacement minimal entre requêtes, partagé entre threads.
+
+Un seul RateLimiter par clé API: RiotAPIClient l'utilise avant chaque
+requête, et plusieurs éditions traitées en parallèle (scripts/occilan.py)
+partagent le même client, donc le même quota. Un 429 (Retry-After) met
+en pause tous les threads, pas seulement celui qui l'a reçu.
+
+PriorityRateLimiter (limiteur par défaut de RiotAPIClient) ordonne les
+requêtes en attente par priorité: un rafraîchissement de rangs depuis
+l'Admin passe devant un backfill de matchs (étape 5) qui tourne sur la même
+clé, au lieu d'attendre la fin de sa file.
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+# Limites applicatives Riot ("requêtes:secondes" par fenêtre): clé de
+# production et clé de développement
+PRODUCTION_APP_LIMITS = "500:10,30000:600"
+DEV_KEY_APP_LIMITS = "20:1,100:120"
+
+# Priorités des requêtes, de la plus urgente à la moins urgente
+PRIORITY_INTERACTIVE = "interactive"   # action de l'utilisateur (bouton, recherche d'un match)
+PRIORITY_NORMAL = "normal"             # étapes 2-4 du pipeline
+PRIORITY_BULK = "bulk"                 # backfill de matchs / timelines (étape 5)
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_NORMAL, PRIORITY_BULK)
+
+# Part des créneaux de chaque priorité quand plusieurs attendent en même temps
+# (une priorité seule utilise tous les créneaux)
+PRIORITY_BUDGETS = {PRIORITY_INTERACTIVE: 0.7, PRIORITY_NORMAL: 0.2, PRIORITY_BULK: 0.1}
+
+
+def parse_limits(spec: str) -> List[Tuple[int, int]]:
+    """"20:1,100:120" → [(20, 1), (100, 120)] (requêtes, secondes)"""
+    limits = []
+    for part in spec.split(","):
+        count, seconds = part.strip().split(":")
+        limits.append((int(count), int(seconds)))
+    return limits
+
+
+class RateLimiter:
+    """
+    Attribue à chaque appel de wait() un créneau espacé d'au moins
+    min_interval du précédent (créneaux réservés sous verrou, attente hors
+    verrou).
+    """
+
+    def __init__(self, min_interval: float):
+        """
+        Args:
+            min_interval: Intervalle minimal entre deux requêtes (secondes)
+        """
+        self.min_interval = min_interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self, priority: str = PRIORITY_NORMAL) -> float:
+        """
+        Bloque jusqu'au prochain créneau libre (ordre d'arrivée, priorité ignorée).
+
+        Returns:
+            Temps d'attente (secondes)
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def pause(self, seconds: float):
+        """Repousse les prochains créneaux de tous les threads (ex: Retry-After)"""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+
+class PriorityRateLimiter(RateLimiter):
+    """
+    Même espacement que RateLimiter, mais les créneaux sont attribués par
+    priorité au lieu de l'ordre d'arrivée.
+
+    Ordonnancement (stride scheduling): chaque priorité avance d'un pas
+    1 / budget à chaque créneau obtenu, le prochain créneau va à la priorité
+    en attente la moins avancée. Quand plusieurs priorités attendent, chacune
+    obtient sa part PRIORITY_BUDGETS des créneaux: une requête interactive
+    passe au créneau suivant (attente ~ min_interval), le backfill garde sa
+    part et n'est jamais affamé. Une priorité qui n'attendait pas repart au
+    niveau courant: pas de crédit accumulé pendant l'inactivité.
+
+    Un créneau n'est attribué qu'à son heure (pas de réservation à l'avance
+    comme RateLimiter): une requête prioritaire arrivée entre-temps le prend.
+    """
+
+    def __init__(self, min_interval: float, budgets: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            min_interval: Intervalle minimal entre deux requêtes (secondes)
+            budgets: Part des créneaux par priorité (défaut: PRIORITY_BUDGETS)
+        """
+        super().__init__(min_interval)
+        self.budgets = dict(budgets or PRIORITY_BUDGETS)
+        unknown = set(self.budgets) - set(PRIORITIES)
+        if unknown or any(budget <= 0 for budget in self.budgets.values()):
+            raise ValueError(f"Invalid priority budgets: {self.budgets}")
+
+        self._condition = threading.Condition(self._lock)
+        self._queues: Dict[str, deque] = {priority: deque() for priority in self.budgets}
+        self._pass: Dict[str, float] = {priority: 0.0 for priority in self.budgets}
+        self._virtual_time = 0.0
+        self._stats = {priority: {"requests": 0, "wait_seconds": 0.0, "max_wait": 0.0}
+                       for priority in self.budgets}
+
+    def _next_priority(self) -> Optional[str]:
+        waiting = [priority for priority, queue in self._queues.items() if queue]
+        if not waiting:
+            return None
+        return min(waiting, key=lambda priority: (self._pass[priority], PRIORITIES.index(priority)))
+
+    def wait(self, priority: str = PRIORITY_NORMAL) -> float:
+        """
+        Bloque jusqu'au créneau attribué à cette requête.
+
+        Args:
+            priority: PRIORITY_INTERACTIVE, PRIORITY_NORMAL ou PRIORITY_BULK
+
+        Returns:
+            Temps d'attente (secondes)
+        """
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority: {priority}")
+
+        started = time.monotonic()
+        ticket = object()
+        with self._condition:
+            queue = self._queues[priority]
+            if not queue:
+                self._pass[priority] = max(self._pass[priority], self._virtual_time)
+            queue.append(ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    if now >= self._next_slot and queue[0] is ticket and self._next_priority() == priority:
+                        break
+                    # Le premier en file dort jusqu'au créneau, les autres jusqu'à un réveil
+                    self._condition.wait(self._next_slot - now if now < self._next_slot else None)
+            except BaseException:
+                queue.remove(ticket)
+                self._condition.notify_all()
+                raise
+
+            queue.popleft()
+            self._next_slot = now + self.min_interval
+            self._virtual_time = self._pass[priority]
+            self._pass[priority] += 1.0 / self.budgets[priority]
+
+            delay = now - started
+            stats = self._stats[priority]
+            stats["requests"] += 1
+            stats["wait_seconds"] += delay
+            stats["max_wait"] = max(stats["max_wait"], delay)
+            self._condition.notify_all()
+        return delay
+
+    def expected_wait(self) -> float:
+        """Attente estimée d'une nouvelle requête (créneau suivant + requêtes en file)"""
+        with self._lock:
+            waiting = sum(len(queue) for queue in self._queues.values())
+            return max(0.0, self._next_slot - time.monotonic()) + waiting * self.min_interval
+
+    def pause(self, seconds: float):
+        """Repousse les prochains créneaux de toutes les priorités (ex: Retry-After)"""
+        with self._condition:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        Par priorité: requêtes servies, attente totale / moyenne / max (secondes)
+        et requêtes en file
+        """
+        with self._lock:
+            return {
+                priority: {
+                    "requests": stats["requests"],
+                    "waiting": len(self._queues[priority]),
+                    "wait_seconds": round(stats["wait_seconds"], 4),
+                    "avg_wait": round(stats["wait_seconds"] / stats["requests"], 4) if stats["requests"] else 0.0,
+                    "max_wait": round(stats["max_wait"], 4)
+                }
+                for priority, stats in self._stats.items()
+            }
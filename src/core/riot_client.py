@@ -6,18 +6,38 @@ Endpoints implémentés:
 - Account-V1: Riot ID → PUUID
 - Summoner-V4: PUUID → summoner info
 - League-V4: summoner ID → rank/LP
-- Match-V5: PUUID → match IDs, match details
+- Match-V5: PUUID → match IDs, match details, match timelines
+
+Routage: platform / région de chaque appel déduite de l'ID de match, du
+Riot ID ou de la platform du joueur, et requêtes réparties sur une ou
+plusieurs clés API (voir src/core/riot_routing.py).
+
+Priorités: les requêtes passent par un PriorityRateLimiter. Par défaut
+"normal"; get_all_match_details est en "bulk", et une action interactive
+s'exécute dans `with client.priority(PRIORITY_INTERACTIVE):` pour passer
+devant un backfill en cours sur le même client.
 """
 
 import os
 import time
+import gzip
 import json
 import logging
+import tempfile
+import threading
+from contextlib import contextmanager
 from typing import Optional, Dict, List, Any
 from pathlib import Path
 from datetime import datetime
 import requests
 
+from src.core.api_metrics import ApiMetrics
+from src.core.rate_limiter import RateLimiter, PriorityRateLimiter, PRIORITY_NORMAL, PRIORITY_BULK
+from src.core.riot_routing import (
+    ApiKeyPool, project_keys, mask_key, region_for_platform, account_region,
+    platform_for_match, platform_for_tag
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,35 +48,65 @@ class RiotAPIClient:
     Regional routing:
     - Account-V1, Match-V5: region (europe, americas, asia, sea)
     - Summoner-V4, League-V4: platform (euw1, na1, kr, etc.)
+    
+    Un limiteur par (clé, routage): les limites Riot sont comptées par
+    région, une édition multi-régions n'attend pas sur un seul quota.
     """
     
     # Rate limiting
     REQUEST_DELAY = 0.05  # 50ms entre requêtes (20 req/s max)
     MAX_RETRIES = 3
     
-    # Régions et platforms
+    DEFAULT_CACHE_DIR = "data/cache"
+    MOCK_CACHE_DIR = "data/cache/mock"  # Serveur autre que l'API Riot (mock, tests de charge)
+    
+    # Régions et platforms par défaut (joueurs / matchs sans platform connue)
     REGION = "europe"  # Pour Account-V1 et Match-V5
     PLATFORM = "euw1"  # Pour Summoner-V4 et League-V4
     
-    def __init__(self, api_key: str, cache_dir: str = "data/cache"):
+    def __init__(self, api_key: str, cache_dir: Optional[str] = None, base_url: Optional[str] = None,
+                 rate_limiter: Optional[RateLimiter] = None, platform: Optional[str] = None,
+                 api_keys: Optional[str] = None):
         """
         Initialise le client API.
         
+        Le client peut être partagé entre threads (une édition par thread):
+        rate limit, métriques et cache PUUID sont protégés par verrou.
+        
         Args:
             api_key: Clé API Riot Games
-            cache_dir: Répertoire pour le cache local
+            cache_dir: Répertoire pour le cache local (défaut: DEFAULT_CACHE_DIR, ou
+                       MOCK_CACHE_DIR avec base_url / RIOT_API_BASE_URL, pour que les
+                       données d'un mock n'entrent jamais dans le cache de l'API réelle)
+            base_url: Serveur à utiliser à la place de https://{routing}.api.riotgames.com
+                      (ex: mock local "http://127.0.0.1:8765"), sinon RIOT_API_BASE_URL
+            rate_limiter: Limiteur unique pour toutes les requêtes, partagé avec d'autres
+                          clients de la même clé (par défaut: un PriorityRateLimiter à
+                          REQUEST_DELAY par clé et par routage)
+            platform: Platform par défaut (défaut: PLATFORM)
+            api_keys: Clés "projet/clé[@limites];..." (sinon RIOT_API_KEYS): seules celles
+                      du projet de api_key sont utilisées (PUUIDs chiffrés par projet),
+                      ignorées avec un rate_limiter unique
         """
         self.api_key = api_key
-        self.cache_dir = Path(cache_dir)
+        self.platform = (platform or self.PLATFORM).lower()
+        self.region = region_for_platform(self.platform)
+        self.base_url = (base_url or os.getenv("RIOT_API_BASE_URL") or "").rstrip("/")
+        self.cache_dir = Path(cache_dir or (self.MOCK_CACHE_DIR if self.base_url else self.DEFAULT_CACHE_DIR))
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Cache des matchs
+        # Cache des matchs (payloads bruts complets, gzip)
         self.matches_cache_dir = self.cache_dir / "matches"
         self.matches_cache_dir.mkdir(exist_ok=True)
         
+        # Cache des timelines (gzip, ~10x plus volumineuses que les matchs)
+        self.timelines_cache_dir = self.cache_dir / "timelines"
+        self.timelines_cache_dir.mkdir(exist_ok=True)
+        
         # Cache PUUID → summonerName
         self.puuid_map_file = self.cache_dir / "puuid_map.json"
         self.puuid_map = self._load_puuid_map()
+        self._puuid_map_lock = threading.Lock()
         
         # Headers pour toutes les requêtes
         self.headers = {
@@ -64,38 +114,95 @@ class RiotAPIClient:
             "Accept": "application/json"
         }
         
-        # Timestamp dernière requête (rate limiting)
-        self.last_request_time = 0
+        # Rate limiting: limiteur unique (partagé entre clients), sinon pool de clés
+        self.rate_limiter = rate_limiter
+        keys, ignored = project_keys(api_key, api_keys if api_keys is not None else os.getenv("RIOT_API_KEYS"))
+        if ignored:
+            logger.warning(f"API keys ignored (not declared in the same project as the main key): "
+                           f"{', '.join(mask_key(key) for key in ignored)}")
+        self.key_pool = ApiKeyPool(keys or [(api_key, None)], self.REQUEST_DELAY)
+        
+        # Priorité des requêtes du thread courant (voir priority())
+        self._local = threading.local()
+        
+        # Métriques par famille d'endpoints
+        self._metrics = ApiMetrics()
         
-        logger.info(f"RiotAPIClient initialized (region={self.REGION}, platform={self.PLATFORM})")
+        logger.info(f"RiotAPIClient initialized (region={self.region}, platform={self.platform}, "
+                    f"keys={', '.join(mask_key(key) for key, _ in self.key_pool.keys)})")
+        if self.base_url:
+            logger.info(f"Using API base URL {self.base_url}")
+    
+    def _url(self, routing: str, path: str) -> str:
+        """URL d'un endpoint (routing = region ou platform)"""
+        if self.base_url:
+            return f"{self.base_url}{path}"
+        return f"https://{routing}.api.riotgames.com{path}"
     
     # =========================================================================
     # RATE LIMITING & RETRY LOGIC
     # =========================================================================
     
-    def _wait_for_rate_limit(self):
-        """Attend pour respecter le rate limit (20 req/s)."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.REQUEST_DELAY:
-            time.sleep(self.REQUEST_DELAY - elapsed)
-        self.last_request_time = time.time()
+    @contextmanager
+    def priority(self, priority: str):
+        """
+        Priorité des requêtes faites par le thread courant dans le bloc.
+        
+        Exemple:
+            >>> with client.priority(PRIORITY_INTERACTIVE):
+            ...     client.get_ranked_info(puuid)
+        """
+        previous = self.current_priority()
+        self._local.priority = priority
+        try:
+            yield self
+        finally:
+            self._local.priority = previous
+    
+    def current_priority(self) -> str:
+        return getattr(self._local, "priority", PRIORITY_NORMAL)
+    
+    def _wait_for_rate_limit(self, endpoint: str = "other", routing: Optional[str] = None) -> str:
+        """
+        Attend le créneau de la requête (rate limit, selon la priorité du thread).
+        
+        Returns:
+            Clé API à utiliser
+        """
+        priority = self.current_priority()
+        if self.rate_limiter is not None:
+            api_key, delay = self.api_key, self.rate_limiter.wait(priority)
+        else:
+            api_key, delay = self.key_pool.acquire(routing or self.region, priority)
+        if delay > 0:
+            self._metrics.record_sleep(endpoint, "throttle", delay)
+        return api_key
     
-    def _make_request(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+    def _make_request(self, url: str, params: Optional[Dict] = None, endpoint: str = "other",
+                      routing: Optional[str] = None) -> Optional[Dict]:
         """
         Effectue une requête API avec retry logic.
         
         Args:
             url: URL complète de l'endpoint
             params: Paramètres query string
+            endpoint: Famille d'endpoints pour les métriques
+                      (account, summoner, league, match-ids, match, timeline)
+            routing: Région ou platform de la requête (limiteur utilisé)
         
         Returns:
             Réponse JSON ou None si erreur
         """
+        routing = routing or self.region
         for attempt in range(self.MAX_RETRIES):
+            can_retry = attempt < self.MAX_RETRIES - 1
             try:
-                self._wait_for_rate_limit()
+                api_key = self._wait_for_rate_limit(endpoint, routing)
+                headers = self.headers if api_key == self.api_key else {**self.headers, "X-Riot-Token": api_key}
                 
-                response = requests.get(url, headers=self.headers, params=params, timeout=10)
+                started = time.perf_counter()
+                response = requests.get(url, headers=headers, params=params, timeout=10)
+                self._metrics.observe_request(endpoint, time.perf_counter() - started, response.status_code)
                 
                 # Succès
                 if response.status_code == 200:
@@ -104,8 +211,18 @@ class RiotAPIClient:
                 # Rate limit dépassé
                 elif response.status_code == 429:
                     retry_after = int(response.headers.get("Retry-After", 1))
-                    logger.warning(f"Rate limited (429), waiting {retry_after}s...")
-                    time.sleep(retry_after)
+                    logger.warning(f"Rate limited (429) on key {mask_key(api_key)}/{routing}, waiting {retry_after}s...")
+                    # Pause partagée: les autres threads attendent aussi
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.pause(retry_after)
+                    else:
+                        self.key_pool.pause(api_key, routing, retry_after)
+                    if self.rate_limiter is not None or len(self.key_pool.keys) == 1:
+                        time.sleep(retry_after)
+                        self._metrics.record_sleep(endpoint, "retry_after", retry_after)
+                    # Plusieurs clés: le nouvel essai part sur une clé non bloquée
+                    if can_retry:
+                        self._metrics.record_retry(endpoint)
                     continue
                 
                 # Non trouvé (normal, pas une erreur)
@@ -116,22 +233,73 @@ class RiotAPIClient:
                 # Autres erreurs
                 else:
                     logger.warning(f"API error {response.status_code}: {response.text}")
-                    if attempt < self.MAX_RETRIES - 1:
+                    if can_retry:
                         wait_time = 2 ** attempt
                         logger.info(f"Retrying in {wait_time}s... (attempt {attempt + 1}/{self.MAX_RETRIES})")
                         time.sleep(wait_time)
+                        self._metrics.record_sleep(endpoint, "backoff", wait_time)
+                        self._metrics.record_retry(endpoint)
                     continue
                     
             except requests.exceptions.RequestException as e:
+                self._metrics.observe_request(endpoint, time.perf_counter() - started, None)
                 logger.error(f"Request exception: {e}")
-                if attempt < self.MAX_RETRIES - 1:
+                if can_retry:
                     time.sleep(2 ** attempt)
+                    self._metrics.record_sleep(endpoint, "backoff", 2 ** attempt)
+                    self._metrics.record_retry(endpoint)
                     continue
                 return None
         
         logger.error(f"Failed after {self.MAX_RETRIES} retries: {url}")
         return None
     
+    # =========================================================================
+    # METRICS
+    # =========================================================================
+    
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Snapshot des métriques par famille d'endpoints (requêtes, latence,
+        codes HTTP, retries, attentes, cache). Voir src/core/api_metrics.py.
+        
+        + "priorities" (attente par priorité) et, avec le pool de clés,
+        "routes" (par clé masquée / routage).
+        """
+        snapshot = self._metrics.snapshot()
+        if self.rate_limiter is None:
+            snapshot["priorities"] = self.key_pool.priority_totals()
+            snapshot["routes"] = self.key_pool.stats()
+        elif isinstance(self.rate_limiter, PriorityRateLimiter):
+            snapshot["priorities"] = self.rate_limiter.stats()
+        return snapshot
+    
+    def reset_metrics(self):
+        self._metrics.reset()
+    
+    def dump_metrics(self, path: Optional[str] = None, format: str = "json") -> str:
+        """
+        Exporte les métriques.
+        
+        Args:
+            path: Fichier de sortie (optionnel)
+            format: "json" ou "prometheus" (format texte d'exposition)
+        
+        Returns:
+            Le contenu exporté
+        """
+        if format == "prometheus":
+            content = self._metrics.to_prometheus()
+        elif format == "json":
+            content = self._metrics.to_json()
+        else:
+            raise ValueError(f"Unknown metrics format: {format}")
+        
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        return content
+    
     # =========================================================================
     # CACHE MANAGEMENT
     # =========================================================================
@@ -149,44 +317,83 @@ class RiotAPIClient:
     def _save_puuid_map(self):
         """Sauvegarde le mapping PUUID → summonerName."""
         try:
-            with open(self.puuid_map_file, 'w', encoding='utf-8') as f:
-                json.dump(self.puuid_map, f, indent=2, ensure_ascii=False)
+            with self._puuid_map_lock:
+                content = json.dumps(self.puuid_map, indent=2, ensure_ascii=False)
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".puuid_map.", suffix=".tmp")
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                os.replace(tmp_path, self.puuid_map_file)
         except Exception as e:
             logger.error(f"Error saving puuid_map: {e}")
     
     def _get_cached_match(self, match_id: str) -> Optional[Dict]:
-        """Récupère un match depuis le cache local."""
-        cache_file = self.matches_cache_dir / f"{match_id}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
+        """Récupère un match (payload brut complet) depuis le cache local."""
+        cache_file = self.matches_cache_dir / f"{match_id}.json.gz"
+        legacy_file = self.matches_cache_dir / f"{match_id}.json"
+        try:
+            if cache_file.exists():
+                with gzip.open(cache_file, 'rt', encoding='utf-8') as f:
                     logger.debug(f"Match {match_id} loaded from cache")
                     return json.load(f)
-            except Exception as e:
-                logger.error(f"Error loading cached match {match_id}: {e}")
+            if legacy_file.exists():
+                # Ancien cache non compressé
+                with open(legacy_file, 'r', encoding='utf-8') as f:
+                    logger.debug(f"Match {match_id} loaded from cache")
+                    return json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading cached match {match_id}: {e}")
         return None
     
     def _cache_match(self, match_id: str, match_data: Dict):
-        """Sauvegarde un match dans le cache local."""
-        cache_file = self.matches_cache_dir / f"{match_id}.json"
+        """
+        Sauvegarde un match dans le cache local (JSON compact gzip).
+        
+        Seule copie du payload brut: l'édition ne stocke que la projection
+        (voir match_projection), re-projetable depuis ce cache.
+        """
+        cache_file = self.matches_cache_dir / f"{match_id}.json.gz"
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(match_data, f, indent=2, ensure_ascii=False)
+            with gzip.open(cache_file, 'wt', encoding='utf-8') as f:
+                json.dump(match_data, f, separators=(',', ':'), ensure_ascii=False)
             logger.debug(f"Match {match_id} cached")
         except Exception as e:
             logger.error(f"Error caching match {match_id}: {e}")
     
+    def _get_cached_timeline(self, match_id: str) -> Optional[Dict]:
+        """Récupère une timeline depuis le cache local."""
+        cache_file = self.timelines_cache_dir / f"{match_id}.json.gz"
+        if cache_file.exists():
+            try:
+                with gzip.open(cache_file, 'rt', encoding='utf-8') as f:
+                    logger.debug(f"Timeline {match_id} loaded from cache")
+                    return json.load(f)
+            except Exception as e:
+                logger.error(f"Error loading cached timeline {match_id}: {e}")
+        return None
+    
+    def _cache_timeline(self, match_id: str, timeline: Dict):
+        """Sauvegarde une timeline dans le cache local (JSON compact gzip)."""
+        cache_file = self.timelines_cache_dir / f"{match_id}.json.gz"
+        try:
+            with gzip.open(cache_file, 'wt', encoding='utf-8') as f:
+                json.dump(timeline, f, separators=(',', ':'), ensure_ascii=False)
+            logger.debug(f"Timeline {match_id} cached")
+        except Exception as e:
+            logger.error(f"Error caching timeline {match_id}: {e}")
+    
     # =========================================================================
     # ACCOUNT-V1: Riot ID → PUUID
     # =========================================================================
     
-    def get_account_by_riot_id(self, game_name: str, tag_line: str) -> Optional[Dict]:
+    def get_account_by_riot_id(self, game_name: str, tag_line: str,
+                               platform: Optional[str] = None) -> Optional[Dict]:
         """
         Convertit un Riot ID (gameName#tagLine) en PUUID.
         
         Args:
             game_name: Nom du joueur (sans le #)
             tag_line: Tag après le # (ex: "EUW")
+            platform: Platform du joueur (défaut: déduite du tag, sinon platform du client)
         
         Returns:
             {"puuid": "...", "gameName": "...", "tagLine": "..."}
@@ -196,10 +403,11 @@ class RiotAPIClient:
             >>> client.get_account_by_riot_id("Player1", "EUW")
             {"puuid": "abc123...", "gameName": "Player1", "tagLine": "EUW"}
         """
-        url = f"https://{self.REGION}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
+        region = account_region(platform or platform_for_tag(tag_line, self.platform))
+        url = self._url(region, f"/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}")
         
         logger.debug(f"Fetching PUUID for {game_name}#{tag_line}...")
-        result = self._make_request(url)
+        result = self._make_request(url, endpoint="account", routing=region)
         
         if result:
             logger.info(f"✓ PUUID found for {game_name}#{tag_line}")
@@ -212,12 +420,13 @@ class RiotAPIClient:
     # SUMMONER-V4: PUUID → Summoner Info
     # =========================================================================
     
-    def get_summoner_by_puuid(self, puuid: str) -> Optional[Dict]:
+    def get_summoner_by_puuid(self, puuid: str, platform: Optional[str] = None) -> Optional[Dict]:
         """
         Récupère les infos summoner à partir du PUUID.
         
         Args:
             puuid: PUUID du joueur
+            platform: Platform du joueur (défaut: platform du client)
         
         Returns:
             {
@@ -234,15 +443,17 @@ class RiotAPIClient:
             >>> client.get_summoner_by_puuid("abc123...")
             {"id": "xyz789...", "name": "Player1", ...}
         """
-        url = f"https://{self.PLATFORM}.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/{puuid}"
+        platform = (platform or self.platform).lower()
+        url = self._url(platform, f"/lol/summoner/v4/summoners/by-puuid/{puuid}")
         
         logger.debug(f"Fetching summoner info for PUUID {puuid[:20]}...")
-        result = self._make_request(url)
+        result = self._make_request(url, endpoint="summoner", routing=platform)
         
         if result:
             # Mise à jour cache PUUID → gameName (nouveau format Riot ID)
             summoner_name = result.get("gameName", result.get("name", "Unknown"))
-            self.puuid_map[puuid] = summoner_name
+            with self._puuid_map_lock:
+                self.puuid_map[puuid] = summoner_name
             self._save_puuid_map()
             logger.info(f"✓ Summoner info found (level {result.get('summonerLevel', '?')})")
             logger.debug(f"Summoner full data: {result}")
@@ -253,12 +464,13 @@ class RiotAPIClient:
     # LEAGUE-V4: Summoner ID → Rank/LP
     # =========================================================================
     
-    def get_ranked_info(self, puuid: str) -> Optional[Dict]:
+    def get_ranked_info(self, puuid: str, platform: Optional[str] = None) -> Optional[Dict]:
         """
         Récupère le rank actuel (SoloQ) d'un summoner via PUUID.
         
         Args:
             puuid: PUUID du joueur
+            platform: Platform du joueur (défaut: platform du client)
         
         Returns:
             {
@@ -274,10 +486,11 @@ class RiotAPIClient:
               Si besoin de Flex, adapter le code.
         """
         # Nouvelle API: League-V4 accepte maintenant le PUUID directement
-        url = f"https://{self.PLATFORM}.api.riotgames.com/lol/league/v4/entries/by-puuid/{puuid}"
+        platform = (platform or self.platform).lower()
+        url = self._url(platform, f"/lol/league/v4/entries/by-puuid/{puuid}")
         
         logger.debug(f"Fetching ranked info for PUUID {puuid[:20]}...")
-        result = self._make_request(url)
+        result = self._make_request(url, endpoint="league", routing=platform)
         
         if not result:
             logger.warning("✗ No ranked data (unranked)")
@@ -312,7 +525,8 @@ class RiotAPIClient:
         end_time: Optional[int] = None,
         queue_id: Optional[int] = None,
         match_type: Optional[str] = None,  # "tourney" pour tournois !
-        count: int = 100
+        count: int = 100,
+        platform: Optional[str] = None
     ) -> List[str]:
         """
         Récupère les IDs de matchs d'un joueur.
@@ -324,6 +538,7 @@ class RiotAPIClient:
             queue_id: 0 = custom, 420 = SoloQ, 440 = Flex (optionnel si match_type défini)
             match_type: "tourney" = tournois uniquement, None = tous
             count: Nombre max de matchs (max 100)
+            platform: Platform du joueur (défaut: platform du client)
         
         Returns:
             Liste d'IDs de matchs ["EUW1_6234567890", ...]
@@ -337,7 +552,8 @@ class RiotAPIClient:
             >>> client.get_match_ids_by_puuid(puuid, start, end, queue_id=0)
             ["EUW1_6234567890", ...]
         """
-        url = f"https://{self.REGION}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
+        region = region_for_platform(platform or self.platform)
+        url = self._url(region, f"/lol/match/v5/matches/by-puuid/{puuid}/ids")
         
         params = {
             "count": count
@@ -356,7 +572,7 @@ class RiotAPIClient:
         
         type_desc = match_type or f"queue={queue_id}"
         logger.debug(f"Fetching match IDs for PUUID {puuid[:20]} ({type_desc}, count={count})...")
-        result = self._make_request(url, params)
+        result = self._make_request(url, params, endpoint="match-ids", routing=region)
         
         if result:
             logger.info(f"✓ Found {len(result)} matches")
@@ -369,13 +585,15 @@ class RiotAPIClient:
     # MATCH-V5: Match ID → Détails Complets
     # =========================================================================
     
-    def get_match_details(self, match_id: str, use_cache: bool = True) -> Optional[Dict]:
+    def get_match_details(self, match_id: str, use_cache: bool = True,
+                          cache_only: bool = False) -> Optional[Dict]:
         """
         Récupère les détails complets d'un match.
         
         Args:
             match_id: ID du match (ex: "EUW1_6234567890")
             use_cache: Si True, utilise le cache local
+            cache_only: Si True, n'appelle jamais l'API (None si absent du cache)
         
         Returns:
             {
@@ -397,13 +615,18 @@ class RiotAPIClient:
         # Vérifier cache
         if use_cache:
             cached = self._get_cached_match(match_id)
+            self._metrics.record_cache("match", cached is not None)
             if cached:
                 return cached
+        if cache_only:
+            return None
         
-        url = f"https://{self.REGION}.api.riotgames.com/lol/match/v5/matches/{match_id}"
+        # Région déduite de l'ID ("KR_..." → asia)
+        region = region_for_platform(platform_for_match(match_id, self.platform))
+        url = self._url(region, f"/lol/match/v5/matches/{match_id}")
         
         logger.debug(f"Fetching match details for {match_id}...")
-        result = self._make_request(url)
+        result = self._make_request(url, endpoint="match", routing=region)
         
         if result:
             # Mise en cache
@@ -417,6 +640,51 @@ class RiotAPIClient:
         
         return result
     
+    def get_match_timeline(self, match_id: str, use_cache: bool = True) -> Optional[Dict]:
+        """
+        Récupère la timeline d'un match (frames par minute + événements).
+        
+        Args:
+            match_id: ID du match (ex: "EUW1_6234567890")
+            use_cache: Si True, utilise le cache local
+        
+        Returns:
+            {
+                "metadata": {"matchId": "...", "participants": ["puuid1", ...]},
+                "info": {
+                    "frameInterval": 60000,
+                    "frames": [
+                        {
+                            "timestamp": 60000,
+                            "participantFrames": {"1": {"totalGold": 500, "xp": 280, ...}, ...},
+                            "events": [{"type": "CHAMPION_KILL", ...}, ...]
+                        },
+                        ...
+                    ]
+                }
+            }
+            ou None si non trouvé
+        """
+        if use_cache:
+            cached = self._get_cached_timeline(match_id)
+            self._metrics.record_cache("timeline", cached is not None)
+            if cached:
+                return cached
+        
+        region = region_for_platform(platform_for_match(match_id, self.platform))
+        url = self._url(region, f"/lol/match/v5/matches/{match_id}/timeline")
+        
+        logger.debug(f"Fetching timeline for {match_id}...")
+        result = self._make_request(url, endpoint="timeline", routing=region)
+        
+        if result:
+            self._cache_timeline(match_id, result)
+            logger.info(f"✓ Timeline retrieved ({len(result['info']['frames'])} frames)")
+        else:
+            logger.warning(f"✗ Timeline not found for {match_id}")
+        
+        return result
+    
     # =========================================================================
     # BATCH OPERATIONS
     # =========================================================================
@@ -425,7 +693,8 @@ class RiotAPIClient:
         self,
         match_ids: List[str],
         use_cache: bool = True,
-        progress_callback=None
+        progress_callback=None,
+        priority: str = PRIORITY_BULK
     ) -> Dict[str, Dict]:
         """
         Récupère les détails de plusieurs matchs en batch.
@@ -434,6 +703,7 @@ class RiotAPIClient:
             match_ids: Liste d'IDs de matchs
             use_cache: Si True, utilise le cache local
             progress_callback: Fonction(current, total, match_id) pour suivre la progression
+            priority: Priorité des requêtes (backfill: cède le pas aux actions interactives)
         
         Returns:
             {match_id: match_data, ...}
@@ -443,13 +713,14 @@ class RiotAPIClient:
         
         logger.info(f"Fetching {total} match details...")
         
-        for i, match_id in enumerate(match_ids, 1):
-            if progress_callback:
-                progress_callback(match_id, i, total)
-            
-            details = self.get_match_details(match_id, use_cache)
-            if details:
-                match_details[match_id] = details
+        with self.priority(priority):
+            for i, match_id in enumerate(match_ids, 1):
+                if progress_callback:
+                    progress_callback(match_id, i, total)
+                
+                details = self.get_match_details(match_id, use_cache)
+                if details:
+                    match_details[match_id] = details
         
         logger.info(f"✓ Retrieved {len(match_details)}/{total} match details")
         return match_details
@@ -469,6 +740,7 @@ class RiotAPIClient:
             Nom d'invocateur ou "Unknown"
         """
         # Vérifier cache
+        self._metrics.record_cache("summoner", puuid in self.puuid_map)
         if puuid in self.puuid_map:
             return self.puuid_map[puuid]
         
@@ -506,26 +778,28 @@ class RiotAPIClient:
             ou None si joueur non trouvé
         """
         logger.info(f"Fetching full info for {game_name}#{tag_line}...")
+        platform = platform_for_tag(tag_line, self.platform)
         
         # Étape 1: Riot ID → PUUID
-        account = self.get_account_by_riot_id(game_name, tag_line)
+        account = self.get_account_by_riot_id(game_name, tag_line, platform)
         if not account:
             return None
         
         puuid = account["puuid"]
         
         # Étape 2: PUUID → Summoner
-        summoner = self.get_summoner_by_puuid(puuid)
+        summoner = self.get_summoner_by_puuid(puuid, platform)
         if not summoner:
             return None
         
         # Étape 3: PUUID → Rank
-        ranked = self.get_ranked_info(puuid)
+        ranked = self.get_ranked_info(puuid, platform)
         
         return {
             "game_name": game_name,
             "tag_line": tag_line,
             "puuid": puuid,
+            "platform": platform,
             "summoner_name": summoner.get("gameName", summoner.get("name", game_name)),
             "summoner_level": summoner["summonerLevel"],
             "profile_icon_id": summoner.get("profileIconId"),
@@ -0,0 +1,202 @@
+"""
+Riot Routing
+Routage des requêtes Riot: platform / région de chaque appel et pool de clés API.
+
+Platform (Summoner-V4, League-V4): euw1, na1, kr...
+Région (Account-V1, Match-V5): europe, americas, asia, sea
+
+- Un ID de match porte sa platform: "EUW1_6234567890" → euw1 → europe
+- Un Riot ID par défaut porte la sienne: "Player#EUW" → euw1. Les tags
+  personnalisés ("#0000", "#FRA") ne disent rien: platform par défaut
+  (config de l'édition, sinon celle du client)
+
+Les limites Riot s'appliquent par clé et par région/platform: le pool garde
+un PriorityRateLimiter par (clé, routage). Avec plusieurs clés, chaque
+requête part sur la clé dont la file est la plus courte pour ce routage.
+
+Les PUUIDs (et les PUUIDs des payloads Match-V5) sont chiffrés par projet
+de clé API: un PUUID obtenu avec une clé n'est pas valide avec la clé d'un
+autre projet (400 "Exception decrypting") et ne correspond pas à
+teams_with_puuid.json. Le pool ne répartit donc que sur les clés déclarées
+du même projet que la clé principale (RIOT_API_KEY); les autres sont
+ignorées.
+
+Clés supplémentaires (.env), même projet que RIOT_API_KEY:
+    RIOT_API_KEYS=occilan/RGAPI-main;occilan/RGAPI-bbb@500:10,30000:600
+    (projet/clé[@limites applicatives], séparées par ";"; sans limites:
+    REQUEST_DELAY). La clé principale doit y figurer avec son projet.
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from src.core.rate_limiter import PriorityRateLimiter, parse_limits
+
+DEFAULT_PLATFORM = "euw1"
+
+PLATFORM_REGIONS = {
+    "euw1": "europe", "eun1": "europe", "tr1": "europe", "ru": "europe", "me1": "europe",
+    "na1": "americas", "br1": "americas", "la1": "americas", "la2": "americas",
+    "kr": "asia", "jp1": "asia",
+    "oc1": "sea", "sg2": "sea", "tw2": "sea", "vn2": "sea"
+}
+
+# Account-V1 n'est pas servi par "sea"
+ACCOUNT_REGIONS = {"europe": "europe", "americas": "americas", "asia": "asia", "sea": "asia"}
+
+# Tags par défaut des Riot IDs (tag du serveur de création du compte)
+TAG_PLATFORMS = {
+    "EUW": "euw1", "EUW1": "euw1", "EUNE": "eun1", "EUN1": "eun1", "TR": "tr1", "TR1": "tr1",
+    "RU": "ru", "RU1": "ru", "ME": "me1", "ME1": "me1",
+    "NA": "na1", "NA1": "na1", "BR": "br1", "BR1": "br1", "LAN": "la1", "LA1": "la1",
+    "LAS": "la2", "LA2": "la2",
+    "KR": "kr", "KR1": "kr", "JP": "jp1", "JP1": "jp1",
+    "OCE": "oc1", "OC1": "oc1", "SG": "sg2", "SG2": "sg2", "TW": "tw2", "TW2": "tw2",
+    "VN": "vn2", "VN2": "vn2"
+}
+
+
+# ============================================================================
+# PLATFORM / RÉGION
+# ============================================================================
+
+def region_for_platform(platform: Optional[str]) -> str:
+    """Région Match-V5 d'une platform ("euw1" → "europe")"""
+    return PLATFORM_REGIONS.get((platform or DEFAULT_PLATFORM).lower(), "europe")
+
+
+def account_region(platform: Optional[str]) -> str:
+    """Région Account-V1 d'une platform"""
+    return ACCOUNT_REGIONS[region_for_platform(platform)]
+
+
+def platform_for_match(match_id: str, default: Optional[str] = None) -> Optional[str]:
+    """Platform d'un ID de match ("EUW1_6234567890" → "euw1"), sinon default"""
+    prefix, _, number = match_id.partition("_")
+    platform = prefix.lower()
+    return platform if number and platform in PLATFORM_REGIONS else default
+
+
+def platform_for_tag(tag_line: Optional[str], default: Optional[str] = None) -> Optional[str]:
+    """Platform d'un tag de Riot ID par défaut ("EUW" → "euw1"), sinon default"""
+    return TAG_PLATFORMS.get((tag_line or "").strip().upper(), default)
+
+
+def mask_key(api_key: str) -> str:
+    """Clé affichable dans les logs et métriques ("…a1b2")"""
+    return f"…{api_key[-4:]}" if api_key else "-"
+
+
+# ============================================================================
+# POOL DE CLÉS
+# ============================================================================
+
+def parse_key_spec(spec: Optional[str]) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """
+    "p/KEY1@20:1,100:120;KEY2" → [("KEY1", "20:1,100:120", "p"), ("KEY2", None, None)]
+    (clé, limites, projet)
+    """
+    keys = []
+    for entry in (spec or "").split(";"):
+        entry, _, limits = entry.strip().partition("@")
+        project, _, key = entry.rpartition("/")
+        if key:
+            keys.append((key, limits or None, project or None))
+    return keys
+
+
+def project_keys(api_key: str, spec: Optional[str]) -> Tuple[List[Tuple[str, Optional[str]]], List[str]]:
+    """
+    Clés utilisables avec la clé principale: elle-même et les clés déclarées
+    du même projet (les PUUIDs ne sont valides que dans leur projet).
+
+    Returns:
+        ([(clé, limites)] la principale en premier, [clés ignorées])
+    """
+    entries = parse_key_spec(spec)
+    declared = {key: (limits, project) for key, limits, project in entries}
+    limits, project = declared.get(api_key, (None, None))
+    keys = [(api_key, limits)] if api_key else []
+    ignored = []
+    for key, key_limits, key_project in entries:
+        if key == api_key:
+            continue
+        if project is not None and key_project == project:
+            keys.append((key, key_limits))
+        else:
+            ignored.append(key)
+    return keys, ignored
+
+
+class ApiKeyPool:
+    """
+    Clés API et un PriorityRateLimiter par (clé, routage), créé au premier appel.
+
+    Intervalle d'une clé: débit soutenable de sa fenêtre la plus stricte
+    ("20:1,100:120" → 1.2s), sans rafale: pas de 429 applicatif tant que la
+    clé ne sert qu'à ce client, et N clés donnent N fois le débit.
+    """
+
+    def __init__(self, keys: List[Tuple[str, Optional[str]]], default_interval: float):
+        """
+        Args:
+            keys: [(clé, limites applicatives "20:1,100:120" ou None)], sans doublon
+            default_interval: Intervalle entre requêtes d'une clé sans limites connues
+        """
+        if not keys:
+            raise ValueError("At least one API key is required")
+        self.keys = list(dict(keys).items())
+        self.intervals = {
+            key: max(seconds / count for count, seconds in parse_limits(limits)) if limits else default_interval
+            for key, limits in self.keys
+        }
+        self._limiters: Dict[Tuple[str, str], PriorityRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, api_key: str, routing: str) -> PriorityRateLimiter:
+        with self._lock:
+            limiter = self._limiters.get((api_key, routing))
+            if limiter is None:
+                limiter = PriorityRateLimiter(self.intervals[api_key])
+                self._limiters[(api_key, routing)] = limiter
+            return limiter
+
+    def acquire(self, routing: str, priority: str) -> Tuple[str, float]:
+        """
+        Attend un créneau sur la clé la moins chargée pour ce routage.
+
+        Returns:
+            (clé à utiliser, temps d'attente en secondes)
+        """
+        if len(self.keys) == 1:
+            api_key = self.keys[0][0]
+        else:
+            api_key = min((key for key, _ in self.keys),
+                          key=lambda key: self.limiter(key, routing).expected_wait())
+        return api_key, self.limiter(api_key, routing).wait(priority)
+
+    def pause(self, api_key: str, routing: str, seconds: float):
+        """Retry-After: seule la clé concernée, sur ce routage, est mise en pause"""
+        self.limiter(api_key, routing).pause(seconds)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Par "clé masquée/routage": stats par priorité du limiteur"""
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {f"{mask_key(key)}/{routing}": limiter.stats()
+                for (key, routing), limiter in sorted(limiters.items())}
+
+    def priority_totals(self) -> Dict[str, Dict]:
+        """Stats par priorité, toutes clés et tous routages confondus"""
+        totals: Dict[str, Dict] = {}
+        for route_stats in self.stats().values():
+            for priority, data in route_stats.items():
+                total = totals.setdefault(priority, {"requests": 0, "waiting": 0, "wait_seconds": 0.0,
+                                                     "avg_wait": 0.0, "max_wait": 0.0})
+                total["requests"] += data["requests"]
+                total["waiting"] += data["waiting"]
+                total["wait_seconds"] = round(total["wait_seconds"] + data["wait_seconds"], 4)
+                total["max_wait"] = max(total["max_wait"], data["max_wait"])
+        for total in totals.values():
+            total["avg_wait"] = round(total["wait_seconds"] / total["requests"], 4) if total["requests"] else 0.0
+        return totals
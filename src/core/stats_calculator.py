@@ -3,42 +3,23 @@ Stats Calculator for OcciLan Stats
 Calculates player stats, team stats, records, and champion statistics from match data
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 import logging
 
+from src.core.champion_registry import get_champion_registry
+
 logger = logging.getLogger(__name__)
 
 
 class StatsCalculator:
-    # Static mapping for championId to championName (partial, for demo; extend as needed)
-    CHAMPION_ID_TO_NAME = {
-        266: "Aatrox", 103: "Ahri", 84: "Akali", 166: "Akshan", 12: "Alistar", 32: "Amumu", 34: "Anivia", 1: "Annie",
-        523: "Aphelios", 22: "Ashe", 136: "AurelionSol", 268: "Azir", 432: "Bard", 53: "Blitzcrank", 63: "Brand",
-        201: "Braum", 51: "Caitlyn", 164: "Camille", 69: "Cassiopeia", 31: "Chogath", 42: "Corki", 122: "Darius",
-        131: "Diana", 119: "Draven", 36: "DrMundo", 245: "Ekko", 60: "Elise", 28: "Evelynn", 81: "Ezreal",
-        9: "Fiddlesticks", 114: "Fiora", 105: "Fizz", 3: "Galio", 41: "Gangplank", 86: "Garen", 150: "Gnar",
-        79: "Gragas", 104: "Graves", 887: "Gwen", 120: "Hecarim", 74: "Heimerdinger", 420: "Illaoi", 39: "Irelia",
-        427: "Ivern", 40: "Janna", 59: "JarvanIV", 24: "Jax", 126: "Jayce", 202: "Jhin", 222: "Jinx", 145: "Kaisa",
-        429: "Kalista", 43: "Karma", 30: "Karthus", 38: "Kassadin", 55: "Katarina", 10: "Kayle", 141: "Kayn",
-        85: "Kennen", 121: "Khazix", 203: "Kindred", 240: "Kled", 96: "KogMaw", 7: "Leblanc", 64: "LeeSin",
-        89: "Leona", 876: "Lillia", 127: "Lissandra", 236: "Lucian", 117: "Lulu", 99: "Lux", 54: "Malphite",
-        90: "Malzahar", 57: "Maokai", 11: "MasterYi", 21: "MissFortune", 62: "Wukong", 82: "Mordekaiser",
-        25: "Morgana", 267: "Nami", 75: "Nasus", 111: "Nautilus", 518: "Neeko", 76: "Nidalee", 56: "Nocturne",
-        20: "Nunu", 2: "Olaf", 61: "Orianna", 516: "Ornn", 80: "Pantheon", 78: "Poppy", 555: "Pyke",
-        246: "Qiyana", 133: "Quinn", 497: "Rakan", 33: "Rammus", 421: "RekSai", 526: "Rell", 58: "Renekton",
-        107: "Rengar", 92: "Riven", 68: "Rumble", 13: "Ryze", 360: "Samira", 113: "Sejuani", 235: "Senna",
-        147: "Seraphine", 875: "Sett", 35: "Shaco", 98: "Shen", 102: "Shyvana", 27: "Singed", 14: "Sion",
-        15: "Sivir", 72: "Skarner", 37: "Sona", 16: "Soraka", 50: "Swain", 517: "Sylas", 134: "Syndra",
-        223: "TahmKench", 163: "Taliyah", 91: "Talon", 44: "Taric", 17: "Teemo", 412: "Thresh", 18: "Tristana",
-        48: "Trundle", 23: "Tryndamere", 4: "TwistedFate", 29: "Twitch", 77: "Udyr", 6: "Urgot", 110: "Varus",
-        67: "Vayne", 45: "Veigar", 161: "Velkoz", 711: "Vex", 254: "Vi", 234: "Viego", 112: "Viktor",
-        8: "Vladimir", 106: "Volibear", 19: "Warwick", 498: "Xayah", 101: "Xerath", 5: "XinZhao", 157: "Yasuo",
-        777: "Yone", 83: "Yorick", 350: "Yuumi", 154: "Zac", 238: "Zed", 221: "Zeri", 115: "Ziggs",
-        26: "Zilean", 142: "Zoe", 143: "Zyra"
-    }
     """Calculates comprehensive tournament statistics from match details"""
     
+    # Early game checkpoints (minutes) for timeline-based metrics
+    GOLD_DIFF_MINUTE = 15
+    CS_DIFF_MINUTE = 10
+    
     def __init__(self):
+        self.champions = get_champion_registry()
         self.stats = self._initialize_stats()
     
     def _initialize_stats(self) -> Dict[str, Any]:
@@ -114,12 +95,8 @@ class StatsCalculator:
         return f"{minutes}:{remaining_seconds:02d}"
     
     def _format_champion_name(self, champion_name: str) -> str:
-        """Format champion name (handle special cases)"""
-        special_cases = {
-            "MonkeyKing": "Wukong",
-            "FiddleSticks": "Fiddlesticks"
-        }
-        return special_cases.get(champion_name, champion_name)
+        """Format champion name as stored in general_stats.json (registry label)"""
+        return self.champions.stats_name(champion_name) or champion_name
     
     def _get_team_name_from_puuid(self, puuid: str, teams_with_puuid: Dict[str, Any]) -> str:
         """Get team name from player PUUID"""
@@ -206,6 +183,8 @@ class StatsCalculator:
             team_id = participant.get("teamId")
             team_name = self._get_team_name_from_puuid(puuid, teams_with_puuid)
             player_name = self._get_player_name_from_puuid(puuid, teams_with_puuid)
+            # Learn champions newer than the local snapshot so their bans resolve too
+            self.champions.register(participant.get("championId"), participant.get("championName"))
             champion_name = self._format_champion_name(participant.get("championName", "Unknown"))
             
             # Initialize player stats if needed
@@ -324,12 +303,16 @@ class StatsCalculator:
         for team in teams:
             for ban in team.get("bans", []):
                 champion_id = ban.get("championId")
-                champion_name = self.CHAMPION_ID_TO_NAME.get(champion_id)
-                if champion_name:
-                    champ_stats = self.stats["champion_stats"]
-                    if champion_name not in champ_stats["bans"]:
-                        champ_stats["bans"][champion_name] = 0
-                    champ_stats["bans"][champion_name] += 1
+                if champion_id is None or champion_id < 0:
+                    continue  # No ban for this pick turn
+                champion_name = self.champions.stats_name(champion_id)
+                if not champion_name:
+                    logger.warning(f"Match {match_id}: unknown banned championId {champion_id}")
+                    champion_name = str(champion_id)
+                champ_stats = self.stats["champion_stats"]
+                if champion_name not in champ_stats["bans"]:
+                    champ_stats["bans"][champion_name] = 0
+                champ_stats["bans"][champion_name] += 1
     
     def _calculate_averages(self) -> None:
         """Calculate averages for all players and teams"""
@@ -373,7 +356,7 @@ class StatsCalculator:
                     team_stats["average_game_duration"]
                 )
     
-    def _calculate_records(self) -> None:
+    def _calculate_records(self, with_early_game: bool = False) -> None:
         """Find best players for each statistic"""
         
         stats_to_check = [
@@ -392,6 +375,13 @@ class StatsCalculator:
             ("winrate", "Winrate %")
         ]
         
+        if with_early_game:
+            stats_to_check += [
+                ("average_gd_at_15", "Average GD@15"),
+                ("average_csd_at_10", "Average CSD@10"),
+                ("first_blood_participation", "First Blood Participation %")
+            ]
+        
         for stat_key, stat_name in stats_to_check:
             max_value = float('-inf')
             best_player = None
@@ -399,6 +389,8 @@ class StatsCalculator:
             
             for player_name, player_stats in self.stats["player_stats"].items():
                 value = player_stats.get(stat_key, 0)
+                if value is None:
+                    continue  # No timeline for this player
                 
                 if value > max_value:
                     max_value = value
@@ -440,20 +432,127 @@ class StatsCalculator:
             winrate = (wins / picks * 100) if picks > 0 else 0
             champ_stats["winrates"][champion] = round(winrate, 2)
     
-    def calculate_all_stats(self, match_details: Dict[str, Any], 
-                           teams_with_puuid: Dict[str, Any]) -> Dict[str, Any]:
+    def _lane_opponents(self, participants: List[Dict[str, Any]]) -> List[int]:
+        """Index of each participant's lane opponent (same teamPosition, other side)"""
+        by_side_position = {
+            (p.get("teamId"), p.get("teamPosition")): i
+            for i, p in enumerate(participants)
+        }
+        opponents = []
+        for i, participant in enumerate(participants):
+            other_side = 200 if participant.get("teamId") == 100 else 100
+            opponent = by_side_position.get((other_side, participant.get("teamPosition")))
+            # Fallback: same slot on the other side (participantId 1 ↔ 6, ...)
+            if not participant.get("teamPosition") or opponent is None:
+                opponent = (i + 5) % 10
+            opponents.append(opponent)
+        return opponents
+    
+    def _calculate_early_game(self, participants_by_match: Dict[str, List[Dict]], timelines: Dict[str, Dict],
+                              teams_with_puuid: Dict[str, Any]) -> int:
+        """
+        Timeline-based early game metrics per player (GD@15, CSD@10, first blood participation)
+        
+        Frames of all matches are stacked into (matches x 10) arrays and
+        aggregated per player with bincount, no per-participant Python loop
+        over frames.
+        
+        Args:
+            participants_by_match: {match_id: info.participants} of the processed matches
+            timelines: {match_id: arrays} from TimelineStore
+            teams_with_puuid: Dictionary of team data
+        
+        Returns:
+            Number of matches with a usable timeline
+        """
+        import numpy as np
+        
+        player_names = []
+        opponents = []
+        gold_at, cs_at, first_blood = [], [], []
+        
+        for match_id, frames in timelines.items():
+            participants = participants_by_match.get(match_id, [])
+            if len(participants) != 10 or frames["gold"].shape[1] != 10:
+                continue
+            participants = sorted(participants, key=lambda p: p.get("participantId", 0))
+            
+            gold_row = np.full(10, np.nan)
+            cs_row = np.full(10, np.nan)
+            gold_frame = np.searchsorted(frames["timestamps"], self.GOLD_DIFF_MINUTE * 60000)
+            cs_frame = np.searchsorted(frames["timestamps"], self.CS_DIFF_MINUTE * 60000)
+            if gold_frame < len(frames["timestamps"]):
+                gold_row = frames["gold"][gold_frame].astype(np.float64)
+            if cs_frame < len(frames["timestamps"]):
+                cs_row = frames["cs"][cs_frame].astype(np.float64)
+            
+            offset = 10 * len(gold_at)
+            opponents.extend(offset + o for o in self._lane_opponents(participants))
+            player_names.extend(
+                self._get_player_name_from_puuid(p.get("puuid"), teams_with_puuid) for p in participants
+            )
+            gold_at.append(gold_row)
+            cs_at.append(cs_row)
+            first_blood.append(frames["first_blood"])
+        
+        if not gold_at:
+            return 0
+        
+        opponents = np.array(opponents)
+        gold_at = np.concatenate(gold_at)
+        cs_at = np.concatenate(cs_at)
+        gold_diff = gold_at - gold_at[opponents]
+        cs_diff = cs_at - cs_at[opponents]
+        first_blood = np.concatenate(first_blood).astype(np.float64)
+        
+        names, player_index = np.unique(np.array(player_names), return_inverse=True)
+        games = np.bincount(player_index, minlength=len(names))
+        
+        def mean_by_player(values):
+            valid = ~np.isnan(values)
+            sums = np.bincount(player_index[valid], weights=values[valid], minlength=len(names))
+            counts = np.bincount(player_index[valid], minlength=len(names))
+            return np.divide(sums, counts, out=np.full(len(names), np.nan), where=counts > 0)
+        
+        avg_gold_diff = mean_by_player(gold_diff)
+        avg_cs_diff = mean_by_player(cs_diff)
+        first_blood_rate = np.bincount(player_index, weights=first_blood, minlength=len(names)) / games
+        
+        for i, player_name in enumerate(names):
+            player_stats = self.stats["player_stats"].get(str(player_name))
+            if player_stats is None:
+                continue
+            player_stats["timeline_games"] = int(games[i])
+            player_stats["average_gd_at_15"] = None if np.isnan(avg_gold_diff[i]) else round(float(avg_gold_diff[i]), 0)
+            player_stats["average_csd_at_10"] = None if np.isnan(avg_cs_diff[i]) else round(float(avg_cs_diff[i]), 1)
+            player_stats["first_blood_participation"] = round(float(first_blood_rate[i]) * 100, 2)
+        
+        return len(gold_at) // 10
+    
+    def calculate_all_stats(self, match_details: Union[Dict[str, Any], Iterable[Tuple[str, Dict]]],
+                           teams_with_puuid: Dict[str, Any],
+                           timelines: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
         """
         Calculate all tournament statistics
         
+        Matches are processed in a single pass: an iterator such as
+        EditionDataManager.iter_match_details() keeps memory bounded to one
+        match (plus the participants of matches that have a timeline).
+        
         Args:
-            match_details: Dictionary of match data from match_details.json
+            match_details: Dictionary of match data from match_details.json,
+                           or any iterable of (match_id, match_data) pairs
             teams_with_puuid: Dictionary of team data from teams_with_puuid.json
+            timelines: Optional {match_id: frame arrays} from TimelineStore,
+                       enables early game metrics (GD@15, CSD@10, first blood)
         
         Returns:
             Complete statistics dictionary
         """
         
-        logger.info(f"Calculating stats for {len(match_details)} matches")
+        if isinstance(match_details, dict):
+            logger.info(f"Calculating stats for {len(match_details)} matches")
+            match_details = match_details.items()
         
         # Reset stats
         self.stats = self._initialize_stats()
@@ -461,22 +560,31 @@ class StatsCalculator:
         # Process each match
         processed = 0
         errors = 0
+        participants_by_match = {}  # Only for matches with a timeline
         
-        for match_id, match_data in match_details.items():
+        for match_id, match_data in match_details:
             try:
                 self._process_match(match_id, match_data, teams_with_puuid)
                 processed += 1
             except Exception as e:
                 logger.error(f"Error processing match {match_id}: {e}")
                 errors += 1
+            if timelines and match_id in timelines:
+                participants_by_match[match_id] = match_data.get("info", {}).get("participants", [])
         
         logger.info(f"Processed {processed} matches, {errors} errors")
         
         # Calculate averages
         self._calculate_averages()
         
+        # Early game metrics from timelines
+        timeline_matches = 0
+        if timelines:
+            timeline_matches = self._calculate_early_game(participants_by_match, timelines, teams_with_puuid)
+            logger.info(f"Early game metrics computed from {timeline_matches} timelines")
+        
         # Calculate records
-        self._calculate_records()
+        self._calculate_records(with_early_game=timeline_matches > 0)
         
         # Finalize champion stats
         self._finalize_champion_stats()
@@ -486,24 +594,55 @@ class StatsCalculator:
             "total_matches_processed": processed,
             "total_errors": errors,
             "total_players": len(self.stats["player_stats"]),
-            "total_teams": len(self.stats["team_stats"])
+            "total_teams": len(self.stats["team_stats"]),
+            "total_timelines_processed": timeline_matches
         }
         
         return self.stats
 
 
 # Standalone function for easy use
-def calculate_stats(match_details: Dict[str, Any], 
-                   teams_with_puuid: Dict[str, Any]) -> Dict[str, Any]:
+def calculate_stats(match_details: Union[Dict[str, Any], Iterable[Tuple[str, Dict]]],
+                   teams_with_puuid: Dict[str, Any],
+                   timelines: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
     """
     Calculate all tournament statistics (standalone function)
     
     Args:
-        match_details: Dictionary from match_details.json
+        match_details: Dictionary from match_details.json, or an iterable
+                       of (match_id, match_data) pairs
         teams_with_puuid: Dictionary from teams_with_puuid.json
+        timelines: Optional {match_id: frame arrays} from TimelineStore
     
     Returns:
         Complete statistics dictionary
     """
     calculator = StatsCalculator()
-    return calculator.calculate_all_stats(match_details, teams_with_puuid)
+    return calculator.calculate_all_stats(match_details, teams_with_puuid, timelines)
+
+
+def build_team_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the per-team view (team_stats.json format) from general stats
+    
+    Args:
+        stats: Dictionary from general_stats.json
+    
+    Returns:
+        { "TeamName": { "team_stats": {...}, "players": {player_name: {...}} } }
+        Empty dict if general stats have no team_stats / player_stats
+    """
+    if "team_stats" not in stats or "player_stats" not in stats:
+        return {}
+    
+    team_stats = {
+        team_name: {"team_stats": team_data, "players": {}}
+        for team_name, team_data in stats["team_stats"].items()
+    }
+    
+    for player_name, player_data in stats["player_stats"].items():
+        team_name = player_data.get("team")
+        if team_name in team_stats:
+            team_stats[team_name]["players"][player_name] = player_data
+    
+    return team_stats
@@ -0,0 +1,138 @@
+"""
+Timeline Store
+Frames par minute des timelines Match-V5 stockées en tableaux typés (.npz).
+
+Une timeline JSON fait ~10x la taille du match; seules les séries utiles aux
+stats early game sont conservées:
+
+data/editions/edition_X/timelines/<match_id>.npz
+├── timestamps          int32  (F,)      # ms depuis le début de la partie
+├── gold                int32  (F, 10)   # totalGold par participant
+├── xp                  int32  (F, 10)
+├── cs                  int16  (F, 10)   # minions + monstres neutres
+├── first_blood         bool   (10,)     # tueur ou assistant du first blood
+└── first_blood_victim  int8   ()        # index participant (−1 si aucun kill)
+
+Les colonnes suivent l'ordre participantId 1..10 (= info.participants).
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PARTICIPANTS = 10
+FRAME_ARRAYS = ("timestamps", "gold", "xp", "cs", "first_blood", "first_blood_victim")
+
+
+def extract_frames(timeline: Dict) -> Dict[str, np.ndarray]:
+    """
+    Convertit une timeline Match-V5 en tableaux compacts.
+
+    Args:
+        timeline: Réponse de /lol/match/v5/matches/{id}/timeline
+
+    Returns:
+        {"timestamps", "gold", "xp", "cs", "first_blood", "first_blood_victim"}
+    """
+    frames = timeline.get("info", {}).get("frames", [])
+    count = len(frames)
+
+    timestamps = np.zeros(count, dtype=np.int32)
+    gold = np.zeros((count, PARTICIPANTS), dtype=np.int32)
+    xp = np.zeros((count, PARTICIPANTS), dtype=np.int32)
+    cs = np.zeros((count, PARTICIPANTS), dtype=np.int16)
+    first_blood = np.zeros(PARTICIPANTS, dtype=bool)
+    first_blood_victim = -1
+
+    for i, frame in enumerate(frames):
+        timestamps[i] = frame.get("timestamp", 0)
+        for participant_id, pf in frame.get("participantFrames", {}).items():
+            column = int(participant_id) - 1
+            if not 0 <= column < PARTICIPANTS:
+                continue
+            gold[i, column] = pf.get("totalGold", 0)
+            xp[i, column] = pf.get("xp", 0)
+            cs[i, column] = pf.get("minionsKilled", 0) + pf.get("jungleMinionsKilled", 0)
+
+        if first_blood_victim < 0:
+            for event in frame.get("events", []):
+                if event.get("type") != "CHAMPION_KILL":
+                    continue
+                involved = [event.get("killerId", 0)] + event.get("assistingParticipantIds", [])
+                for participant_id in involved:
+                    if 1 <= participant_id <= PARTICIPANTS:  # 0 = exécution (tourelle, sbire)
+                        first_blood[participant_id - 1] = True
+                first_blood_victim = event.get("victimId", 0) - 1
+                break
+
+    return {
+        "timestamps": timestamps,
+        "gold": gold,
+        "xp": xp,
+        "cs": cs,
+        "first_blood": first_blood,
+        "first_blood_victim": np.array(first_blood_victim, dtype=np.int8)
+    }
+
+
+class TimelineStore:
+    """
+    Un fichier .npz compressé par match.
+    """
+
+    def __init__(self, directory: Path):
+        """
+        Args:
+            directory: Dossier des timelines (ex: data/editions/edition_7/timelines)
+        """
+        self.directory = Path(directory)
+
+    def _path(self, match_id: str) -> Path:
+        return self.directory / f"{match_id}.npz"
+
+    def has(self, match_id: str) -> bool:
+        return self._path(match_id).exists()
+
+    def ids(self) -> List[str]:
+        if not self.directory.exists():
+            return []
+        return sorted(path.stem for path in self.directory.glob("*.npz"))
+
+    def save(self, match_id: str, timeline: Dict):
+        """
+        Extrait les frames d'une timeline Match-V5 et les enregistre.
+
+        Args:
+            match_id: ID du match
+            timeline: Timeline Match-V5 brute
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        arrays = extract_frames(timeline)
+        np.savez_compressed(self._path(match_id), **arrays)
+        logger.debug(f"Timeline frames saved: {match_id} ({arrays['gold'].shape[0]} frames)")
+
+    def load(self, match_id: str) -> Optional[Dict[str, np.ndarray]]:
+        """Tableaux d'un match, None si absent"""
+        path = self._path(match_id)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                return {name: data[name] for name in FRAME_ARRAYS}
+        except Exception as e:
+            logger.error(f"Error loading timeline frames {path.name}: {e}")
+            return None
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, np.ndarray]]]:
+        """Itère (match_id, tableaux) pour tous les matchs stockés"""
+        for match_id in self.ids():
+            arrays = self.load(match_id)
+            if arrays is not None:
+                yield match_id, arrays
+
+    def load_all(self) -> Dict[str, Dict[str, np.ndarray]]:
+        return dict(self.items())
@@ -0,0 +1,279 @@
+"""
+Batch Runner - Runs pipeline steps over several editions concurrently
+
+One EditionProcessor per edition, one thread per edition (up to `workers`).
+All editions share a single RiotAPIClient, hence a single rate limiter and
+API cache: running editions in parallel overlaps their file I/O and stats
+computation, it never exceeds the API key's request rate.
+
+Incremental mode skips work that is already up to date:
+- step 2 (PUUIDs): skipped if teams_with_puuid.json is newer than teams.json
+- step 3 (ranks): always run (ranks change daily)
+- step 4 (match IDs): skipped once fetched after the edition's end_date
+- step 5 (match details): only fetches matches missing from match_details
+- step 6 (stats): skipped if general_stats.json is newer than match_details
+  and teams_with_puuid.json
+
+Used by scripts/occilan.py.
+"""
+
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Iterable, Callable
+
+from src.core.data_manager import EditionDataManager
+
+logger = logging.getLogger(__name__)
+
+# Step number → (name, description)
+STEPS = {
+    2: ("puuids", "Fetch PUUIDs (Account-V1)"),
+    3: ("ranks", "Fetch ranks (League-V4)"),
+    4: ("match-ids", "Fetch match IDs (Match-V5)"),
+    5: ("matches", "Fetch match details (Match-V5)"),
+    6: ("stats", "Calculate statistics")
+}
+
+# Steps calling the Riot API (the others work offline)
+API_STEPS = {2, 3, 4, 5}
+
+
+def parse_steps(values: Iterable[str]) -> List[int]:
+    """
+    Parse step selectors: numbers, ranges or names ("2-6", "5,6", "stats").
+
+    Raises:
+        ValueError: Unknown step
+    """
+    names = {name: step for step, (name, _) in STEPS.items()}
+    steps = set()
+    for value in values:
+        for part in str(value).split(","):
+            part = part.strip()
+            if not part:
+                continue
+            if part in names:
+                steps.add(names[part])
+            elif "-" in part:
+                first, last = part.split("-", 1)
+                steps.update(range(int(first), int(last) + 1))
+            else:
+                steps.add(int(part))
+    unknown = steps - set(STEPS)
+    if unknown:
+        raise ValueError(f"Unknown step(s): {sorted(unknown)} (valid: 2-6 or {', '.join(names)})")
+    return sorted(steps)
+
+
+def _end_timestamp(config: Optional[Dict]) -> Optional[float]:
+    end_date = (config or {}).get("end_date")
+    if not end_date:
+        return None
+    try:
+        return datetime.strptime(end_date, "%Y-%m-%d").timestamp()
+    except ValueError:
+        return None
+
+
+def skip_reason(manager: EditionDataManager, step: int, incremental: bool) -> Optional[str]:
+    """
+    Why a step can be skipped in incremental mode
+
+    Returns:
+        Reason, or None if the step has to run
+    """
+    if not incremental:
+        return None
+
+    if step == 2:
+        teams = manager.data_version("teams.json")
+        teams_with_puuid = manager.data_version("teams_with_puuid.json")
+        if teams is not None and teams_with_puuid is not None and teams_with_puuid >= teams:
+            return "teams_with_puuid.json newer than teams.json"
+
+    elif step == 4:
+        end = _end_timestamp(manager.load_config())
+        fetched = manager.data_version("tournament_matches.json")
+        # end_date is a day: match IDs fetched the day after cover the whole tournament
+        if end is not None and fetched is not None and fetched >= end + 86400:
+            return "match IDs fetched after the end of the edition"
+
+    elif step == 6:
+        stats = manager.data_version("general_stats.json")
+        sources = [manager.data_version("match_details.json"), manager.data_version("teams_with_puuid.json")]
+        if stats is not None and all(source is not None and stats >= source for source in sources):
+            return "general_stats.json up to date"
+
+    return None
+
+
+def plan_edition(manager: EditionDataManager, steps: List[int], incremental: bool) -> List[Dict[str, Any]]:
+    """
+    What a run would do, without calling the API or writing anything
+
+    Returns:
+        [{"step", "name", "status": "planned" | "skipped", "detail"}]
+    """
+    plan = []
+    for step in steps:
+        reason = skip_reason(manager, step, incremental)
+        detail = reason or STEPS[step][1]
+        if reason is None and step == 5 and incremental:
+            wanted = set(manager.get_all_match_ids())
+            stored = {match_id for match_id, _ in manager.iter_match_details()}
+            missing = len(wanted - stored)
+            if not missing:
+                reason = detail = "no new match"
+            else:
+                detail = f"{missing} new match(es) to fetch"
+        plan.append({
+            "step": step,
+            "name": STEPS[step][0],
+            "status": "skipped" if reason else "planned",
+            "detail": detail
+        })
+    return plan
+
+
+def run_edition(edition: int, steps: List[int], riot_client=None, api_key: str = "",
+                base_path: str = "data/editions", incremental: bool = False,
+                use_cache: bool = True, fetch_timelines: bool = False,
+                progress_callback: Optional[Callable[[int, str, float], None]] = None,
+                on_step: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Run the selected steps for one edition, stopping at the first failed step
+
+    A step fails when it raises or produces no data (missing input: "Run step
+    N first", nothing fetched). Errors on single players / teams / matches
+    (logged by the processor, the step goes on) do not stop the run, as in
+    run_full_pipeline: they are counted in the step detail and listed in
+    "errors".
+
+    Args:
+        progress_callback: Optional callback(step, message, progress) fed by the
+                           processor's _update_progress
+        on_step: Optional callback(step_report) after each step (run or skipped)
+
+    Returns:
+        {"edition", "success", "seconds", "steps": [{"step", "name", "status", "seconds", "detail"}],
+         "errors", "warnings"}
+    """
+    from src.pipeline.edition_processor import EditionProcessor
+
+    started = time.perf_counter()
+    processor = EditionProcessor(edition, api_key, riot_client=riot_client, base_path=base_path)
+    manager = processor.data_manager
+    report = {"edition": edition, "success": True, "steps": []}
+
+    for step in steps:
+        name = STEPS[step][0]
+        if progress_callback:
+            processor.progress_callback = lambda message, progress, step=step: progress_callback(step, message, progress)
+            progress_callback(step, STEPS[step][1], 0)
+
+        reason = skip_reason(manager, step, incremental)
+        if reason:
+            report["steps"].append({"step": step, "name": name, "status": "skipped", "seconds": 0.0, "detail": reason})
+            if on_step:
+                on_step(report["steps"][-1])
+            continue
+
+        errors_before = len(processor.errors)
+        step_started = time.perf_counter()
+        try:
+            if step == 2:
+                result = processor.step2_fetch_puuids()
+                detail = f"{sum(len(team['players']) for team in result.values())} players"
+            elif step == 3:
+                result = processor.step3_fetch_ranks()
+                detail = f"{len(result)} teams"
+            elif step == 4:
+                result = processor.step4_fetch_match_ids()
+                detail = f"{len({match_id for ids in result.values() for match_id in ids})} match IDs"
+            elif step == 5:
+                result = processor.step5_fetch_match_details(use_cache, fetch_timelines, incremental)
+                detail = f"{len(result)} matches fetched" if result or not incremental else "no new match"
+            else:
+                result = processor.step6_calculate_stats()
+                metadata = result.get("metadata", {})
+                detail = f"{metadata.get('total_players', 0)} players, {metadata.get('total_matches_processed', 0)} matches"
+            # Step 5 returns {} when there is nothing new to fetch: only a failure if it logged an error
+            failed = not result and (step != 5 or len(processor.errors) > errors_before)
+            item_errors = len(processor.errors) - errors_before
+            if not failed and item_errors:
+                detail += f" ({item_errors} error(s))"
+        except Exception as e:
+            processor._log_error(f"Step {step} ({name}) failed: {e}")
+            failed, detail = True, str(e)
+
+        report["steps"].append({
+            "step": step,
+            "name": name,
+            "status": "failed" if failed else "ok",
+            "seconds": round(time.perf_counter() - step_started, 3),
+            "detail": processor.errors[-1] if failed and processor.errors else detail
+        })
+        if on_step:
+            on_step(report["steps"][-1])
+        if failed:
+            report["success"] = False
+            break
+
+    report["seconds"] = round(time.perf_counter() - started, 3)
+    report["errors"] = processor.errors
+    report["warnings"] = processor.warnings
+    return report
+
+
+def run_batch(editions: List[int], steps: List[int], riot_client=None, api_key: str = "",
+              base_path: str = "data/editions", workers: int = 4, incremental: bool = False,
+              dry_run: bool = False, use_cache: bool = True, fetch_timelines: bool = False) -> Dict[str, Any]:
+    """
+    Run steps over several editions, `workers` editions at a time
+
+    Args:
+        editions: Edition numbers
+        steps: Step numbers (see STEPS)
+        riot_client: Client shared by all editions (required for API steps)
+        workers: Editions processed concurrently
+        incremental: Skip up-to-date work (see module docstring)
+        dry_run: Only report what would run
+
+    Returns:
+        {"editions": [report per edition, in input order], "seconds", "dry_run",
+         "api_metrics" (if a client was used)}
+    """
+    started = time.perf_counter()
+
+    if dry_run:
+        reports = [{
+            "edition": edition,
+            "success": True,
+            "seconds": 0.0,
+            "steps": plan_edition(EditionDataManager(edition, base_path), steps, incremental),
+            "errors": [],
+            "warnings": []
+        } for edition in editions]
+    else:
+        def run(edition: int) -> Dict[str, Any]:
+            try:
+                return run_edition(edition, steps, riot_client, api_key, base_path,
+                                   incremental, use_cache, fetch_timelines)
+            except Exception as e:
+                logger.exception(f"Edition {edition} failed")
+                return {"edition": edition, "success": False, "seconds": 0.0, "steps": [],
+                        "errors": [str(e)], "warnings": []}
+
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="edition") as executor:
+            reports = list(executor.map(run, editions))
+
+    batch = {
+        "editions": reports,
+        "seconds": round(time.perf_counter() - started, 3),
+        "dry_run": dry_run
+    }
+    if riot_client is not None and not dry_run:
+        batch["api_metrics"] = riot_client.metrics()
+    return batch
@@ -4,13 +4,18 @@ Handles all 6 steps from team input to final statistics
 """
 
 import logging
+import itertools
 from typing import Dict, Any, List, Callable, Optional
 from datetime import datetime
 from pathlib import Path
 
 from src.core.data_manager import EditionDataManager
+from src.core.match_projection import SCHEMA_VERSION, project_match, projection_version
+from src.core.participant_matrix import ParticipantMatrixBuilder
+from src.core.rate_limiter import PRIORITY_BULK
 from src.core.riot_client import RiotAPIClient
-from src.core.stats_calculator import StatsCalculator
+from src.core.riot_routing import platform_for_tag
+from src.core.stats_calculator import StatsCalculator, build_team_stats
 from src.parsers.opgg_parser import OPGGParser
 
 logger = logging.getLogger(__name__)
@@ -25,12 +30,15 @@ class EditionProcessor:
     2. Fetch PUUIDs (Account-V1) → teams_with_puuid.json
     3. Fetch ranks (League-V4) → teams_with_puuid.json (updated)
     4. Fetch match IDs (Match-V5) → tournament_matches.json
-    5. Fetch match details (Match-V5) → match_details.json
-    6. Calculate stats → general_stats.json
+    5. Fetch match details (Match-V5) → match_details.json (lean projection,
+       raw payloads stay in the API cache) (+ optional timelines → timelines/<match_id>.npz)
+    6. Calculate stats → general_stats.json (+ participants/ stat matrix)
     """
     
     def __init__(self, edition_id: int, api_key: str, 
-                 progress_callback: Optional[Callable[[str, float], None]] = None):
+                 progress_callback: Optional[Callable[[str, float], None]] = None,
+                 riot_client: Optional[RiotAPIClient] = None,
+                 base_path: str = "data/editions"):
         """
         Initialize processor
         
@@ -38,16 +46,34 @@ class EditionProcessor:
             edition_id: Edition number
             api_key: Riot API key
             progress_callback: Optional callback function(message, progress) for UI updates
+            riot_client: Preconfigured client (e.g. pointed at the mock API server)
+            base_path: Editions directory
         """
         self.edition_id = edition_id
-        self.data_manager = EditionDataManager(edition_id)
-        self.riot_client = RiotAPIClient(api_key)
+        self.data_manager = EditionDataManager(edition_id, base_path)
+        self.riot_client = riot_client or RiotAPIClient(api_key)
         self.stats_calculator = StatsCalculator()
         self.opgg_parser = OPGGParser()
         self.progress_callback = progress_callback
         
         self.errors = []
         self.warnings = []
+        self._default_platform = None
+    
+    @property
+    def default_platform(self) -> str:
+        """Platform of players without a known one: edition config "platform", else the client's"""
+        if self._default_platform is None:
+            config = self.data_manager.load_config() or {}
+            self._default_platform = (config.get("platform") or self.riot_client.platform).lower()
+        return self._default_platform
+    
+    def player_platform(self, player: Dict[str, Any]) -> str:
+        """
+        Platform of a player: stored one (teams.json or step 2), else the one of
+        a default Riot ID tag ("#EUW", "#KR1"), else the edition's
+        """
+        return player.get("platform") or platform_for_tag(player.get("tagLine")) or self.default_platform
     
     def _update_progress(self, message: str, progress: float):
         """Update progress via callback"""
@@ -142,6 +168,7 @@ class EditionProcessor:
                 game_name = player["gameName"]
                 tag_line = player["tagLine"]
                 role = player["role"]
+                platform = self.player_platform(player)
                 
                 self._update_progress(
                     f"Fetching PUUID for {game_name}#{tag_line}...",
@@ -150,19 +177,20 @@ class EditionProcessor:
                 
                 try:
                     # Fetch account info
-                    account_info = self.riot_client.get_account_by_riot_id(game_name, tag_line)
+                    account_info = self.riot_client.get_account_by_riot_id(game_name, tag_line, platform)
                     
                     if account_info:
                         puuid = account_info["puuid"]
                         
                         # Fetch summoner info (for level)
-                        summoner_info = self.riot_client.get_summoner_by_puuid(puuid)
+                        summoner_info = self.riot_client.get_summoner_by_puuid(puuid, platform)
                         
                         player_data = {
                             "gameName": game_name,
                             "tagLine": tag_line,
                             "role": role,
                             "puuid": puuid,
+                            "platform": platform,
                             "summonerLevel": summoner_info.get("summonerLevel", 0) if summoner_info else 0,
                             "profileIconId": summoner_info.get("profileIconId", 0) if summoner_info else 0
                         }
@@ -205,6 +233,10 @@ class EditionProcessor:
         total_players = sum(len(team["players"]) for team in teams_with_puuid.values())
         processed_players = 0
         
+        rank_history = self.data_manager.rank_history
+        self._seed_rank_history(rank_history, teams_with_puuid)
+        fetched_entries = {}
+        
         for team_name, team_data in teams_with_puuid.items():
             for player in team_data["players"]:
                 puuid = player.get("puuid")
@@ -222,24 +254,9 @@ class EditionProcessor:
                 )
                 
                 try:
-                    ranked_info = self.riot_client.get_ranked_info(puuid)
-                    
-                    if ranked_info:
-                        player["tier"] = ranked_info.get("tier", "UNRANKED")
-                        player["rank"] = ranked_info.get("rank", "")
-                        player["leaguePoints"] = ranked_info.get("leaguePoints", 0)
-                        player["wins"] = ranked_info.get("wins", 0)
-                        player["losses"] = ranked_info.get("losses", 0)
-                        
-                        total_games = player["wins"] + player["losses"]
-                        player["winrate"] = round((player["wins"] / total_games * 100), 2) if total_games > 0 else 0
-                    else:
-                        player["tier"] = "UNRANKED"
-                        player["rank"] = ""
-                        player["leaguePoints"] = 0
-                        player["wins"] = 0
-                        player["losses"] = 0
-                        player["winrate"] = 0
+                    ranked_info = self.riot_client.get_ranked_info(puuid, self.player_platform(player))
+                    fetched_entries[puuid] = ranked_info
+                    self._apply_ranked_info(player, ranked_info)
                         
                 except Exception as e:
                     self._log_error(f"Error fetching rank for {game_name}#{tag_line}: {str(e)}")
@@ -248,10 +265,85 @@ class EditionProcessor:
         
         # Save
         self.data_manager.save_teams_with_puuid(teams_with_puuid)
-        self._update_progress(f"Ranks fetched: {processed_players} players", 100)
+        
+        # Only the entries that changed since the last fetch are appended
+        changes = rank_history.record_many(fetched_entries)
+        self._update_progress(f"Ranks fetched: {processed_players} players ({changes} rank changes)", 100)
         
         return teams_with_puuid
     
+    @staticmethod
+    def _apply_ranked_info(player: Dict[str, Any], ranked_info: Optional[Dict[str, Any]]):
+        """Store a League-V4 entry (None = unranked) on a teams_with_puuid player"""
+        if ranked_info:
+            player["tier"] = ranked_info.get("tier", "UNRANKED")
+            player["rank"] = ranked_info.get("rank", "")
+            player["leaguePoints"] = ranked_info.get("leaguePoints", 0)
+            player["wins"] = ranked_info.get("wins", 0)
+            player["losses"] = ranked_info.get("losses", 0)
+            
+            total_games = player["wins"] + player["losses"]
+            player["winrate"] = round((player["wins"] / total_games * 100), 2) if total_games > 0 else 0
+        else:
+            player["tier"] = "UNRANKED"
+            player["rank"] = ""
+            player["leaguePoints"] = 0
+            player["wins"] = 0
+            player["losses"] = 0
+            player["winrate"] = 0
+    
+    def refresh_team_ranks(self, team_name: str) -> Dict[str, Any]:
+        """
+        Step 3 for a single team (Admin "Rafraîchir les rangs" button)
+        
+        Run it under `riot_client.priority(PRIORITY_INTERACTIVE)` on the client
+        shared with the background jobs: its few requests then go ahead of a
+        running match backfill.
+        
+        Returns:
+            Updated team data, {} if the team has no PUUIDs yet
+        """
+        teams_with_puuid = self.data_manager.load_teams_with_puuid()
+        team_data = teams_with_puuid.get(team_name)
+        if not team_data:
+            self._log_error(f"Team {team_name} not found in teams_with_puuid. Run step 2 first.")
+            return {}
+        
+        rank_history = self.data_manager.rank_history
+        self._seed_rank_history(rank_history, teams_with_puuid)
+        fetched_entries = {}
+        for player in team_data["players"]:
+            puuid = player.get("puuid")
+            if not puuid:
+                self._log_warning(f"No PUUID for {player.get('gameName')}#{player.get('tagLine')}, skipping rank fetch")
+                continue
+            ranked_info = self.riot_client.get_ranked_info(puuid, self.player_platform(player))
+            fetched_entries[puuid] = ranked_info
+            self._apply_ranked_info(player, ranked_info)
+        
+        self.data_manager.save_teams_with_puuid(teams_with_puuid)
+        changes = rank_history.record_many(fetched_entries)
+        logger.info(f"Ranks refreshed for {team_name}: {len(fetched_entries)} players ({changes} rank changes)")
+        return team_data
+    
+    def _seed_rank_history(self, rank_history, teams_with_puuid: Dict[str, Any]):
+        """
+        First run with a rank history: record the ranks already stored in
+        teams_with_puuid.json, dated from the file's last write
+        """
+        if rank_history.players():
+            return
+        stored_at = self.data_manager.data_version("teams_with_puuid.json")
+        entries = {
+            player["puuid"]: player if player.get("tier") not in (None, "UNRANKED") else None
+            for team in teams_with_puuid.values()
+            for player in team.get("players", [])
+            if player.get("puuid") and "tier" in player
+        }
+        if stored_at is not None and entries:
+            seeded = rank_history.record_many(entries, timestamp=int(stored_at))
+            logger.info(f"Rank history seeded with {seeded} stored ranks")
+    
     # ========================================
     # STEP 4: Fetch match IDs
     # ========================================
@@ -283,14 +375,9 @@ class EditionProcessor:
         
         # Get dates from config if not provided
         if start_timestamp is None or end_timestamp is None:
-            config = self.data_manager.load_config()
-            if config:
-                # Convert date strings to timestamps
-                from datetime import datetime
-                start_date = datetime.strptime(config.get("start_date", "2025-01-01"), "%Y-%m-%d")
-                end_date = datetime.strptime(config.get("end_date", "2025-12-31"), "%Y-%m-%d")
-                start_timestamp = int(start_date.timestamp())
-                end_timestamp = int(end_date.timestamp())
+            window = self.edition_window()
+            if window[0] is not None:
+                start_timestamp, end_timestamp = window
         
         tournament_matches = {}
         total_teams = len(teams_with_puuid)
@@ -302,61 +389,11 @@ class EditionProcessor:
                 (processed_teams / total_teams) * 100
             )
             
-            # OPTIMISATION: Prendre seulement le premier joueur
-            # (tous jouent les mêmes matchs de tournoi)
-            if not team_data.get("players"):
-                logger.warning(f"No players found for team {team_name}")
-                processed_teams += 1
-                continue
-            
-            first_player = team_data["players"][0]
-            puuid = first_player.get("puuid")
-            game_name = first_player.get("gameName", "Unknown")
-            
-            if not puuid:
-                logger.warning(f"No PUUID for {game_name} in {team_name}")
-                processed_teams += 1
-                continue
-            
             try:
-                # Vérifier si l'édition a un queue_id spécifique (ex: 3130 pour ARURF)
-                config = self.data_manager.load_config()
-                custom_queue_id = config.get("queue_id") if config else None
-                
-                if custom_queue_id:
-                    # Mode spécial avec queue ID custom (ex: ARURF 3130)
-                    match_ids = self.riot_client.get_match_ids_by_puuid(
-                        puuid=puuid,
-                        start_time=start_timestamp,
-                        end_time=end_timestamp,
-                        queue_id=custom_queue_id,  # 🎯 Queue spécifique (ARURF, etc.)
-                        count=50
-                    )
-                    logger.info(f"Using custom queue {custom_queue_id} for {team_name}")
-                elif use_tourney_filter:
-                    # Méthode optimale: type="tourney"
-                    match_ids = self.riot_client.get_match_ids_by_puuid(
-                        puuid=puuid,
-                        start_time=start_timestamp,
-                        end_time=end_timestamp,
-                        match_type="tourney",  # 🎯 Filtre tournois !
-                        count=50
-                    )
-                else:
-                    # Ancienne méthode: queue_id=0 (custom games)
-                    match_ids = self.riot_client.get_match_ids_by_puuid(
-                        puuid=puuid,
-                        start_time=start_timestamp,
-                        end_time=end_timestamp,
-                        queue_id=0,
-                        count=100
-                    )
-                
+                match_ids = self.fetch_team_match_ids(team_name, team_data, start_timestamp,
+                                                      end_timestamp, use_tourney_filter)
                 if match_ids:
                     tournament_matches[team_name] = match_ids
-                    logger.info(f"{team_name} ({game_name}): {len(match_ids)} matches found")
-                else:
-                    logger.warning(f"{team_name} ({game_name}): No matches found")
                     
             except Exception as e:
                 self._log_error(f"Error fetching matches for {team_name}: {str(e)}")
@@ -370,19 +407,103 @@ class EditionProcessor:
         
         return tournament_matches
     
+    def edition_window(self) -> tuple:
+        """
+        (start, end) epoch seconds of the edition from config.json
+        (None, None) without config
+        """
+        config = self.data_manager.load_config()
+        if not config:
+            return None, None
+        start_date = datetime.strptime(config.get("start_date", "2025-01-01"), "%Y-%m-%d")
+        end_date = datetime.strptime(config.get("end_date", "2025-12-31"), "%Y-%m-%d")
+        return int(start_date.timestamp()), int(end_date.timestamp())
+    
+    def fetch_team_match_ids(self, team_name: str, team_data: Dict[str, Any],
+                             start_timestamp: int = None, end_timestamp: int = None,
+                             use_tourney_filter: bool = True) -> Optional[List[str]]:
+        """
+        Match IDs of one team, from its first player's history
+        (all players of a team play the same tournament matches)
+        
+        Returns:
+            Match IDs (possibly empty), None if the team has no usable player
+        """
+        # OPTIMISATION: Prendre seulement le premier joueur
+        # (tous jouent les mêmes matchs de tournoi)
+        if not team_data.get("players"):
+            logger.warning(f"No players found for team {team_name}")
+            return None
+        
+        first_player = team_data["players"][0]
+        puuid = first_player.get("puuid")
+        platform = self.player_platform(first_player)
+        game_name = first_player.get("gameName", "Unknown")
+        
+        if not puuid:
+            logger.warning(f"No PUUID for {game_name} in {team_name}")
+            return None
+        
+        # Vérifier si l'édition a un queue_id spécifique (ex: 3130 pour ARURF)
+        config = self.data_manager.load_config()
+        custom_queue_id = config.get("queue_id") if config else None
+        
+        if custom_queue_id:
+            # Mode spécial avec queue ID custom (ex: ARURF 3130)
+            match_ids = self.riot_client.get_match_ids_by_puuid(
+                puuid=puuid,
+                start_time=start_timestamp,
+                end_time=end_timestamp,
+                queue_id=custom_queue_id,  # 🎯 Queue spécifique (ARURF, etc.)
+                count=50,
+                platform=platform
+            )
+            logger.info(f"Using custom queue {custom_queue_id} for {team_name}")
+        elif use_tourney_filter:
+            # Méthode optimale: type="tourney"
+            match_ids = self.riot_client.get_match_ids_by_puuid(
+                puuid=puuid,
+                start_time=start_timestamp,
+                end_time=end_timestamp,
+                match_type="tourney",  # 🎯 Filtre tournois !
+                count=50,
+                platform=platform
+            )
+        else:
+            # Ancienne méthode: queue_id=0 (custom games)
+            match_ids = self.riot_client.get_match_ids_by_puuid(
+                puuid=puuid,
+                start_time=start_timestamp,
+                end_time=end_timestamp,
+                queue_id=0,
+                count=100,
+                platform=platform
+            )
+        
+        if match_ids:
+            logger.info(f"{team_name} ({game_name}): {len(match_ids)} matches found")
+        else:
+            logger.warning(f"{team_name} ({game_name}): No matches found")
+        return match_ids or []
+    
     # ========================================
     # STEP 5: Fetch match details
     # ========================================
     
-    def step5_fetch_match_details(self, use_cache: bool = True) -> Dict[str, Any]:
+    def step5_fetch_match_details(self, use_cache: bool = True,
+                                  fetch_timelines: bool = False,
+                                  incremental: bool = False) -> Dict[str, Any]:
         """
         Step 5: Fetch detailed match data using Match-V5
         
         Args:
             use_cache: Whether to use cached matches
+            fetch_timelines: Also fetch match timelines and store their
+                             gold/xp/cs frames (early game stats in step 6)
+            incremental: Only fetch matches not already in match_details
         
         Returns:
-            Match details data
+            Match details data (only the newly fetched matches if incremental)
         """
         self._update_progress("Fetching match details from Riot API...", 0)
         
@@ -398,6 +519,12 @@ class EditionProcessor:
             if isinstance(match_ids_list, list):
                 all_match_ids.update(match_ids_list)
         
+        if incremental:
+            all_match_ids -= set(self.stored_match_ids())
+            if not all_match_ids:
+                self._update_progress("Match details up to date: no new match", 100)
+                return {}
+        
         all_match_ids = list(all_match_ids)
         total_matches = len(all_match_ids)
         
@@ -415,9 +542,14 @@ class EditionProcessor:
                 progress_callback=match_progress_callback
             )
             
-            # Save each match detail
+            # Save the lean projection of each match (appended to the match log,
+            # merged once at the end); the raw payload stays in the API cache
             for match_id, match_data in match_details.items():
-                self.data_manager.add_match_detail(match_id, match_data)
+                self.data_manager.add_match_detail(match_id, project_match(match_data))
+            self.data_manager.compact_match_log()
+            
+            if fetch_timelines:
+                self._fetch_timelines(list(match_details), use_cache)
             
             self._update_progress(f"Match details fetched: {len(match_details)} matches", 100)
             
@@ -427,6 +559,81 @@ class EditionProcessor:
             self._log_error(f"Error fetching match details: {str(e)}")
             return {}
     
+    def stored_match_ids(self) -> List[str]:
+        """IDs of the matches already in match_details (streamed, payloads not kept)"""
+        return [match_id for match_id, _ in self.data_manager.iter_match_details()]
+    
+    def _fetch_timelines(self, match_ids: List[str], use_cache: bool = True) -> int:
+        """
+        Fetch timelines and store them as compact frame arrays
+        
+        Args:
+            match_ids: Matches to fetch timelines for
+            use_cache: Whether to use cached timelines
+        
+        Returns:
+            Number of timelines stored
+        """
+        store = self.data_manager.timelines
+        missing = [m for m in match_ids if not (use_cache and store.has(m))]
+        stored = 0
+        
+        with self.riot_client.priority(PRIORITY_BULK):
+            for i, match_id in enumerate(missing, 1):
+                self._update_progress(f"Fetching timeline {i}/{len(missing)}: {match_id}", i / len(missing) * 100)
+                timeline = self.riot_client.get_match_timeline(match_id, use_cache)
+                if not timeline:
+                    self._log_warning(f"Timeline not found for {match_id}")
+                    continue
+                store.save(match_id, timeline)
+                stored += 1
+        
+        logger.info(f"Timelines stored: {stored} new, {len(match_ids) - len(missing)} already present")
+        return stored
+    
+    def reproject_match_details(self, fetch_missing: bool = False) -> Dict[str, int]:
+        """
+        Rebuild match_details.json at the current projection schema
+        
+        Raw payloads come from the API cache; stored raw payloads (editions
+        fetched before the projection) are projected in place. Matches whose
+        raw payload is unavailable keep their current record.
+        
+        Args:
+            fetch_missing: Fetch raw payloads missing from the cache from the API
+        
+        Returns:
+            {"reprojected": n, "up_to_date": n, "missing": n}
+        """
+        match_details = self.data_manager.load_match_details()
+        counts = {"reprojected": 0, "up_to_date": 0, "missing": 0}
+        
+        for i, (match_id, match_data) in enumerate(match_details.items(), 1):
+            self._update_progress(f"Reprojecting match {i}/{len(match_details)}: {match_id}",
+                                  i / len(match_details) * 100)
+            version = projection_version(match_data)
+            if version == SCHEMA_VERSION:
+                counts["up_to_date"] += 1
+                continue
+            
+            with self.riot_client.priority(PRIORITY_BULK):
+                raw = self.riot_client.get_match_details(match_id, use_cache=True, cache_only=not fetch_missing)
+            if raw is None and version is None:
+                raw = match_data
+            if raw is None:
+                self._log_warning(f"Raw payload unavailable for {match_id} (schema v{version} kept)")
+                counts["missing"] += 1
+                continue
+            
+            match_details[match_id] = project_match(raw)
+            counts["reprojected"] += 1
+        
+        if counts["reprojected"]:
+            self.data_manager.save_match_details(match_details)
+        
+        logger.info(f"Match details reprojected to schema v{SCHEMA_VERSION}: {counts}")
+        return counts
+    
     # ========================================
     # STEP 6: Calculate statistics
     # ========================================
@@ -440,10 +647,12 @@ class EditionProcessor:
         """
         self._update_progress("Calculating statistics...", 0)
         
-        match_details = self.data_manager.load_match_details()
+        # Streamed one match at a time (the edition is never fully in memory)
+        match_details = self.data_manager.iter_match_details()
+        first_match = next(match_details, None)
         teams_with_puuid = self.data_manager.load_teams_with_puuid()
         
-        if not match_details:
+        if first_match is None:
             self._log_error("No match details found. Run step 5 first.")
             return {}
         
@@ -452,36 +661,22 @@ class EditionProcessor:
             return {}
         
         try:
-            stats = self.stats_calculator.calculate_all_stats(match_details, teams_with_puuid)
+            timelines = self.data_manager.timelines.load_all()
+            # Participant matrix for the interactive filters, built in the same pass
+            matrix = ParticipantMatrixBuilder(teams_with_puuid)
+            stats = self.stats_calculator.calculate_all_stats(
+                matrix.collect(itertools.chain([first_match], match_details)), teams_with_puuid, timelines
+            )
+            matrix.save(self.data_manager.participants.directory)
             
             # Save general_stats.json (contains everything)
             self.data_manager.save_general_stats(stats)
             
-            # Generate team_stats.json in the format expected by Stats Équipes page
-            # Structure: { "TeamName": { "team_stats": {...}, "players": {...} } }
-            if "team_stats" in stats and "player_stats" in stats:
-                import json
-                
-                team_stats_formatted = {}
-                
-                for team_name, team_data in stats["team_stats"].items():
-                    # Initialize team structure
-                    team_stats_formatted[team_name] = {
-                        "team_stats": team_data,
-                        "players": {}
-                    }
-                    
-                    # Add players belonging to this team
-                    for player_name, player_data in stats["player_stats"].items():
-                        if player_data.get("team") == team_name:
-                            team_stats_formatted[team_name]["players"][player_name] = player_data
-                
-                # Save to team_stats.json
-                team_stats_path = self.data_manager.edition_path / "team_stats.json"
-                with open(team_stats_path, 'w', encoding='utf-8') as f:
-                    json.dump(team_stats_formatted, f, ensure_ascii=False, indent=2)
-                
-                logger.info(f"Saved team_stats.json with {len(team_stats_formatted)} teams")
+            # Per-team view expected by Stats Équipes / Stats Joueurs pages
+            team_stats = build_team_stats(stats)
+            if team_stats:
+                self.data_manager.save_team_stats(team_stats)
+                logger.info(f"Saved team stats with {len(team_stats)} teams")
             
             self._update_progress(
                 f"Stats calculated: {stats['metadata']['total_players']} players, "
@@ -501,7 +696,8 @@ class EditionProcessor:
     
     def run_full_pipeline(self, start_timestamp: int = None, 
                          end_timestamp: int = None,
-                         use_cache: bool = True) -> Dict[str, Any]:
+                         use_cache: bool = True,
+                         fetch_timelines: bool = False) -> Dict[str, Any]:
         """
         Run the complete pipeline (steps 2-6)
         Assumes teams are already added (step 1)
@@ -510,6 +706,7 @@ class EditionProcessor:
             start_timestamp: Start date for match history
             end_timestamp: End date for match history
             use_cache: Use cached matches
+            fetch_timelines: Also ingest match timelines (early game stats)
         
         Returns:
             Pipeline results summary
@@ -540,6 +737,7 @@ class EditionProcessor:
             results["success"] = False
             results["errors"] = self.errors
             results["warnings"] = self.warnings
+            results["api_metrics"] = self.riot_client.metrics()
             return results
         
         # Step 3: Fetch ranks
@@ -572,12 +770,13 @@ class EditionProcessor:
             results["success"] = False
             results["errors"] = self.errors
             results["warnings"] = self.warnings
+            results["api_metrics"] = self.riot_client.metrics()
             return results
         
         # Step 5: Fetch match details
         try:
             self._update_progress("STEP 5/6: Fetching match details...", 66)
-            match_details = self.step5_fetch_match_details(use_cache)
+            match_details = self.step5_fetch_match_details(use_cache, fetch_timelines)
             results["steps"]["step5_match_details"] = {
                 "success": len(match_details) > 0,
                 "matches_fetched": len(match_details)
@@ -588,6 +787,7 @@ class EditionProcessor:
             results["success"] = False
             results["errors"] = self.errors
             results["warnings"] = self.warnings
+            results["api_metrics"] = self.riot_client.metrics()
             return results
         
         # Step 6: Calculate stats
@@ -611,6 +811,7 @@ class EditionProcessor:
         results["duration_seconds"] = duration
         results["errors"] = self.errors
         results["warnings"] = self.warnings
+        results["api_metrics"] = self.riot_client.metrics()
         results["success"] = all(
             step.get("success", False) 
             for step in results["steps"].values()
@@ -620,5 +821,10 @@ class EditionProcessor:
         
         logger.info(f"Pipeline completed in {duration:.1f}s")
         logger.info(f"Errors: {len(self.errors)}, Warnings: {len(self.warnings)}")
+        totals = results["api_metrics"]["totals"]
+        logger.info(
+            f"API: {totals['requests']} requests, {totals['retries']} retries, "
+            f"{totals['latency_seconds']:.1f}s in requests, {totals['sleep_seconds']:.1f}s waiting"
+        )
         
         return results
@@ -0,0 +1,346 @@
+"""
+Job Runner - Runs Admin pipeline actions in background threads
+
+The Admin page enqueues jobs (an edition + pipeline steps) instead of running
+EditionProcessor steps inside the Streamlit script thread: a long step 5 no
+longer blocks the session, and closing or refreshing the browser does not stop
+it. The page only reads the job table to display status and progress.
+
+- Job table: data/jobs/jobs.json (kept in memory, written atomically on every
+  status change and at most once per second for progress updates)
+- Workers: a thread pool (`workers` editions processed concurrently, at most
+  one job per edition). Jobs share one RiotAPIClient per API key, hence one
+  rate limiter: concurrency never exceeds the key's request rate.
+- Steps run through batch_runner.run_edition; progress comes from the
+  processor's _update_progress
+- Cancel: checked at every progress update, the step stops at the next player
+  or match
+- Resume: a failed, cancelled or interrupted job is queued again with its
+  remaining steps, in incremental mode (step 5 only fetches the missing
+  matches, the API cache avoids refetching those already downloaded)
+
+Jobs still queued or running when the process stops are marked "interrupted"
+at the next start.
+"""
+
+import os
+import json
+import time
+import uuid
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+from src.pipeline.batch_runner import STEPS, API_STEPS, run_edition
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = {"queued", "running"}
+RESUMABLE_STATUSES = {"failed", "cancelled", "interrupted"}
+
+# Finished jobs kept in the table
+MAX_FINISHED_JOBS = 50
+
+# Minimal delay between two writes of the table for progress updates (seconds)
+SAVE_INTERVAL = 1.0
+
+
+class JobCancelled(BaseException):
+    """
+    Raised from the progress callback of a cancelled job
+
+    BaseException, like KeyboardInterrupt: the steps catch Exception per
+    player / match to keep going, a cancellation must go through them.
+    """
+
+
+class JobRunner:
+    """
+    Persistent job table + background workers
+    """
+
+    def __init__(self, path: str = "data/jobs/jobs.json", workers: int = 2,
+                 base_path: str = "data/editions", cache_dir: Optional[str] = None):
+        """
+        Args:
+            path: Job table file
+            workers: Jobs (editions) run concurrently
+            base_path: Editions directory
+            cache_dir: Riot API cache directory (default: RiotAPIClient's, see MOCK_CACHE_DIR)
+        """
+        self.path = Path(path)
+        self.base_path = base_path
+        self.cache_dir = cache_dir
+
+        self._lock = threading.RLock()
+        self._cancel_events: Dict[str, threading.Event] = {}
+        self._clients: Dict[str, Any] = {}
+        self._last_save = 0.0
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="job")
+
+        self._jobs: Dict[str, Dict[str, Any]] = self._load()
+        interrupted = False
+        for job in self._jobs.values():
+            if job["status"] in ACTIVE_STATUSES:
+                job.update(status="interrupted", message="Interrompu (redémarrage)",
+                           finished_at=job.get("finished_at") or datetime.now().isoformat())
+                interrupted = True
+        if interrupted:
+            self._save(force=True)
+
+    # ========================================
+    # JOB TABLE
+    # ========================================
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return {job["id"]: job for job in json.load(f).get("jobs", [])}
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Unreadable job table {self.path}: {e}")
+            return {}
+
+    def _save(self, force: bool = False):
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_save < SAVE_INTERVAL:
+                return
+            self._last_save = now
+            self._prune()
+            content = json.dumps({"jobs": list(self._jobs.values())}, indent=2, ensure_ascii=False)
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.stem}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+    def _prune(self):
+        finished = [job for job in self._jobs.values() if job["status"] not in ACTIVE_STATUSES]
+        finished.sort(key=lambda job: job["created_at"])
+        for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job["id"]]
+
+    def _update(self, job_id: str, force: bool = False, **fields):
+        with self._lock:
+            self._jobs[job_id].update(fields)
+            self._save(force=force)
+
+    def list_jobs(self, edition: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Jobs, most recent first (copies)"""
+        with self._lock:
+            jobs = [dict(job) for job in self._jobs.values()
+                    if edition is None or job["edition"] == edition]
+        return sorted(jobs, key=lambda job: job["created_at"], reverse=True)
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def active_job(self, edition: int) -> Optional[Dict[str, Any]]:
+        """Queued or running job of an edition"""
+        with self._lock:
+            for job in self._jobs.values():
+                if job["edition"] == edition and job["status"] in ACTIVE_STATUSES:
+                    return dict(job)
+        return None
+
+    # ========================================
+    # SUBMIT / CANCEL / RESUME
+    # ========================================
+
+    def submit(self, edition: int, steps: List[int], api_key: str, label: str = "",
+               incremental: bool = False, use_cache: bool = True,
+               fetch_timelines: bool = False) -> str:
+        """
+        Queue pipeline steps for an edition
+
+        Returns:
+            Job ID
+
+        Raises:
+            ValueError: Unknown step, or the edition already has an active job
+        """
+        unknown = set(steps) - set(STEPS)
+        if unknown:
+            raise ValueError(f"Unknown step(s): {sorted(unknown)}")
+
+        with self._lock:
+            if self.active_job(edition):
+                raise ValueError(f"Edition {edition} already has a job in progress")
+
+            job_id = uuid.uuid4().hex[:12]
+            self._jobs[job_id] = {
+                "id": job_id,
+                "edition": edition,
+                "label": label or f"Steps {', '.join(str(step) for step in steps)}",
+                "steps": sorted(steps),
+                "options": {"incremental": incremental, "use_cache": use_cache, "fetch_timelines": fetch_timelines},
+                "status": "queued",
+                "current_step": None,
+                "progress": 0.0,
+                "message": "En attente",
+                "completed_steps": [],
+                "step_reports": [],
+                "report": None,
+                "error": None,
+                "created_at": datetime.now().isoformat(),
+                "started_at": None,
+                "finished_at": None
+            }
+            self._save(force=True)
+            self._enqueue(job_id, api_key)
+        return job_id
+
+    def _enqueue(self, job_id: str, api_key: str):
+        # One event per submission: a task left queued by a cancelled run sees
+        # that its event was replaced (resume) and does nothing
+        cancel_event = threading.Event()
+        self._cancel_events[job_id] = cancel_event
+        self._executor.submit(self._run, job_id, api_key, cancel_event)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a queued job, or ask a running one to stop at its next progress update
+
+        Returns:
+            False if the job is not active
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job or job["status"] not in ACTIVE_STATUSES:
+                return False
+            event = self._cancel_events.get(job_id)
+            if event:
+                event.set()
+            if job["status"] == "queued":
+                self._update(job_id, force=True, status="cancelled", message="Annulé",
+                             finished_at=datetime.now().isoformat())
+            else:
+                self._update(job_id, force=True, message="Annulation demandée...")
+        return True
+
+    def resume(self, job_id: str, api_key: str) -> bool:
+        """
+        Queue a failed, cancelled or interrupted job again with its remaining steps
+
+        Returns:
+            False if the job cannot be resumed
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job or job["status"] not in RESUMABLE_STATUSES or self.active_job(job["edition"]):
+                return False
+            remaining = [step for step in job["steps"] if step not in job["completed_steps"]]
+            if not remaining:
+                return False
+            job["options"]["incremental"] = True
+            self._update(job_id, force=True, status="queued", steps=remaining, progress=0.0,
+                         current_step=None, completed_steps=[], message="En attente (reprise)",
+                         error=None, finished_at=None)
+            self._enqueue(job_id, api_key)
+        return True
+
+    # ========================================
+    # WORKER
+    # ========================================
+
+    def client(self, api_key: str):
+        """One client per API key, shared by all jobs (single rate limiter and cache)"""
+        from src.core.riot_client import RiotAPIClient
+
+        with self._lock:
+            if api_key not in self._clients:
+                self._clients[api_key] = RiotAPIClient(api_key, cache_dir=self.cache_dir)
+            return self._clients[api_key]
+
+    def _run(self, job_id: str, api_key: str, cancel_event: threading.Event):
+        with self._lock:
+            if self._cancel_events.get(job_id) is not cancel_event:
+                # Stale task (job cancelled while queued, then resumed)
+                return
+            job = self._jobs.get(job_id)
+            if job is None or job["status"] != "queued" or cancel_event.is_set():
+                self._cancel_events.pop(job_id, None)
+                return
+            steps = list(job["steps"])
+            options = dict(job["options"])
+            self._update(job_id, force=True, status="running", started_at=datetime.now().isoformat(),
+                         message="Démarrage...")
+
+        def progress_callback(step: int, message: str, progress: float):
+            if cancel_event.is_set():
+                raise JobCancelled()
+            overall = (steps.index(step) + min(max(progress, 0), 100) / 100) / len(steps) * 100
+            self._update(job_id, current_step=step, progress=round(overall, 1), message=message)
+
+        def on_step(step_report: Dict[str, Any]):
+            with self._lock:
+                job = self._jobs[job_id]
+                job["step_reports"].append(step_report)
+                if step_report["status"] in ("ok", "skipped"):
+                    job["completed_steps"].append(step_report["step"])
+                self._save(force=True)
+
+        try:
+            client = self.client(api_key) if set(steps) & API_STEPS else None
+            report = run_edition(
+                job["edition"], steps, riot_client=client, api_key=api_key, base_path=self.base_path,
+                incremental=options["incremental"], use_cache=options["use_cache"],
+                fetch_timelines=options["fetch_timelines"],
+                progress_callback=progress_callback, on_step=on_step
+            )
+            if client is not None:
+                report["api_metrics"] = client.metrics()
+            self._update(job_id, force=True, status="done" if report["success"] else "failed",
+                         progress=100.0 if report["success"] else self._jobs[job_id]["progress"],
+                         message="Terminé" if report["success"] else "Échec",
+                         report=report, error=None if report["success"] else "; ".join(report["errors"][-3:]),
+                         finished_at=datetime.now().isoformat())
+        except JobCancelled:
+            logger.info(f"Job {job_id} cancelled")
+            self._update(job_id, force=True, status="cancelled", message="Annulé",
+                         finished_at=datetime.now().isoformat())
+        except Exception as e:
+            logger.exception(f"Job {job_id} failed")
+            self._update(job_id, force=True, status="failed", message="Échec", error=str(e),
+                         finished_at=datetime.now().isoformat())
+        finally:
+            with self._lock:
+                if self._cancel_events.get(job_id) is cancel_event:
+                    del self._cancel_events[job_id]
+
+    def shutdown(self, wait: bool = True):
+        """Cancel every active job and stop the workers"""
+        for job in self.list_jobs():
+            if job["status"] in ACTIVE_STATUSES:
+                self.cancel(job["id"])
+        self._executor.shutdown(wait=wait)
+
+
+_runner: Optional[JobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner(**kwargs) -> JobRunner:
+    """
+    Process-wide runner (the Streamlit server runs every session in one process:
+    all Admin sessions see the same jobs)
+    """
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = JobRunner(**kwargs)
+        return _runner
@@ -0,0 +1,233 @@
+"""
+Live Watcher - Polls an edition during the event and ingests new matches
+
+Each cycle asks Match-V5 for the match IDs of every team's first player
+within the edition window (EditionProcessor.fetch_team_match_ids, as in
+step 4), then:
+- merges the new IDs into tournament_matches.json
+- fetches and stores only the matches missing from match_details
+  (appended to the match log, no full rewrite)
+- recomputes general_stats.json / team_stats.json (step 6, streamed) only
+  when at least one match was ingested
+
+Adaptive interval:
+- a match ended less than `hot_window` ago (or was just ingested): the round
+  is in progress, poll every `fast_interval`
+- otherwise the interval grows by `backoff` each empty cycle, up to
+  `idle_interval`
+- before the edition window: sleep until it opens (at most `idle_interval`);
+  once end_date is over (end of that day, see _window): stop
+
+Rate budget: the watcher owns its RiotAPIClient, paced so that it uses at
+most `budget` (0-1) of each application rate limit window ("20:1,100:120"):
+requests are spaced accordingly and a cycle never starts before the
+previous one's requests fit in the budget. The rest of the key's quota stays
+available to the Admin page and scripts. The default limits are those of a
+development key, the strictest: pass the production limits explicitly.
+"""
+
+import time
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from src.core.match_projection import project_match
+from src.core.rate_limiter import RateLimiter, DEV_KEY_APP_LIMITS, parse_limits
+
+logger = logging.getLogger(__name__)
+
+DAY = 86400
+
+
+class LiveWatcher:
+    """
+    Polling loop around an EditionProcessor
+    """
+
+    def __init__(self, processor, fast_interval: float = 60, idle_interval: float = 900,
+                 backoff: float = 1.5, hot_window: float = 1800, budget: float = 0.5,
+                 app_limits: str = DEV_KEY_APP_LIMITS):
+        """
+        Args:
+            processor: EditionProcessor of the edition to watch
+            fast_interval: Seconds between polls while games are being played
+            idle_interval: Maximum seconds between polls when idle
+            backoff: Interval multiplier after each cycle without new match
+            hot_window: Seconds after a game's end during which the round is
+                        considered ongoing
+            budget: Fraction (0-1] of the application rate limits the watcher may use
+            app_limits: Application rate limits of the API key ("count:seconds,...")
+        """
+        if not 0 < budget <= 1:
+            raise ValueError(f"budget must be in (0, 1], got {budget}")
+
+        self.processor = processor
+        self.data_manager = processor.data_manager
+        self.riot_client = processor.riot_client
+        self.fast_interval = fast_interval
+        self.idle_interval = idle_interval
+        self.backoff = backoff
+        self.hot_window = hot_window
+        self.budget = budget
+        self.limits = parse_limits(app_limits)
+
+        # Pace the watcher's own requests within the budget of the shortest window
+        count, seconds = min(self.limits, key=lambda limit: limit[1])
+        self.riot_client.rate_limiter = RateLimiter(seconds / (count * budget))
+
+        self.interval = fast_interval
+        self.last_game_end: Optional[float] = None
+        self.cycles = 0
+        self.total_ingested = 0
+
+    # ========================================
+    # BUDGET
+    # ========================================
+
+    def _requests_made(self) -> int:
+        return self.riot_client.metrics()["totals"]["requests"]
+
+    def min_interval_for(self, requests: int) -> float:
+        """Shortest cycle length keeping `requests` per cycle within the budget of every window"""
+        return max(requests * seconds / (count * self.budget) for count, seconds in self.limits)
+
+    # ========================================
+    # POLLING
+    # ========================================
+
+    def _window(self) -> tuple:
+        start, end = self.processor.edition_window()
+        # end_date is a day: the window closes at the end of it
+        return start, (end + DAY if end is not None else None)
+
+    def poll_once(self) -> Dict[str, Any]:
+        """
+        One polling cycle
+
+        Returns:
+            {"state": "before" | "live" | "finished", "new_match_ids", "ingested",
+             "stats_updated", "requests", "seconds", "next_interval"}
+        """
+        started = time.time()
+        requests_before = self._requests_made()
+        result = {"state": "live", "new_match_ids": 0, "ingested": 0, "stats_updated": False}
+
+        start, end = self._window()
+        now = int(started)
+        if start is not None and now < start:
+            result.update(state="before", requests=0, seconds=0.0,
+                          next_interval=min(self.idle_interval, start - now))
+            return result
+        if end is not None and now > end:
+            result.update(state="finished", requests=0, seconds=0.0, next_interval=None)
+            return result
+
+        teams_with_puuid = self.data_manager.load_teams_with_puuid()
+        tournament_matches = self.data_manager.load_tournament_matches()
+
+        # 1. New match IDs, team by team
+        new_ids = set()
+        for team_name, team_data in teams_with_puuid.items():
+            try:
+                match_ids = self.processor.fetch_team_match_ids(
+                    team_name, team_data, start, min(now, end) if end is not None else now
+                )
+            except Exception as e:
+                self.processor._log_warning(f"Polling {team_name} failed: {e}")
+                continue
+            known = set(tournament_matches.get(team_name, []))
+            fresh = [match_id for match_id in match_ids or [] if match_id not in known]
+            if fresh:
+                tournament_matches.setdefault(team_name, []).extend(fresh)
+                new_ids.update(fresh)
+
+        if new_ids:
+            self.data_manager.save_tournament_matches(tournament_matches)
+            result["new_match_ids"] = len(new_ids)
+
+            # 2. Only the matches not stored yet
+            stored = set(self.processor.stored_match_ids())
+            for match_id in sorted(new_ids - stored):
+                match_data = self.riot_client.get_match_details(match_id)
+                if not match_data:
+                    continue
+                self.data_manager.add_match_detail(match_id, project_match(match_data))
+                result["ingested"] += 1
+                info = match_data.get("info", {})
+                game_end = info.get("gameEndTimestamp") or (
+                    info.get("gameCreation", 0) + info.get("gameDuration", 0) * 1000
+                )
+                if game_end:
+                    self.last_game_end = max(self.last_game_end or 0, game_end / 1000)
+
+        # 3. Aggregates, only when something changed
+        if result["ingested"]:
+            stats = self.processor.step6_calculate_stats()
+            result["stats_updated"] = bool(stats)
+            self.total_ingested += result["ingested"]
+
+        result["requests"] = self._requests_made() - requests_before
+        result["seconds"] = round(time.time() - started, 2)
+        result["next_interval"] = self._next_interval(result)
+        self.cycles += 1
+        return result
+
+    def _next_interval(self, result: Dict[str, Any]) -> float:
+        hot = result["ingested"] > 0 or (
+            self.last_game_end is not None and time.time() - self.last_game_end < self.hot_window
+        )
+        if hot:
+            self.interval = self.fast_interval
+        else:
+            self.interval = min(self.idle_interval, self.interval * self.backoff)
+        # Never start the next cycle before this one's requests fit in the budget
+        return max(self.interval, self.min_interval_for(result["requests"]) - result["seconds"])
+
+    def run(self, stop_event: Optional[threading.Event] = None, max_cycles: Optional[int] = None,
+            on_cycle=None) -> Dict[str, Any]:
+        """
+        Poll until the edition is over, `stop_event` is set or `max_cycles` is reached
+
+        Args:
+            stop_event: Set it (e.g. from a signal handler) to stop between cycles
+            max_cycles: Stop after this many cycles, including the ones spent
+                        waiting for the window to open or failing
+            on_cycle: Optional callback(result) after each cycle
+
+        Returns:
+            {"cycles", "ingested"}
+        """
+        stop_event = stop_event or threading.Event()
+        logger.info(f"Watching edition {self.processor.edition_id} "
+                    f"(fast {self.fast_interval}s, idle {self.idle_interval}s, budget {self.budget:.0%})")
+
+        iterations = 0
+        try:
+            while not stop_event.is_set():
+                iterations += 1
+                try:
+                    result = self.poll_once()
+                except Exception as e:
+                    # Transient failure (network, disk): retry later, never die mid-event
+                    self.processor._log_error(f"Polling cycle failed: {e}")
+                    self.interval = min(self.idle_interval, self.interval * self.backoff)
+                    result = {"state": "error", "error": str(e), "next_interval": self.interval}
+
+                if on_cycle:
+                    on_cycle(result)
+                if result["state"] == "finished":
+                    logger.info("Edition is over, stopping")
+                    break
+                if max_cycles is not None and iterations >= max_cycles:
+                    break
+
+                logger.info(f"Next poll in {result['next_interval']:.0f}s "
+                            f"({datetime.now().strftime('%H:%M:%S')})")
+                stop_event.wait(result["next_interval"])
+        finally:
+            # Merge the match log written during the session
+            if self.total_ingested:
+                self.data_manager.compact_match_log()
+
+        return {"cycles": self.cycles, "ingested": self.total_ingested}
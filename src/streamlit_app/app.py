@@ -11,7 +11,9 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.core.data_manager import MultiEditionManager, EditionDataManager
+from src.core.data_manager import EditionDataManager
+from components.app_shell import get_multi_manager, render_sidebar
+from components.assets import get_role_icon_url
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -58,65 +60,8 @@ def main():
     </style>
     """, unsafe_allow_html=True)
     
-    # Sidebar - Edition selector
-    with st.sidebar:
-        st.markdown("### 📂 Sélection d'édition")
-        
-        multi_manager = MultiEditionManager()
-        
-        # Vérifier si l'utilisateur est admin
-        is_admin = st.session_state.get("authenticated", False)
-        
-        # Lister les éditions (privées uniquement si admin)
-        editions = multi_manager.list_editions(include_private=is_admin)
-        
-        if not editions:
-            st.warning("⚠️ Aucune édition disponible")
-            st.info("💡 Créez une édition dans la page Admin")
-            selected_edition = None
-        else:
-            # Initialiser selected_edition dans session_state si pas déjà fait
-            if "selected_edition" not in st.session_state:
-                st.session_state.selected_edition = 7 if 7 in editions else (editions[0] if editions else None)
-            
-            # Trouver l'index de l'édition sélectionnée
-            default_index = 0
-            if st.session_state.selected_edition in editions:
-                default_index = editions.index(st.session_state.selected_edition)
-            
-            # Sélecteur visible pour tous les utilisateurs
-            selected_edition = st.selectbox(
-                "Édition",
-                editions,
-                index=default_index,
-                format_func=lambda x: f"Edition {x}",
-                label_visibility="collapsed",
-                key="edition_selector_home"
-            )
-            
-            # Sauvegarder dans session_state
-            st.session_state.selected_edition = selected_edition
-            
-            if selected_edition:
-                edition_manager = EditionDataManager(selected_edition)
-                config = edition_manager.load_config()
-                
-                if config:
-                    st.markdown(f"**{config.get('name', 'N/A')}**")
-                    st.caption(f"📆 {config.get('start_date', 'N/A')} → {config.get('end_date', 'N/A')}")
-        
-        st.markdown("---")
-        st.markdown("### 🧭 Navigation")
-        st.page_link("app.py", label="🏠 Accueil")
-        st.page_link("pages/1_📊_Stats_Generales.py", label="📊 Stats Générales")
-        st.page_link("pages/2_Liste_des_Matchs.py", label="📋 Liste des Matchs")
-        st.page_link("pages/3_🐉_Stats_Champions.py", label="🐉 Stats Champions")
-        st.page_link("pages/4_🏆_Stats_Equipes.py", label="🏆 Stats Équipes")
-        st.page_link("pages/5_👤_Stats_Joueurs.py", label="👤 Stats Joueurs")
-        st.page_link("pages/6_🔍_Recherche.py", label="🔍 Recherche")
-        st.page_link("pages/9_🔧_Admin.py", label="🔧 Admin")
-        st.markdown("---")
-        st.caption("🎮 OcciLan Stats v2.0")
+    # Sidebar - Edition selector (catalogue seul, voir components/app_shell.py)
+    editions, selected_edition = render_sidebar("edition_selector_home")
     
     # Main content
     st.markdown('<h1 class="main-header">🎮 OcciLan Stats</h1>', unsafe_allow_html=True)
@@ -152,10 +97,8 @@ def main():
             """)
     else:
         # Edition selected - show summary
-        selected_edition = st.session_state.get("selected_edition")
         edition_manager = EditionDataManager(selected_edition)
-        config = edition_manager.load_config()
-        summary = edition_manager.get_summary()
+        summary = get_multi_manager().get_summary(selected_edition)
         
         st.subheader(f"📊 Résumé - Edition {selected_edition}")
         
@@ -234,21 +177,6 @@ def main():
                                 "TOP": "TOP", "JGL": "JGL", "JUNGLE": "JGL", "MID": "MID", "ADC": "ADC", "SUP": "SUP", "SUPP": "SUP"
                             }
                             role_std = role_map.get(role_raw, "UNKNOWN")
-                            def get_role_icon_url(role: str, size: int = 24) -> str:
-                                role_norm = role.upper()
-                                if role_norm in ["TOP"]:
-                                    key = "position-top.svg"
-                                elif role_norm in ["JGL", "JUNGLE"]:
-                                    key = "position-jungle.svg"
-                                elif role_norm in ["MID", "MIDDLE"]:
-                                    key = "position-middle.svg"
-                                elif role_norm in ["ADC", "BOTTOM"]:
-                                    key = "position-bottom.svg"
-                                elif role_norm in ["SUP", "SUPP", "UTILITY"]:
-                                    key = "position-utility.svg"
-                                else:
-                                    key = "position-top.svg"
-                                return f"https://raw.communitydragon.org/pbe/plugins/rcp-fe-lol-static-assets/global/default/svg/{key}"
                             role_icon_url = get_role_icon_url(role_std)
                             game_name = player.get('gameName', 'Unknown')
                             tag_line = player.get('tagLine', '0000')
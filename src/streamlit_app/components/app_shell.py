@@ -0,0 +1,155 @@
+"""
+Squelette commun des pages: sélecteur d'édition et navigation de la sidebar
+
+Usage dans une page:
+    from components.app_shell import get_multi_manager, lazy_module, render_sidebar
+
+    pd = lazy_module("pandas")                  # importé au premier pd.DataFrame(...)
+    px = lazy_module("plotly.express")          # importé au premier graphique
+
+    multi_manager = get_multi_manager()
+    available_editions, selected_edition = render_sidebar("edition_selector_stats")
+
+Démarrage à froid:
+- le sélecteur ne lit que le catalogue des éditions (data/editions/catalog.json):
+  aucun fichier d'édition n'est parsé pour afficher la sidebar
+- MultiEditionManager est partagé entre sessions et reruns (catalogue et
+  caches gardés en mémoire)
+- pandas / plotly ne sont importés qu'à la première utilisation: une page
+  qui s'arrête avant (aucune édition, accueil) ne les charge jamais
+"""
+
+import importlib
+from types import ModuleType
+from typing import List, Optional, Tuple
+
+import streamlit as st
+
+from src.core.data_manager import MultiEditionManager
+
+# Édition sélectionnée par défaut (si présente)
+DEFAULT_EDITION = 7
+
+NAV_LINKS = [
+    ("app.py", "🏠 Accueil"),
+    ("pages/1_📊_Stats_Generales.py", "📊 Stats Générales"),
+    ("pages/2_Liste_des_Matchs.py", "📋 Liste des Matchs"),
+    ("pages/3_🐉_Stats_Champions.py", "🐉 Stats Champions"),
+    ("pages/4_🏆_Stats_Equipes.py", "🏆 Stats Équipes"),
+    ("pages/5_👤_Stats_Joueurs.py", "👤 Stats Joueurs"),
+    ("pages/6_🔍_Recherche.py", "🔍 Recherche"),
+    ("pages/9_🔧_Admin.py", "🔧 Admin")
+]
+
+
+# ============================================================================
+# IMPORTS DIFFÉRÉS
+# ============================================================================
+
+class LazyModule(ModuleType):
+    """
+    Module importé au premier accès à un de ses attributs
+    (pd.DataFrame, px.bar...). L'import réel est mis en cache par Python:
+    les accès suivants ne coûtent qu'un getattr.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._module = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_module(name: str) -> LazyModule:
+    """Module `name` importé à la première utilisation"""
+    return LazyModule(name)
+
+
+# ============================================================================
+# SIDEBAR
+# ============================================================================
+
+@st.cache_resource
+def get_multi_manager() -> MultiEditionManager:
+    """MultiEditionManager partagé par toutes les sessions (caches mémoire conservés)"""
+    return MultiEditionManager()
+
+
+def render_navigation():
+    """Liens vers les pages (la navigation native est masquée par le CSS des pages)"""
+    st.markdown("### 🧭 Navigation")
+    for page, label in NAV_LINKS:
+        st.page_link(page, label=label)
+    st.markdown("---")
+    st.caption("🎮 OcciLan Stats v2.0")
+
+
+def _edition_selector(available_editions: List[int], key: str) -> Optional[int]:
+    if not available_editions:
+        st.warning("⚠️ Aucune édition disponible")
+        st.info("💡 Créez une édition dans la page Admin")
+        return None
+
+    # Édition partagée entre les pages via session_state
+    if st.session_state.get("selected_edition") not in available_editions:
+        st.session_state.selected_edition = (
+            DEFAULT_EDITION if DEFAULT_EDITION in available_editions else available_editions[0]
+        )
+
+    selected_edition = st.selectbox(
+        "Édition",
+        available_editions,
+        index=available_editions.index(st.session_state.selected_edition),
+        format_func=lambda x: f"Edition {x}",
+        label_visibility="collapsed",
+        key=key
+    )
+    st.session_state.selected_edition = selected_edition
+
+    if selected_edition:
+        config = get_multi_manager().get_config(selected_edition)
+        if config:
+            st.markdown(f"**{config.get('name', 'N/A')}**")
+            st.caption(f"📆 {config.get('start_date', 'N/A')} → {config.get('end_date', 'N/A')}")
+    return selected_edition
+
+
+def render_sidebar(key: str, include_private: Optional[bool] = None,
+                   expander: bool = False) -> Tuple[List[int], Optional[int]]:
+    """
+    Sélecteur d'édition + navigation
+
+    Args:
+        key: Clé du selectbox (unique par page)
+        include_private: Éditions privées listées (par défaut: si admin connecté)
+        expander: Sélecteur dans un expander sous le titre de l'app (Recherche, Admin)
+
+    Returns:
+        (éditions disponibles, édition sélectionnée ou None)
+    """
+    if include_private is None:
+        include_private = st.session_state.get("authenticated", False)
+    available_editions = get_multi_manager().list_editions(include_private=include_private)
+
+    with st.sidebar:
+        if expander:
+            st.title("🎮 OcciLan Stats")
+            with st.expander("📂 Sélection d'édition", expanded=True):
+                selected_edition = _edition_selector(available_editions, key)
+        else:
+            st.markdown("### 📂 Sélection d'édition")
+            selected_edition = _edition_selector(available_editions, key)
+
+        st.markdown("---")
+        render_navigation()
+
+    return available_editions, selected_edition
@@ -0,0 +1,263 @@
+"""
+Static assets (icônes champions et rôles)
+
+Les icônes sont copiées une seule fois depuis Data Dragon / CommunityDragon
+dans un cache local (scripts/mirror_assets.py), indexé par un manifest par
+version. Les pages utilisent ensuite get_champion_icon_url / get_role_icon_url:
+
+- mode "inline" (défaut): data URI base64 construit une fois par process,
+  aucune requête image côté navigateur
+- mode "static": URL servie par Streamlit (server.enableStaticServing)
+- fallback CDN si l'icône n'a pas encore été copiée localement
+
+Structure:
+src/streamlit_app/static/assets/
+├── roles/position-top.svg, ...
+└── 15.20.1/
+    ├── manifest.json
+    └── champion/Aatrox.png, ...
+"""
+
+import os
+import json
+import base64
+import hashlib
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from datetime import datetime
+
+from src.core.champion_registry import DDRAGON_VERSION, get_champion_registry
+
+logger = logging.getLogger(__name__)
+
+DDRAGON_CHAMPION_URL = "https://ddragon.leagueoflegends.com/cdn/{version}/img/champion/{key}.png"
+DDRAGON_CHAMPION_LIST_URL = "https://ddragon.leagueoflegends.com/cdn/{version}/data/en_US/champion.json"
+ROLE_ICON_URL = "https://raw.communitydragon.org/pbe/plugins/rcp-fe-lol-static-assets/global/default/svg/{file}"
+
+# Dossier servi par Streamlit en mode static (app/static/...)
+ASSETS_DIR = Path(__file__).parent.parent / "static" / "assets"
+STATIC_URL_PREFIX = "app/static/assets"
+
+# "inline" | "static" | "cdn"
+ASSETS_MODE = os.getenv("OCCILAN_ASSETS_MODE", "inline").lower()
+
+ROLE_ICON_FILES = {
+    "TOP": "position-top.svg",
+    "JGL": "position-jungle.svg",
+    "JUNGLE": "position-jungle.svg",
+    "MID": "position-middle.svg",
+    "MIDDLE": "position-middle.svg",
+    "ADC": "position-bottom.svg",
+    "BOTTOM": "position-bottom.svg",
+    "SUP": "position-utility.svg",
+    "SUPP": "position-utility.svg",
+    "UTILITY": "position-utility.svg",
+}
+DEFAULT_ROLE_ICON = "position-top.svg"
+
+MIME_TYPES = {".png": "image/png", ".svg": "image/svg+xml"}
+
+
+# =============================================================================
+# NORMALISATION
+# =============================================================================
+
+def role_icon_file(role: str) -> str:
+    """Nom du fichier d'icône pour un rôle (TOP, JGL, JUNGLE, MIDDLE, UTILITY, ...)"""
+    return ROLE_ICON_FILES.get((role or "").upper(), DEFAULT_ROLE_ICON)
+
+
+def champion_icon_key(champion_name: str) -> str:
+    """Clé Data Dragon pour un nom de champion (interne, affichage ou championId)"""
+    champion = get_champion_registry().get(champion_name)
+    if champion:
+        return champion.key
+    return str(champion_name or "").replace(" ", "").replace("'", "").replace(".", "")
+
+
+# =============================================================================
+# MANIFEST
+# =============================================================================
+
+def _version_dir(version: str) -> Path:
+    return ASSETS_DIR / version
+
+
+def _manifest_path(version: str) -> Path:
+    return _version_dir(version) / "manifest.json"
+
+
+@lru_cache(maxsize=4)
+def load_manifest(version: str = DDRAGON_VERSION) -> Dict:
+    """
+    Charge le manifest des assets copiés pour une version Data Dragon.
+
+    Returns:
+        {
+            "version": "15.20.1",
+            "updated_at": "...",
+            "champions": {"Aatrox": {"file": "champion/Aatrox.png", "sha1": "...", "bytes": 12345}},
+            "roles": {"position-top.svg": {"file": "../roles/position-top.svg", ...}}
+        }
+    """
+    path = _manifest_path(version)
+    if not path.exists():
+        return {"version": version, "champions": {}, "roles": {}}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"Invalid asset manifest {path}: {e}")
+        return {"version": version, "champions": {}, "roles": {}}
+
+
+def _save_manifest(version: str, manifest: Dict):
+    path = _manifest_path(version)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest["updated_at"] = datetime.now().isoformat()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    load_manifest.cache_clear()
+    _local_asset_url.cache_clear()
+
+
+# =============================================================================
+# URLS
+# =============================================================================
+
+@lru_cache(maxsize=1024)
+def _local_asset_url(relative_file: str, version: str, mode: str) -> Optional[str]:
+    """URL locale (data URI ou static) d'un asset copié, None si absent"""
+    path = (_version_dir(version) / relative_file).resolve()
+    if not path.exists():
+        return None
+
+    if mode == "static":
+        relative = path.relative_to(ASSETS_DIR.resolve()).as_posix()
+        return f"{STATIC_URL_PREFIX}/{relative}"
+
+    mime = MIME_TYPES.get(path.suffix, "application/octet-stream")
+    encoded = base64.b64encode(path.read_bytes()).decode("ascii")
+    return f"data:{mime};base64,{encoded}"
+
+
+def get_champion_icon_url(champion_name: str, version: str = DDRAGON_VERSION) -> str:
+    """
+    URL de l'icône d'un champion (locale si copiée, sinon CDN Data Dragon).
+
+    Args:
+        champion_name: Nom interne ("MonkeyKing") ou d'affichage ("Wukong", "Kai'Sa")
+        version: Version Data Dragon
+    """
+    key = champion_icon_key(champion_name)
+    if ASSETS_MODE != "cdn":
+        entry = load_manifest(version)["champions"].get(key)
+        if entry:
+            local_url = _local_asset_url(entry["file"], version, ASSETS_MODE)
+            if local_url:
+                return local_url
+    return DDRAGON_CHAMPION_URL.format(version=version, key=key)
+
+
+def get_role_icon_url(role: str, size: int = 24) -> str:
+    """URL de l'icône d'un rôle (locale si copiée, sinon CDN CommunityDragon)"""
+    file = role_icon_file(role)
+    if ASSETS_MODE != "cdn":
+        entry = load_manifest(DDRAGON_VERSION)["roles"].get(file)
+        if entry:
+            local_url = _local_asset_url(entry["file"], DDRAGON_VERSION, ASSETS_MODE)
+            if local_url:
+                return local_url
+    return ROLE_ICON_URL.format(file=file)
+
+
+# =============================================================================
+# MIRRORING
+# =============================================================================
+
+def _download(url: str) -> Optional[bytes]:
+    import requests
+
+    try:
+        response = requests.get(url, timeout=10)
+        if response.status_code == 200:
+            return response.content
+        logger.warning(f"Asset download failed ({response.status_code}): {url}")
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"Asset download error: {url} ({e})")
+    return None
+
+
+def _store(target: Path, content: bytes) -> Dict:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(content)
+    return {"sha1": hashlib.sha1(content).hexdigest(), "bytes": len(content)}
+
+
+def fetch_champion_keys(version: str = DDRAGON_VERSION) -> list:
+    """Liste des clés champions publiées par Data Dragon pour une version"""
+    content = _download(DDRAGON_CHAMPION_LIST_URL.format(version=version))
+    if not content:
+        return []
+    return sorted(json.loads(content).get("data", {}).keys())
+
+
+def mirror_assets(
+    champion_names: Optional[Iterable[str]] = None,
+    version: str = DDRAGON_VERSION,
+    force: bool = False
+) -> Dict[str, int]:
+    """
+    Copie localement les icônes champions et rôles manquantes.
+
+    Args:
+        champion_names: Champions à copier (None = tous ceux du snapshot champion.json)
+        version: Version Data Dragon
+        force: Si True, re-télécharge même les icônes déjà présentes
+
+    Returns:
+        {"downloaded": n, "skipped": n, "failed": n}
+    """
+    manifest = load_manifest(version)
+    manifest = {
+        "version": version,
+        "champions": dict(manifest.get("champions", {})),
+        "roles": dict(manifest.get("roles", {}))
+    }
+    counts = {"downloaded": 0, "skipped": 0, "failed": 0}
+
+    if champion_names is None:
+        keys = sorted(get_champion_registry(version).by_key) or fetch_champion_keys(version)
+    else:
+        keys = sorted({champion_icon_key(name) for name in champion_names if name})
+
+    for key in keys:
+        relative_file = f"champion/{key}.png"
+        if not force and key in manifest["champions"] and (_version_dir(version) / relative_file).exists():
+            counts["skipped"] += 1
+            continue
+        content = _download(DDRAGON_CHAMPION_URL.format(version=version, key=key))
+        if content is None:
+            counts["failed"] += 1
+            continue
+        manifest["champions"][key] = {"file": relative_file, **_store(_version_dir(version) / relative_file, content)}
+        counts["downloaded"] += 1
+
+    # Les icônes de rôles ne dépendent pas de la version Data Dragon
+    for file in sorted(set(ROLE_ICON_FILES.values())):
+        relative_file = f"../roles/{file}"
+        if not force and file in manifest["roles"] and (ASSETS_DIR / "roles" / file).exists():
+            counts["skipped"] += 1
+            continue
+        content = _download(ROLE_ICON_URL.format(file=file))
+        if content is None:
+            counts["failed"] += 1
+            continue
+        manifest["roles"][file] = {"file": relative_file, **_store(ASSETS_DIR / "roles" / file, content)}
+        counts["downloaded"] += 1
+
+    _save_manifest(version, manifest)
+    logger.info(f"Assets mirrored for {version}: {counts}")
+    return counts
@@ -1,30 +1,7 @@
 import streamlit as st
 from datetime import datetime
-
-def get_role_icon_url(role: str, size: int = 24) -> str:
-    role_norm = role.upper()
-    if role_norm in ["TOP"]:
-        key = "position-top.svg"
-    elif role_norm in ["JGL", "JUNGLE"]:
-        key = "position-jungle.svg"
-    elif role_norm in ["MID", "MIDDLE"]:
-        key = "position-middle.svg"
-    elif role_norm in ["ADC", "BOTTOM"]:
-        key = "position-bottom.svg"
-    elif role_norm in ["SUP", "SUPP", "UTILITY"]:
-        key = "position-utility.svg"
-    else:
-        key = "position-top.svg"
-    return f"https://raw.communitydragon.org/pbe/plugins/rcp-fe-lol-static-assets/global/default/svg/{key}"
-
-def get_champion_icon_url(champion_name: str) -> str:
-    champion_mapping = {
-        "MonkeyKing": "Wukong",
-        "Belveth": "Belveth",
-        "RenataGlasc": "Renata"
-    }
-    display_name = champion_mapping.get(champion_name, champion_name)
-    return f"https://ddragon.leagueoflegends.com/cdn/15.20.1/img/champion/{display_name}.png"
+from components.assets import get_champion_icon_url, get_role_icon_url
+from src.core.champion_registry import get_champion_registry
 
 def format_duration(seconds):
     minutes = int(seconds / 60)
@@ -72,6 +49,7 @@ def get_team_name_from_players(participants, player_to_team, tournament_matches=
     return "Équipe Inconnue"
 
 def display_match_card(match_id, match_data, player_to_team, teams_with_puuid=None, tournament_matches=None):
+    champions = get_champion_registry()
     info = match_data.get("info", {})
     participants = info.get("participants", [])
     teams = info.get("teams", [])
@@ -114,11 +92,7 @@ def display_match_card(match_id, match_data, player_to_team, teams_with_puuid=No
             for p in team_100:
                 display_name, aliases = get_display_name_and_aliases(team_100_name, p, teams_with_puuid)
                 champion = p.get("championName", "Unknown")
-                # Always display 'Wukong' for MonkeyKing
-                if champion in ["MonkeyKing", "Wukong"]:
-                    champion_display = "Wukong"
-                else:
-                    champion_display = champion
+                champion_display = champions.display_name(p.get("championId")) or champion
                 kills = p.get("kills", 0)
                 deaths = p.get("deaths", 0)
                 assists = p.get("assists", 0)
@@ -165,6 +139,7 @@ def display_match_card(match_id, match_data, player_to_team, teams_with_puuid=No
             for p in team_200:
                 display_name, aliases = get_display_name_and_aliases(team_200_name, p, teams_with_puuid)
                 champion = p.get("championName", "Unknown")
+                champion_display = champions.display_name(p.get("championId")) or champion
                 kills = p.get("kills", 0)
                 deaths = p.get("deaths", 0)
                 assists = p.get("assists", 0)
@@ -177,12 +152,12 @@ def display_match_card(match_id, match_data, player_to_team, teams_with_puuid=No
                 with col_card:
                     player_html = f'''
                     <div style="display: flex; align-items: center; gap: 12px; padding: 8px; background: rgba(0,0,0,0.2); border-radius: 6px; margin-bottom: 6px;">
-                        <img src="{icon_url}" style="width: 40px; height: 40px; border-radius: 6px; border: 2px solid rgba(255,100,100,0.3);" title="{champion}">
+                        <img src="{icon_url}" style="width: 40px; height: 40px; border-radius: 6px; border: 2px solid rgba(255,100,100,0.3);" title="{champion_display}">
                         <div style="flex: 1;">
                             <div style="font-weight: 700; color: #e6eef6; font-size: 14px;">
                                 <img src="{role_icon_url}" style="width:18px;vertical-align:middle;margin-right:4px;" title="{role}">{display_name}
                             </div>
-                            <div style="color: #9fb0c6; font-size: 12px;">{champion}</div>
+                            <div style="color: #9fb0c6; font-size: 12px;">{champion_display}</div>
                         </div>
                         <div style="text-align: right;">
                             <div style="color: #e6eef6; font-weight: 600;">{kda}</div>
@@ -0,0 +1,216 @@
+"""
+Profilage des pages (opt-in)
+
+Activation:
+- variable d'environnement OCCILAN_PROFILE=1 (temps + mémoire) ou
+  OCCILAN_PROFILE=time (temps seulement, sans le surcoût de tracemalloc)
+- toggle "Profilage des pages" de la page Admin (session admin connectée,
+  temps + mémoire)
+- paramètre d'URL ?profile=1 (n'importe quel visiteur: temps seulement)
+
+Usage dans une page (script Streamlit à plat):
+    profiler = start_page("Recherche")
+    with profiler.section("load_team_stats", "json"):
+        team_stats_data = edition_manager.load_team_stats()
+    profiler.checkpoint("Mapping joueurs", "compute")   # jusqu'au prochain checkpoint
+    ...
+    profiler.render_sidebar()
+
+Désactivé, le profiler ne fait rien (coût ~nul). Les mesures mémoire
+(tracemalloc) sont globales au process: avec plusieurs sessions
+simultanées, elles incluent les allocations des autres sessions, et toutes
+les sessions paient le surcoût tant qu'un profiler mémoire est actif.
+tracemalloc est donc arrêté dès que le dernier profiler qui l'utilise
+termine (fin de page, ou exécution interrompue par st.stop()).
+"""
+
+import os
+import time
+import weakref
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import streamlit as st
+
+PROFILE_ENV = "OCCILAN_PROFILE"
+HISTORY_SIZE = 10
+
+# Catégories affichées dans le récapitulatif
+CATEGORIES = {
+    "json": "Lecture JSON",
+    "compute": "Agrégation",
+    "dataframe": "DataFrame",
+    "plotly": "Figures Plotly",
+    "html": "Cartes HTML",
+    "render": "Rendu Streamlit"
+}
+
+
+def _profiling_mode() -> Optional[str]:
+    """None (désactivé), "time" ou "full" (temps + mémoire)"""
+    env = os.getenv(PROFILE_ENV, "").strip().lower()
+    if env == "time":
+        return "time"
+    if env in ("1", "true", "yes", "full"):
+        return "full"
+    try:
+        # tracemalloc ralentit tout le process: réservé à l'admin connecté
+        if st.session_state.get("profiling") and st.session_state.get("authenticated"):
+            return "full"
+        if st.query_params.get("profile") == "1":
+            return "time"
+    except Exception:
+        pass  # Hors contexte Streamlit (scripts, benchmarks)
+    return None
+
+
+# Profilers mémoire actifs: tracemalloc tourne tant qu'il en reste un
+_tracing_users = 0
+_tracing_lock = threading.Lock()
+_tracing_owned = False
+
+
+def _acquire_tracing():
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_owned = True
+        _tracing_users += 1
+
+
+def _release_tracing():
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        _tracing_users = max(0, _tracing_users - 1)
+        # Ne pas arrêter un tracemalloc démarré ailleurs (python -X tracemalloc)
+        if _tracing_users == 0 and _tracing_owned:
+            tracemalloc.stop()
+            _tracing_owned = False
+
+
+class PageProfiler:
+    """
+    Chronomètre les sections d'une exécution de page.
+    """
+
+    def __init__(self, page: str, mode: Optional[str] = None):
+        self.page = page
+        self.enabled = mode is not None
+        self.track_memory = mode == "full"
+        self.records: List[Dict] = []
+        self._open: Optional[Dict] = None
+
+        # Libéré par finish(), ou à la destruction du profiler si la page s'arrête avant
+        self._release_tracing = None
+        if self.track_memory:
+            _acquire_tracing()
+            self._release_tracing = weakref.finalize(self, _release_tracing)
+        self._started = time.perf_counter()
+
+    def _tracing(self) -> bool:
+        """Mémoire suivie et tracemalloc pas encore libéré par finish()"""
+        return self._release_tracing is not None and self._release_tracing.alive
+
+    def _begin(self, name: str, category: str) -> Dict:
+        record = {"name": name, "category": category, "start": time.perf_counter()}
+        if self._tracing():
+            tracemalloc.reset_peak()
+            record["mem_start"] = tracemalloc.get_traced_memory()[0]
+        return record
+
+    def _end(self, record: Dict):
+        seconds = time.perf_counter() - record.pop("start")
+        record["ms"] = round(seconds * 1000, 2)
+        if "mem_start" in record:
+            current, peak = tracemalloc.get_traced_memory()
+            mem_start = record.pop("mem_start")
+            record["mem_delta_mb"] = round((current - mem_start) / 1024 ** 2, 2)
+            record["mem_peak_mb"] = round((peak - mem_start) / 1024 ** 2, 2)
+        self.records.append(record)
+
+    def _close_open(self):
+        if self._open is not None:
+            self._end(self._open)
+            self._open = None
+
+    def checkpoint(self, name: str, category: str = "compute"):
+        """Termine la section en cours et en démarre une nouvelle"""
+        if not self.enabled:
+            return
+        self._close_open()
+        self._open = self._begin(name, category)
+
+    @contextmanager
+    def section(self, name: str, category: str = "compute"):
+        """Chronomètre un bloc (termine le checkpoint en cours)"""
+        if not self.enabled:
+            yield
+            return
+        self._close_open()
+        record = self._begin(name, category)
+        try:
+            yield
+        finally:
+            self._end(record)
+
+    def finish(self) -> Dict:
+        """
+        Returns:
+            {"page", "total_ms", "sections": [...], "categories": {catégorie: ms}}
+        """
+        self._close_open()
+        if self._release_tracing is not None:
+            self._release_tracing()
+        total_ms = round((time.perf_counter() - self._started) * 1000, 2)
+        categories: Dict[str, float] = {}
+        for record in self.records:
+            categories[record["category"]] = categories.get(record["category"], 0) + record["ms"]
+        categories["other"] = max(0.0, total_ms - sum(categories.values()))
+        return {
+            "page": self.page,
+            "total_ms": total_ms,
+            "sections": list(self.records),
+            "categories": {name: round(ms, 2) for name, ms in categories.items()}
+        }
+
+    def render_sidebar(self):
+        """Affiche le détail de l'exécution courante dans la sidebar"""
+        if not self.enabled:
+            return
+        report = self.finish()
+
+        history = st.session_state.setdefault("_profiler_history", [])
+        history.append({"Page": self.page, "Total (ms)": report["total_ms"], "Heure": time.strftime("%H:%M:%S")})
+        del history[:-HISTORY_SIZE]
+
+        import pandas as pd
+
+        with st.sidebar.expander("⏱️ Profilage de la page", expanded=True):
+            st.caption(f"**{self.page}**: {report['total_ms']:.0f} ms au total"
+                       + (" (mémoire suivie, surcoût tracemalloc inclus)" if self.track_memory else ""))
+
+            sections = pd.DataFrame([{
+                "Section": record["name"],
+                "Type": CATEGORIES.get(record["category"], record["category"]),
+                "ms": record["ms"],
+                **({"Δ Mo": record["mem_delta_mb"], "Pic Mo": record["mem_peak_mb"]} if self.track_memory else {})
+            } for record in report["sections"]])
+            if not sections.empty:
+                st.dataframe(sections, hide_index=True, width="stretch")
+
+            st.dataframe(pd.DataFrame([
+                {"Type": CATEGORIES.get(name, "Autre (non instrumenté)"), "ms": ms}
+                for name, ms in sorted(report["categories"].items(), key=lambda item: -item[1])
+            ]), hide_index=True, width="stretch")
+
+            if len(history) > 1:
+                st.caption("Dernières exécutions")
+                st.dataframe(pd.DataFrame(history[::-1]), hide_index=True, width="stretch")
+
+
+def start_page(page: str) -> PageProfiler:
+    """Profiler de l'exécution courante (inactif si le profilage est désactivé)"""
+    return PageProfiler(page, _profiling_mode())
@@ -0,0 +1,89 @@
+"""
+View models des pages (sans dépendance Streamlit)
+
+Préparation des données affichées par les pages, isolée ici pour pouvoir
+être mise en cache par les pages et mesurée par scripts/benchmark.py.
+"""
+
+from typing import Dict, List
+
+
+def build_match_sort_index(match_details: Dict[str, Dict]) -> Dict[str, List[Dict]]:
+    """
+    Index de tri de la liste des matchs: une ligne légère par match.
+
+    Returns:
+        {"date": [...], "duration": [...], "kills": [...]}, lignes triées par
+        ordre croissant de la clé ({"match_id", "date", "duration", "kills"})
+    """
+    rows = []
+    for match_id, match_data in match_details.items():
+        info = match_data.get("info", {})
+        rows.append({
+            "match_id": match_id,
+            "date": info.get("gameCreation", 0) or 0,
+            "duration": info.get("gameDuration", 0) or 0,
+            "kills": sum(p.get("kills", 0) for p in info.get("participants", [])),
+        })
+    return {
+        key: sorted(rows, key=lambda r: r[key])
+        for key in ("date", "duration", "kills")
+    }
+
+
+def build_player_to_team(teams_with_puuid: Dict[str, Dict]) -> Dict[str, str]:
+    """Mapping "GameName#TagLine" (ou GameName seul) → équipe"""
+    player_to_team = {}
+    for team_name, team_info in teams_with_puuid.items():
+        for player in team_info.get("players", []):
+            game_name = player.get("gameName", "")
+            tag_line = player.get("tagLine", "")
+            player_name = f"{game_name}#{tag_line}" if game_name and tag_line else game_name
+            player_to_team[player_name] = team_name
+    return player_to_team
+
+
+def build_team_match_history(
+    match_details: Dict[str, Dict],
+    player_to_team: Dict[str, str],
+    team_name: str
+) -> List[Dict]:
+    """
+    Matchs joués par une équipe, plus récent en premier.
+
+    Returns:
+        [{"match_id", "date", "duration", "won", "side", "participants", "all_participants"}, ...]
+    """
+    team_matches = []
+    for match_id, match_data in match_details.items():
+        info = match_data.get("info", {})
+        participants = info.get("participants", [])
+
+        # Premier joueur de l'équipe trouvé → côté (100 Blue / 200 Red) et résultat
+        team_side = None
+        team_won = False
+        for participant in participants:
+            game_name = participant.get("riotIdGameName", "")
+            tag_line = participant.get("riotIdTagline", "")
+            player_name = f"{game_name}#{tag_line}" if game_name and tag_line else game_name
+
+            if player_to_team.get(player_name) == team_name:
+                team_side = participant.get("teamId")
+                team_won = participant.get("win", False)
+                break
+
+        if team_side is None:
+            continue
+
+        team_matches.append({
+            "match_id": match_id,
+            "date": info.get("gameCreation", 0),
+            "duration": info.get("gameDuration", 0),
+            "won": team_won,
+            "side": team_side,
+            "participants": [p for p in participants if p.get("teamId") == team_side],
+            "all_participants": participants
+        })
+
+    team_matches.sort(key=lambda x: x["date"], reverse=True)
+    return team_matches
@@ -7,18 +7,24 @@ Page: Statistiques Généralewith st.sidebar:
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from pathlib import Path
 import sys
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.core.data_manager import EditionDataManager, MultiEditionManager
+from src.core.data_manager import EditionDataManager
+from src.core.elo_ranking import build_player_frame, rank_players, rank_teams, score_to_elo
+from components.app_shell import lazy_module, render_sidebar
+from components.profiler import start_page
+
+# Chargés au premier tableau / graphique
+pd = lazy_module("pandas")
+px = lazy_module("plotly.express")
+go = lazy_module("plotly.graph_objects")
 
 st.set_page_config(page_title="Stats Générales - OcciLan Stats", page_icon="📊", layout="wide")
+profiler = start_page("Stats Générales")
 
 # Custom CSS pour masquer la navigation par défaut
 st.markdown("""
@@ -29,69 +35,13 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+profiler.checkpoint("Sidebar", "render")
+
 # ============================================================================
 # SIDEBAR - Navigation cohérente
 # ============================================================================
 
-with st.sidebar:
-    st.markdown("### 📂 Sélection d'édition")
-    
-    multi_manager = MultiEditionManager()
-    
-    # Vérifier si l'utilisateur est admin
-    is_admin = st.session_state.get("authenticated", False)
-    
-    # Lister les éditions (privées uniquement si admin)
-    available_editions = multi_manager.list_editions(include_private=is_admin)
-    
-    if not available_editions:
-        st.warning("⚠️ Aucune édition disponible")
-        st.info("💡 Créez une édition dans la page Admin")
-        selected_edition = None
-    else:
-        # Initialiser selected_edition dans session_state si pas déjà fait
-        if "selected_edition" not in st.session_state:
-            # Mettre 7 par défaut si présent, sinon le premier
-            st.session_state.selected_edition = 7 if 7 in available_editions else (available_editions[0] if available_editions else None)
-        
-        # Trouver l'index de l'édition sélectionnée
-        default_index = 0
-        if st.session_state.selected_edition in available_editions:
-            default_index = available_editions.index(st.session_state.selected_edition)
-        
-        # Sélecteur visible pour tous les utilisateurs
-        selected_edition = st.selectbox(
-            "Édition",
-            available_editions,
-            index=default_index,
-            format_func=lambda x: f"Edition {x}",
-            label_visibility="collapsed",
-            key="edition_selector_stats"
-        )
-        
-        # Sauvegarder dans session_state
-        st.session_state.selected_edition = selected_edition
-        
-        if selected_edition:
-            edition_manager = EditionDataManager(selected_edition)
-            config = edition_manager.load_config()
-            
-            if config:
-                st.markdown(f"**{config.get('name', 'N/A')}**")
-                st.caption(f"📆 {config.get('start_date', 'N/A')} → {config.get('end_date', 'N/A')}")
-    
-    st.markdown("---")
-    st.markdown("### 🧭 Navigation")
-    st.page_link("app.py", label="🏠 Accueil")
-    st.page_link("pages/1_📊_Stats_Generales.py", label="📊 Stats Générales")
-    st.page_link("pages/2_Liste_des_Matchs.py", label="📋 Liste des Matchs")
-    st.page_link("pages/3_🐉_Stats_Champions.py", label="🐉 Stats Champions")
-    st.page_link("pages/4_🏆_Stats_Equipes.py", label="🏆 Stats Équipes")
-    st.page_link("pages/5_👤_Stats_Joueurs.py", label="👤 Stats Joueurs")
-    st.page_link("pages/6_🔍_Recherche.py", label="🔍 Recherche")
-    st.page_link("pages/9_🔧_Admin.py", label="🔧 Admin")
-    st.markdown("---")
-    st.caption("🎮 OcciLan Stats v2.0")
+available_editions, selected_edition = render_sidebar("edition_selector_stats")
 
 # ============================================================================
 # CONFIGURATION
@@ -108,138 +58,19 @@ edition_manager = EditionDataManager(selected_edition)
 # LOAD DATA
 # ============================================================================
 
-teams_with_puuid = edition_manager.load_teams_with_puuid()
+with profiler.section("load_teams_with_puuid", "json"):
+    teams_with_puuid = edition_manager.load_teams_with_puuid()
 
 if not teams_with_puuid:
     st.info("ℹ️ Aucune donnée disponible pour cette édition. Veuillez d'abord exécuter le pipeline (étapes 2-3).")
     st.stop()
 
+profiler.checkpoint("Scores joueurs / équipes", "compute")
+
 # ============================================================================
 # CALCUL DES STATISTIQUES
 # ============================================================================
 
-# Mapping des ELO vers des scores numériques
-ELO_SCORES = {
-    "IRON": 1,
-    "BRONZE": 2,
-    "SILVER": 3,
-    "GOLD": 4,
-    "PLATINUM": 5,
-    "EMERALD": 6,
-    "DIAMOND": 7,
-    "MASTER": 8,
-    "GRANDMASTER": 15,
-    "CHALLENGER": 20
-}
-
-# Mapping des divisions
-def get_role_icon_url(role: str, size: int = 24) -> str:
-    """Get Data Dragon role icon URL"""
-    role_map = {
-        "TOP": "top",
-        "JGL": "jungle",
-        "JUNGLE": "jungle",
-        "MID": "middle",
-        "ADC": "bottom",
-        "SUP": "utility",
-        "SUPP": "utility",
-        "UNKNOWN": "unknown"
-    }
-    key = role_map.get(role.upper(), "unknown")
-    return f"https://raw.communitydragon.org/latest/plugins/rcp-fe-lol-champion-select/global/default/{key}_icon.png"
-DIVISION_MULTIPLIERS = {
-    "I": 0.75,
-    "II": 0.5,
-    "III": 0.25,
-    "IV": 0.0
-}
-
-def calculate_player_score(tier: str, rank: str, lp: int) -> float:
-    """Calcule le score d'un joueur basé sur son ELO"""
-    base_score = ELO_SCORES.get(tier, 0)
-    
-    # Master+ : +1 par 100 LP
-    if tier in ["MASTER", "GRANDMASTER", "CHALLENGER"]:
-        return base_score + (lp / 100.0)
-    
-    # Autres: score de base + bonus de division
-    division_bonus = DIVISION_MULTIPLIERS.get(rank, 0)
-    return base_score + division_bonus
-
-def score_to_elo(score: float) -> str:
-    """Convertit un score numérique en tier ELO équivalent"""
-    if score >= 20:
-        return "CHALLENGER"
-    elif score >= 15:
-        return "GRANDMASTER"
-    elif score >= 8:
-        lp = int((score - 8) * 100)
-        return f"MASTER ({lp} LP)"
-    elif score >= 7:
-        division = "I" if score >= 7.75 else "II" if score >= 7.5 else "III" if score >= 7.25 else "IV"
-        return f"DIAMOND {division}"
-    elif score >= 6:
-        division = "I" if score >= 6.75 else "II" if score >= 6.5 else "III" if score >= 6.25 else "IV"
-        return f"EMERALD {division}"
-    elif score >= 5:
-        division = "I" if score >= 5.75 else "II" if score >= 5.5 else "III" if score >= 5.25 else "IV"
-        return f"PLATINUM {division}"
-    elif score >= 4:
-        division = "I" if score >= 4.75 else "II" if score >= 4.5 else "III" if score >= 4.25 else "IV"
-        return f"GOLD {division}"
-    elif score >= 3:
-        division = "I" if score >= 3.75 else "II" if score >= 3.5 else "III" if score >= 3.25 else "IV"
-        return f"SILVER {division}"
-    elif score >= 2:
-        division = "I" if score >= 2.75 else "II" if score >= 2.5 else "III" if score >= 2.25 else "IV"
-        return f"BRONZE {division}"
-    elif score >= 1:
-        division = "I" if score >= 1.75 else "II" if score >= 1.5 else "III" if score >= 1.25 else "IV"
-        return f"IRON {division}"
-    else:
-        return "UNRANKED"
-
-# Collecter tous les joueurs
-all_players = []
-team_scores = {}
-
-for team_name, team_data in teams_with_puuid.items():
-    players = team_data.get("players", [])
-    team_total_score = 0
-    team_player_count = 0
-    
-    for player in players:
-        tier = player.get("tier", "UNRANKED")
-        rank = player.get("rank", "IV")
-        lp = player.get("leaguePoints", 0)
-        role = player.get("role", "UNKNOWN")
-        
-        # Calculer le score
-        score = calculate_player_score(tier, rank, lp)
-        
-        all_players.append({
-            "team": team_name,
-            "gameName": player.get("gameName", "Unknown"),
-            "tagLine": player.get("tagLine", "0000"),
-            "role": role,
-            "tier": tier,
-            "rank": rank,
-            "lp": lp,
-            "score": score,
-            "summonerLevel": player.get("summonerLevel", 0)
-        })
-        
-        if tier != "UNRANKED":
-            team_total_score += score
-            team_player_count += 1
-    
-    # Moyenne de l'équipe
-    if team_player_count > 0:
-        team_scores[team_name] = {
-            "avg_score": team_total_score / team_player_count,
-            "player_count": team_player_count
-        }
-
 # Fonction pour fusionner les stats de l'ADC de Donne ta jungle
 
 # Correction : additionne explicitement total_cs et total_game_duration lors de la fusion multi-comptes
@@ -273,11 +104,29 @@ def get_obli_aliases_and_merge(players_list):
         merged = players_list
     return merged
 
-# Remplacer la création de all_players par :
-all_players = get_obli_aliases_and_merge(all_players)
-df_players = pd.DataFrame(all_players)
+
+@st.cache_data(show_spinner=False)
+def compute_elo_tables(edition: int, version: float):
+    """
+    Scores des joueurs, seeding des équipes et classement des joueurs
+    (src/core/elo_ranking.py), calculés une seule fois par version de
+    teams_with_puuid.json au lieu de chaque rerun.
+    """
+    df_all = build_player_frame(EditionDataManager(edition).load_teams_with_puuid())
+    # Seeding sur les comptes du roster, tableaux avec les comptes fusionnés
+    df_teams = rank_teams(df_all)
+    df_players = pd.DataFrame(get_obli_aliases_and_merge(df_all.to_dict("records")), columns=df_all.columns)
+    return df_players, df_teams, rank_players(df_players)
+
+
+with profiler.section("Scores ELO (cache)", "compute"):
+    df_players, df_ranking, df_player_ranking = compute_elo_tables(
+        selected_edition, edition_manager.data_version("teams_with_puuid.json")
+    )
 total_players = len(df_players)
 
+profiler.checkpoint("Vue d'ensemble", "render")
+
 # ============================================================================
 # MÉTRIQUES GÉNÉRALES
 # ============================================================================
@@ -304,6 +153,8 @@ with col4:
     else:
         st.metric("📊 Score moyen", "N/A")
 
+profiler.checkpoint("Répartition rôle / Élo", "dataframe")
+
 # ============================================================================
 # RÉPARTITION PAR RÔLE ET ELO
 # ============================================================================
@@ -462,6 +313,7 @@ if len(df_ranked) > 0:
             "IRON": "#78716C"
         }
         
+        profiler.checkpoint("Graphiques Élo", "plotly")
         fig1 = px.bar(
             df_ranked,
             x="tier",
@@ -544,49 +396,15 @@ if len(df_ranked) > 0:
 else:
     st.info("ℹ️ Aucun joueur classé trouvé")
 
+profiler.checkpoint("Seeding équipes", "dataframe")
+
 # ============================================================================
 # SEEDING / CLASSEMENT DES ÉQUIPES
 # ============================================================================
 
 st.header("🏅 Seeding / Classement des équipes")
 
-if team_scores:
-    # Créer le DataFrame de classement
-    ranking_data = []
-    for team_name, data in team_scores.items():
-        avg_score = data["avg_score"]
-        
-        # Déterminer le tier estimé
-        if avg_score >= 15:
-            estimated_tier = "Grandmaster"
-        elif avg_score >= 8:
-            estimated_tier = "Master"
-        elif avg_score >= 7:
-            estimated_tier = "Diamond"
-        elif avg_score >= 6:
-            estimated_tier = "Emerald"
-        elif avg_score >= 5:
-            estimated_tier = "Platinum"
-        elif avg_score >= 4:
-            estimated_tier = "Gold"
-        elif avg_score >= 3:
-            estimated_tier = "Silver"
-        elif avg_score >= 2:
-            estimated_tier = "Bronze"
-        else:
-            estimated_tier = "Iron"
-        
-        ranking_data.append({
-            "Team": team_name,
-            "Avg Score": avg_score,
-            "Estimated Tier": estimated_tier
-        })
-    
-    df_ranking = pd.DataFrame(ranking_data)
-    df_ranking = df_ranking.sort_values("Avg Score", ascending=False).reset_index(drop=True)
-    df_ranking.index = df_ranking.index + 1
-    df_ranking.index.name = "Rank"
-    
+if not df_ranking.empty:
     # Afficher le tableau
     st.dataframe(
         df_ranking,
@@ -619,6 +437,8 @@ if team_scores:
 else:
     st.info("ℹ️ Aucune équipe avec joueurs classés")
 
+profiler.checkpoint("Classement joueurs", "dataframe")
+
 # ============================================================================
 # CLASSEMENT DES JOUEURS PAR ELO
 # ============================================================================
@@ -626,33 +446,7 @@ else:
 st.header("🎖️ Classement des joueurs par ELO")
 
 if not df_players.empty:
-    # Filtrer les joueurs classés
-    ranked_players = df_players[df_players["tier"] != "UNRANKED"].copy()
-    
-    if not ranked_players.empty:
-        # Trier par score décroissant
-        ranked_players = ranked_players.sort_values("score", ascending=False).reset_index(drop=True)
-        
-        # Créer le DataFrame d'affichage
-        player_ranking_data = []
-        for idx, player in ranked_players.iterrows():
-            # Format du rang avec LP pour Master+
-            if player["tier"] in ["MASTER", "GRANDMASTER", "CHALLENGER"]:
-                rank_display = f"{player['tier']} ({player['lp']} LP)"
-            else:
-                rank_display = f"{player['tier']} {player['rank']}"
-            
-            player_ranking_data.append({
-                "Rang": idx + 1,
-                "Joueur": f"{player['gameName']}#{player['tagLine']}",
-                "Rôle": player["role"],
-                "Équipe": player["team"],
-                "ELO": rank_display,
-                "Score": round(player["score"], 2)
-            })
-        
-        df_player_ranking = pd.DataFrame(player_ranking_data)
-        
+    if not df_player_ranking.empty:
         # Afficher le tableau
         st.dataframe(
             df_player_ranking,
@@ -665,6 +459,9 @@ if not df_players.empty:
 else:
     st.info("ℹ️ Aucun joueur trouvé")
 
+
+profiler.checkpoint("Détails équipe", "render")
+
 # ============================================================================
 # DÉTAILS PAR ÉQUIPE
 # ============================================================================
@@ -728,6 +525,7 @@ if selected_team:
                 "IRON": "#A8A29E"
             }
             
+            profiler.checkpoint("Répartition Élo équipe", "plotly")
             fig_team_elo = px.pie(
                 ranked_in_team,
                 names="tier",
@@ -739,3 +537,5 @@ if selected_team:
             st.plotly_chart(fig_team_elo, use_container_width=True)
         else:
             st.info("Aucun joueur classé dans cette équipe")
+
+profiler.render_sidebar()
@@ -10,10 +10,10 @@ Affiche la liste des matchs avec leurs détails
 
 import streamlit as st
 from components.match_card import display_match_card
-import json
-from pathlib import Path
-import sys
-from src.core.data_manager import EditionDataManager, MultiEditionManager
+from components.view_models import build_match_sort_index as build_sort_index
+from components.profiler import start_page
+from components.app_shell import render_sidebar
+from src.core.data_manager import EditionDataManager
 
 # Configuration de la page
 st.set_page_config(
@@ -21,6 +21,7 @@ st.set_page_config(
     page_icon="🎮",
     layout="wide"
 )
+profiler = start_page("Liste des Matchs")
 
 # Masquer la navigation native Streamlit
 st.markdown("""
@@ -29,49 +30,9 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+profiler.checkpoint("Sidebar", "render")
 # Sidebar: Edition selector and navigation
-with st.sidebar:
-    st.markdown("### 📂 Sélection d'édition")
-    multi_manager = MultiEditionManager()
-    is_admin = st.session_state.get("authenticated", False)
-    available_editions = multi_manager.list_editions(include_private=is_admin)
-    if not available_editions:
-        st.warning("⚠️ Aucune édition disponible")
-        st.info("💡 Créez une édition dans la page Admin")
-        selected_edition = None
-    else:
-        if "selected_edition" not in st.session_state:
-            st.session_state.selected_edition = 7 if 7 in available_editions else (available_editions[0] if available_editions else None)
-        default_index = 0
-        if st.session_state.selected_edition in available_editions:
-            default_index = available_editions.index(st.session_state.selected_edition)
-        selected_edition = st.selectbox(
-            "Édition",
-            available_editions,
-            index=default_index,
-            format_func=lambda x: f"Edition {x}",
-            label_visibility="collapsed",
-            key="edition_selector_matches"
-        )
-        st.session_state.selected_edition = selected_edition
-        if selected_edition:
-            edition_manager = EditionDataManager(selected_edition)
-            config = edition_manager.load_config()
-            if config:
-                st.markdown(f"**{config.get('name', 'N/A')}**")
-                st.caption(f"📆 {config.get('start_date', 'N/A')} → {config.get('end_date', 'N/A')}")
-    st.markdown("---")
-    st.markdown("### 🧭 Navigation")
-    st.page_link("app.py", label="🏠 Accueil")
-    st.page_link("pages/1_📊_Stats_Generales.py", label="📊 Stats Générales")
-    st.page_link("pages/2_Liste_des_Matchs.py", label="📋 Liste des Matchs")
-    st.page_link("pages/3_🐉_Stats_Champions.py", label="🐉 Stats Champions")
-    st.page_link("pages/4_🏆_Stats_Equipes.py", label="🏆 Stats Équipes")
-    st.page_link("pages/5_👤_Stats_Joueurs.py", label="👤 Stats Joueurs")
-    st.page_link("pages/6_🔍_Recherche.py", label="🔍 Recherche")
-    st.page_link("pages/9_🔧_Admin.py", label="🔧 Admin")
-    st.markdown("---")
-    st.caption("🎮 OcciLan Stats v2.0")
+available_editions, selected_edition = render_sidebar("edition_selector_matches")
 
 # Titre de la page
 st.title("🎮 Matchs du Tournoi")
@@ -83,52 +44,71 @@ if not available_editions or not selected_edition:
 
 # Utiliser l'édition manager
 edition_manager = EditionDataManager(selected_edition)
-data_dir = Path(__file__).parent.parent.parent.parent / "data" / "editions" / f"edition_{selected_edition}"
 
 # Charger les team_stats pour le mapping joueur->équipe
-team_stats_path = data_dir / "team_stats.json"
+with profiler.section("load_team_stats", "json"):
+    team_stats_data = edition_manager.load_team_stats()
+profiler.checkpoint("Mapping joueur → équipe", "compute")
 player_to_team = {}
-if team_stats_path.exists():
-    with open(team_stats_path, "r", encoding="utf-8") as f:
-        team_stats_data = json.load(f)
-        for team_name, team_data in team_stats_data.items():
-            players = team_data.get("players", {})
-            for player_key, player_data in players.items():
-                game_name = player_data.get("gameName") or player_data.get("player_name")
-                tag_line = player_data.get("tagLine") or ""
-                if game_name and tag_line:
-                    player_to_team[f"{game_name}#{tag_line}"] = team_name
-                    player_to_team[f"{game_name.replace(' ', '').lower()}#{tag_line.lower()}"] = team_name
-                if game_name:
-                    player_to_team[game_name] = team_name
-                    player_to_team[game_name.replace(' ', '').lower()] = team_name
+if team_stats_data:
+    for team_name, team_data in team_stats_data.items():
+        players = team_data.get("players", {})
+        for player_key, player_data in players.items():
+            game_name = player_data.get("gameName") or player_data.get("player_name")
+            tag_line = player_data.get("tagLine") or ""
+            if game_name and tag_line:
+                player_to_team[f"{game_name}#{tag_line}"] = team_name
+                player_to_team[f"{game_name.replace(' ', '').lower()}#{tag_line.lower()}"] = team_name
+            if game_name:
+                player_to_team[game_name] = team_name
+                player_to_team[game_name.replace(' ', '').lower()] = team_name
 
 # Charger tournament_matches pour fallback équipe
-tournament_matches_path = data_dir / "tournament_matches.json"
-tournament_matches = None
-if tournament_matches_path.exists():
-    with open(tournament_matches_path, "r", encoding="utf-8") as f:
-        tournament_matches = json.load(f)
+with profiler.section("load_tournament_matches", "json"):
+    tournament_matches = edition_manager.load_tournament_matches() or None
 
 # Charger teams_with_puuid pour l'accès aux oldAccounts
-teams_with_puuid = edition_manager.load_teams_with_puuid() if 'edition_manager' in locals() else {}
+with profiler.section("load_teams_with_puuid", "json"):
+    teams_with_puuid = edition_manager.load_teams_with_puuid() if 'edition_manager' in locals() else {}
 
 # Charger les match_details
-match_details_path = data_dir / "match_details.json"
-if not match_details_path.exists():
+match_details_version = edition_manager.data_version("match_details.json")
+if match_details_version is None:
     st.error("❌ Aucun match trouvé pour cette édition")
     st.info("💡 Allez dans l'onglet Admin pour lancer le traitement des données")
     st.stop()
-with open(match_details_path, "r", encoding="utf-8") as f:
-    match_details = json.load(f)
+
+
+@st.cache_resource(show_spinner=False)
+def load_match_details_cached(edition: int, version: float):
+    """Charge match_details une seule fois par version du stockage (partagé entre sessions)"""
+    return EditionDataManager(edition).load_match_details()
+
+
+@st.cache_data(show_spinner=False)
+def build_match_sort_index(edition: int, version: float):
+    """
+    Index de tri précalculé: une ligne légère par match.
+
+    Les clés de tri (date, durée, kills totaux) sont calculées une seule fois
+    par version du fichier au lieu d'être recalculées dans chaque lambda de tri.
+    """
+    return build_sort_index(load_match_details_cached(edition, version))
+
+
+with profiler.section("load_match_details (cache)", "json"):
+    match_details = load_match_details_cached(selected_edition, match_details_version)
 if not match_details:
     st.warning("⚠️ Aucun match disponible")
     st.stop()
+with profiler.section("Index de tri (cache)", "compute"):
+    sort_index = build_match_sort_index(selected_edition, match_details_version)
 
+profiler.checkpoint("Filtres et tri", "compute")
 # Filtres
 st.markdown("---")
 st.subheader("🔍 Filtres")
-col1, col2 = st.columns(2)
+col1, col2, col3 = st.columns(3)
 with col1:
     min_duration = st.slider("Durée minimale (minutes)", 0, 60, 0)
 with col2:
@@ -136,55 +116,46 @@ with col2:
         "Trier par",
         ["Date (récent)", "Date (ancien)", "Durée (longue)", "Durée (courte)", "Kills (plus)", "Kills (moins)"]
     )
+with col3:
+    page_size = st.selectbox("Matchs par page", [10, 25, 50], index=0)
+
+# Tri via l'index précalculé (ordre croissant, inversé si besoin)
+SORT_OPTIONS = {
+    "Date (récent)": ("date", True),
+    "Date (ancien)": ("date", False),
+    "Durée (longue)": ("duration", True),
+    "Durée (courte)": ("duration", False),
+    "Kills (plus)": ("kills", True),
+    "Kills (moins)": ("kills", False),
+}
+sort_key, descending = SORT_OPTIONS[sort_by]
+ordered_rows = reversed(sort_index[sort_key]) if descending else sort_index[sort_key]
 
 # Appliquer les filtres
-filtered_matches = {}
-for match_id, match_data in match_details.items():
-    info = match_data.get("info", {})
-    duration = info.get("gameDuration", 0)
-    if duration >= (min_duration * 60):
-        filtered_matches[match_id] = match_data
-
-# Tri
-if sort_by == "Date (récent)":
-    sorted_matches = sorted(
-        filtered_matches.items(),
-        key=lambda x: x[1].get("info", {}).get("gameCreation", 0),
-        reverse=True
-    )
-elif sort_by == "Date (ancien)":
-    sorted_matches = sorted(
-        filtered_matches.items(),
-        key=lambda x: x[1].get("info", {}).get("gameCreation", 0)
-    )
-elif sort_by == "Durée (longue)":
-    sorted_matches = sorted(
-        filtered_matches.items(),
-        key=lambda x: x[1].get("info", {}).get("gameDuration", 0),
-        reverse=True
-    )
-elif sort_by == "Durée (courte)":
-    sorted_matches = sorted(
-        filtered_matches.items(),
-        key=lambda x: x[1].get("info", {}).get("gameDuration", 0)
-    )
-elif sort_by == "Kills (plus)":
-    sorted_matches = sorted(
-        filtered_matches.items(),
-        key=lambda x: sum(p.get("kills", 0) for p in x[1].get("info", {}).get("participants", [])),
-        reverse=True
-    )
-else:  # Kills (moins)
-    sorted_matches = sorted(
-        filtered_matches.items(),
-        key=lambda x: sum(p.get("kills", 0) for p in x[1].get("info", {}).get("participants", []))
-    )
+min_duration_seconds = min_duration * 60
+sorted_match_ids = [row["match_id"] for row in ordered_rows if row["duration"] >= min_duration_seconds]
+
+# Pagination "charger plus": réinitialisée quand l'édition ou les filtres changent
+list_state = (selected_edition, min_duration, sort_by, page_size)
+if st.session_state.get("matches_list_state") != list_state:
+    st.session_state.matches_list_state = list_state
+    st.session_state.matches_visible = page_size
+visible_count = min(st.session_state.matches_visible, len(sorted_match_ids))
 
+profiler.checkpoint("Cartes de match", "html")
 # Afficher les matchs
 st.markdown("---")
-st.subheader(f"📋 Liste des matchs ({len(sorted_matches)} matchs)")
-if sorted_matches:
-    for match_id, match_data in sorted_matches:
-        display_match_card(match_id, match_data, player_to_team)
+st.subheader(f"📋 Liste des matchs ({len(sorted_match_ids)} matchs)")
+if sorted_match_ids:
+    for match_id in sorted_match_ids[:visible_count]:
+        display_match_card(match_id, match_details[match_id], player_to_team)
+
+    st.caption(f"{visible_count} / {len(sorted_match_ids)} matchs affichés")
+    if visible_count < len(sorted_match_ids):
+        if st.button(f"⬇️ Charger {min(page_size, len(sorted_match_ids) - visible_count)} matchs de plus", use_container_width=True):
+            st.session_state.matches_visible += page_size
+            st.rerun()
 else:
     st.info("Aucun match ne correspond aux filtres sélectionnés")
+
+profiler.render_sidebar()
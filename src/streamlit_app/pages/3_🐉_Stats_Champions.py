@@ -4,18 +4,24 @@ Affiche les stats des champions (picks, bans, winrates, KDA, etc.)
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from pathlib import Path
 import sys
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.core.data_manager import EditionDataManager, MultiEditionManager
+from src.core.data_manager import EditionDataManager
+from src.core.champion_registry import get_champion_registry
+from components.assets import get_champion_icon_url
+from components.app_shell import get_multi_manager, lazy_module, render_sidebar
+from components.profiler import start_page
+
+# Chargés au premier tableau / graphique
+pd = lazy_module("pandas")
+px = lazy_module("plotly.express")
 
 st.set_page_config(page_title="Stats Champions - OcciLan Stats", page_icon="🐉", layout="wide")
+profiler = start_page("Stats Champions")
 
 # Custom CSS pour masquer la navigation par défaut
 st.markdown("""
@@ -47,68 +53,15 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+profiler.checkpoint("Sidebar", "render")
+
 # ============================================================================
 # SIDEBAR - Navigation cohérente
 # ============================================================================
 
-with st.sidebar:
-    st.markdown("### 📂 Sélection d'édition")
-    
-    multi_manager = MultiEditionManager()
-    
-    # Vérifier si l'utilisateur est admin
-    is_admin = st.session_state.get("authenticated", False)
-    
-    # Lister les éditions (privées uniquement si admin)
-    available_editions = multi_manager.list_editions(include_private=is_admin)
-    
-    if not available_editions:
-        st.warning("⚠️ Aucune édition disponible")
-        st.info("💡 Créez une édition dans la page Admin")
-        selected_edition = None
-    else:
-        # Initialiser selected_edition dans session_state si pas déjà fait
-        if "selected_edition" not in st.session_state:
-            st.session_state.selected_edition = 7 if 7 in available_editions else available_editions[0]
-        
-        # Trouver l'index de l'édition sélectionnée
-        default_index = 0
-        if st.session_state.selected_edition in available_editions:
-            default_index = available_editions.index(st.session_state.selected_edition)
-        
-        # Sélecteur visible pour tous les utilisateurs
-        selected_edition = st.selectbox(
-            "Édition",
-            available_editions,
-            index=default_index,
-            format_func=lambda x: f"Edition {x}",
-            label_visibility="collapsed",
-            key="edition_selector_champions"
-        )
-        
-        # Sauvegarder dans session_state
-        st.session_state.selected_edition = selected_edition
-        
-        if selected_edition:
-            edition_manager = EditionDataManager(selected_edition)
-            config = edition_manager.load_config()
-            
-            if config:
-                st.markdown(f"**{config.get('name', 'N/A')}**")
-                st.caption(f"📆 {config.get('start_date', 'N/A')} → {config.get('end_date', 'N/A')}")
-    
-    st.markdown("---")
-    st.markdown("### 🧭 Navigation")
-    st.page_link("app.py", label="🏠 Accueil")
-    st.page_link("pages/1_📊_Stats_Generales.py", label="📊 Stats Générales")
-    st.page_link("pages/2_Liste_des_Matchs.py", label="📋 Liste des Matchs")
-    st.page_link("pages/3_🐉_Stats_Champions.py", label="🐉 Stats Champions")
-    st.page_link("pages/4_🏆_Stats_Equipes.py", label="🏆 Stats Équipes")
-    st.page_link("pages/5_👤_Stats_Joueurs.py", label="👤 Stats Joueurs")
-    st.page_link("pages/6_🔍_Recherche.py", label="🔍 Recherche")
-    st.page_link("pages/9_🔧_Admin.py", label="🔧 Admin")
-    st.markdown("---")
-    st.caption("🎮 OcciLan Stats v2.0")
+multi_manager = get_multi_manager()
+is_admin = st.session_state.get("authenticated", False)
+available_editions, selected_edition = render_sidebar("edition_selector_champions")
 
 # ============================================================================
 # CONFIGURATION
@@ -120,120 +73,15 @@ if not available_editions or not selected_edition:
     st.info("👈 Sélectionnez une édition dans la sidebar")
     st.stop()
 
-# ============================================================================
-# FONCTIONS DE NORMALISATION DES NOMS DE CHAMPIONS
-# ============================================================================
-
-def normalize_champion_display_name(champion_name):
-    """Convertit les noms internes Riot en noms d'affichage"""
-    display_mapping = {
-        "MonkeyKing": "Wukong",
-        "Chogath": "Cho'Gath",
-        "DrMundo": "Dr. Mundo",
-        "JarvanIV": "Jarvan IV",
-        "Kaisa": "Kai'Sa",
-        "Khazix": "Kha'Zix",
-        "KogMaw": "Kog'Maw",
-        "Leblanc": "LeBlanc",
-        "MissFortune": "Miss Fortune",
-        "Nunu": "Nunu & Willump",
-        "RekSai": "Rek'Sai",
-        "Renata": "Renata Glasc",
-        "TahmKench": "Tahm Kench",
-        "TwistedFate": "Twisted Fate",
-        "Velkoz": "Vel'Koz",
-        "XinZhao": "Xin Zhao"
-    }
-    return display_mapping.get(champion_name, champion_name)
-
-def normalize_champion_key(champion_name):
-    """Convertit n'importe quel nom en clé interne Riot"""
-    key_mapping = {
-        "Wukong": "MonkeyKing",
-        "MonkeyKing": "MonkeyKing",
-        "Cho'Gath": "Chogath",
-        "Chogath": "Chogath",
-        "Dr. Mundo": "DrMundo",
-        "DrMundo": "DrMundo",
-        "Jarvan IV": "JarvanIV",
-        "JarvanIV": "JarvanIV",
-        "Kai'Sa": "Kaisa",
-        "Kaisa": "Kaisa",
-        "Kha'Zix": "Khazix",
-        "Khazix": "Khazix",
-        "Kog'Maw": "KogMaw",
-        "KogMaw": "KogMaw",
-        "LeBlanc": "Leblanc",
-        "Leblanc": "Leblanc",
-        "Miss Fortune": "MissFortune",
-        "MissFortune": "MissFortune",
-        "Nunu & Willump": "Nunu",
-        "Nunu": "Nunu",
-        "Rek'Sai": "RekSai",
-        "RekSai": "RekSai",
-        "Renata Glasc": "Renata",
-        "Renata": "Renata",
-        "Tahm Kench": "TahmKench",
-        "TahmKench": "TahmKench",
-        "Twisted Fate": "TwistedFate",
-        "TwistedFate": "TwistedFate",
-        "Vel'Koz": "Velkoz",
-        "Velkoz": "Velkoz",
-        "Xin Zhao": "XinZhao",
-        "XinZhao": "XinZhao"
-    }
-    return key_mapping.get(champion_name, champion_name)
-
-def get_champion_icon(champion_name):
-    version = "15.20.1"  # Updated to include Yunara and latest champions
-    # Mapping des noms de champions pour Data Dragon
-    champion_mapping = {
-        "MonkeyKing": "MonkeyKing",  # Wukong en interne
-        "Wukong": "MonkeyKing",
-        "Chogath": "Chogath",
-        "Cho'Gath": "Chogath",
-        "DrMundo": "DrMundo",
-        "Dr. Mundo": "DrMundo",
-        "JarvanIV": "JarvanIV",
-        "Jarvan IV": "JarvanIV",
-        "Kaisa": "Kaisa",
-        "Kai'Sa": "Kaisa",
-        "Khazix": "Khazix",
-        "Kha'Zix": "Khazix",
-        "KogMaw": "KogMaw",
-        "Kog'Maw": "KogMaw",
-        "Leblanc": "Leblanc",
-        "LeBlanc": "Leblanc",
-        "MissFortune": "MissFortune",
-        "Miss Fortune": "MissFortune",
-        "Nunu": "Nunu",
-        "Nunu & Willump": "Nunu",
-        "RekSai": "RekSai",
-        "Rek'Sai": "RekSai",
-        "Renata": "Renata",
-        "Renata Glasc": "Renata",
-        "TahmKench": "TahmKench",
-        "Tahm Kench": "TahmKench",
-        "TwistedFate": "TwistedFate",
-        "Twisted Fate": "TwistedFate",
-        "Velkoz": "Velkoz",
-        "Vel'Koz": "Velkoz",
-        "XinZhao": "XinZhao",
-        "Xin Zhao": "XinZhao"
-    }
-    
-    # Utiliser le mapping ou nettoyer le nom
-    clean_name = champion_mapping.get(champion_name, champion_name.replace(" ", "").replace("'", ""))
-    url = f"https://ddragon.leagueoflegends.com/cdn/{version}/img/champion/{clean_name}.png"
-    return url
-
 # ============================================================================
 # CHARGEMENT DES DONNÉES
 # ============================================================================
 
 # Charger les données de l'édition
 edition_manager = EditionDataManager(selected_edition)
-general_stats = edition_manager.load_general_stats()
+with profiler.section("load_general_stats", "json"):
+    general_stats = edition_manager.load_general_stats()
+champions = get_champion_registry()
 
 if not general_stats or "champion_stats" not in general_stats:
     st.warning("⚠️ Aucune donnée de champions disponible pour cette édition")
@@ -242,49 +90,13 @@ if not general_stats or "champion_stats" not in general_stats:
 # Extraire les stats champions
 champion_data = general_stats["champion_stats"]
 
-# Charger les données détaillées des matchs pour calculer le KDA
-match_details = edition_manager.load_match_details()
-
-# Calculer le KDA par champion à partir des match_details
-champion_kda_data = {}
-champion_kp_data = {}
-
-if match_details:
-    for match_id, match in match_details.items():
-        if "info" not in match or "participants" not in match["info"]:
-            continue
-        
-        participants = match["info"]["participants"]
-        
-        # Calculer les kills totaux de chaque équipe
-        team_kills = {100: 0, 200: 0}
-        for p in participants:
-            team_kills[p.get("teamId", 100)] += p.get("kills", 0)
-        
-        for participant in participants:
-            champ_name_raw = participant.get("championName", "Unknown")
-            # Normaliser le nom du champion pour le matching
-            champ_name = normalize_champion_key(champ_name_raw)
-            
-            kills = participant.get("kills", 0)
-            deaths = participant.get("deaths", 0)
-            assists = participant.get("assists", 0)
-            team_id = participant.get("teamId", 100)
-            
-            # KDA calculation
-            kda = (kills + assists) / deaths if deaths > 0 else kills + assists
-            
-            # Kill Participation (KP) = (Kills + Assists) / Team Total Kills
-            total_team_kills = team_kills.get(team_id, 1)
-            kp = ((kills + assists) / total_team_kills * 100) if total_team_kills > 0 else 0
-            
-            if champ_name not in champion_kda_data:
-                champion_kda_data[champ_name] = []
-                champion_kp_data[champ_name] = []
-            
-            champion_kda_data[champ_name].append(kda)
-            champion_kp_data[champ_name].append(kp)
+# KDA / KP par champion: méta précalculée par édition (champion_meta.json),
+# sans charger match_details
+with profiler.section("get_champion_trends", "json"):
+    champion_trends = multi_manager.get_champion_trends(include_private=is_admin)
+edition_meta = {row["champion"]: row for row in champion_trends if row["edition"] == selected_edition}
 
+profiler.checkpoint("DataFrame champions", "dataframe")
 # Créer un DataFrame à partir des données JSON
 # Structure: {"picks": {...}, "bans": {...}, "wins": {...}}
 champions_list = []
@@ -301,18 +113,13 @@ for champion in all_champions:
     # Calculer le winrate
     winrate = (wins / picks * 100) if picks > 0 else 0
     
-    # Normaliser le nom du champion pour le matching avec les stats de match
-    champion_key = normalize_champion_key(champion)
-    
-    # Calculer le KDA moyen et KP moyen
-    kda_list = champion_kda_data.get(champion_key, [])
-    kp_list = champion_kp_data.get(champion_key, [])
-    
-    avg_kda = sum(kda_list) / len(kda_list) if len(kda_list) > 0 else 0
-    avg_kp = sum(kp_list) / len(kp_list) if len(kp_list) > 0 else 0
+    # KDA moyen et KP moyen (moyennes par partie, 0 sans match_details)
+    meta = edition_meta.get(champion, {})
+    avg_kda = meta.get("kda") or 0
+    avg_kp = meta.get("kp") or 0
     
     # Utiliser le nom d'affichage
-    display_name = normalize_champion_display_name(champion)
+    display_name = champions.display_name(champion)
     
     champions_list.append({
         "Champion": display_name,
@@ -329,6 +136,7 @@ df = df.sort_values("Games", ascending=False).reset_index(drop=True)
 
 st.markdown("---")
 
+profiler.checkpoint("Top 5", "html")
 # === SECTION 1: TOP 5 STATS ===
 st.header("📊 Top 5 des Champions")
 
@@ -340,7 +148,7 @@ with col1:
     
     for idx, row in top_played.iterrows():
         wr_color = "winrate-high" if row['WR'] >= 50 else "winrate-low"
-        icon_url = get_champion_icon(row['Champion'])
+        icon_url = get_champion_icon_url(row['Champion'])
         st.markdown(f"""
             <div class="metric-card">
                 <img src="{icon_url}" class="champion-icon" style="width: 50px; height: 50px; border-radius: 50%; vertical-align: middle; margin-right: 10px;" onerror="this.style.display='none'">
@@ -358,7 +166,7 @@ with col2:
     top_banned = df.nlargest(5, 'Bans')[['Champion', 'Bans', 'WR']]
     
     for idx, row in top_banned.iterrows():
-        icon_url = get_champion_icon(row['Champion'])
+        icon_url = get_champion_icon_url(row['Champion'])
         wr_color = "winrate-high" if row['WR'] >= 50 else "winrate-low"
         st.markdown(f"""
             <div class="metric-card">
@@ -380,7 +188,7 @@ with col3:
         top_winrate = df_filtered.nlargest(5, 'WR')[['Champion', 'WR', 'Games', 'KDA']]
         
         for idx, row in top_winrate.iterrows():
-            icon_url = get_champion_icon(row['Champion'])
+            icon_url = get_champion_icon_url(row['Champion'])
             st.markdown(f"""
                 <div class="metric-card">
                     <img src="{icon_url}" class="champion-icon" style="width: 50px; height: 50px; border-radius: 50%; vertical-align: middle; margin-right: 10px;" onerror="this.style.display='none'">
@@ -397,6 +205,7 @@ with col3:
 
 st.markdown("---")
 
+profiler.checkpoint("Graphiques", "plotly")
 # === SECTION 2: GRAPHIQUES ===
 st.header("📈 Visualisations")
 
@@ -469,6 +278,7 @@ with tab3:
 
 st.markdown("---")
 
+profiler.checkpoint("Filtres", "dataframe")
 # === SECTION 3: TABLEAU COMPLET ===
 st.header("📋 Tableau complet — Champions (détails)")
 
@@ -486,6 +296,7 @@ if search_champion:
         df_filtered_display['Champion'].str.contains(search_champion, case=False, na=False)
     ]
 
+profiler.checkpoint("Tableau HTML", "html")
 # Construire le tableau HTML
 table_html = '''
 <table style="width: 100%; border-collapse: collapse; font-family: 'Inter', sans-serif; margin-top: 16px; box-shadow: 0 2px 8px rgba(0,0,0,0.2); border-radius: 8px; overflow: hidden;">
@@ -529,7 +340,7 @@ for idx, (_, champ) in enumerate(df_filtered_display.iterrows(), 1):
     bg_color = "#0f1113" if idx % 2 == 0 else "#0b0d10"
     
     # Champion icon
-    icon_url = get_champion_icon(champ['Champion'])
+    icon_url = get_champion_icon_url(champ['Champion'])
     
     table_html += f'''
         <tr style="background: {bg_color}; border-top: 1px solid rgba(255,255,255,0.05); transition: background 0.2s;" onmouseover="this.style.background='#1a1d24'" onmouseout="this.style.background='{bg_color}'">
@@ -550,6 +361,7 @@ table_html += '''
 </table>
 '''
 
+profiler.checkpoint("Rendu tableau", "render")
 # Use st.components for proper HTML rendering
 import streamlit.components.v1 as components
 components.html(table_html, height=600, scrolling=True)
@@ -561,3 +373,70 @@ with col_stat1:
     st.metric("Champions uniques", len(df))
 with col_stat2:
     st.metric("KDA moyen", f"{df['KDA'].mean():.2f}")
+
+st.markdown("---")
+
+profiler.checkpoint("Évolution de la méta", "plotly")
+# === SECTION 4: ÉVOLUTION DE LA MÉTA ===
+st.header("📆 Évolution de la méta")
+
+trends_df = pd.DataFrame(champion_trends)
+meta_editions = sorted(trends_df["edition"].unique()) if not trends_df.empty else []
+
+if len(meta_editions) < 2:
+    st.info("Il faut au moins deux éditions pour comparer la méta")
+else:
+    trend_fields = {
+        "presence": "Présence (%)",
+        "pickrate": "Pickrate (%)",
+        "banrate": "Banrate (%)",
+        "winrate": "Winrate (%)",
+        "picks": "Picks",
+        "bans": "Bans",
+        "kda": "KDA",
+        "kp": "KP (%)"
+    }
+    col_meta1, col_meta2 = st.columns([1, 3])
+    with col_meta1:
+        trend_field = st.selectbox("Statistique", list(trend_fields), format_func=trend_fields.get, key="meta_field")
+    
+    # Par défaut: les champions les plus présents toutes éditions confondues
+    presence_totals = trends_df.groupby("champion")[["picks", "bans"]].sum().sum(axis=1).sort_values(ascending=False)
+    with col_meta2:
+        meta_champions = st.multiselect(
+            "Champions",
+            sorted(presence_totals.index, key=champions.display_name),
+            default=list(presence_totals.index[:8]),
+            format_func=champions.display_name,
+            key="meta_champions"
+        )
+    
+    selected_trends = trends_df[trends_df["champion"].isin(meta_champions)].copy()
+    if selected_trends.empty:
+        st.info("Sélectionnez au moins un champion")
+    else:
+        selected_trends["Champion"] = selected_trends["champion"].map(champions.display_name)
+        selected_trends["Édition"] = selected_trends["edition"].map(lambda edition: f"Edition {edition}")
+        fig_meta = px.line(
+            selected_trends,
+            x="Édition",
+            y=trend_field,
+            color="Champion",
+            markers=True,
+            title=f"{trend_fields[trend_field]} par édition",
+            labels={trend_field: trend_fields[trend_field]},
+            category_orders={"Édition": [f"Edition {edition}" for edition in meta_editions]}
+        )
+        fig_meta.update_layout(
+            height=500,
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white')
+        )
+        st.plotly_chart(fig_meta, use_container_width=True)
+        
+        meta_table = selected_trends.pivot(index="Champion", columns="Édition", values=trend_field)
+        meta_table = meta_table.reindex(columns=[f"Edition {edition}" for edition in meta_editions])
+        st.dataframe(meta_table, use_container_width=True)
+
+profiler.render_sidebar()
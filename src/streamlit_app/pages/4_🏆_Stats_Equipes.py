@@ -4,86 +4,20 @@ Affiche les statistiques détaillées de chaque équipe avec des cartes KPI et u
 """
 
 import streamlit as st
-import pandas as pd
 from pathlib import Path
 import sys
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.core.data_manager import EditionDataManager, MultiEditionManager
+from src.core.data_manager import EditionDataManager
+from components.assets import get_champion_icon_url, get_role_icon_url
+from components.app_shell import render_sidebar
+from components.profiler import start_page
 
 st.set_page_config(page_title="Stats Équipes - OcciLan Stats", page_icon="🏆", layout="wide")
+profiler = start_page("Stats Équipes")
 
-# Helper function for champion icons
-def get_role_icon_url(role: str, size: int = 24) -> str:
-    """Get Data Dragon role icon URL"""
-    role_norm = role.upper()
-    if role_norm in ["TOP"]:
-        key = "position-top.svg"
-    elif role_norm in ["JGL", "JUNGLE"]:
-        key = "position-jungle.svg"
-    elif role_norm in ["MID", "MIDDLE"]:
-        key = "position-middle.svg"
-    elif role_norm in ["ADC", "BOTTOM"]:
-        key = "position-bottom.svg"
-    elif role_norm in ["SUP", "SUPP", "UTILITY"]:
-        key = "position-utility.svg"
-    else:
-        key = "position-top.svg"
-    return f"https://raw.communitydragon.org/pbe/plugins/rcp-fe-lol-static-assets/global/default/svg/{key}"
-def get_champion_icon_url(champion_name: str, size: int = 48) -> str:
-    """Get Data Dragon champion icon URL"""
-    # Champion name corrections for Data Dragon API
-    # Data Dragon utilise les clés internes de Riot
-    champion_name_mapping = {
-        "Wukong": "MonkeyKing",  # Wukong → MonkeyKing pour Data Dragon
-        "MonkeyKing": "MonkeyKing",  # Déjà correct
-        "FiddleSticks": "Fiddlesticks",
-        "Nunu": "Nunu",
-        "Nunu & Willump": "Nunu",
-        "RekSai": "RekSai",
-        "Rek'Sai": "RekSai",
-        "KSante": "KSante",
-        "K'Sante": "KSante",
-        "Renata": "Renata",
-        "Renata Glasc": "Renata",
-        "BelVeth": "Belveth",
-        "Bel'Veth": "Belveth",
-        "KhaZix": "Khazix",
-        "Kha'Zix": "Khazix",
-        "VelKoz": "Velkoz",
-        "Vel'Koz": "Velkoz",
-        "ChoGath": "Chogath",
-        "Cho'Gath": "Chogath",
-        "KaiSa": "Kaisa",
-        "Kai'Sa": "Kaisa",
-        "LeBlanc": "Leblanc",
-        "JarvanIV": "JarvanIV",
-        "Jarvan IV": "JarvanIV",
-        "XinZhao": "XinZhao",
-        "Xin Zhao": "XinZhao",
-        "MasterYi": "MasterYi",
-        "Master Yi": "MasterYi",
-        "MissFortune": "MissFortune",
-        "Miss Fortune": "MissFortune",
-        "TahmKench": "TahmKench",
-        "Tahm Kench": "TahmKench",
-        "TwistedFate": "TwistedFate",
-        "Twisted Fate": "TwistedFate",
-        "AurelionSol": "AurelionSol",
-        "Aurelion Sol": "AurelionSol",
-        "DrMundo": "DrMundo",
-        "Dr. Mundo": "DrMundo",
-        "KogMaw": "KogMaw",
-        "Kog'Maw": "KogMaw"
-    }
-    
-    # Use the mapping if champion name exists in it, otherwise use as-is
-    corrected_name = champion_name_mapping.get(champion_name, champion_name)
-    
-    # Latest version - updated to 15.20.1 to include Yunara
-    return f"https://ddragon.leagueoflegends.com/cdn/15.20.1/img/champion/{corrected_name}.png"
 
 # Custom CSS
 st.markdown("""
@@ -217,66 +151,13 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+profiler.checkpoint("Sidebar", "render")
+
 # ============================================================================
 # SIDEBAR
 # ============================================================================
 
-with st.sidebar:
-    st.markdown("### 📂 Sélection d'édition")
-    
-    multi_manager = MultiEditionManager()
-    is_admin = st.session_state.get("authenticated", False)
-    available_editions = multi_manager.list_editions(include_private=is_admin)
-    
-    if not available_editions:
-        st.warning("⚠️ Aucune édition disponible")
-        st.info("💡 Créez une édition dans la page Admin")
-        selected_edition = None
-    else:
-        # Initialiser selected_edition dans session_state si pas déjà fait
-        if "selected_edition" not in st.session_state:
-            st.session_state.selected_edition = 7 if 7 in available_editions else (available_editions[0] if available_editions else None)
-        
-        # Trouver l'index de l'édition sélectionnée
-        default_index = 0
-        if st.session_state.selected_edition in available_editions:
-            default_index = available_editions.index(st.session_state.selected_edition)
-        
-        # Sélecteur visible pour tous les utilisateurs
-        selected_edition = st.selectbox(
-            "Édition",
-            available_editions,
-            index=default_index,
-            format_func=lambda x: f"Edition {x}",
-            label_visibility="collapsed",
-            key="edition_selector_teams"
-        )
-        
-        # Sauvegarder dans session_state
-        st.session_state.selected_edition = selected_edition
-        
-        if selected_edition:
-            edition_manager = EditionDataManager(selected_edition)
-            config = edition_manager.load_config()
-            
-            if config:
-                st.markdown(f"**{config.get('name', 'N/A')}**")
-                st.caption(f"📆 {config.get('start_date', 'N/A')} → {config.get('end_date', 'N/A')}")
-    
-    st.markdown("---")
-    st.markdown("### 🧭 Navigation")
-    st.page_link("app.py", label="🏠 Accueil")
-    st.page_link("pages/1_📊_Stats_Generales.py", label="📊 Stats Générales")
-    st.page_link("pages/2_Liste_des_Matchs.py", label="📋 Liste des Matchs")
-    st.page_link("pages/3_🐉_Stats_Champions.py", label="🐉 Stats Champions")
-    st.page_link("pages/4_🏆_Stats_Equipes.py", label="🏆 Stats Équipes")
-    st.page_link("pages/5_👤_Stats_Joueurs.py", label="👤 Stats Joueurs")
-    st.page_link("pages/6_🔍_Recherche.py", label="🔍 Recherche")
-    st.page_link("pages/9_🔧_Admin.py", label="🔧 Admin")
-    st.markdown("---")
-    st.caption("🎮 OcciLan Stats v2.0")
-    st.markdown("---")
-    st.caption("🎮 OcciLan Stats v2.0")
+available_editions, selected_edition = render_sidebar("edition_selector_teams")
 
 # ============================================================================
 # MAIN
@@ -291,25 +172,18 @@ if not available_editions or not selected_edition:
 edition_manager = EditionDataManager(selected_edition)
 
 # Load data
-teams_with_puuid = edition_manager.load_teams_with_puuid()
-
-# Try to load team_stats.json (old format from edition 6)
-import json
-data_dir = Path(__file__).parent.parent.parent.parent / "data" / "editions" / f"edition_{selected_edition}"
-team_stats_path = data_dir / "team_stats.json"
+with profiler.section("load_teams_with_puuid", "json"):
+    teams_with_puuid = edition_manager.load_teams_with_puuid()
 
-if not team_stats_path.exists():
-    st.warning("⚠️ Fichier team_stats.json introuvable")
-    st.info("💡 Ce fichier est nécessaire pour afficher les statistiques par équipe")
-    st.stop()
-
-with open(team_stats_path, "r", encoding="utf-8") as f:
-    team_stats_data = json.load(f)
+# Stats par équipe (team_stats.json, ou reconstruites depuis general_stats)
+with profiler.section("load_team_stats", "json"):
+    team_stats_data = edition_manager.load_team_stats()
 
 if not team_stats_data:
     st.warning("⚠️ Aucune statistique d'équipe disponible")
     st.stop()
 
+profiler.checkpoint("Sélection équipe", "render")
 # Team selector
 team_names = sorted(team_stats_data.keys())
 selected_team = st.selectbox("🏆 Sélectionnez une équipe", team_names, key="team_selector")
@@ -323,6 +197,8 @@ team_data = team_entry.get("team_stats", {})
 player_stats_dict = team_entry.get("players", {})
 team_info = teams_with_puuid.get(selected_team, {})
 
+profiler.checkpoint("KPIs équipe", "html")
+
 # ============================================================================
 # TEAM KPIs
 # ============================================================================
@@ -418,6 +294,7 @@ def get_kda_class(kda):
     except:
         return ""
 
+profiler.checkpoint("Tableau joueurs", "html")
 # Build HTML table
 table_html = '<table class="player-table">'
 table_html += '<thead><tr>'
@@ -503,6 +380,7 @@ table_html += '</tbody></table>'
 
 st.markdown(table_html, unsafe_allow_html=True)
 
+profiler.checkpoint("Boutons profils", "render")
 # Boutons cliquables pour voir les profils des joueurs de l'équipe
 st.markdown("---")
 st.markdown("#### 👁️ Voir le profil des joueurs")
@@ -525,82 +403,28 @@ for idx, player in enumerate(team_players):
 st.markdown("---")
 st.markdown("### 📜 Historique des Matchs")
 
-# Charger match_details.json
-match_details_path = data_dir / "match_details.json"
+# Charger match_details
+with profiler.section("load_match_details", "json"):
+    match_details_data = edition_manager.load_match_details()
 
-if match_details_path.exists():
-    with open(match_details_path, "r", encoding="utf-8") as f:
-        match_details_data = json.load(f)
-    
-    # Créer un mapping joueur->équipe depuis teams_with_puuid
-    player_to_team = {}
-    teams_with_puuid_path = data_dir / "teams_with_puuid.json"
-    if teams_with_puuid_path.exists():
-        with open(teams_with_puuid_path, "r", encoding="utf-8") as f:
-            teams_with_puuid_data = json.load(f)
-        
-        for team_name, team_info in teams_with_puuid_data.items():
-            players = team_info.get("players", [])
-            for player in players:
-                game_name = player.get("gameName", "")
-                tag_line = player.get("tagLine", "")
-                player_name = f"{game_name}#{tag_line}" if game_name and tag_line else game_name
-                player_to_team[player_name] = team_name
-    
-    # Filtrer les matchs où cette équipe a joué
-    team_matches = []
-    for match_id, match_data in match_details_data.items():
-        participants = match_data.get("info", {}).get("participants", [])
-        
-        # Vérifier si l'équipe a participé à ce match
-        team_participated = False
-        team_side = None  # 100 (Blue) ou 200 (Red)
-        team_won = False
-        
-        for participant in participants:
-            # Build full player name (GameName#TagLine)
-            game_name = participant.get("riotIdGameName", "")
-            tag_line = participant.get("riotIdTagline", "")
-            player_name = f"{game_name}#{tag_line}" if game_name and tag_line else game_name
-            
-            if player_to_team.get(player_name) == selected_team:
-                team_participated = True
-                team_side = participant.get("teamId")
-                team_won = participant.get("win", False)
-                break
-        
-        if team_participated:
-            # Récupérer les infos du match
-            game_creation = match_data.get("info", {}).get("gameCreation", 0)
-            game_duration = match_data.get("info", {}).get("gameDuration", 0)
-            
-            # Filtrer les participants de l'équipe
-            team_participants = [p for p in participants if p.get("teamId") == team_side]
-            
-            team_matches.append({
-                "match_id": match_id,
-                "date": game_creation,
-                "duration": game_duration,
-                "won": team_won,
-                "side": team_side,
-                "participants": team_participants,
-                "all_participants": participants
-            })
-    
-    # Trier par date (plus récent en premier)
-    team_matches.sort(key=lambda x: x["date"], reverse=True)
-    
+if match_details_data:
+    profiler.checkpoint("Historique: filtre des matchs", "compute")
+    from components.view_models import build_player_to_team, build_team_match_history
+    player_to_team = build_player_to_team(teams_with_puuid or {})
+
+    # Matchs où cette équipe a joué (plus récent en premier)
+    team_matches = build_team_match_history(match_details_data, player_to_team, selected_team)
+
+    profiler.checkpoint("Historique: cartes de match", "html")
     if team_matches:
         st.info(f"📊 {len(team_matches)} match(s) trouvé(s)")
         from components.match_card import display_match_card
         # Charger tournament_matches pour fallback équipe
-        tournament_matches_path = data_dir / "tournament_matches.json"
-        tournament_matches = None
-        if tournament_matches_path.exists():
-            with open(tournament_matches_path, "r", encoding="utf-8") as f:
-                tournament_matches = json.load(f)
+        tournament_matches = edition_manager.load_tournament_matches() or None
         for match in team_matches:
             display_match_card(match["match_id"], match_details_data[match["match_id"]], player_to_team, tournament_matches=tournament_matches)
 else:
     st.warning("⚠️ Fichier match_details.json introuvable")
     st.info("💡 Ce fichier est nécessaire pour afficher l'historique des matchs")
+
+profiler.render_sidebar()
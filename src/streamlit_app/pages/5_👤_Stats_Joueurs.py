@@ -4,87 +4,24 @@ Affiche les statistiques individuelles des joueurs avec classements et comparais
 """
 
 import streamlit as st
-import pandas as pd
 from pathlib import Path
 import sys
-import json
+from datetime import datetime, time
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.core.data_manager import EditionDataManager, MultiEditionManager
+from src.core.data_manager import EditionDataManager
+from components.assets import get_champion_icon_url, get_role_icon_url
+from components.app_shell import get_multi_manager, lazy_module, render_sidebar
+from components.profiler import start_page
+
+# Chargé au premier tableau
+pd = lazy_module("pandas")
 
 st.set_page_config(page_title="Stats Joueurs - OcciLan Stats", page_icon="👤", layout="wide")
+profiler = start_page("Stats Joueurs")
 
-# Helper function for champion icons
-def get_role_icon_url(role: str, size: int = 24) -> str:
-    """Get Data Dragon role icon URL"""
-    role_norm = role.upper()
-    if role_norm in ["TOP"]:
-        key = "position-top.svg"
-    elif role_norm in ["JGL", "JUNGLE"]:
-        key = "position-jungle.svg"
-    elif role_norm in ["MID", "MIDDLE"]:
-        key = "position-middle.svg"
-    elif role_norm in ["ADC", "BOTTOM"]:
-        key = "position-bottom.svg"
-    elif role_norm in ["SUP", "SUPP", "UTILITY"]:
-        key = "position-utility.svg"
-    else:
-        key = "position-top.svg"
-    return f"https://raw.communitydragon.org/pbe/plugins/rcp-fe-lol-static-assets/global/default/svg/{key}"
-def get_champion_icon_url(champion_name: str, size: int = 48) -> str:
-    """Get Data Dragon champion icon URL"""
-    # Champion name corrections for Data Dragon API
-    # Data Dragon utilise les clés internes de Riot
-    champion_name_mapping = {
-        "Wukong": "MonkeyKing",  # Wukong → MonkeyKing pour Data Dragon
-        "MonkeyKing": "MonkeyKing",  # Déjà correct
-        "FiddleSticks": "Fiddlesticks",
-        "Nunu": "Nunu",
-        "Nunu & Willump": "Nunu",
-        "RekSai": "RekSai",
-        "Rek'Sai": "RekSai",
-        "KSante": "KSante",
-        "K'Sante": "KSante",
-        "Renata": "Renata",
-        "Renata Glasc": "Renata",
-        "BelVeth": "Belveth",
-        "Bel'Veth": "Belveth",
-        "KhaZix": "Khazix",
-        "Kha'Zix": "Khazix",
-        "VelKoz": "Velkoz",
-        "Vel'Koz": "Velkoz",
-        "ChoGath": "Chogath",
-        "Cho'Gath": "Chogath",
-        "KaiSa": "Kaisa",
-        "Kai'Sa": "Kaisa",
-        "LeBlanc": "Leblanc",
-        "JarvanIV": "JarvanIV",
-        "Jarvan IV": "JarvanIV",
-        "XinZhao": "XinZhao",
-        "Xin Zhao": "XinZhao",
-        "MasterYi": "MasterYi",
-        "Master Yi": "MasterYi",
-        "MissFortune": "MissFortune",
-        "Miss Fortune": "MissFortune",
-        "TahmKench": "TahmKench",
-        "Tahm Kench": "TahmKench",
-        "TwistedFate": "TwistedFate",
-        "Twisted Fate": "TwistedFate",
-        "AurelionSol": "AurelionSol",
-        "Aurelion Sol": "AurelionSol",
-        "DrMundo": "DrMundo",
-        "Dr. Mundo": "DrMundo",
-        "KogMaw": "KogMaw",
-        "Kog'Maw": "KogMaw"
-    }
-    
-    # Use the mapping if champion name exists in it, otherwise use as-is
-    corrected_name = champion_name_mapping.get(champion_name, champion_name)
-    
-    # Latest version - updated to 15.20.1 to include Yunara
-    return f"https://ddragon.leagueoflegends.com/cdn/15.20.1/img/champion/{corrected_name}.png"
 
 # Custom CSS
 st.markdown("""
@@ -192,64 +129,15 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+profiler.checkpoint("Sidebar", "render")
+
 # ============================================================================
 # SIDEBAR
 # ============================================================================
 
-with st.sidebar:
-    st.markdown("### 📂 Sélection d'édition")
-    
-    multi_manager = MultiEditionManager()
-    is_admin = st.session_state.get("authenticated", False)
-    available_editions = multi_manager.list_editions(include_private=is_admin)
-    
-    if not available_editions:
-        st.warning("⚠️ Aucune édition disponible")
-        st.info("💡 Créez une édition dans la page Admin")
-        selected_edition = None
-    else:
-        # Initialiser selected_edition dans session_state si pas déjà fait
-        if "selected_edition" not in st.session_state:
-            st.session_state.selected_edition = 7 if 7 in available_editions else (available_editions[0] if available_editions else None)
-        
-        # Trouver l'index de l'édition sélectionnée
-        default_index = 0
-        if st.session_state.selected_edition in available_editions:
-            default_index = available_editions.index(st.session_state.selected_edition)
-        
-        # Sélecteur visible pour tous les utilisateurs
-        selected_edition = st.selectbox(
-            "Édition",
-            available_editions,
-            index=default_index,
-            format_func=lambda x: f"Edition {x}",
-            label_visibility="collapsed",
-            key="edition_selector_players"
-        )
-        
-        # Sauvegarder dans session_state
-        st.session_state.selected_edition = selected_edition
-        
-        if selected_edition:
-            edition_manager = EditionDataManager(selected_edition)
-            config = edition_manager.load_config()
-            
-            if config:
-                st.markdown(f"**{config.get('name', 'N/A')}**")
-                st.caption(f"📆 {config.get('start_date', 'N/A')} → {config.get('end_date', 'N/A')}")
-    
-    st.markdown("---")
-    st.markdown("### 🧭 Navigation")
-    st.page_link("app.py", label="🏠 Accueil")
-    st.page_link("pages/1_📊_Stats_Generales.py", label="📊 Stats Générales")
-    st.page_link("pages/2_Liste_des_Matchs.py", label="📋 Liste des Matchs")
-    st.page_link("pages/3_🐉_Stats_Champions.py", label="🐉 Stats Champions")
-    st.page_link("pages/4_🏆_Stats_Equipes.py", label="🏆 Stats Équipes")
-    st.page_link("pages/5_👤_Stats_Joueurs.py", label="👤 Stats Joueurs")
-    st.page_link("pages/6_🔍_Recherche.py", label="🔍 Recherche")
-    st.page_link("pages/9_🔧_Admin.py", label="🔧 Admin")
-    st.markdown("---")
-    st.caption("🎮 OcciLan Stats v2.0")
+multi_manager = get_multi_manager()
+is_admin = st.session_state.get("authenticated", False)
+available_editions, selected_edition = render_sidebar("edition_selector_players")
 
 # ============================================================================
 # MAIN
@@ -264,16 +152,14 @@ if not available_editions or not selected_edition:
 edition_manager = EditionDataManager(selected_edition)
 
 # Load data
-data_dir = Path(__file__).parent.parent.parent.parent / "data" / "editions" / f"edition_{selected_edition}"
-team_stats_path = data_dir / "team_stats.json"
+with profiler.section("load_team_stats", "json"):
+    team_stats_data = edition_manager.load_team_stats()
 
-if not team_stats_path.exists():
-    st.warning("⚠️ Fichier team_stats.json introuvable")
+if not team_stats_data:
+    st.warning("⚠️ Aucune statistique d'équipe disponible")
     st.stop()
 
-with open(team_stats_path, "r", encoding="utf-8") as f:
-    team_stats_data = json.load(f)
-
+profiler.checkpoint("Liste des joueurs", "compute")
 # Extract all players
 all_players = []
 for team_name, team_data in team_stats_data.items():
@@ -286,6 +172,76 @@ for team_name, team_data in team_stats_data.items():
         }
         all_players.append(player_entry)
 
+@st.cache_resource(show_spinner=False)
+def load_participant_matrix(edition: int, version):
+    """Matrice des participants (memmap), ouverte une fois par version et partagée entre sessions"""
+    if version is None:
+        # Pas de matrice (checkout / déploiement, ou édition calculée avant son introduction)
+        matrix = EditionDataManager(edition).ensure_participant_matrix()
+        return matrix.load() if matrix is not None else None
+    return EditionDataManager(edition).participants.load()
+
+
+def apply_game_filter(player: dict, filtered: dict) -> dict:
+    """Remplace les moyennes du joueur par celles des parties retenues par le filtre"""
+    return {
+        **player,
+        "games_played": filtered["games"],
+        "wins": filtered["wins"],
+        "losses": filtered["losses"],
+        "winrate": filtered["winrate"],
+        "average_kills": filtered["kills"],
+        "average_deaths": filtered["deaths"],
+        "average_assists": filtered["assists"],
+        "average_kda": filtered["kda"],
+        "average_cs_per_min": filtered["cs_per_min"],
+        "average_cs_per_minute": filtered["cs_per_min"],
+        "average_vision_score": filtered["vision"],
+        "average_gold_per_min": filtered["gold_per_min"],
+        "average_damage_per_min": filtered["damage_per_min"],
+        "champions_played": filtered["champions"],
+        "unique_champions_played": len(filtered["champions"])
+    }
+
+
+profiler.checkpoint("Filtre par parties", "compute")
+# Filtres champion / période: agrégats recalculés depuis la matrice des participants
+with profiler.section("load_participant_matrix", "json"):
+    matrix = load_participant_matrix(selected_edition, edition_manager.participants.version())
+
+if matrix is not None and len(matrix):
+    creation = matrix.column("game_creation")
+    first_day = datetime.fromtimestamp(int(creation.min())).date()
+    last_day = datetime.fromtimestamp(int(creation.max())).date()
+    
+    with st.expander("🔎 Filtrer les parties (champions, période)"):
+        fcol1, fcol2 = st.columns(2)
+        with fcol1:
+            filter_champions = st.multiselect(
+                "🐉 Champions",
+                sorted(matrix.values("champion")),
+                key="champion_filter"
+            )
+        with fcol2:
+            date_range = st.date_input(
+                "📆 Période",
+                value=(first_day, last_day),
+                min_value=first_day,
+                max_value=last_day,
+                key="date_filter"
+            )
+    
+    start = end = None
+    if isinstance(date_range, (list, tuple)) and len(date_range) == 2 and tuple(date_range) != (first_day, last_day):
+        start = int(datetime.combine(date_range[0], time.min).timestamp())
+        end = int(datetime.combine(date_range[1], time.max).timestamp())
+    
+    if filter_champions or start is not None:
+        mask = matrix.mask(start=start, end=end, champion=filter_champions or None)
+        filtered_players = {row["player"]: row for row in matrix.aggregate(mask, by="player")}
+        all_players = [apply_game_filter(p, filtered_players[p["name"]]) for p in all_players if p["name"] in filtered_players]
+        st.caption(f"🔎 {int(mask.sum())} participations retenues sur {len(matrix)}")
+
 # Fonction pour fusionner les stats de l'ADC de Donne ta jungle
 def get_obli_aliases_and_merge(players_list):
     # Fusionne les stats de l'ADC de Donne ta jungle sur tous ses comptes
@@ -320,9 +276,12 @@ if not all_players:
     st.warning("⚠️ Aucune statistique de joueur disponible")
     st.stop()
 
+profiler.checkpoint("DataFrame joueurs", "dataframe")
 # Convert to DataFrame
 df = pd.DataFrame(all_players)
 
+profiler.checkpoint("Filtres et tri", "dataframe")
+
 # ============================================================================
 # FILTERS AND SORTING
 # ============================================================================
@@ -383,6 +342,8 @@ sort_column = sort_mapping.get(sort_by, "average_kda")
 if sort_column in filtered_df.columns:
     filtered_df = filtered_df.sort_values(by=sort_column, ascending=False)
 
+profiler.checkpoint("Podium", "html")
+
 # ============================================================================
 # TOP PLAYERS PODIUM
 # ============================================================================
@@ -428,6 +389,7 @@ if len(filtered_df) >= 3:
 st.markdown("---")
 st.markdown("### 📋 Classement Complet")
 
+profiler.checkpoint("Classement: tableau HTML", "html")
 # Build table HTML
 table_html = '''
 <table style="width: 100%; border-collapse: collapse; font-family: 'Inter', sans-serif; margin-top: 16px; box-shadow: 0 2px 8px rgba(0,0,0,0.2); border-radius: 8px; overflow: hidden;">
@@ -523,10 +485,12 @@ table_html += '''
 </table>
 '''
 
+profiler.checkpoint("Classement: rendu", "render")
 # Use st.components for proper HTML rendering
 import streamlit.components.v1 as components
 components.html(table_html, height=3500, scrolling=True)
 
+profiler.checkpoint("Boutons profils", "render")
 # Boutons cliquables pour voir les profils des joueurs
 st.markdown("---")
 st.markdown("### 👁️ Voir le profil d'un joueur")
@@ -538,6 +502,8 @@ for idx, (_, player) in enumerate(filtered_df.iterrows()):
             st.session_state["search_player"] = player['name']
             st.switch_page("pages/6_🔍_Recherche.py")
 
+profiler.checkpoint("Résumé", "render")
+
 # ============================================================================
 # STATISTICS SUMMARY
 # ============================================================================
@@ -567,3 +533,49 @@ with col3:
 with col4:
     total_players = len(filtered_df)
     st.metric("Joueurs", total_players)
+
+profiler.checkpoint("Classement all-time", "compute")
+
+# ============================================================================
+# ALL-TIME LEADERBOARD
+# ============================================================================
+
+st.markdown("---")
+st.markdown("### 🏛️ Classement All-Time")
+st.caption("Toutes éditions confondues, par compte (anciens comptes fusionnés)")
+
+col1, col2 = st.columns(2)
+with col1:
+    all_time_sort = st.selectbox(
+        "Trier par",
+        ["average_kda", "games", "winrate", "average_kills", "average_cs_per_min", "unique_champions_played"],
+        format_func=lambda key: {
+            "average_kda": "KDA", "games": "Parties", "winrate": "Winrate",
+            "average_kills": "Kills/G", "average_cs_per_min": "CS/min",
+            "unique_champions_played": "Champions joués"
+        }[key],
+        key="all_time_sort"
+    )
+with col2:
+    all_time_min_games = st.number_input("Parties minimum", min_value=0, value=5, step=1, key="all_time_min_games")
+
+leaderboard = multi_manager.all_time_leaderboard(
+    sort_by=all_time_sort, min_games=all_time_min_games, limit=50, include_private=is_admin
+)
+
+if leaderboard:
+    st.dataframe(pd.DataFrame([{
+        "Joueur": row["name"],
+        "Équipes": ", ".join(row["teams"]),
+        "Éditions": ", ".join(str(edition) for edition in row["editions"]),
+        "Parties": row["games"],
+        "Winrate": f"{row['winrate']:.0f}%",
+        "KDA": row["average_kda"],
+        "K/D/A": f"{row['average_kills']:.1f} / {row['average_deaths']:.1f} / {row['average_assists']:.1f}",
+        "CS/min": row["average_cs_per_min"],
+        "Champions": ", ".join(row["champion_pool"][:3])
+    } for row in leaderboard]), hide_index=True, width="stretch")
+else:
+    st.info("Aucun joueur ne correspond à ces critères")
+
+profiler.render_sidebar()
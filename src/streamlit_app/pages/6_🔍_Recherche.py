@@ -12,48 +12,25 @@ Permet de rechercher un joueur ou une équipe et afficher ses statistiques déta
 """
 
 import streamlit as st
-import pandas as pd
 from pathlib import Path
 import sys
-import json
 from datetime import datetime
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.core.data_manager import EditionDataManager, MultiEditionManager
+from src.core.data_manager import EditionDataManager
+from components.assets import get_champion_icon_url, get_role_icon_url
+from components.app_shell import lazy_module, render_sidebar
+from components.profiler import start_page
+
+# Chargés au premier tableau / graphique
+pd = lazy_module("pandas")
+go = lazy_module("plotly.graph_objects")
 
 st.set_page_config(page_title="Recherche - OcciLan Stats", page_icon="🔍", layout="wide")
+profiler = start_page("Recherche")
 
-# Helper function for champion icons
-def get_champion_icon_url(champion_name: str) -> str:
-    """Get Data Dragon champion icon URL"""
-    champion_name_mapping = {
-        "Wukong": "MonkeyKing",  # DataDragon attend MonkeyKing
-        "MonkeyKing": "MonkeyKing",
-        "FiddleSticks": "Fiddlesticks",
-        "Nunu": "Nunu",
-        "RekSai": "RekSai",
-        "KSante": "KSante",
-        "Renata": "Renata",
-        "BelVeth": "Belveth",
-        "KhaZix": "Khazix",
-        "VelKoz": "Velkoz",
-        "ChoGath": "Chogath",
-        "KaiSa": "Kaisa",
-        "LeBlanc": "Leblanc",
-        "JarvanIV": "JarvanIV",
-        "XinZhao": "XinZhao",
-        "Xin Zhao": "XinZhao",
-        "MasterYi": "MasterYi",
-        "MissFortune": "MissFortune",
-        "TahmKench": "TahmKench",
-        "TwistedFate": "TwistedFate",
-        "AurelionSol": "AurelionSol",
-        "DrMundo": "DrMundo"
-    }
-    corrected_name = champion_name_mapping.get(champion_name, champion_name)
-    return f"https://ddragon.leagueoflegends.com/cdn/15.20.1/img/champion/{corrected_name}.png"
 
 # Custom CSS
 st.markdown("""
@@ -118,64 +95,13 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+profiler.checkpoint("Sidebar", "render")
+
 # ============================================================================
 # SIDEBAR
 # ============================================================================
 
-multi_manager = MultiEditionManager()
-available_editions = multi_manager.list_editions()
-
-with st.sidebar:
-    st.title("🎮 OcciLan Stats")
-    
-    with st.expander("📂 Sélection d'édition", expanded=True):
-        if not available_editions:
-            st.warning("⚠️ Aucune édition disponible")
-            st.info("💡 Créez une édition dans la page Admin")
-            selected_edition = None
-        else:
-            # Initialiser selected_edition dans session_state si pas déjà fait
-            if "selected_edition" not in st.session_state:
-                st.session_state.selected_edition = 7 if 7 in available_editions else (available_editions[0] if available_editions else None)
-            
-            # Trouver l'index de l'édition sélectionnée
-            default_index = 0
-            if st.session_state.selected_edition in available_editions:
-                default_index = available_editions.index(st.session_state.selected_edition)
-            
-            # Sélecteur visible pour tous les utilisateurs
-            selected_edition = st.selectbox(
-                "Édition",
-                available_editions,
-                index=default_index,
-                format_func=lambda x: f"Edition {x}",
-                label_visibility="collapsed",
-                key="edition_selector_search"
-            )
-            
-            # Sauvegarder dans session_state
-            st.session_state.selected_edition = selected_edition
-            
-            if selected_edition:
-                edition_manager = EditionDataManager(selected_edition)
-                config = edition_manager.load_config()
-                
-                if config:
-                    st.markdown(f"**{config.get('name', 'N/A')}**")
-                    st.caption(f"📆 {config.get('start_date', 'N/A')} → {config.get('end_date', 'N/A')}")
-    
-    st.markdown("---")
-    st.markdown("### 🧭 Navigation")
-    st.page_link("app.py", label="🏠 Accueil")
-    st.page_link("pages/1_📊_Stats_Generales.py", label="📊 Stats Générales")
-    st.page_link("pages/2_Liste_des_Matchs.py", label="📋 Liste des Matchs")
-    st.page_link("pages/3_🐉_Stats_Champions.py", label="🐉 Stats Champions")
-    st.page_link("pages/4_🏆_Stats_Equipes.py", label="🏆 Stats Équipes")
-    st.page_link("pages/5_👤_Stats_Joueurs.py", label="👤 Stats Joueurs")
-    st.page_link("pages/6_🔍_Recherche.py", label="🔍 Recherche")
-    st.page_link("pages/9_🔧_Admin.py", label="🔧 Admin")
-    st.markdown("---")
-    st.caption("🎮 OcciLan Stats v2.0")
+available_editions, selected_edition = render_sidebar("edition_selector_search", include_private=True, expander=True)
 
 # ============================================================================
 # MAIN
@@ -190,21 +116,27 @@ if not available_editions or not selected_edition:
 edition_manager = EditionDataManager(selected_edition)
 
 # Load data
-team_stats_path = edition_manager.edition_path / "team_stats.json"
-match_details_path = edition_manager.edition_path / "match_details.json"
+with profiler.section("load_team_stats", "json"):
+    team_stats_data = edition_manager.load_team_stats()
 
-if not team_stats_path.exists():
-    st.warning("⚠️ Fichier team_stats.json introuvable")
+if not team_stats_data:
+    st.warning("⚠️ Aucune statistique d'équipe disponible")
     st.stop()
 
-with open(team_stats_path, "r", encoding="utf-8") as f:
-    team_stats_data = json.load(f)
+@st.cache_resource(show_spinner=False)
+def load_participant_matrix(edition: int, version):
+    """Matrice des participants (memmap), ouverte une fois par version et partagée entre sessions"""
+    if version is None:
+        # Pas de matrice (checkout / déploiement, ou édition calculée avant son introduction)
+        matrix = EditionDataManager(edition).ensure_participant_matrix()
+        return matrix.load() if matrix is not None else None
+    return EditionDataManager(edition).participants.load()
+
 
-# Load match details if available
-match_details = {}
-if match_details_path.exists():
-    with open(match_details_path, "r", encoding="utf-8") as f:
-        match_details = json.load(f)
+# Participations par match (filtrées par masques, sans charger match_details)
+with profiler.section("load_participant_matrix", "json"):
+    matrix = load_participant_matrix(selected_edition, edition_manager.participants.version())
+profiler.checkpoint("Index joueurs / équipes", "compute")
 # Create player -> team mapping
 player_to_team = {}
 for team_name, team_data in team_stats_data.items():
@@ -216,14 +148,13 @@ for team_name, team_data in team_stats_data.items():
 all_players = []
 all_teams = list(team_stats_data.keys())
 
+# Mapping des rôles depuis teams.json (chargé une seule fois)
+with profiler.section("load_teams", "json"):
+    teams_json = edition_manager.load_teams()
+profiler.checkpoint("Index joueurs / équipes", "compute")
+
 for team_name, team_data in team_stats_data.items():
     players_dict = team_data.get("players", {})
-    # Charger le mapping des rôles depuis teams.json
-    try:
-        with open(str(edition_manager.edition_path / "teams.json"), "r", encoding="utf-8") as tf:
-            teams_json = json.load(tf)
-    except Exception:
-        teams_json = {}
     team_players = teams_json.get(team_name, {}).get("players", [])
     player_roles = {p["gameName"]: p["role"] for p in team_players if "gameName" in p and "role" in p}
     for player_name, pstats in players_dict.items():
@@ -266,6 +197,7 @@ def get_obli_aliases_and_merge(players_list):
 # Remplacer la création de all_players par :
 all_players = get_obli_aliases_and_merge(all_players)
 
+profiler.checkpoint("Sélection", "render")
 # Search type selector
 search_type = st.radio(
     "Type de recherche",
@@ -328,29 +260,59 @@ if search_type == "👤 Joueur":
                     player_aliases.add(normalize_name(acc_name))
                 if acc_name:
                     player_aliases.add(normalize_name(acc_name))
+            # Participations dont le Riot ID correspond à un alias du joueur
+            player_mask = None
+            if matrix is not None:
+                player_riot_ids = [
+                    riot_id for riot_id in matrix.values("riot_id")
+                    if normalize_name(riot_id) in player_aliases
+                    or normalize_name(riot_id.split('#')[0]) in player_aliases
+                ]
+                player_mask = matrix.mask(riot_id=player_riot_ids)
             pstats = player_data["stats"]
             team_name = player_data["team"]
             role = pstats.get("role", "")
-            def get_role_icon_url(role: str, size: int = 24) -> str:
-                role_norm = role.upper()
-                if role_norm in ["TOP"]:
-                    key = "position-top.svg"
-                elif role_norm in ["JGL", "JUNGLE"]:
-                    key = "position-jungle.svg"
-                elif role_norm in ["MID", "MIDDLE"]:
-                    key = "position-middle.svg"
-                elif role_norm in ["ADC", "BOTTOM"]:
-                    key = "position-bottom.svg"
-                elif role_norm in ["SUP", "SUPP", "UTILITY"]:
-                    key = "position-utility.svg"
-                else:
-                    key = "position-top.svg"
-                return f"https://raw.communitydragon.org/pbe/plugins/rcp-fe-lol-static-assets/global/default/svg/{key}"
             role_icon_url = get_role_icon_url(role)
             st.markdown("---")
             st.markdown(f"## <img src='{role_icon_url}' style='width:22px;vertical-align:middle;margin-right:6px;' title='{role}'> Statistiques de {selected_player_name}", unsafe_allow_html=True)
             st.caption(f"**Équipe:** {team_name}")
             
+            # Rang au début du tournoi et courbe de LP (historique de l'étape 3, sans appel API)
+            with profiler.section("rank_history", "json"):
+                player_puuid = next((
+                    p["puuid"] for team in edition_manager.load_teams_with_puuid().values()
+                    for p in team.get("players", [])
+                    if p.get("puuid") and normalize_name(f"{p.get('gameName')}#{p.get('tagLine')}") in player_aliases
+                ), None)
+                rank_history = edition_manager.rank_history
+                lp_points = rank_history.lp_progression(player_puuid) if player_puuid else []
+            if lp_points:
+                with st.expander("📈 Évolution du rang"):
+                    start_date = (edition_manager.load_config() or {}).get("start_date")
+                    if start_date:
+                        start_rank = rank_history.rank_at(player_puuid, int(datetime.strptime(start_date, "%Y-%m-%d").timestamp()))
+                        if start_rank:
+                            division = "" if start_rank["tier"] in ("MASTER", "GRANDMASTER", "CHALLENGER") else f" {start_rank['rank']}"
+                            st.caption(f"**Rang au début du tournoi:** {start_rank['tier']}{division} ({start_rank['leaguePoints']} LP)")
+                    fig_lp = go.Figure(go.Scatter(
+                        x=[datetime.fromtimestamp(point["timestamp"]) for point in lp_points],
+                        y=[point["score"] for point in lp_points],
+                        text=[point["label"] for point in lp_points],
+                        hovertemplate="%{text}<extra></extra>",
+                        mode="lines+markers",
+                        line=dict(color="#a78bfa")
+                    ))
+                    fig_lp.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='white'),
+                        height=300,
+                        yaxis=dict(showticklabels=False, title="LP"),
+                        margin=dict(t=10, b=10)
+                    )
+                    st.plotly_chart(fig_lp, use_container_width=True)
+            
+            profiler.checkpoint("KPIs joueur", "html")
             # Main stats KPIs
             col1, col2, col3, col4 = st.columns(4)
             
@@ -401,6 +363,7 @@ if search_type == "👤 Joueur":
             st.markdown("---")
             st.markdown("### 🎮 Champions les plus joués")
             
+            profiler.checkpoint("Pool de champions", "html")
             champions = pstats.get("champions_played", [])
             if champions:
                 st.markdown("#### Pool de champions")
@@ -420,87 +383,27 @@ if search_type == "👤 Joueur":
                 st.markdown(champs_html, unsafe_allow_html=True)
                 st.caption(f"**{len(champions)} champions** joués")
                 
-                # Champion statistics from match details
-                if match_details:
-                    # DEBUG : Affiche tous les identifiants trouvés dans les participants des matchs (dans le bloc principal du joueur)
-                    debug_names = set()
-                    for match_id, match_data in match_details.items():
-                        participants = match_data.get("info", {}).get("participants", [])
-                        for participant in participants:
-                            for key in ["riotIdGameName", "summonerName", "gameName"]:
-                                val = participant.get(key)
-                                if val:
-                                    debug_names.add(normalize_name(val))
-                            gname = participant.get("gameName")
-                            tline = participant.get("tagLine")
-                            if gname and tline:
-                                debug_names.add(normalize_name(f"{gname}#{tline}"))
-                    # Collect champion stats avec matching enrichi
-                    champion_stats = {}
-                    for match_id, match_data in match_details.items():
-                        participants = match_data.get("info", {}).get("participants", [])
-                        for participant in participants:
-                            names_to_check = set()
-                            for key in ["riotIdGameName", "summonerName", "gameName"]:
-                                val = participant.get(key)
-                                if val:
-                                    names_to_check.add(normalize_name(val))
-                            gname = participant.get("gameName")
-                            tline = participant.get("tagLine")
-                            if gname and tline:
-                                names_to_check.add(normalize_name(f"{gname}#{tline}"))
-                            riot_name = participant.get("riotIdGameName")
-                            riot_tag = participant.get("riotIdTagline")
-                            if riot_name and riot_tag:
-                                names_to_check.add(normalize_name(f"{riot_name}#{riot_tag}"))
-                            # Compare avec tous les alias du joueur sélectionné
-                            if any(n in player_aliases for n in names_to_check):
-                                champ = participant.get("championName", "Unknown")
-                                if champ not in champion_stats:
-                                    champion_stats[champ] = {"wins": 0, "losses": 0, "games": 0, "kills": 0, "deaths": 0, "assists": 0, "kda_values": []}
-                                champion_stats[champ]["games"] += 1
-                                if participant.get("win"):
-                                    champion_stats[champ]["wins"] += 1
-                                else:
-                                    champion_stats[champ]["losses"] += 1
-                                champion_stats[champ]["kills"] += participant.get("kills", 0)
-                                champion_stats[champ]["deaths"] += participant.get("deaths", 0)
-                                champion_stats[champ]["assists"] += participant.get("assists", 0)
-                                kills = participant.get("kills", 0)
-                                deaths = participant.get("deaths", 0)
-                                assists = participant.get("assists", 0)
-                                kda = ((kills + assists) / deaths) if deaths > 0 else kills + assists
-                                champion_stats[champ]["kda_values"].append(kda)
-                                # Calculate KP: (player kills + assists) / team total kills
-                                team_id = participant.get("teamId")
-                                team_kills = sum(p.get("kills", 0) for p in participants if p.get("teamId") == team_id)
-                                kp = ((kills + assists) / team_kills * 100) if team_kills > 0 else 0
-                                if "kp_values" not in champion_stats[champ]:
-                                    champion_stats[champ]["kp_values"] = []
-                                champion_stats[champ]["kp_values"].append(kp)
-                                break
+                # Champion statistics from the participant matrix
+                if player_mask is not None:
+                    profiler.checkpoint("Stats par champion", "compute")
+                    champion_rows = matrix.aggregate(player_mask, by="champion")
                     
-                    if champion_stats:
-                        import plotly.graph_objects as go
-                        import plotly.express as px
-                        
+                    if champion_rows:
                         # Prepare data for chart
-                        champ_data = []
-                        for champ, stats in champion_stats.items():
-                            avg_kp = sum(stats.get("kp_values", [])) / len(stats.get("kp_values", [])) if stats.get("kp_values") else 0
-                            champ_data.append({
-                                "champion": champ,
-                                "wins": stats["wins"],
-                                "losses": stats["losses"],
-                                "games": stats["games"],
-                                "winrate": (stats["wins"] / stats["games"] * 100) if stats["games"] > 0 else 0,
-                                "kda": sum(stats["kda_values"]) / len(stats["kda_values"]) if stats["kda_values"] else 0,
-                                "kp": avg_kp
-                            })
+                        champ_data = [{
+                            "champion": row["champion"],
+                            "wins": row["wins"],
+                            "losses": row["losses"],
+                            "games": row["games"],
+                            "winrate": row["winrate"],
+                            "kda": row["game_kda"],
+                            "kp": row["kp"]
+                        } for row in champion_rows]
                         
                         # Sort by games played
                         champ_data = sorted(champ_data, key=lambda x: x["games"], reverse=True)
                         
+                        profiler.checkpoint("Graphique champions", "plotly")
                         # Winrate bar chart
                         st.markdown("#### Nombre de games par champion")
                         fig = go.Figure()
@@ -528,11 +431,10 @@ if search_type == "👤 Joueur":
                         )
                         st.plotly_chart(fig, use_container_width=True)
                         
+                        profiler.checkpoint("Tableau champions", "dataframe")
                         # Champion stats table - Style DataFrame like SC-Esport-Stats
                         st.markdown("#### CHAMPIONS STATS")
                         
-                        import pandas as pd
-                        
                         # Prepare DataFrame with HTML formatting
                         df_data = []
                         for champ in champ_data:
@@ -625,102 +527,44 @@ if search_type == "👤 Joueur":
                         st.markdown(df_champ.to_html(escape=False, index=False, classes='dataframe'), unsafe_allow_html=True)
             
             # Match history (if available)
-            if match_details:
+            if player_mask is not None:
                 st.markdown("---")
                 st.markdown("### 📋 Historique des parties")
                 
-                # Filter matches for this player (robuste sur tous les alias)
-                player_matches = []
-                for match_id, match_data in match_details.items():
-                    participants = match_data.get("info", {}).get("participants", [])
-                    for participant in participants:
-                        # Récupère tous les identifiants possibles du participant
-                        names_to_check = set()
-                        for key in ["riotIdGameName", "summonerName", "gameName"]:
-                            val = participant.get(key)
-                            if val:
-                                names_to_check.add(normalize_name(val))
-                        # Ajoute gameName#tagLine si possible
-                        gname = participant.get("gameName")
-                        tline = participant.get("tagLine")
-                        if gname and tline:
-                            names_to_check.add(normalize_name(f"{gname}#{tline}"))
-                        # Ajoute riotIdGameName#riotIdTagline si possible (édition 7)
-                        riot_name = participant.get("riotIdGameName")
-                        riot_tag = participant.get("riotIdTagline")
-                        if riot_name and riot_tag:
-                            names_to_check.add(normalize_name(f"{riot_name}#{riot_tag}"))
-                        # Compare avec tous les alias du joueur sélectionné
-                        # On normalise aussi le nom sélectionné pour garantir le matching
-                        if any(n in player_aliases for n in names_to_check):
-                            player_matches.append({
-                                "match_id": match_id,
-                                "match_data": match_data,
-                                "player_data": participant
-                            })
-                            break
+                profiler.checkpoint("Historique: filtre des matchs", "compute")
+                # Last 25 matches of this player (robuste sur tous les alias)
+                player_games = matrix.rows(player_mask, limit=25)
                 
-                if player_matches:
-                    # Sort by date (most recent first)
-                    player_matches = sorted(
-                        player_matches,
-                        key=lambda x: x["match_data"].get("info", {}).get("gameCreation", 0),
-                        reverse=True
-                    )
-                    
+                if player_games:
                     match_rows = []
-                    for match_info in player_matches[:25]:  # Last 25 matches
-                        player_data = match_info["player_data"]
-                        match_data = match_info["match_data"]
-                        info = match_data.get("info", {})
-                        
-                        champion = player_data.get("championName", "Unknown")
-                        win = player_data.get("win", False)
-                        kills = player_data.get("kills", 0)
-                        deaths = player_data.get("deaths", 0)
-                        assists = player_data.get("assists", 0)
+                    for game in player_games:
+                        kills = game["kills"]
+                        deaths = game["deaths"]
+                        assists = game["assists"]
                         kda_val = ((kills + assists) / deaths) if deaths > 0 else kills + assists
-                        cs = player_data.get("totalMinionsKilled", 0) + player_data.get("neutralMinionsKilled", 0)
-                        game_duration = info.get("gameDuration", 0)
-                        cs_per_min_match = (cs / (game_duration / 60)) if game_duration > 0 else 0
-                        vision_score = player_data.get("visionScore", 0)
-                        gold = player_data.get("goldEarned", 0)
-                        kp = player_data.get("challenges", {}).get("killParticipation", 0) * 100
-                        damage = player_data.get("totalDamageDealtToChampions", 0)
+                        game_duration = game["duration"]
+                        cs_per_min_match = (game["cs"] / (game_duration / 60)) if game_duration > 0 else 0
+                        kp = ((kills + assists) / game["team_kills"] * 100) if game["team_kills"] > 0 else 0
+                        gold = game["gold"]
+                        damage = game["damage"]
                         
                         # Calculate gold efficiency: (damage / gold) * 1000
                         gold_efficiency = round((damage / gold) * 1000, 1) if gold > 0 else 0
                         
-                        # Get game date
-                        game_creation = info.get("gameCreation", 0)
-                        from datetime import datetime
-                        game_date = datetime.fromtimestamp(game_creation / 1000).strftime("%d/%m/%Y") if game_creation > 0 else "N/A"
-                        
-                        # Find opponent team
-                        opponent = "N/A"
-                        player_team_id = player_data.get("teamId")
-                        if player_team_id:
-                            # Find an opponent player (different teamId)
-                            participants = info.get("participants", [])
-                            for participant in participants:
-                                if participant.get("teamId") != player_team_id:
-                                    opponent_name = participant.get("riotIdGameName") or participant.get("summonerName", "")
-                                    if opponent_name in player_to_team:
-                                        opponent = player_to_team[opponent_name]
-                                        break
+                        game_date = datetime.fromtimestamp(game["game_creation"]).strftime("%d/%m/%Y") if game["game_creation"] > 0 else "N/A"
                         
                         match_rows.append({
                             "date": game_date,
-                            "champion": champion,
-                            "win": win,
-                            "opponent": opponent,
+                            "champion": game["champion"],
+                            "win": game["win"],
+                            "opponent": game["opponent"],
                             "kills": kills,
                             "deaths": deaths,
                             "assists": assists,
                             "kda": kda_val,
                             "kp": kp,
                             "cs_per_min": cs_per_min_match,
-                            "vision": vision_score,
+                            "vision": game["vision"],
                             "gold": gold,
                             "duration": game_duration,
                             "damage": damage,
@@ -728,6 +572,7 @@ if search_type == "👤 Joueur":
                         })
                     
                     if match_rows:
+                        profiler.checkpoint("Historique: tableau HTML", "dataframe")
                         # Create DataFrame like SC-Esport-Stats
                         df_matches = []
                         for match in match_rows:
@@ -789,6 +634,7 @@ if search_type == "👤 Joueur":
                 st.info("Les détails des matchs ne sont pas disponibles")
 
 else:
+    profiler.checkpoint("Recherche équipe", "render")
     # Team search
     st.markdown("---")
     
@@ -821,6 +667,7 @@ else:
         with col4:
             st.metric("Winrate", f"{win_rate:.1f}%")
         
+        profiler.checkpoint("Roster", "dataframe")
         # Players table
         st.markdown("---")
         st.markdown("### 👥 Roster de l'équipe")
@@ -842,3 +689,5 @@ else:
             
             df_players = pd.DataFrame(player_rows)
             st.dataframe(df_players, use_container_width=True, hide_index=True)
+
+profiler.render_sidebar()
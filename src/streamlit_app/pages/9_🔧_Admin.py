@@ -1,9 +1,14 @@
 
 import os
 import streamlit as st
-import pandas as pd
-from src.core.data_manager import EditionDataManager, MultiEditionManager
+from src.core.data_manager import EditionDataManager
+from src.core.rate_limiter import PRIORITY_INTERACTIVE
 from src.pipeline.edition_processor import EditionProcessor
+from src.pipeline.job_runner import get_job_runner
+from components.app_shell import lazy_module, render_sidebar
+
+# Chargé au premier tableau
+pd = lazy_module("pandas")
 
 st.set_page_config(page_title="Admin - OcciLan Stats", page_icon="🔧", layout="wide")
 st.markdown("""
@@ -15,58 +20,7 @@ st.markdown("""
 # ===============================
 # SIDEBAR (toujours visible)
 # ===============================
-multi_manager = MultiEditionManager()
-editions = multi_manager.list_editions()
-with st.sidebar:
-    st.title("🎮 OcciLan Stats")
-    with st.expander("📂 Sélection d'édition", expanded=True):
-        if not editions:
-            st.warning("⚠️ Aucune édition disponible")
-            st.info("💡 Créez une édition dans la page Admin")
-            selected_edition = None
-        else:
-            # Initialiser selected_edition à 7 si elle existe, sinon à la première
-            if "selected_edition" not in st.session_state:
-                if 7 in editions:
-                    st.session_state.selected_edition = 7
-                else:
-                    st.session_state.selected_edition = editions[0]
-            default_index = 0
-            if st.session_state.selected_edition in editions:
-                default_index = editions.index(st.session_state.selected_edition)
-            selected_edition = st.selectbox(
-                "Édition",
-                editions,
-                index=default_index,
-                format_func=lambda x: f"Edition {x}",
-                label_visibility="collapsed",
-                key="edition_selector_admin"
-            )
-            st.session_state.selected_edition = selected_edition
-            if selected_edition:
-                edition_manager = EditionDataManager(selected_edition)
-                config = edition_manager.load_config()
-                if config:
-                    st.markdown(f"**{config.get('name', 'N/A')}**")
-                    st.caption(f"📆 {config.get('start_date', 'N/A')} → {config.get('end_date', 'N/A')}")
-    st.markdown("---")
-    st.markdown("### 🧭 Navigation")
-    st.page_link("app.py", label="🏠 Accueil")
-    st.page_link("pages/1_📊_Stats_Generales.py", label="📊 Stats Générales")
-    st.page_link("pages/2_Liste_des_Matchs.py", label="📋 Liste des Matchs")
-    st.page_link("pages/3_🐉_Stats_Champions.py", label="🐉 Stats Champions")
-    st.page_link("pages/4_🏆_Stats_Equipes.py", label="🏆 Stats Équipes")
-    st.page_link("pages/5_👤_Stats_Joueurs.py", label="👤 Stats Joueurs")
-    st.page_link("pages/6_🔍_Recherche.py", label="🔍 Recherche")
-    st.page_link("pages/9_🔧_Admin.py", label="🔧 Admin")
-    st.markdown("---")
-    st.caption("🎮 OcciLan Stats v2.0")
-
-import os
-import streamlit as st
-import pandas as pd
-from src.core.data_manager import EditionDataManager, MultiEditionManager
-from src.pipeline.edition_processor import EditionProcessor
+editions, selected_edition = render_sidebar("edition_selector_admin", include_private=True, expander=True)
 
 # ============================================================================
 # Authentication page
@@ -90,11 +44,26 @@ if not st.session_state.get("authenticated", False):
 st.title("🔧 Administration")
 st.markdown("Gestion des équipes et traitement des données")
 
+# Traitements en arrière-plan, partagés par toutes les sessions (voir src/pipeline/job_runner.py)
+job_runner = get_job_runner()
+
 # Logout button
 if st.button("🚪 Déconnexion", type="secondary"):
     st.session_state.authenticated = False
     st.rerun()
 
+# Profilage des pages (session courante), voir components/profiler.py
+def _toggle_profiling():
+    st.session_state.profiling = st.session_state._profiling_toggle
+
+st.toggle(
+    "⏱️ Profilage des pages",
+    value=st.session_state.get("profiling", False),
+    key="_profiling_toggle",
+    on_change=_toggle_profiling,
+    help="Affiche dans la sidebar de chaque page le temps et la mémoire par section (JSON, DataFrame, Plotly, HTML)"
+)
+
 # Section pour créer une nouvelle édition
 with st.expander("➕ Créer une nouvelle édition", expanded=False):
     with st.form("create_edition_form"):
@@ -696,13 +665,24 @@ with tab2:
                             if not api_key:
                                 st.error("❌ Clé API manquante")
                             else:
-                                with st.spinner(f"Mise à jour des rangs pour {team_name}..."):
-                                    try:
-                                        # Import EditionProcessor pour utiliser ses méthodes
-                                        processor = EditionProcessor(selected_edition, api_key)
-                                        # ...existing code...
-                                    except Exception as e:
-                                        st.error(f"❌ Erreur: {str(e)}")
+                                active = job_runner.active_job(selected_edition)
+                                if active and {2, 3} & set(active["steps"]):
+                                    st.warning("⏳ Les rangs sont déjà en cours de mise à jour par une tâche")
+                                else:
+                                    with st.spinner(f"Mise à jour des rangs pour {team_name}..."):
+                                        try:
+                                            # Client partagé avec les tâches: ses requêtes passent
+                                            # devant un backfill de matchs en cours (priorité interactive)
+                                            riot_client = job_runner.client(api_key)
+                                            processor = EditionProcessor(selected_edition, api_key, riot_client=riot_client)
+                                            with riot_client.priority(PRIORITY_INTERACTIVE):
+                                                team_data = processor.refresh_team_ranks(team_name)
+                                            if team_data:
+                                                st.success(f"✅ Rangs de {team_name} mis à jour ({len(team_data['players'])} joueurs)")
+                                            else:
+                                                st.error(f"❌ {processor.errors[-1] if processor.errors else 'Équipe introuvable'}")
+                                        except Exception as e:
+                                            st.error(f"❌ Erreur: {str(e)}")
                     st.markdown("---")
                     # Bouton pour modifier le nom de l'équipe
                     edit_mode = st.checkbox(f"✏️ Modifier les rôles et noms de joueurs", key=f"edit_{idx}")
@@ -895,6 +875,16 @@ with tab3:
             st.error("❌ Clé API Riot manquante. Ajoutez RIOT_API_KEY dans le fichier .env")
         else:
             st.success("✅ Clé API Riot détectée")
+            st.caption("Les traitements tournent en arrière-plan: vous pouvez changer de page ou d'édition, "
+                       "leur avancement s'affiche dans « 📋 Tâches en cours ».")
+            
+            def enqueue_job(steps, label):
+                """Ajoute une tâche à la file (une seule tâche active par édition)"""
+                try:
+                    job_runner.submit(selected_edition, steps, api_key, label=label)
+                    st.toast(f"⏳ {label} (édition {selected_edition}) ajouté à la file")
+                except ValueError:
+                    st.warning("⚠️ Un traitement est déjà en cours pour cette édition")
             
             # Boutons individuels pour chaque étape
             st.subheader("🔧 Pipeline par étapes")
@@ -903,83 +893,37 @@ with tab3:
             
             with col1:
                 if st.button("1️⃣ Fetch PUUID", help="Récupère les PUUIDs des joueurs", use_container_width=True):
-                    processor = EditionProcessor(selected_edition, api_key)
-                    
-                    with st.spinner("Récupération des PUUIDs..."):
-                        teams_with_puuid = processor.step2_fetch_puuids()
-                        
-                        if teams_with_puuid:
-                            player_count = sum(len(team.get('players', [])) for team in teams_with_puuid.values())
-                            st.success(f"✅ {len(teams_with_puuid)} équipes, {player_count} joueurs")
-                        else:
-                            st.error("❌ Échec de la récupération des PUUIDs")
+                    enqueue_job([2], "Fetch PUUID")
             
             with col2:
                 if st.button("2️⃣ Fetch Ranks", help="Récupère les rangs des joueurs", use_container_width=True):
-                    processor = EditionProcessor(selected_edition, api_key)
-                    
-                    teams_with_puuid = edition_manager.load_teams_with_puuid()
-                    if not teams_with_puuid:
+                    if not edition_manager.load_teams_with_puuid():
                         st.error("❌ Exécutez d'abord l'étape 1 (Fetch PUUID)")
                     else:
-                        with st.spinner("Récupération des rangs..."):
-                            teams_with_ranks = processor.step3_fetch_ranks()
-                            
-                            if teams_with_ranks:
-                                st.success(f"✅ Rangs mis à jour pour {len(teams_with_ranks)} équipes")
-                            else:
-                                st.error("❌ Échec de la récupération des rangs")
+                        enqueue_job([3], "Fetch Ranks")
             
             with col3:
                 if st.button("3️⃣ Fetch Match IDs", help="Récupère les IDs des matchs", use_container_width=True):
-                    processor = EditionProcessor(selected_edition, api_key)
-                    
-                    teams_with_puuid = edition_manager.load_teams_with_puuid()
-                    if not teams_with_puuid:
+                    if not edition_manager.load_teams_with_puuid():
                         st.error("❌ Exécutez d'abord l'étape 1 (Fetch PUUID)")
                     else:
-                        with st.spinner("Récupération des match IDs..."):
-                            tournament_matches = processor.step4_fetch_match_ids()
-                            
-                            if tournament_matches:
-                                total_matches = sum(len(matches) for matches in tournament_matches.values())
-                                st.success(f"✅ {total_matches} matchs trouvés pour {len(tournament_matches)} équipes")
-                            else:
-                                st.error("❌ Aucun match trouvé")
+                        enqueue_job([4], "Fetch Match IDs")
             
             col4, col5, col6 = st.columns(3)
             
             with col4:
                 if st.button("4️⃣ Fetch Match Details", help="Récupère les détails des matchs", use_container_width=True):
-                    processor = EditionProcessor(selected_edition, api_key)
-                    
-                    tournament_matches = edition_manager.load_tournament_matches()
-                    if not tournament_matches:
+                    if not edition_manager.load_tournament_matches():
                         st.error("❌ Exécutez d'abord l'étape 3 (Fetch Match IDs)")
                     else:
-                        with st.spinner("Récupération des détails..."):
-                            match_details = processor.step5_fetch_match_details(use_cache=True)
-                            
-                            if match_details:
-                                st.success(f"✅ {len(match_details)} matchs détaillés récupérés")
-                            else:
-                                st.error("❌ Échec de la récupération des détails")
+                        enqueue_job([5], "Fetch Match Details")
             
             with col5:
                 if st.button("5️⃣ Calculate Stats", help="Calcule les statistiques", use_container_width=True):
-                    processor = EditionProcessor(selected_edition, api_key)
-                    
-                    match_details = edition_manager.load_match_details()
-                    if not match_details:
+                    if next(edition_manager.iter_match_details(), None) is None:
                         st.error("❌ Exécutez d'abord l'étape 4 (Fetch Match Details)")
                     else:
-                        with st.spinner("Calcul des statistiques..."):
-                            stats = processor.step6_calculate_stats()
-                            
-                            if stats:
-                                st.success(f"✅ Stats calculées: {stats['metadata']['total_players']} joueurs, {stats['metadata']['total_matches_processed']} matchs")
-                            else:
-                                st.error("❌ Échec du calcul des stats")
+                        enqueue_job([6], "Calculate Stats")
             
             with col6:
                 st.write("")  # Espace vide pour alignement
@@ -992,174 +936,150 @@ with tab3:
             
             with col_fetch:
                 if st.button("🎮 Fetch Matchs Tournoi", help="Récupère les matchs de tournoi et calcule les stats (étapes 3-5)", use_container_width=True):
-                    # Initialize processor
-                    processor = EditionProcessor(
-                        edition_id=selected_edition,
-                        api_key=api_key
-                    )
-                    
-                    # Check if teams_with_puuid exists
-                    teams_with_puuid = edition_manager.load_teams_with_puuid()
-                    if not teams_with_puuid:
+                    if not edition_manager.load_teams_with_puuid():
                         st.error("❌ Lancez d'abord les étapes PUUID et Ranks (traitement complet)")
                     else:
-                        progress_bar = st.progress(0)
-                        status_text = st.empty()
-                        
-                        def progress_callback(message: str, progress: float):
-                            status_text.text(message)
-                            progress_bar.progress(min(int(progress), 100))
-                        
-                        processor.progress_callback = progress_callback
-                        
-                        try:
-                            with st.spinner("🎮 Récupération des matchs de tournoi..."):
-                                # Step 4: Fetch match IDs avec type="tourney" ou queue custom
-                                status_text.text("📋 Récupération des IDs de matchs...")
-                                progress_bar.progress(20)
-                                
-                                tournament_matches = processor.step4_fetch_match_ids(
-                                    use_tourney_filter=True  # 🎯 Filtre tournois ou queue custom !
-                                )
-                                
-                                if not tournament_matches:
-                                    progress_bar.empty()
-                                    status_text.empty()
-                                    st.warning("⚠️ Aucun match trouvé")
-                                else:
-                                    total_matches = sum(len(matches) for matches in tournament_matches.values())
-                                    st.info(f"✅ {total_matches} matchs trouvés pour {len(tournament_matches)} équipes")
-                                    
-                                    # Step 5: Fetch match details
-                                    status_text.text("📝 Récupération des détails de matchs...")
-                                    progress_bar.progress(50)
-                                    
-                                    match_details = processor.step5_fetch_match_details(use_cache=True)
-                                    
-                                    if match_details:
-                                        matches_fetched = len(match_details)
-                                        st.info(f"✅ {matches_fetched} matchs détaillés récupérés")
-                                        
-                                        # Step 6: Calculate stats
-                                        status_text.text("📊 Calcul des statistiques...")
-                                        progress_bar.progress(80)
-                                        
-                                        stats_result = processor.step6_calculate_stats()
-                                        
-                                        progress_bar.progress(100)
-                                        progress_bar.empty()
-                                        status_text.empty()
-                                        
-                                        if stats_result:
-                                            champions_count = len(stats_result)
-                                            st.success(f"✅ Pipeline terminé ! {champions_count} champions analysés")
-                                            
-                                            # Afficher le résumé
-                                            col1, col2, col3 = st.columns(3)
-                                            with col1:
-                                                st.metric("Équipes", len(tournament_matches))
-                                            with col2:
-                                                st.metric("Matchs", matches_fetched)
-                                            with col3:
-                                                st.metric("Champions", champions_count)
-                                            
-                                            # Afficher la liste des matchs par équipe
-                                            with st.expander("📋 Matchs par équipe"):
-                                                for team_name, match_ids in tournament_matches.items():
-                                                    st.markdown(f"**{team_name}**: {len(match_ids)} matchs")
-                                                    st.caption(", ".join(match_ids[:5]) + ("..." if len(match_ids) > 5 else ""))
-                                        else:
-                                            st.warning("⚠️ Erreur lors du calcul des stats")
-                                    else:
-                                        st.warning("⚠️ Erreur lors de la récupération des détails")
-                        
-                        except Exception as e:
-                            progress_bar.empty()
-                            status_text.empty()
-                            st.error(f"❌ Erreur: {str(e)}")
-                            st.exception(e)
+                        enqueue_job([4, 5, 6], "Fetch Matchs Tournoi")
             
             with col_full:
-                # Process button (traitement complet)
                 if st.button("🚀 Traitement Complet", type="primary", help="Pipeline complet: PUUID + Ranks + Matchs + Stats", use_container_width=True):
+                    enqueue_job([2, 3, 4, 5, 6], "Traitement Complet")
+        
+        st.markdown("---")
+        
+        # ========================
+        # TÂCHES EN ARRIÈRE-PLAN
+        # ========================
+        JOB_STATUS_LABELS = {
+            "queued": "⏳ En attente",
+            "running": "🔄 En cours",
+            "done": "✅ Terminé",
+            "failed": "❌ Échec",
+            "cancelled": "⏹️ Annulé",
+            "interrupted": "⚠️ Interrompu"
+        }
+        
+        def render_api_metrics(api_metrics):
+            """Temps passé par endpoint API (métriques du client partagé par les tâches)"""
+            totals = api_metrics["totals"]
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Requêtes", totals["requests"])
+            col2.metric("Temps en requêtes", f"{totals['latency_seconds']:.1f}s")
+            col3.metric("Temps d'attente", f"{totals['sleep_seconds']:.1f}s")
+            
+            metrics_rows = []
+            for endpoint, data in api_metrics["endpoints"].items():
+                statuses = data["statuses"]
+                hit_ratio = data["cache"]["hit_ratio"]
+                metrics_rows.append({
+                    "Endpoint": endpoint,
+                    "Requêtes": data["requests"],
+                    "Latence moy. (ms)": round(data["latency"]["avg"] * 1000),
+                    "Latence max (ms)": round(data["latency"]["max"] * 1000),
+                    "Retries": data["retries"],
+                    "429": statuses.get("429", 0),
+                    "5xx": sum(n for code, n in statuses.items() if code.startswith("5")),
+                    "Attente rate limit (s)": round(data["sleep"]["throttle"] + data["sleep"]["retry_after"], 1),
+                    "Attente backoff (s)": round(data["sleep"]["backoff"], 1),
+                    "Cache": f"{hit_ratio:.0%}" if hit_ratio is not None else "-"
+                })
+            st.dataframe(pd.DataFrame(metrics_rows), hide_index=True, width="stretch")
+            
+            # File d'attente par priorité (actions interactives vs backfill)
+            priorities = api_metrics.get("priorities")
+            if priorities:
+                st.dataframe(pd.DataFrame([
+                    {
+                        "Priorité": priority,
+                        "Requêtes": data["requests"],
+                        "En file": data["waiting"],
+                        "Attente moy. (ms)": round(data["avg_wait"] * 1000),
+                        "Attente max (ms)": round(data["max_wait"] * 1000)
+                    }
+                    for priority, data in priorities.items()
+                ]), hide_index=True, width="stretch")
+            
+            # Requêtes par clé API et par région / platform
+            routes = api_metrics.get("routes")
+            if routes and len(routes) > 1:
+                st.dataframe(pd.DataFrame([
+                    {
+                        "Clé / routage": route,
+                        "Requêtes": sum(data["requests"] for data in route_stats.values()),
+                        "Attente (s)": round(sum(data["wait_seconds"] for data in route_stats.values()), 1)
+                    }
+                    for route, route_stats in routes.items()
+                ]), hide_index=True, width="stretch")
+            if api_key:
+                st.download_button(
+                    "📥 Métriques (Prometheus)",
+                    job_runner.client(api_key).dump_metrics(format="prometheus"),
+                    file_name="riot_api_metrics.prom",
+                    mime="text/plain"
+                )
+        
+        def render_jobs():
+            """Tâches de toutes les éditions (plusieurs éditions peuvent tourner en parallèle)"""
+            jobs = job_runner.list_jobs()
+            if not jobs:
+                st.caption("Aucune tâche")
+                return
+            
+            for job in jobs:
+                active = job["status"] in ("queued", "running")
+                title = f"{JOB_STATUS_LABELS.get(job['status'], job['status'])} — Édition {job['edition']} — {job['label']}"
+                
+                with st.container(border=True):
+                    col_info, col_action = st.columns([4, 1])
+                    with col_info:
+                        st.markdown(f"**{title}**")
+                        if active:
+                            st.progress(min(int(job["progress"]), 100), text=job["message"])
+                        else:
+                            started = (job.get("started_at") or job["created_at"])[:19].replace("T", " ")
+                            st.caption(f"Lancée le {started} — {job['message']}")
+                        if job.get("error"):
+                            st.error(job["error"])
                     
-                    # Initialize processor
-                    processor = EditionProcessor(
-                        edition_id=selected_edition,
-                        api_key=api_key
-                    )
-                    
-                    # Create progress containers
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    step_details = st.empty()
-                    
-                    # Progress callback for UI updates
-                    def progress_callback(message: str, progress: float):
-                        status_text.text(message)
-                        progress_bar.progress(int(progress))
-                    
-                    processor.progress_callback = progress_callback
+                    with col_action:
+                        if active:
+                            if st.button("⏹️ Annuler", key=f"cancel_job_{job['id']}", use_container_width=True):
+                                job_runner.cancel(job["id"])
+                                st.rerun()
+                        elif job["status"] in ("failed", "cancelled", "interrupted") and api_key:
+                            if st.button("▶️ Reprendre", key=f"resume_job_{job['id']}", use_container_width=True,
+                                         help="Relance les étapes non terminées (seuls les matchs manquants sont récupérés)"):
+                                if not job_runner.resume(job["id"], api_key):
+                                    st.warning("⚠️ Un traitement est déjà en cours pour cette édition")
+                                st.rerun()
                     
-                    try:
-                        with st.spinner("Pipeline en cours d'exécution..."):
-                            # Run full pipeline
-                            results = processor.run_full_pipeline(use_cache=True)
-                            
-                            # Clear progress
-                            progress_bar.empty()
-                            status_text.empty()
-                            
-                            # Display results
-                            if results.get("success"):
-                                st.success("✅ Pipeline terminé avec succès!")
-                                st.balloons()
-                                
-                                # Show summary
-                                col1, col2, col3 = st.columns(3)
-                                
-                                with col1:
-                                    teams_count = results["steps"]["step2_puuids"]["teams_count"]
-                                    st.metric("Équipes traitées", teams_count)
-                                
-                                with col2:
-                                    matches_count = results["steps"]["step5_match_details"]["matches_fetched"]
-                                    st.metric("Matchs analysés", matches_count)
-                                
-                                with col3:
-                                    duration = results["duration_seconds"]
-                                    st.metric("Durée", f"{duration:.1f}s")
-                                
-                                # Show detailed steps
-                                with st.expander("📋 Détails du pipeline"):
-                                    for step_name, step_data in results["steps"].items():
-                                        status_icon = "✅" if step_data.get("success") else "❌"
-                                        st.markdown(f"{status_icon} **{step_name}**: {step_data}")
-                            
-                            else:
-                                st.error("❌ Le pipeline a rencontré des erreurs")
-                                
-                                # Show errors
-                                if results.get("errors"):
-                                    st.error("**Erreurs:**")
-                                    for error in results["errors"]:
-                                        st.error(f"- {error}")
-                            
-                            # Show warnings
-                            if results.get("warnings"):
-                                with st.expander("⚠️ Avertissements"):
-                                    for warning in results["warnings"]:
-                                        st.warning(warning)
-                            
-                            # Show full results in expander
-                            with st.expander("🔍 Résultats complets (JSON)"):
-                                st.json(results)
+                    if job["step_reports"]:
+                        with st.expander("📋 Détails du pipeline"):
+                            for step in job["step_reports"]:
+                                status_icon = {"ok": "✅", "skipped": "⏭️"}.get(step["status"], "❌")
+                                st.markdown(f"{status_icon} **Étape {step['step']} ({step['name']})** — "
+                                            f"{step['seconds']:.1f}s — {step['detail']}")
+                            report = job.get("report") or {}
+                            if report.get("warnings"):
+                                st.caption(f"⚠️ {len(report['warnings'])} avertissement(s)")
+                                for warning in report["warnings"][:20]:
+                                    st.warning(warning)
                     
-                    except Exception as e:
-                        progress_bar.empty()
-                        status_text.empty()
-                        st.error(f"❌ Erreur lors de l'exécution du pipeline: {str(e)}")
-                        st.exception(e)
+                    api_metrics = (job.get("report") or {}).get("api_metrics", {})
+                    if api_metrics.get("endpoints"):
+                        with st.expander("⏱️ Temps passé par endpoint API"):
+                            render_api_metrics(api_metrics)
+        
+        st.subheader("📋 Tâches en cours")
+        auto_refresh = st.toggle("Actualisation automatique", value=True, key="jobs_auto_refresh")
+        
+        # Sans fragment (Streamlit < 1.37), actualisation manuelle
+        if hasattr(st, "fragment"):
+            st.fragment(run_every=2 if auto_refresh else None)(render_jobs)()
+        else:
+            if st.button("🔄 Rafraîchir"):
+                st.rerun()
+            render_jobs()
 
 # Footer
 st.markdown("---")
@@ -0,0 +1,449 @@
+"""
+Mock Riot API
+Serveur HTTP local qui remplace l'API Riot pour les tests de charge hors ligne.
+
+Implémente les routes utilisées par RiotAPIClient et sert une édition
+synthétique (src/utils/synthetic.py):
+- Account-V1:  /riot/account/v1/accounts/by-riot-id/{gameName}/{tagLine}
+- Summoner-V4: /lol/summoner/v4/summoners/by-puuid/{puuid}
+- League-V4:   /lol/league/v4/entries/by-puuid/{puuid}
+- Match-V5:    /lol/match/v5/matches/by-puuid/{puuid}/ids
+               /lol/match/v5/matches/{matchId}
+               /lol/match/v5/matches/{matchId}/timeline
+
+Comportements émulés:
+- En-têtes X-App-Rate-Limit(-Count) / X-Method-Rate-Limit(-Count)
+- 429 avec Retry-After et X-Rate-Limit-Type quand une fenêtre est pleine
+- Rafales de 5xx (probabilité de début de rafale + longueur)
+- Latence log-normale (médiane + sigma)
+
+Statistiques serveur: GET /mock/stats
+
+Usage:
+    server = MockRiotServer(MockRiotData.synthetic(teams=16, matches=200))
+    server.start()
+    client = RiotAPIClient("mock-key", base_url=server.url)  # cache: data/cache/mock
+
+Avec base_url (ou RIOT_API_BASE_URL), le cache par défaut du client est
+data/cache/mock: les données synthétiques ne se mélangent pas au cache de
+l'API réelle (data/cache). Les tests de charge passent un cache temporaire.
+"""
+
+import re
+import json
+import math
+import time
+import random
+import bisect
+import logging
+import threading
+from urllib.parse import urlparse, parse_qs, unquote
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, List, Optional, Tuple
+
+from src.core.rate_limiter import PRODUCTION_APP_LIMITS, DEV_KEY_APP_LIMITS, parse_limits
+from src.utils.synthetic import generate_teams, generate_timeline, iter_matches
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METHOD_LIMITS = {
+    "account": "1000:60",
+    "summoner": "1600:60",
+    "league": "20000:10",
+    "match-ids": "2000:10",
+    "match": "2000:10",
+    "timeline": "2000:10"
+}
+
+# (famille, motif) — l'ordre compte: by-puuid avant les IDs de match
+ROUTES = [
+    ("account", re.compile(r"^/riot/account/v1/accounts/by-riot-id/([^/]+)/([^/]+)$")),
+    ("summoner", re.compile(r"^/lol/summoner/v4/summoners/by-puuid/([^/]+)$")),
+    ("league", re.compile(r"^/lol/league/v4/entries/by-puuid/([^/]+)$")),
+    ("match-ids", re.compile(r"^/lol/match/v5/matches/by-puuid/([^/]+)/ids$")),
+    ("timeline", re.compile(r"^/lol/match/v5/matches/([^/]+)/timeline$")),
+    ("match", re.compile(r"^/lol/match/v5/matches/([^/]+)$")),
+]
+
+
+class SlidingWindowLimiter:
+    """
+    Fenêtres glissantes "N requêtes par S secondes" (plusieurs fenêtres
+    cumulées, comme les limites Riot).
+    """
+
+    def __init__(self, spec: str):
+        self.spec = spec
+        self.limits = parse_limits(spec)
+        self.longest = max(seconds for _, seconds in self.limits)
+        self.hits: List[float] = []
+
+    def _trim(self, now: float):
+        cut = bisect.bisect_left(self.hits, now - self.longest)
+        if cut:
+            del self.hits[:cut]
+
+    def acquire(self, now: float) -> Optional[float]:
+        """
+        Compte une requête si toutes les fenêtres le permettent.
+
+        Returns:
+            None si acceptée, sinon le délai (s) avant qu'une place se libère
+        """
+        self._trim(now)
+        retry_after = None
+        for count, seconds in self.limits:
+            start = bisect.bisect_left(self.hits, now - seconds)
+            if len(self.hits) - start >= count:
+                wait = self.hits[len(self.hits) - count] + seconds - now
+                retry_after = max(retry_after or 0.0, wait)
+        if retry_after is None:
+            self.hits.append(now)
+        return retry_after
+
+    def counts(self, now: float) -> str:
+        """Valeur de l'en-tête X-*-Rate-Limit-Count ("3:1,3:120")"""
+        return ",".join(
+            f"{len(self.hits) - bisect.bisect_left(self.hits, now - seconds)}:{seconds}"
+            for _, seconds in self.limits
+        )
+
+
+class MockRiotData:
+    """
+    Données servies par le mock: comptes, rangs et matchs indexés.
+    """
+
+    def __init__(self, teams_with_puuid: Dict[str, Dict], matches: Dict[str, Dict], seed: int = 42):
+        self.seed = seed
+        self.players: Dict[str, Dict] = {}
+        self.accounts: Dict[Tuple[str, str], str] = {}
+        for team in teams_with_puuid.values():
+            for player in team["players"]:
+                self.players[player["puuid"]] = player
+                self.accounts[(player["gameName"].lower(), player["tagLine"].lower())] = player["puuid"]
+
+        # Matchs stockés sérialisés (mémoire / coût de réponse réalistes)
+        self.matches: Dict[str, bytes] = {}
+        self.match_ids_by_puuid: Dict[str, List[Tuple[int, str]]] = {}
+        for match_id, match in matches.items():
+            self.matches[match_id] = json.dumps(match, separators=(',', ':')).encode('utf-8')
+            for puuid in match["metadata"]["participants"]:
+                self.match_ids_by_puuid.setdefault(puuid, []).append((match["info"]["gameCreation"], match_id))
+        for entries in self.match_ids_by_puuid.values():
+            entries.sort(reverse=True)  # Plus récent en premier, comme Match-V5
+
+    @classmethod
+    def synthetic(cls, teams: int = 16, matches: int = 100, seed: int = 42) -> "MockRiotData":
+        """Données d'une édition synthétique (mêmes IDs que write_synthetic_edition)"""
+        teams_with_puuid = generate_teams(teams, seed)
+        return cls(teams_with_puuid, dict(iter_matches(teams_with_puuid, matches, seed)), seed)
+
+    def account(self, game_name: str, tag_line: str) -> Optional[Dict]:
+        puuid = self.accounts.get((game_name.lower(), tag_line.lower()))
+        if puuid is None:
+            return None
+        player = self.players[puuid]
+        return {"puuid": puuid, "gameName": player["gameName"], "tagLine": player["tagLine"]}
+
+    def summoner(self, puuid: str) -> Optional[Dict]:
+        player = self.players.get(puuid)
+        if player is None:
+            return None
+        return {
+            "puuid": puuid,
+            "profileIconId": player["profileIconId"],
+            "revisionDate": 1_760_000_000_000,
+            "summonerLevel": player["summonerLevel"]
+        }
+
+    def league_entries(self, puuid: str) -> Optional[List[Dict]]:
+        player = self.players.get(puuid)
+        if player is None:
+            return None
+        return [{
+            "leagueId": f"mock-{player['tier'].lower()}",
+            "queueType": "RANKED_SOLO_5x5",
+            "tier": player["tier"],
+            "rank": player["rank"],
+            "puuid": puuid,
+            "leaguePoints": player["leaguePoints"],
+            "wins": player["wins"],
+            "losses": player["losses"],
+            "veteran": False,
+            "inactive": False,
+            "freshBlood": False,
+            "hotStreak": False
+        }]
+
+    def match_ids(self, puuid: str, params: Dict[str, str]) -> Optional[List[str]]:
+        if puuid not in self.players:
+            return None
+        start_time = int(params.get("startTime", 0)) * 1000
+        end_time = int(params["endTime"]) * 1000 if "endTime" in params else None
+        start = int(params.get("start", 0))
+        count = min(int(params.get("count", 20)), 100)
+
+        ids = [
+            match_id for created, match_id in self.match_ids_by_puuid.get(puuid, [])
+            if created >= start_time and (end_time is None or created <= end_time)
+        ]
+        return ids[start:start + count]
+
+    def timeline(self, match_id: str) -> Optional[Dict]:
+        raw = self.matches.get(match_id)
+        if raw is None:
+            return None
+        return generate_timeline(json.loads(raw), self.seed)
+
+
+class MockRiotServer(ThreadingHTTPServer):
+    """
+    Serveur HTTP multi-thread émulant l'API Riot.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        data: MockRiotData,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        app_limits: str = PRODUCTION_APP_LIMITS,
+        method_limits: Optional[Dict[str, str]] = None,
+        latency_ms: float = 30.0,
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.0,
+        error_burst: int = 3,
+        seed: int = 0
+    ):
+        """
+        Args:
+            data: Données servies
+            host, port: Adresse d'écoute (port 0 = port libre)
+            app_limits: Limites de l'application ("20:1,100:120")
+            method_limits: Limites par famille de routes (défaut DEFAULT_METHOD_LIMITS)
+            latency_ms: Latence médiane
+            latency_sigma: Dispersion de la latence (log-normale, 0 = constante)
+            error_rate: Probabilité qu'une requête démarre une rafale de 5xx
+            error_burst: Nombre de 5xx consécutifs par rafale
+            seed: Graine des tirages (latence, erreurs)
+        """
+        super().__init__((host, port), _MockRiotHandler)
+        self.data = data
+        self.app_limits = app_limits
+        self.method_limits = {**DEFAULT_METHOD_LIMITS, **(method_limits or {})}
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.error_burst = error_burst
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._limiters: Dict[Tuple[str, str], SlidingWindowLimiter] = {}
+        self._burst_remaining = 0
+        self._thread: Optional[threading.Thread] = None
+        self.reset_stats()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # =========================================================================
+    # CYCLE DE VIE
+    # =========================================================================
+
+    def start(self) -> "MockRiotServer":
+        """Démarre le serveur dans un thread de fond"""
+        self._thread = threading.Thread(target=self.serve_forever, name="mock-riot-api", daemon=True)
+        self._thread.start()
+        logger.info(f"Mock Riot API listening on {self.url}")
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    # =========================================================================
+    # STATISTIQUES
+    # =========================================================================
+
+    def reset_stats(self):
+        with getattr(self, "_lock", threading.Lock()):
+            self._stats = {"requests": 0, "routes": {}, "statuses": {}, "started_at": time.time()}
+
+    def stats(self) -> Dict:
+        """
+        Returns:
+            {"requests", "routes": {famille: n}, "statuses": {"200": n, ...},
+             "throttled", "server_errors", "elapsed"}
+        """
+        with self._lock:
+            statuses = dict(self._stats["statuses"])
+            return {
+                "requests": self._stats["requests"],
+                "routes": dict(self._stats["routes"]),
+                "statuses": statuses,
+                "throttled": statuses.get("429", 0),
+                "server_errors": sum(n for code, n in statuses.items() if code.startswith("5")),
+                "elapsed": round(time.time() - self._stats["started_at"], 3)
+            }
+
+    def _record(self, route: str, status: int):
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["routes"][route] = self._stats["routes"].get(route, 0) + 1
+            self._stats["statuses"][str(status)] = self._stats["statuses"].get(str(status), 0) + 1
+
+    # =========================================================================
+    # ÉMULATION
+    # =========================================================================
+
+    def _limiter(self, key: str, scope: str, spec: str) -> SlidingWindowLimiter:
+        limiter = self._limiters.get((key, scope))
+        if limiter is None:
+            limiter = self._limiters[(key, scope)] = SlidingWindowLimiter(spec)
+        return limiter
+
+    def check_rate_limits(self, api_key: str, route: str) -> Tuple[Dict[str, str], Optional[Tuple[str, float]]]:
+        """
+        Returns:
+            (en-têtes de rate limit, None ou (type de limite, retry_after))
+        """
+        with self._lock:
+            now = time.monotonic()
+            app = self._limiter(api_key, "application", self.app_limits)
+            method = self._limiter(api_key, route, self.method_limits[route])
+
+            blocked = None
+            wait = app.acquire(now)
+            if wait is not None:
+                blocked = ("application", wait)
+            else:
+                wait = method.acquire(now)
+                if wait is not None:
+                    app.hits.pop()  # Requête rejetée: non comptée
+                    blocked = ("method", wait)
+
+            headers = {
+                "X-App-Rate-Limit": app.spec,
+                "X-App-Rate-Limit-Count": app.counts(now),
+                "X-Method-Rate-Limit": method.spec,
+                "X-Method-Rate-Limit-Count": method.counts(now)
+            }
+            return headers, blocked
+
+    def draw_fault(self) -> Optional[int]:
+        """Code 5xx si la requête tombe dans une rafale d'erreurs"""
+        with self._lock:
+            if self._burst_remaining > 0:
+                self._burst_remaining -= 1
+            elif self.error_rate and self._rng.random() < self.error_rate:
+                self._burst_remaining = self.error_burst - 1
+            else:
+                return None
+            return self._rng.choice([500, 502, 503, 504])
+
+    def draw_latency(self) -> float:
+        """Latence d'une réponse (s)"""
+        if self.latency_ms <= 0:
+            return 0.0
+        with self._lock:
+            if self.latency_sigma <= 0:
+                return self.latency_ms / 1000
+            return self._rng.lognormvariate(math.log(self.latency_ms / 1000), self.latency_sigma)
+
+
+class _MockRiotHandler(BaseHTTPRequestHandler):
+    server: MockRiotServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send(self, status: int, body, headers: Optional[Dict[str, str]] = None):
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _error(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        self._send(status, {"status": {"message": message, "status_code": status}}, headers)
+
+    def _resolve(self, path: str) -> Tuple[Optional[str], List[str]]:
+        """Famille de route + segments variables"""
+        for route, pattern in ROUTES:
+            match = pattern.match(path)
+            if match:
+                return route, [unquote(group) for group in match.groups()]
+        return None, []
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        server = self.server
+
+        if parsed.path == "/mock/stats":
+            self._send(200, server.stats())
+            return
+
+        route, args = self._resolve(parsed.path)
+        if route is None:
+            server._record("unknown", 404)
+            self._error(404, "Not found")
+            return
+
+        api_key = self.headers.get("X-Riot-Token")
+        if not api_key:
+            server._record(route, 401)
+            self._error(401, "Unauthorized")
+            return
+
+        time.sleep(server.draw_latency())
+
+        headers, blocked = server.check_rate_limits(api_key, route)
+        if blocked:
+            limit_type, wait = blocked
+            server._record(route, 429)
+            self._error(429, "Rate limit exceeded", {
+                **headers,
+                "Retry-After": str(max(1, math.ceil(wait))),
+                "X-Rate-Limit-Type": limit_type
+            })
+            return
+
+        fault = server.draw_fault()
+        if fault:
+            server._record(route, fault)
+            self._error(fault, "Internal server error" if fault == 500 else "Service unavailable", headers)
+            return
+
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        data = server.data
+        if route == "account":
+            body = data.account(*args)
+        elif route == "summoner":
+            body = data.summoner(args[0])
+        elif route == "league":
+            body = data.league_entries(args[0])
+        elif route == "match-ids":
+            body = data.match_ids(args[0], params)
+        elif route == "match":
+            body = data.matches.get(args[0])
+        else:
+            body = data.timeline(args[0])
+
+        if body is None:
+            server._record(route, 404)
+            self._error(404, "Data not found", headers)
+            return
+
+        server._record(route, 200)
+        self._send(200, body, headers)
@@ -0,0 +1,351 @@
+"""
+Synthetic edition generator
+Génère des éditions déterministes (même seed → mêmes fichiers) de taille
+configurable pour les benchmarks: teams_with_puuid.json, tournament_matches.json
+et match_details.json au format Match-V5.
+
+Usage:
+    python scripts/generate_synthetic_edition.py --edition 9001 --teams 64 --matches 2000
+"""
+
+import json
+import random
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from src.core.champion_registry import get_champion_registry
+from src.core.data_manager import EditionDataManager
+from src.core.match_projection import project_match
+
+logger = logging.getLogger(__name__)
+
+ROLES = ["TOP", "JGL", "MID", "ADC", "SUP"]
+TEAM_POSITIONS = {"TOP": "TOP", "JGL": "JUNGLE", "MID": "MIDDLE", "ADC": "BOTTOM", "SUP": "UTILITY"}
+TIERS = ["IRON", "BRONZE", "SILVER", "GOLD", "PLATINUM", "EMERALD", "DIAMOND", "MASTER"]
+DIVISIONS = ["IV", "III", "II", "I"]
+
+# Profils par rôle: (cs/min, vision/min, part des kills de l'équipe)
+ROLE_PROFILES = {
+    "TOP": (6.5, 0.6, 0.20),
+    "JGL": (5.0, 1.0, 0.22),
+    "MID": (7.5, 0.7, 0.26),
+    "ADC": (8.0, 0.6, 0.27),
+    "SUP": (1.2, 2.2, 0.05),
+}
+
+MATCH_ID_BASE = 9_000_000_000
+GAME_CREATION_BASE = 1_760_000_000_000  # ms
+
+
+def _puuid(seed: int, index: int) -> str:
+    """PUUID déterministe de 78 caractères"""
+    digest = hashlib.sha512(f"{seed}:{index}".encode()).hexdigest()
+    return (digest + digest)[:78]
+
+
+def generate_teams(teams: int, seed: int = 42) -> Dict[str, Dict]:
+    """
+    Génère des équipes au format teams_with_puuid.json.
+
+    Args:
+        teams: Nombre d'équipes
+        seed: Graine du générateur
+
+    Returns:
+        {"Team 001": {"name": ..., "opgg_link": ..., "players": [...]}, ...}
+    """
+    rng = random.Random(seed)
+    result = {}
+
+    for t in range(teams):
+        team_name = f"Team {t + 1:03d}"
+        players = []
+        for r, role in enumerate(ROLES):
+            index = t * len(ROLES) + r
+            wins, losses = rng.randint(5, 300), rng.randint(5, 300)
+            players.append({
+                "gameName": f"Player{index + 1:05d}",
+                "tagLine": rng.choice(["EUW", "0000", "FR1", "OCC"]),
+                "role": role,
+                "puuid": _puuid(seed, index),
+                "summonerLevel": rng.randint(30, 700),
+                "profileIconId": rng.randint(1, 6000),
+                "tier": rng.choice(TIERS),
+                "rank": rng.choice(DIVISIONS),
+                "leaguePoints": rng.randint(0, 99),
+                "wins": wins,
+                "losses": losses,
+                "winrate": round(wins / (wins + losses) * 100, 2)
+            })
+        result[team_name] = {
+            "name": team_name,
+            "opgg_link": "https://op.gg/fr/lol/multisearch/euw?summoners=" + "%2C".join(
+                f"{p['gameName']}%23{p['tagLine']}" for p in players
+            ),
+            "players": players
+        }
+
+    return result
+
+
+def to_teams(teams_with_puuid: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Équipes au format teams.json (Riot IDs et rôles, sans données API)"""
+    return {
+        name: {**team, "players": [
+            {k: p[k] for k in ("gameName", "tagLine", "role")} for p in team["players"]
+        ]}
+        for name, team in teams_with_puuid.items()
+    }
+
+
+def _participant(rng: random.Random, participant_id: int, team_id: int, player: Dict,
+                 champion, win: bool, duration: int, team_kills: int, enemy_kills: int) -> Dict:
+    minutes = duration / 60
+    cs_per_min, vision_per_min, kill_share = ROLE_PROFILES[player["role"]]
+    kills = max(0, round(team_kills * kill_share * rng.uniform(0.4, 1.6)))
+    deaths = max(0, round(enemy_kills / 5 * rng.uniform(0.3, 1.7)))
+    assists = max(0, round((team_kills - kills) * rng.uniform(0.2, 0.8)))
+    jungle = player["role"] == "JGL"
+    cs = round(cs_per_min * minutes * rng.uniform(0.75, 1.25))
+    gold = round(minutes * rng.uniform(280, 480) + kills * 300 + assists * 100)
+    position = TEAM_POSITIONS[player["role"]]
+
+    return {
+        "participantId": participant_id,
+        "teamId": team_id,
+        "puuid": player["puuid"],
+        "riotIdGameName": player["gameName"],
+        "riotIdTagline": player["tagLine"],
+        "summonerName": "",
+        "championId": champion.id,
+        "championName": champion.key,
+        "champLevel": min(18, 6 + round(minutes / 3)),
+        "teamPosition": position,
+        "individualPosition": position,
+        "lane": "JUNGLE" if jungle else position,
+        "role": "SOLO",
+        "kills": kills,
+        "deaths": deaths,
+        "assists": assists,
+        "totalMinionsKilled": 0 if jungle else cs,
+        "neutralMinionsKilled": cs if jungle else rng.randint(0, 12),
+        "visionScore": round(vision_per_min * minutes * rng.uniform(0.7, 1.3)),
+        "wardsPlaced": rng.randint(3, 40),
+        "wardsKilled": rng.randint(0, 15),
+        "goldEarned": gold,
+        "goldSpent": round(gold * rng.uniform(0.85, 1.0)),
+        "totalDamageDealtToChampions": round(minutes * rng.uniform(300, 1100)),
+        "totalDamageTaken": round(minutes * rng.uniform(400, 1200)),
+        "damageDealtToObjectives": round(minutes * rng.uniform(50, 600)),
+        "timeCCingOthers": rng.randint(0, 60),
+        "summoner1Id": 4,
+        "summoner2Id": 11 if jungle else rng.choice([3, 7, 12, 14]),
+        **{f"item{i}": rng.randint(1000, 7000) for i in range(7)},
+        "doubleKills": kills // 4,
+        "tripleKills": kills // 9,
+        "quadraKills": 0,
+        "pentaKills": 0,
+        "firstBloodKill": False,
+        "firstBloodAssist": False,
+        "timePlayed": duration,
+        "win": win
+    }
+
+
+def generate_match(match_id: str, blue: Tuple[str, Dict], red: Tuple[str, Dict],
+                   rng: random.Random, game_creation: int, champions: List) -> Dict:
+    """
+    Génère un match Match-V5 entre deux équipes.
+
+    Args:
+        match_id: ID du match ("EUW1_9000000001")
+        blue, red: (nom, données teams_with_puuid) des deux équipes
+        rng: Générateur aléatoire (état partagé pour le déterminisme)
+        game_creation: Timestamp de création (ms)
+        champions: Champions disponibles (registry)
+    """
+    duration = rng.randint(17 * 60, 45 * 60)
+    blue_win = rng.random() < 0.5
+    kills = {100: rng.randint(5, 40), 200: rng.randint(5, 40)}
+    picks = rng.sample(champions, 20)
+
+    participants = []
+    for side, (team_id, (_, team)) in enumerate(((100, blue), (200, red))):
+        win = blue_win if team_id == 100 else not blue_win
+        for r, player in enumerate(team["players"][:5]):
+            participants.append(_participant(
+                rng, side * 5 + r + 1, team_id, player, picks[side * 5 + r],
+                win, duration, kills[team_id], kills[300 - team_id]
+            ))
+
+    first_blood = rng.randrange(10)
+    participants[first_blood]["firstBloodKill"] = True
+
+    teams = []
+    for side, team_id in enumerate((100, 200)):
+        win = blue_win if team_id == 100 else not blue_win
+        teams.append({
+            "teamId": team_id,
+            "win": win,
+            "bans": [
+                {"championId": picks[10 + side * 5 + turn].id, "pickTurn": turn + 1}
+                for turn in range(5)
+            ],
+            "objectives": {
+                "baron": {"first": win and rng.random() < 0.6, "kills": rng.randint(0, 2) if win else rng.randint(0, 1)},
+                "champion": {"first": participants[first_blood]["teamId"] == team_id, "kills": kills[team_id]},
+                "dragon": {"first": rng.random() < 0.5, "kills": rng.randint(0, 4)},
+                "horde": {"first": rng.random() < 0.5, "kills": rng.randint(0, 6)},
+                "inhibitor": {"first": win, "kills": rng.randint(1, 3) if win else rng.randint(0, 1)},
+                "riftHerald": {"first": rng.random() < 0.5, "kills": rng.randint(0, 1)},
+                "tower": {"first": rng.random() < 0.5, "kills": rng.randint(6, 11) if win else rng.randint(0, 6)}
+            }
+        })
+
+    return {
+        "metadata": {
+            "dataVersion": "2",
+            "matchId": match_id,
+            "participants": [p["puuid"] for p in participants]
+        },
+        "info": {
+            "gameCreation": game_creation,
+            "gameStartTimestamp": game_creation + 30_000,
+            "gameEndTimestamp": game_creation + 30_000 + duration * 1000,
+            "gameDuration": duration,
+            "gameId": int(match_id.split("_")[1]),
+            "gameMode": "CLASSIC",
+            "gameType": "CUSTOM_GAME",
+            "gameVersion": "15.20.712.6543",
+            "mapId": 11,
+            "platformId": "EUW1",
+            "queueId": 0,
+            "participants": participants,
+            "teams": teams
+        }
+    }
+
+
+def generate_timeline(match: Dict, seed: int = 42) -> Dict:
+    """
+    Timeline Match-V5 simplifiée (frames par minute + first blood) cohérente
+    avec les totaux du match.
+    """
+    info = match["info"]
+    rng = random.Random(f"{seed}:{match['metadata']['matchId']}")
+    minutes = info["gameDuration"] // 60
+    participants = info["participants"]
+    first_blood = next((p["participantId"] for p in participants if p.get("firstBloodKill")), 1)
+    victim = rng.choice([p["participantId"] for p in participants if p["teamId"] != participants[first_blood - 1]["teamId"]])
+
+    frames = []
+    for minute in range(minutes + 1):
+        progress = minute / max(1, minutes)
+        frames.append({
+            "timestamp": minute * 60_000 + (rng.randint(0, 40) if minute else 0),
+            "participantFrames": {
+                str(p["participantId"]): {
+                    "totalGold": 500 + round((p["goldEarned"] - 500) * progress),
+                    "xp": round(p["champLevel"] * 1000 * progress),
+                    "minionsKilled": round(p["totalMinionsKilled"] * progress),
+                    "jungleMinionsKilled": round(p["neutralMinionsKilled"] * progress)
+                }
+                for p in participants
+            },
+            "events": [{
+                "type": "CHAMPION_KILL",
+                "killerId": first_blood,
+                "victimId": victim,
+                "assistingParticipantIds": []
+            }] if minute == 3 else []
+        })
+
+    return {
+        "metadata": {"matchId": match["metadata"]["matchId"], "participants": match["metadata"]["participants"]},
+        "info": {"frameInterval": 60000, "frames": frames}
+    }
+
+
+def iter_matches(teams: Dict[str, Dict], matches: int, seed: int = 42) -> Iterator[Tuple[str, Dict]]:
+    """
+    Génère les matchs un par un (mémoire constante pour les grandes tailles).
+
+    Yields:
+        (match_id, match_data)
+    """
+    rng = random.Random(seed + 1)
+    champions = sorted(get_champion_registry().by_id.values())
+    team_items = list(teams.items())
+
+    for m in range(matches):
+        blue, red = rng.sample(team_items, 2)
+        match_id = f"EUW1_{MATCH_ID_BASE + m + 1}"
+        game_creation = GAME_CREATION_BASE + m * 15 * 60_000
+        yield match_id, generate_match(match_id, blue, red, rng, game_creation, champions)
+
+
+def write_synthetic_edition(
+    edition_number: int,
+    teams: int = 16,
+    matches: int = 100,
+    seed: int = 42,
+    base_path: str = "data/editions",
+    timelines: bool = False,
+    raw: bool = False
+) -> EditionDataManager:
+    """
+    Écrit une édition synthétique complète (privée) sur le disque.
+
+    match_details.json est écrit en streaming, sans construire le dict
+    complet en mémoire.
+
+    Args:
+        edition_number: Numéro de l'édition à créer
+        teams: Nombre d'équipes (>= 2)
+        matches: Nombre de matchs
+        seed: Graine du générateur
+        base_path: Dossier des éditions
+        timelines: Si True, écrit aussi les frames de timeline (.npz)
+        raw: Si True, stocke les payloads Match-V5 complets au lieu de leur
+             projection (comparaison avec les éditions antérieures)
+
+    Returns:
+        Le manager de l'édition générée
+    """
+    if teams < 2:
+        raise ValueError("At least 2 teams are required")
+
+    manager = EditionDataManager(edition_number, base_path)
+    manager.initialize_edition(
+        edition_name=f"Synthetic {teams}x{matches} (seed {seed})",
+        year=2025,
+        start_date="2025-10-09",
+        end_date="2025-10-12",
+        is_private=True
+    )
+
+    teams_with_puuid = generate_teams(teams, seed)
+    manager.save_teams(to_teams(teams_with_puuid))
+    manager.save_teams_with_puuid(teams_with_puuid)
+
+    tournament_matches = {name: [] for name in teams_with_puuid}
+    timeline_store = manager.timelines if timelines else None
+    puuid_team = {p["puuid"]: name for name, team in teams_with_puuid.items() for p in team["players"]}
+
+    path = Path(manager.edition_path) / "match_details.json"
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("{")
+        for i, (match_id, match) in enumerate(iter_matches(teams_with_puuid, matches, seed)):
+            f.write(("," if i else "") + "\n" + json.dumps(match_id) + ": ")
+            json.dump(match if raw else project_match(match), f, ensure_ascii=False, separators=(',', ':'))
+            for team_name in {puuid_team[puuid] for puuid in match["metadata"]["participants"]}:
+                tournament_matches[team_name].append(match_id)
+            if timeline_store is not None:
+                timeline_store.save(match_id, generate_timeline(match, seed))
+        f.write("\n}\n")
+
+    manager.save_tournament_matches(tournament_matches)
+    logger.info(f"Synthetic edition {edition_number} written: {teams} teams, {matches} matches")
+    return manager